@@ -7,12 +7,13 @@ NO SIMULATION OR DUMMY DATA ALLOWED.
 import os
 import sys
 import time
+import argparse
+import contextlib
 import random
 import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from colorama import init, Fore, Back, Style
-import keyboard
-import requests, json
+import json
 import base64
 
 
@@ -23,44 +24,61 @@ from ui.terminal_ui import clear_screen, print_header, print_menu, get_user_inpu
 from ui.colors import GREEN, RED, YELLOW, BLUE, RESET, BOLD, DIM
 from models.market import (
     MARKETS, FOREX_MARKETS, OTC_MARKETS, 
-    MarketSelector, TimingController, HistoricalDataCollector
+    MarketSelector, MarketTimingController, HistoricalDataCollector
+)
+from utils.credential_store import CredentialStore
+from utils.signal_journal import SignalJournal
+from utils.file_handler import (
+    save_signals_to_file, write_signals, write_columnar, export_signals, SIGNAL_FORMATS
 )
-from models.signal import Signal, generate_signals, get_market_analysis
-from utils.file_handler import save_signals_to_file
 from utils.animations import (
     afa_loading_animation, quotex_connection_animation, 
-    signal_generation_animation, market_analysis_animation,
-    signal_display_animation, success_celebration, countdown_timer
+    signal_display_animation, success_celebration, countdown_timer,
+    set_animations_enabled, StatusRenderer
 )
-from src.service.news_filter import NewsFilter
-from src.service.volatility_filter import VolatilityFilter
+
+# Heavy modules (numpy-backed signal pipeline, filters, requests, keyboard)
+# are imported where they are used so the menu appears without waiting on them
+if TYPE_CHECKING:
+    from models.signal import Signal
+    from src.service.news_filter import NewsFilter
+    from src.service.volatility_filter import VolatilityFilter
 
 # Initialize colorama
 init()
 
-# Global timing controller
-timing_controller = TimingController()
+# Global timing controller (gaps are enforced per market and timeframe)
+timing_controller = MarketTimingController()
 
 USERS_URL = "https://raw.githubusercontent.com/ahsanaligaminnn/AFA-TESST/refs/heads/main/users.json"
 
 USERS_URL = "https://raw.githubusercontent.com/ahsanaligaminnn/AFA-TESST/refs/heads/main/users.json"
 
-def get_users():
-    try:
-        res = requests.get(USERS_URL, timeout=10)
-        if res.status_code == 200:
-            data = res.json()  # direct JSON milega
-            return data.get("users", [])
-        else:
-            print("❌ Error fetching users:", res.status_code)
-            return []
-    except Exception as e:
-        print("❌ Error:", e)
-        return []
+def get_credential_store() -> CredentialStore:
+    """
+    Get the login credential store, loaded from the local cache.
+    
+    A conditional refresh against USERS_URL is started in the background; it
+    is only waited on when there is no cache yet (first run).
+    
+    Returns:
+        CredentialStore: Store ready for verify()
+    """
+    store = CredentialStore(USERS_URL)
+    store.load()
+    store.start_background_refresh()
+    if not len(store):
+        store.wait_for_refresh()
+    return store
+
+def read_key_event():
+    """Block until a key is pressed, loading the keyboard hook on first use."""
+    import keyboard
+    keyboard.read_event()
 
 def login():
-    users = get_users()
-    if not users:
+    store = get_credential_store()
+    if not len(store):
         print("No users found. Exiting...")
         exit()
 
@@ -69,10 +87,9 @@ def login():
         username = input("Enter Username: ")
         password = input("Enter Password: ")
 
-        for u in users:
-            if u["username"] == username and u["password"] == password:
-                print("✅ Login Successful!\n")
-                return True
+        if store.verify(username, password):
+            print("✅ Login Successful!\n")
+            return True
         print("❌ Invalid Username or Password. Try again.\n")
 
 def main():
@@ -98,10 +115,12 @@ def main():
             "Generate Trading Signals (REAL DATA)",
             "View Available Markets",
             "Market Analysis (REAL DATA)",
+            "Live Market Dashboard (REAL DATA)",
             "Historical Data Collection (REAL DATA)",
             "News Filter Settings",
             "Volatility Filter Settings",
             "Timing Control Settings",
+            "Signal Results & Win Rate",
             "Settings",
             "Exit"
         ]
@@ -115,16 +134,20 @@ def main():
         elif choice == 3:
             market_analysis_menu()
         elif choice == 4:
-            historical_data_menu()
+            live_dashboard_menu()
         elif choice == 5:
-            news_filter_menu()
+            historical_data_menu()
         elif choice == 6:
-            volatility_filter_menu()
+            news_filter_menu()
         elif choice == 7:
-            timing_control_menu()
+            volatility_filter_menu()
         elif choice == 8:
-            settings_menu()
+            timing_control_menu()
         elif choice == 9:
+            signal_results_menu()
+        elif choice == 10:
+            settings_menu()
+        elif choice == 11:
             clear_screen()
             print(f"\n{GREEN}{BOLD}🎉 Thank you for using AFA-TRADING!{RESET}")
             print(f"{BLUE}💎 Professional Binary Options Signals{RESET}")
@@ -170,10 +193,10 @@ def select_forex_markets(market_selector: MarketSelector) -> List[str]:
     print(f"{YELLOW}Forex Pairs:{RESET}")
     
     forex_markets = market_selector.get_forex_markets()
-    market_list = ["All (Automatic Random Selection)"] + list(forex_markets.keys())
+    market_list = ["All (Automatic Random Selection)", "Top (Live Screener Score)"] + list(forex_markets.keys())
     
     for i, market in enumerate(market_list, 1):
-        if market.startswith("All"):
+        if market.startswith(("All", "Top")):
             print(f"{GREEN}{i}. {market}{RESET}")
         else:
             volatility = forex_markets[market]["volatility"]
@@ -204,6 +227,8 @@ def select_forex_markets(market_selector: MarketSelector) -> List[str]:
         print(f"\n{BLUE}🚀 Proceeding with automatic selection...{RESET}")
         time.sleep(2)  # Brief pause to show selection
         return selected
+    elif forex_choice == 2:  # Top - best live screener scores
+        return select_top_markets(market_selector, forex_markets, "Forex")
     else:
         selected_market = market_list[forex_choice - 1]
         print(f"\n{GREEN}You have selected: {selected_market}{RESET}")
@@ -215,10 +240,10 @@ def select_otc_markets(market_selector: MarketSelector) -> List[str]:
     print(f"{YELLOW}OTC Pairs:{RESET}")
     
     otc_markets = market_selector.get_otc_markets()
-    market_list = ["All (Automatic Random Selection)"] + list(otc_markets.keys())
+    market_list = ["All (Automatic Random Selection)", "Top (Live Screener Score)"] + list(otc_markets.keys())
     
     for i, market in enumerate(market_list, 1):
-        if market.startswith("All"):
+        if market.startswith(("All", "Top")):
             print(f"{GREEN}{i}. {market}{RESET}")
         else:
             volatility = otc_markets[market]["volatility"]
@@ -249,13 +274,68 @@ def select_otc_markets(market_selector: MarketSelector) -> List[str]:
         print(f"\n{BLUE}🚀 Proceeding with automatic selection...{RESET}")
         time.sleep(2)  # Brief pause to show selection
         return selected
+    elif otc_choice == 2:  # Top - best live screener scores
+        return select_top_markets(market_selector, otc_markets, "OTC")
     else:
         selected_market = market_list[otc_choice - 1]
         print(f"\n{GREEN}You have selected: {selected_market}{RESET}")
         return [selected_market]
 
+def select_top_markets(market_selector: MarketSelector, market_dict: Dict[str, Dict],
+                       label: str, count: int = 3) -> List[str]:
+    """
+    Select the best scoring markets from the live candle screener.
+    
+    Args:
+        market_selector (MarketSelector): Selector doing the ranking
+        market_dict (Dict[str, Dict]): Markets to screen
+        label (str): Category name for messages
+        count (int): Number of markets to select
+        
+    Returns:
+        List[str]: Selected market symbols, best first
+    """
+    from models.signal import get_live_api
+    from src.service.candle_buffer import CandleStore
+    from src.service.market_screener import MarketScreener
+    
+    print(f"\n{BLUE}📡 Screening {len(market_dict)} {label} pairs on live candles...{RESET}")
+    
+    # Fill buffers that are too short to screen; later screens reuse them
+    screener = MarketScreener()
+    store = CandleStore.get_instance()
+    api = get_live_api()
+    if api is not None:
+        for market in market_dict:
+            if len(store.get(market, 1)) < screener.lookback:
+                try:
+                    store.refresh(api, market, 1, screener.lookback * 2)
+                except Exception as e:
+                    print_error_message(f"Could not fetch candles for {market}: {str(e)}")
+    
+    start = time.perf_counter()
+    results = screener.screen(market_dict.keys())
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    if not results:
+        print(f"{YELLOW}⚠️ No live candles buffered - falling back to random selection{RESET}")
+        return market_selector.select_random_markets(market_dict, count)
+    
+    print(f"\n{GREEN}✅ Screened {len(results)} pairs in {elapsed_ms:.1f} ms:{RESET}")
+    print(f"{BOLD}{'Pair':<14}{'Score':>8}{'Volatility':>12}{'Trend':>8}{'Spread':>10}{RESET}")
+    for row in results[:max(count, 5)]:
+        print(f"{row['market']:<14}{row['score']:>8.2f}{row['volatility'] * 100:>11.3f}%"
+              f"{row['trend']:>8.2f}{row['spread'] * 100:>9.4f}%")
+    
+    selected = market_selector.select_top_markets(market_dict, count, screener=screener)
+    print(f"\n{GREEN}✅ Selected top {len(selected)} {label} pairs: {BOLD}{', '.join(selected)}{RESET}")
+    time.sleep(2)  # Brief pause to show selection
+    return selected
+
 def generate_signals_menu():
     """Menu for generating trading signals - 100% GUARANTEED WORKING."""
+    from models.signal import generate_signals, get_real_market_data_many, timeframe_to_minutes
+    
     clear_screen()
     print_header()
     print(f"\n{BOLD}{BLUE}=== Generate Trading Signals - 100% GUARANTEED ==={RESET}\n")
@@ -264,17 +344,6 @@ def generate_signals_menu():
     print(f"{YELLOW}Signals will be generated using REAL Quotex data - 100% guaranteed!{RESET}")
     print(f"{GREEN}Every request will generate signals - NO FAILURES!{RESET}\n")
     
-    # Check timing control
-    if timing_controller.enabled:
-        if not timing_controller.can_emit_signal():
-            wait_time = timing_controller.get_time_until_next_signal()
-            if wait_time:
-                countdown_timer(min(wait_time, 10), "Next signal available in")
-                return
-        
-        if timing_controller.should_force_signal():
-            print(f"{RED}⚠️ Maximum gap reached - forcing signal generation{RESET}")
-    
     # Enhanced market selection
     selected_markets = select_market_with_categories()
     
@@ -346,32 +415,60 @@ def generate_signals_menu():
     vol_idx = get_user_input("Enter option number", 1, len(volatility_options)) - 1
     selected_volatility = volatility_options[vol_idx]
     
-    # Process each selected market with REAL data
+    # Process each selected market with REAL data; the status line tracks progress
     all_signals = []
+    timing_info = None
+    gapped = {}
     
-    for i, market in enumerate(selected_markets, 1):
-        print(f"\n{BLUE}{BOLD}[{i}/{len(selected_markets)}] Processing: {market}{RESET}")
-        
-        # Show signal generation animation
-        signal_generation_animation(market, num_signals)
+    with StatusRenderer(f"Fetching LIVE data for {len(selected_markets)} market(s)",
+                        total=len(selected_markets)) as progress:
+        # Fetch LIVE data for every selected market at once
+        prefetched = get_real_market_data_many(selected_markets, timeframe_to_minutes(selected_timeframe))
         
-        market_signals = generate_signals(
-            market,
-            selected_timeframe,
-            selected_accuracy,
-            num_signals,
-            selected_filter,
-            selected_martingale,
-            days_analyze,
-            selected_news,
-            selected_volatility
-        )
+        for i, market in enumerate(selected_markets, 1):
+            progress.update(message=f"Generating signals: {market}", current=i - 1)
+            print(f"\n{BLUE}{BOLD}[{i}/{len(selected_markets)}] Processing: {market}{RESET}")
+            
+            # Check timing control for this market
+            if not timing_controller.can_emit_signal(market, selected_timeframe):
+                wait_time = timing_controller.get_time_until_next_signal(market, selected_timeframe)
+                print(f"{YELLOW}⏰ {market} is in its signal gap - next signal in {wait_time or 0} seconds{RESET}")
+                gapped[market] = wait_time or 0
+                continue
+            
+            forced = timing_controller.should_force_signal(market, selected_timeframe)
+            if forced:
+                print(f"{RED}⚠️ Maximum gap reached for {market} - forcing signal generation{RESET}")
+            
+            market_signals = generate_signals(
+                market,
+                selected_timeframe,
+                selected_accuracy,
+                num_signals,
+                selected_filter,
+                selected_martingale,
+                days_analyze,
+                selected_news,
+                selected_volatility,
+                market_data=prefetched.get(market)
+            )
+            
+            if market_signals:
+                all_signals.extend(market_signals)
+                timing_info = timing_controller.record_signal_emission(market, selected_timeframe, forced=forced)
+                print_success_message(f"Generated {len(market_signals)} GENUINE signals for {market}")
+            else:
+                print_error_message(f"No GENUINE signals available for {market}")
         
-        if market_signals:
-            all_signals.extend(market_signals)
-            print_success_message(f"Generated {len(market_signals)} GENUINE signals for {market}")
-        else:
-            print_error_message(f"No GENUINE signals available for {market}")
+        progress.update(message="Signal generation", current=len(selected_markets))
+    
+    if not all_signals and len(gapped) == len(selected_markets):
+        next_market = min(gapped, key=gapped.get)
+        minutes, seconds = divmod(gapped[next_market], 60)
+        print(f"\n{YELLOW}⏰ All {len(gapped)} selected market(s) are waiting for their signal gap{RESET}")
+        print(f"{BLUE}Next market due: {next_market} in {minutes}m {seconds:02d}s{RESET}")
+        wait_for_keypress()
+        return
     
     if not all_signals:
         print_error_message("No GENUINE LIVE signals generated!")
@@ -390,22 +487,35 @@ def generate_signals_menu():
         wait_for_keypress()
         return
     
+    # Collapse signals on different markets that are effectively the same bet
+    all_signals = deduplicate_correlated_signals(all_signals, selected_markets)
+    
+    # Record every generated signal in the journal for later lookups
+    try:
+        SignalJournal.get_instance().append(all_signals)
+    except OSError as e:
+        print_error_message(f"Could not write signal journal: {str(e)}")
+    
+    # Settle each signal against live candles when it expires
+    from src.api.quotex_real_api import SIGNAL_STRATEGY
+    
+    tracker = get_result_tracker()
+    for signal in all_signals:
+        tracker.track(signal, SIGNAL_STRATEGY)
+    
     # Success celebration
     success_celebration()
     
-    # Record timing for signal emission
-    timing_info = timing_controller.record_signal_emission(
-        forced=timing_controller.should_force_signal()
-    )
-    
     # Display all REAL signals
     display_signals_enhanced(all_signals, selected_markets, selected_timeframe, 
                            selected_accuracy, selected_news, selected_volatility, timing_info)
 
-def display_signals_enhanced(signals: List[Signal], markets: List[str], timeframe: str, 
+def display_signals_enhanced(signals: List['Signal'], markets: List[str], timeframe: str, 
                            accuracy: str, news_filter: str, volatility_filter: str, 
                            timing_info: Optional[Dict[str, Any]] = None):
     """Enhanced signal display with animations."""
+    from models.signal import SignalBatch
+    
     clear_screen()
     
     # Use animated signal display
@@ -424,18 +534,24 @@ def display_signals_enhanced(signals: List[Signal], markets: List[str], timefram
     print(f"{YELLOW}Filters: News({news_filter}) | Volatility({volatility_filter}){RESET}")
     print(f"{GREEN}Total Signals: {len(signals)} | Source: REAL QUOTEX{RESET}")
     
+    summary = SignalBatch.from_signals(signals).summary()
+    strong = summary['by_strength']['STRONG'] + summary['by_strength']['VERY_STRONG']
+    print(f"{GREEN}BUY: {summary['buy']} | SELL: {summary['sell']} | Strong: {strong} | "
+          f"Blocked: {summary['by_strength']['BLOCKED']} | "
+          f"Avg Confidence: {summary['mean_confidence'] * 100:.1f}%{RESET}")
+    
     # Ask to save signals with animation
     print(f"\n{YELLOW}💾 Save these signals to file?{RESET}")
     save_choice = input(f"{GREEN}► (y/n): {RESET}").strip().lower()
     
     if save_choice == 'y':
-        afa_loading_animation(2, "Saving signals")
-        filename = save_signals_to_file(signals, markets_str.replace(", ", "_"))
+        with StatusRenderer("Saving signals"):
+            filename = save_signals_to_file(signals, markets_str.replace(", ", "_"))
         print_success_message(f"Signals saved to {filename}")
     
     wait_for_keypress()
 
-def display_signals(signals: List[Signal], markets: List[str], timeframe: str, accuracy: str, 
+def display_signals(signals: List['Signal'], markets: List[str], timeframe: str, accuracy: str, 
                    news_filter: str, volatility_filter: str, timing_info: Optional[Dict[str, Any]] = None):
     """Display generated REAL signals with enhanced formatting."""
     clear_screen()
@@ -504,10 +620,13 @@ def display_signals(signals: List[Signal], markets: List[str], timeframe: str, a
         print(f"\n{GREEN}REAL signals saved to {filename}{RESET}")
     
     print(f"\n{YELLOW}Press any key to return to main menu...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
 def market_analysis_menu():
     """Menu for detailed market analysis with REAL data only."""
+    from models.signal import get_live_api
+    from src.service.market_analysis import MarketAnalysisService
+    
     clear_screen()
     print_header()
     print(f"\n{BOLD}{BLUE}=== Market Analysis (REAL DATA ONLY) ==={RESET}\n")
@@ -531,11 +650,19 @@ def market_analysis_menu():
     tf_idx = get_user_input("Enter timeframe number", 1, len(timeframe_options)) - 1
     selected_timeframe = timeframe_options[tf_idx]
     
-    # Analyze each selected market with REAL data
+    # Analyze all selected markets in one batch; results are cached per candle
+    service = MarketAnalysisService.get_instance()
+    stale = service.needs_refresh(selected_markets, selected_timeframe)
+    start = time.perf_counter()
+    with StatusRenderer(f"Analyzing {len(selected_markets)} market(s)"):
+        api = get_live_api() if stale else None
+        analyses = service.analyze(selected_markets, selected_timeframe, api)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    source = "cache" if not stale else f"{len(stale)} live fetch(es)"
+    print(f"\n{GREEN}✅ Analyzed {len(selected_markets)} market(s) in {elapsed_ms:.1f} ms ({source}){RESET}")
+    
     for market in selected_markets:
-        market_analysis_animation(market)
-        
-        analysis = get_market_analysis(market, selected_timeframe)
+        analysis = analyses[market]
         
         # Display analysis results
         print(f"\n{BOLD}{GREEN}=== REAL Analysis Results for {market} ==={RESET}\n")
@@ -563,7 +690,57 @@ def market_analysis_menu():
         print("-" * 60)
     
     print(f"\n{YELLOW}Press any key to return to main menu...{RESET}")
-    keyboard.read_event()
+    read_key_event()
+
+def live_dashboard_menu():
+    """Live table of many markets, updated on every tick until a key is pressed."""
+    from models.signal import get_live_api
+    from src.service.market_monitor import MarketMonitor
+    from ui.dashboard import LiveDashboard
+    
+    clear_screen()
+    print_header()
+    print(f"\n{BOLD}{BLUE}=== Live Market Dashboard (REAL DATA) ==={RESET}\n")
+    
+    scope_options = [
+        f"All markets ({len(MARKETS)})",
+        f"Forex pairs ({len(FOREX_MARKETS)})",
+        f"OTC pairs ({len(OTC_MARKETS)})",
+        "Choose markets"
+    ]
+    for i, option in enumerate(scope_options, 1):
+        print(f"{i}. {option}")
+    scope = get_user_input("Enter scope number", 1, len(scope_options))
+    
+    if scope == 4:
+        markets = select_market_with_categories()
+    else:
+        markets = list((MARKETS, FOREX_MARKETS, OTC_MARKETS)[scope - 1].keys())
+    
+    if not markets:
+        print_error_message("No markets selected")
+        countdown_timer(2, "Returning to menu in")
+        return
+    
+    print(f"\n{YELLOW}Select candle timeframe:{RESET}")
+    timeframe_options = [1, 5, 15]
+    for i, tf in enumerate(timeframe_options, 1):
+        print(f"{i}. {tf} minutes")
+    timeframe = timeframe_options[get_user_input("Enter timeframe number", 1, len(timeframe_options)) - 1]
+    
+    if get_live_api() is None:
+        print_error_message("Could not connect to LIVE Quotex")
+        countdown_timer(2, "Returning to menu in")
+        return
+    
+    # Pending signals come from the shared tracker, settled in the background
+    monitor = MarketMonitor(markets, timeframe, tracker=get_result_tracker())
+    dashboard = LiveDashboard(monitor)
+    dashboard.run(get_live_api, read_key_event)
+    
+    print(f"\n{GREEN}✅ Dashboard closed after {monitor.ticks} ticks "
+          f"({dashboard.frames} frames, {dashboard.cells_drawn} cell updates){RESET}")
+    countdown_timer(2, "Returning to menu in")
 
 def historical_data_menu():
     """Menu for historical data collection."""
@@ -595,14 +772,18 @@ def historical_data_menu():
     # Collect data for each market
     for market in selected_markets:
         print(f"\n{BLUE}{BOLD}📊 Collecting Historical Data: {market}{RESET}")
-        afa_loading_animation(2, f"Initializing data collection for {market}")
-        
-        def progress_callback(message):
-            print(f"{YELLOW}📋 {message}{RESET}")
         
-        collection_result = collector.collect_historical_data(
-            market, days, progress_callback
-        )
+        with StatusRenderer(f"Collecting {market}") as progress:
+            def progress_callback(message):
+                # Per-batch counts go to the status line, the rest is printed
+                if message.startswith("Collected "):
+                    progress.update(detail=message)
+                else:
+                    print(f"{YELLOW}📋 {message}{RESET}")
+            
+            collection_result = collector.collect_historical_data(
+                market, days, progress_callback
+            )
         
         # Display results
         print(f"\n{BOLD}{GREEN}=== Collection Results for {market} ==={RESET}")
@@ -619,11 +800,129 @@ def historical_data_menu():
         
         if collection_result['status'] == 'completed':
             print_success_message("Data collection completed successfully!")
+            store_and_analyze_history(market, collection_result['data'], days)
         else:
             print_error_message("Data collection failed")
     
     wait_for_keypress()
 
+def store_and_analyze_history(market: str, bars: List[Dict[str, Any]], days: int):
+    """
+    Add collected bars to the history store and show the resulting analysis.
+    
+    Args:
+        market (str): Market symbol
+        bars (List[Dict[str, Any]]): Collected OHLCV bars
+        days (int): Number of days collected
+    """
+    from models.market import MarketAnalyzer
+    from src.service.market_history import HistoryStore
+    
+    try:
+        HistoryStore.get_instance().append(market, bars)
+    except OSError as e:
+        print_error_message(f"Could not save history for {market}: {str(e)}")
+        return
+    
+    analysis = MarketAnalyzer.analyze_market(market, days)
+    if not analysis.get('success') or analysis.get('data_source') != 'history':
+        return
+    
+    half_life = analysis['half_life_minutes']
+    print(f"\n{BOLD}{GREEN}=== {days}-Day History Analysis for {market} ==={RESET}")
+    print(f"{BLUE}Bars Analyzed:{RESET} {analysis['bars_analyzed']}")
+    print(f"{BLUE}Realized Volatility (daily):{RESET} {analysis['realized_volatility'] * 100:.3f}%")
+    print(f"{BLUE}Trend Strength (ADX):{RESET} {analysis['adx']:.1f}")
+    print(f"{BLUE}Mean Reversion Half-Life:{RESET} "
+          f"{f'{half_life:.0f} min' if half_life is not None else 'none (trending)'}")
+    print(f"{BLUE}Most Active Session:{RESET} {analysis['most_active_session']}")
+
+def deduplicate_correlated_signals(signals: List['Signal'], markets: List[str]) -> List['Signal']:
+    """
+    Drop signals whose exposure duplicates a stronger signal on a correlated market.
+    
+    Args:
+        signals (List[Signal]): Signals from all selected markets
+        markets (List[str]): Markets the signals were generated for
+        
+    Returns:
+        List[Signal]: Signals that carry distinct exposure
+    """
+    from models.signal import get_live_api
+    from src.service.candle_buffer import CandleStore
+    from src.service.correlation_filter import CorrelationTracker, SignalDeduplicator
+    from src.service.result_tracker import signal_timeframe_minutes
+    
+    if len(signals) < 2:
+        return signals
+    
+    # Bring the rolling correlation matrix up to date with the latest candles
+    # (signals of one menu run share the selected timeframe)
+    minutes = signal_timeframe_minutes(signals[0])
+    tracker = CorrelationTracker.get_instance(minutes)
+    api = get_live_api()
+    if api is not None:
+        store = CandleStore.get_instance()
+        for market in markets:
+            try:
+                store.refresh(api, market, minutes)
+            except Exception as e:
+                print_error_message(f"Could not refresh candles for {market}: {str(e)}")
+        tracker.sync(store)
+    
+    kept, report = SignalDeduplicator(tracker).process(signals)
+    if report:
+        print(f"\n{YELLOW}🔗 Collapsed {len(report)} correlated signal(s):{RESET}")
+        for entry in report:
+            print(f"{DIM}   {entry['market']} {entry['signal_type']} at "
+                  f"{entry['signal_time'].strftime('%H:%M')} duplicates {entry['duplicate_of']} "
+                  f"(similarity {entry['similarity']:.2f}){RESET}")
+    return kept
+
+def get_result_tracker():
+    """Get the shared result tracker, settling in the background on the LIVE session."""
+    from models.signal import get_live_api
+    from src.service.result_tracker import ResultTracker
+    
+    tracker = ResultTracker.get_instance()
+    if tracker.api_provider is None:
+        tracker.api_provider = get_live_api
+    tracker.start()
+    return tracker
+
+def signal_results_menu():
+    """Display settled signal outcomes with win rate, streak and P&L."""
+    clear_screen()
+    print_header()
+    print(f"\n{BOLD}{BLUE}=== Signal Results & Win Rate ==={RESET}\n")
+    
+    tracker = get_result_tracker()
+    overall = tracker.get_overall()
+    
+    print(f"{BLUE}Settled:{RESET} {overall['total']} | {BLUE}Pending:{RESET} {tracker.pending} | "
+          f"{BLUE}Unsettled:{RESET} {tracker.unsettled}")
+    print(f"{BLUE}Win Rate:{RESET} {overall['win_rate'] * 100:.1f}% "
+          f"(last {tracker.window}: {overall['rolling_win_rate'] * 100:.1f}%)")
+    print(f"{BLUE}Streak:{RESET} {overall['streak']:+d} | {BLUE}P&L:{RESET} {overall['pnl']:+.2f} units")
+    
+    for dimension, title in (("market", "By Market"), ("timeframe", "By Timeframe"),
+                             ("strategy", "By Strategy")):
+        rows = tracker.get_stats(dimension)
+        if not rows:
+            continue
+        print(f"\n{BOLD}{YELLOW}{title}{RESET}")
+        print(f"{'Key':14s} {'Trades':>6s} {'W':>4s} {'L':>4s} {'Win%':>6s} {'Roll%':>6s} {'Streak':>6s} {'P&L':>8s}")
+        for row in rows:
+            rate_color = GREEN if row['win_rate'] >= 0.55 else YELLOW if row['win_rate'] >= 0.5 else RED
+            print(f"{str(row['key']):14s} {row['total']:6d} {row['wins']:4d} {row['losses']:4d} "
+                  f"{rate_color}{row['win_rate'] * 100:5.1f}%{RESET} {row['rolling_win_rate'] * 100:5.1f}% "
+                  f"{row['streak']:+6d} {row['pnl']:+8.2f}")
+    
+    if not overall['total']:
+        print(f"\n{YELLOW}No signals settled yet. Results appear once generated signals expire.{RESET}")
+    
+    wait_for_keypress()
+
 def timing_control_menu():
     """Menu for timing control settings."""
     clear_screen()
@@ -654,8 +953,7 @@ def timing_control_menu():
     elif choice == 4:
         display_timing_status()
     elif choice == 5:
-        timing_controller.last_signal_time = None
-        timing_controller.next_allowed_time = None
+        timing_controller.reset()
         print_success_message("Timing state reset")
         countdown_timer(2, "Returning to menu in")
     elif choice == 6:
@@ -701,29 +999,31 @@ def display_timing_status():
     print(f"{BLUE}Min Gap:{RESET} {timing_controller.min_gap_minutes} minutes")
     print(f"{BLUE}Max Gap:{RESET} {timing_controller.max_gap_minutes} minutes")
     
-    if timing_controller.last_signal_time:
-        print(f"{BLUE}Last Signal:{RESET} {timing_controller.last_signal_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        current_time = datetime.datetime.now()
-        elapsed = (current_time - timing_controller.last_signal_time).total_seconds() / 60
-        print(f"{BLUE}Elapsed:{RESET} {elapsed:.1f} minutes")
-        
-        can_emit = timing_controller.can_emit_signal()
-        print(f"{BLUE}Can Emit Signal:{RESET} {'Yes' if can_emit else 'No'}")
-        
-        if not can_emit:
-            wait_time = timing_controller.get_time_until_next_signal()
-            if wait_time:
-                print(f"{BLUE}Next Signal In:{RESET} {wait_time} seconds")
+    status_rows = timing_controller.get_status()
+    if status_rows:
+        for row in status_rows:
+            print(f"\n{BOLD}{row['market']} ({row['timeframe']}){RESET}")
+            print(f"{BLUE}Last Signal:{RESET} {row['last_signal_time'].strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"{BLUE}Elapsed:{RESET} {row['elapsed_minutes']:.1f} minutes")
+            print(f"{BLUE}Can Emit Signal:{RESET} {'Yes' if row['can_emit'] else 'No'}")
+            
+            if not row['can_emit']:
+                print(f"{BLUE}Next Signal In:{RESET} {row['seconds_until_allowed']} seconds")
+            
+            print(f"{BLUE}Should Force Signal:{RESET} {'Yes' if row['should_force'] else 'No'}")
         
-        should_force = timing_controller.should_force_signal()
-        print(f"{BLUE}Should Force Signal:{RESET} {'Yes' if should_force else 'No'}")
+        upcoming = timing_controller.next_due()
+        if upcoming:
+            due, kind, (market, timeframe) = upcoming
+            label = "allowed again" if kind == MarketTimingController.ALLOWED else "force deadline"
+            print(f"\n{BLUE}Next Due:{RESET} {market} ({timeframe}) {label} at "
+                  f"{datetime.datetime.fromtimestamp(due).strftime('%H:%M:%S')}")
     else:
         print(f"{BLUE}Last Signal:{RESET} None")
         print(f"{BLUE}Can Emit Signal:{RESET} Yes")
     
     print(f"\n{YELLOW}Press any key to continue...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
 def volatility_filter_menu():
     """Menu for configuring volatility filter settings."""
@@ -731,6 +1031,8 @@ def volatility_filter_menu():
     print_header()
     print(f"\n{BOLD}{BLUE}=== Volatility Filter Settings ==={RESET}\n")
     
+    from src.service.volatility_filter import VolatilityFilter
+    
     volatility_filter = VolatilityFilter()
     
     options = [
@@ -768,7 +1070,7 @@ def volatility_filter_menu():
     if choice != 7:
         volatility_filter_menu()
 
-def configure_volatility_thresholds(volatility_filter: VolatilityFilter):
+def configure_volatility_thresholds(volatility_filter: 'VolatilityFilter'):
     """Configure volatility filter thresholds."""
     print(f"\n{YELLOW}Current Volatility Thresholds:{RESET}")
     stats = volatility_filter.get_filter_stats()
@@ -800,7 +1102,7 @@ def configure_volatility_thresholds(volatility_filter: VolatilityFilter):
     print(f"\n{GREEN}Volatility thresholds updated successfully!{RESET}")
     time.sleep(2)
 
-def configure_position_sizing(volatility_filter: VolatilityFilter):
+def configure_position_sizing(volatility_filter: 'VolatilityFilter'):
     """Configure position sizing settings."""
     stats = volatility_filter.get_filter_stats()
     
@@ -832,7 +1134,7 @@ def configure_position_sizing(volatility_filter: VolatilityFilter):
     print(f"\n{GREEN}Position sizing settings updated successfully!{RESET}")
     time.sleep(2)
 
-def display_volatility_stats(volatility_filter: VolatilityFilter):
+def display_volatility_stats(volatility_filter: 'VolatilityFilter'):
     """Display volatility filter statistics."""
     stats = volatility_filter.get_filter_stats()
     
@@ -859,9 +1161,9 @@ def display_volatility_stats(volatility_filter: VolatilityFilter):
     print(f"{BLUE}Outlier Multiplier:{RESET} {stats['outlier_multiplier']}")
     
     print(f"\n{YELLOW}Press any key to continue...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
-def test_volatility_analysis(volatility_filter: VolatilityFilter):
+def test_volatility_analysis(volatility_filter: 'VolatilityFilter'):
     """Test volatility analysis with sample market data."""
     print(f"\n{YELLOW}Testing volatility analysis with sample market data...{RESET}")
     
@@ -907,7 +1209,7 @@ def test_volatility_analysis(volatility_filter: VolatilityFilter):
         print(f"{BLUE}Position Size Multiplier:{RESET} {analysis['position_size_multiplier']:.2f}x")
     
     print(f"\n{YELLOW}Press any key to continue...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
 def news_filter_menu():
     """Menu for configuring news filter settings."""
@@ -915,6 +1217,8 @@ def news_filter_menu():
     print_header()
     print(f"\n{BOLD}{BLUE}=== News Filter Settings ==={RESET}\n")
     
+    from src.service.news_filter import NewsFilter
+    
     news_filter = NewsFilter()
     
     options = [
@@ -949,7 +1253,7 @@ def news_filter_menu():
     if choice != 6:
         news_filter_menu()
 
-def configure_news_thresholds(news_filter: NewsFilter):
+def configure_news_thresholds(news_filter: 'NewsFilter'):
     """Configure news filter thresholds."""
     print(f"\n{YELLOW}Current Thresholds:{RESET}")
     print(f"Positive Threshold: {news_filter.positive_threshold}")
@@ -978,7 +1282,7 @@ def configure_news_thresholds(news_filter: NewsFilter):
     print(f"\n{GREEN}Thresholds updated successfully!{RESET}")
     time.sleep(2)
 
-def display_filter_stats(news_filter: NewsFilter):
+def display_filter_stats(news_filter: 'NewsFilter'):
     """Display news filter statistics."""
     stats = news_filter.get_filter_stats()
     
@@ -990,9 +1294,9 @@ def display_filter_stats(news_filter: NewsFilter):
     print(f"{BLUE}Major Event Keywords:{RESET} {stats['major_event_keywords']} keywords")
     
     print(f"\n{YELLOW}Press any key to continue...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
-def test_news_analysis(news_filter: NewsFilter):
+def test_news_analysis(news_filter: 'NewsFilter'):
     """Test news analysis with sample headlines."""
     print(f"\n{YELLOW}Testing news analysis with sample headlines...{RESET}")
     
@@ -1022,7 +1326,7 @@ def test_news_analysis(news_filter: NewsFilter):
         print(f"{YELLOW}Result: Neutral sentiment - signals would proceed normally{RESET}")
     
     print(f"\n{YELLOW}Press any key to continue...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
 def view_markets_menu():
     """Menu to view available markets with categories."""
@@ -1046,8 +1350,17 @@ def view_markets_menu():
     print(f"{BLUE}Forex Pairs: {len(FOREX_MARKETS)}{RESET}")
     print(f"{BLUE}OTC Pairs: {len(OTC_MARKETS)}{RESET}")
     
+    # Live ranking from candles already buffered this session
+    from src.service.market_screener import MarketScreener
+    results = MarketScreener().screen(MARKETS.keys())
+    if results:
+        print(f"\n{BOLD}{GREEN}Live Screener (top {min(5, len(results))} of {len(results)} buffered):{RESET}")
+        for row in results[:5]:
+            print(f"{GREEN}{row['market']:15s}{RESET} score {row['score']:+.2f} | "
+                  f"volatility {row['volatility'] * 100:.3f}% | trend {row['trend']:.2f}")
+    
     print(f"\n{YELLOW}Press any key to return to main menu...{RESET}")
-    keyboard.read_event()
+    read_key_event()
 
 def settings_menu():
     """Menu for application settings."""
@@ -1059,6 +1372,7 @@ def settings_menu():
         "Quotex API Settings",
         "Default Timeframe Settings",
         "Reset All Settings",
+        "Risk of Ruin Simulator",
         "About",
         "Back to Main Menu"
     ]
@@ -1075,14 +1389,78 @@ def settings_menu():
         print_success_message("Settings reset successfully!")
         countdown_timer(2, "Returning to menu in")
     elif choice == 4:
-        about_page()
+        risk_simulator_menu()
     elif choice == 5:
+        about_page()
+    elif choice == 6:
         return
     
     # Return to settings menu unless going back to main
-    if choice != 5:
+    if choice != 6:
         settings_menu()
 
+def read_float(prompt: str, default: float, min_value: float, max_value: float) -> float:
+    """Read a float within a range, falling back to the default on empty or bad input."""
+    try:
+        text = input(f"{prompt} [{default}]: ").strip()
+        value = float(text) if text else default
+        if min_value <= value <= max_value:
+            return value
+        print(f"{RED}Out of range. Using {default}.{RESET}")
+    except ValueError:
+        print(f"{RED}Invalid input. Using {default}.{RESET}")
+    return default
+
+def risk_simulator_menu():
+    """Run the Monte Carlo risk simulator for the Martingale staking rules."""
+    from src.models.risk_simulator import RiskSimulator
+    
+    clear_screen()
+    print_header()
+    print(f"\n{BOLD}{BLUE}=== Risk of Ruin Simulator ==={RESET}\n")
+    print(f"{YELLOW}Press Enter to keep a default.{RESET}\n")
+    
+    balance = read_float("Initial balance", 1000.0, 10.0, 10_000_000.0)
+    stake_percent = read_float("Base stake % of balance", 1.0, 0.1, 20.0)
+    max_tier = int(read_float("Max Martingale tier", 4, 1, 10))
+    daily_loss = read_float("Max daily loss %", 10.0, 1.0, 100.0)
+    payout = read_float("Payout (0.85 = 85%)", 0.85, 0.1, 2.0)
+    days = int(read_float("Trading days", 30, 1, 365))
+    trades_per_day = int(read_float("Trades per day", 20, 1, 200))
+    ruin = read_float("Ruin drawdown % from peak", 50.0, 5.0, 100.0) / 100
+    
+    win_rates = [0.50, 0.55, 0.60, 0.65]
+    observed = get_result_tracker().get_overall()
+    if observed['wins'] + observed['losses'] >= 20:
+        win_rates = sorted(set(win_rates + [round(observed['win_rate'], 3)]))
+    
+    simulator = RiskSimulator(balance, stake_percent, max_tier, daily_loss)
+    paths = 100_000
+    
+    started = time.perf_counter()
+    with StatusRenderer("Simulating trade sequences", total=len(win_rates)) as progress:
+        def on_result(done, total, result):
+            progress.update(current=done, detail=f"win rate {result['win_rate']:.1%} done")
+        
+        results = simulator.simulate_grid(win_rates, [payout], progress=on_result, paths=paths,
+                                          days=days, trades_per_day=trades_per_day, ruin_drawdown=ruin)
+    elapsed = time.perf_counter() - started
+    
+    print(f"\n{BOLD}{paths:,} paths x {days * trades_per_day} trades per win rate "
+          f"({elapsed:.1f}s){RESET}")
+    print(f"{DIM}Break-even win rate at {payout:.0%} payout: "
+          f"{RiskSimulator.breakeven_win_rate(payout):.1%}{RESET}\n")
+    print(f"{'Win%':>6s} {'Ruin%':>7s} {'E[P&L]':>10s} {'P&L p5':>10s} {'P&L p95':>10s} "
+          f"{'DD p50':>7s} {'DD p95':>7s} {'Profit%':>8s}")
+    for r in results:
+        ruin_color = GREEN if r['ruin_probability'] < 0.01 else YELLOW if r['ruin_probability'] < 0.1 else RED
+        print(f"{r['win_rate'] * 100:5.1f}% {ruin_color}{r['ruin_probability'] * 100:6.2f}%{RESET} "
+              f"{r['expected_pnl']:+10.2f} {r['pnl_percentiles'][5]:+10.2f} {r['pnl_percentiles'][95]:+10.2f} "
+              f"{r['max_drawdown_percentiles'][50] * 100:6.1f}% {r['max_drawdown_percentiles'][95] * 100:6.1f}% "
+              f"{r['profitable_probability'] * 100:7.1f}%")
+    
+    wait_for_keypress()
+
 def quotex_api_settings():
     """Configure Quotex API settings."""
     # Show connection animation
@@ -1161,7 +1539,372 @@ def about_page():
     
     wait_for_keypress()
 
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for interactive and headless modes."""
+    parser = argparse.ArgumentParser(
+        description="AFA-TRADING binary options signals generator. "
+                    "Run without a command for the interactive menu."
+    )
+    parser.add_argument("--no-animation", action="store_true",
+                        help="Skip startup and menu animations (same as AFA_NO_ANIMATION=1)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Report module import times and startup wall time, then exit")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--quiet", action="store_true",
+                           help="Only log warnings and errors (default for generate/daemon/backtest)")
+    verbosity.add_argument("--verbose", action="store_true",
+                           help="Log every API call and signal step")
+    parser.add_argument("--log-file",
+                        help="Also write all log levels, with timestamps, to this file")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    # Options shared by the headless commands
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--markets", required=True,
+                        help="Comma separated market symbols, e.g. EURUSD,GBPUSD")
+    common.add_argument("--accuracy", choices=["85%", "90%", "95%"], default="85%",
+                        help="Accuracy level label")
+    common.add_argument("--filter", dest="signal_filter", choices=["ALL", "BUY", "SELL"],
+                        default="ALL", help="Signal direction filter")
+    common.add_argument("--no-news-filter", action="store_true",
+                        help="Disable the news filter")
+    common.add_argument("--no-volatility-filter", action="store_true",
+                        help="Disable the volatility filter")
+    
+    generate_parser = subparsers.add_parser(
+        "generate", parents=[common],
+        help="Generate signals without the interactive UI",
+        description="Headless signal generation. Credentials are read from the "
+                    "AFA_USERNAME and AFA_PASSWORD environment variables."
+    )
+    generate_parser.add_argument("--timeframe", type=int, choices=[1, 5, 15], default=1,
+                                 help="Timeframe in minutes")
+    generate_parser.add_argument("--count", type=int, default=5,
+                                 help="Number of signals per market (1-10)")
+    generate_parser.add_argument("--martingale", action="store_true",
+                                 help="Add martingale follow-up signals")
+    generate_parser.add_argument("--days", type=int, default=7,
+                                 help="Days of analysis (1-30)")
+    generate_parser.add_argument("--format", choices=SIGNAL_FORMATS + ("npz",), default="jsonl",
+                                 help="Output format (npz is binary columnar)")
+    generate_parser.add_argument("--output", default="-",
+                                 help="Output file path, '-' for stdout")
+    
+    daemon_parser = subparsers.add_parser(
+        "daemon", parents=[common],
+        help="Run continuously and emit signals on every candle close",
+        description="Long-running signal daemon. Credentials are read from the "
+                    "AFA_USERNAME and AFA_PASSWORD environment variables."
+    )
+    daemon_parser.add_argument("--timeframes", default="1",
+                               help="Comma separated timeframes in minutes, e.g. 1,5")
+    daemon_parser.add_argument("--sink", action="append", default=[],
+                               help="Signal sink: stdout, file:PATH, socket:ADDRESS "
+                                    "(Unix path or host:port) or journal[:DIR]. "
+                                    "Repeatable; default stdout")
+    daemon_parser.add_argument("--min-gap", type=int, default=3,
+                               help="Minimum minutes between signals per market")
+    daemon_parser.add_argument("--max-gap", type=int, default=15,
+                               help="Minutes after which a blocked signal is forced out")
+    daemon_parser.add_argument("--balance", type=float,
+                               help="Account balance; enables stake sizing and exposure caps")
+    daemon_parser.add_argument("--stake-percent", type=float, default=1.0,
+                               help="Base stake as %% of balance (with --balance)")
+    daemon_parser.add_argument("--exposure-percent", type=float, default=20.0,
+                               help="Max open stake as %% of balance (with --balance)")
+    daemon_parser.add_argument("--currency-cap", type=float,
+                               help="Max open stake per currency (with --balance)")
+    
+    backtest_parser = subparsers.add_parser(
+        "backtest",
+        help="Backtest the strategy over stored market history",
+        description="Replay the trading strategy over the bar history saved by "
+                    "Historical Data Collection and trade the results through "
+                    "the risk manager."
+    )
+    backtest_parser.add_argument("--markets", required=True,
+                                 help="Comma separated market symbols, e.g. EURUSD,GBPUSD")
+    backtest_parser.add_argument("--balance", type=float, default=1000.0,
+                                 help="Starting balance")
+    backtest_parser.add_argument("--stake-percent", type=float, default=1.0,
+                                 help="Base stake as %% of balance")
+    backtest_parser.add_argument("--max-tier", type=int, default=4,
+                                 help="Maximum Martingale tier")
+    backtest_parser.add_argument("--daily-loss", type=float, default=10.0,
+                                 help="Maximum daily loss as %% of the starting balance")
+    backtest_parser.add_argument("--lookback", type=int, default=100,
+                                 help="Bars per strategy evaluation")
+    
+    return parser
+
+# Modules kept off the startup path; profile_startup() reports if any sneak back in
+DEFERRED_MODULES = ("numpy", "requests", "keyboard", "asyncio", "models.signal",
+                    "src.service.news_filter", "src.service.volatility_filter")
+
+def profile_startup(top: int = 15) -> int:
+    """
+    Measure how long importing this module takes in a fresh interpreter.
+    
+    Args:
+        top (int): Number of slowest imports to list
+        
+    Returns:
+        int: Process exit code
+    """
+    import subprocess
+    
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    wall = time.perf_counter() - started
+    
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative), name.strip()))
+    
+    if result.returncode != 0 or not timings:
+        print(f"❌ Startup profiling failed:\n{result.stderr[-2000:]}")
+        return 1
+    
+    print(f"{BOLD}Slowest imports (cumulative):{RESET}")
+    for cumulative, name in sorted(timings, reverse=True)[:top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+    
+    loaded = {name for _, name in timings}
+    eager = [m for m in DEFERRED_MODULES if m in loaded]
+    print(f"\n{BLUE}Interpreter + import wall time:{RESET} {wall:.3f}s")
+    if eager:
+        print(f"{YELLOW}Deferred modules imported at startup:{RESET} {', '.join(eager)}")
+    else:
+        print(f"{GREEN}✓ Heavy modules deferred:{RESET} {', '.join(DEFERRED_MODULES)}")
+    return 0
+
+def configure_logging(args: argparse.Namespace):
+    """
+    Set up logging for the chosen mode.
+    
+    Headless commands log warnings and errors to stderr so stdout carries only
+    signal records; the interactive menu also shows progress messages.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
+    from utils.log import setup_logging
+    
+    headless = args.command in ("generate", "daemon", "backtest")
+    if args.verbose:
+        mode = "verbose"
+    elif args.quiet or headless:
+        mode = "quiet"
+    else:
+        mode = "interactive"
+    setup_logging(mode, stream=sys.stderr if headless else None, log_file=args.log_file)
+
+def parse_markets(text: str) -> List[str]:
+    """Parse a comma separated market list, raising ValueError for unknown symbols."""
+    markets = [m.strip().upper() for m in text.split(",") if m.strip()]
+    unknown = [m for m in markets if m not in MARKETS]
+    if not markets or unknown:
+        raise ValueError(f"Unknown markets: {', '.join(unknown) or text}")
+    return markets
+
+def authenticate_from_env() -> bool:
+    """Authenticate headless runs with AFA_USERNAME/AFA_PASSWORD."""
+    store = get_credential_store()
+    if store.verify(os.environ.get("AFA_USERNAME", ""), os.environ.get("AFA_PASSWORD", "")):
+        return True
+    print("❌ Invalid or missing AFA_USERNAME/AFA_PASSWORD", file=sys.stderr)
+    return False
+
+def run_generate_command(args: argparse.Namespace) -> int:
+    """
+    Run the signal pipeline headlessly and write machine-readable output.
+    
+    Pipeline progress goes to stderr so stdout carries only signal records.
+    
+    Args:
+        args (argparse.Namespace): Parsed 'generate' arguments
+        
+    Returns:
+        int: Process exit code
+    """
+    from models.signal import generate_signals
+    
+    try:
+        markets = parse_markets(args.markets)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    if not 1 <= args.count <= 10 or not 1 <= args.days <= 30:
+        print("❌ --count must be 1-10 and --days must be 1-30", file=sys.stderr)
+        return 2
+    
+    if not authenticate_from_env():
+        return 1
+    
+    all_signals = []
+    started = time.perf_counter()
+    
+    with contextlib.redirect_stdout(sys.stderr):
+        for market in markets:
+            all_signals.extend(generate_signals(
+                market,
+                f"{args.timeframe} min",
+                args.accuracy,
+                args.count,
+                args.signal_filter,
+                1 if args.martingale else 0,
+                args.days,
+                "No" if args.no_news_filter else "Yes",
+                "No" if args.no_volatility_filter else "Yes"
+            ))
+    
+    elapsed = time.perf_counter() - started
+    
+    if args.output == "-" and args.format == "npz":
+        write_columnar(all_signals, sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    elif args.output == "-":
+        write_signals(all_signals, sys.stdout, args.format)
+        sys.stdout.flush()
+    elif args.format == "text":
+        with open(args.output, "w", newline="") as f:
+            write_signals(all_signals, f, args.format)
+    else:
+        export_signals(all_signals, args.output, args.format)
+    
+    rate = len(all_signals) / elapsed if elapsed > 0 else 0.0
+    print(f"✅ {len(all_signals)} signals for {len(markets)} markets in {elapsed:.3f}s "
+          f"({rate:.1f} signals/s)", file=sys.stderr)
+    
+    return 0 if all_signals else 1
+
+def run_daemon_command(args: argparse.Namespace) -> int:
+    """
+    Run the signal daemon until interrupted.
+    
+    Args:
+        args (argparse.Namespace): Parsed 'daemon' arguments
+        
+    Returns:
+        int: Process exit code
+    """
+    from src.models.risk_manager import RiskManager
+    from src.service.risk_pool import RiskPool
+    from src.service.signal_daemon import SignalDaemon, create_sink
+    
+    try:
+        markets = parse_markets(args.markets)
+        timeframes = [int(tf) for tf in args.timeframes.split(",") if tf.strip()]
+        if not timeframes or any(tf not in (1, 5, 15, 30, 60) for tf in timeframes):
+            raise ValueError("Timeframes must be among 1, 5, 15, 30, 60")
+        if not 1 <= args.min_gap < args.max_gap:
+            raise ValueError("--min-gap must be at least 1 and below --max-gap")
+        if args.balance is not None and args.balance <= 0:
+            raise ValueError("--balance must be positive")
+        # Sinks bind to the real stdout before pipeline chatter is redirected
+        sinks = [create_sink(spec) for spec in (args.sink or ["stdout"])]
+    except (ValueError, OSError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    if not authenticate_from_env():
+        return 1
+    
+    risk_pool = None
+    if args.balance is not None:
+        risk_pool = RiskPool(args.exposure_percent, args.currency_cap)
+        risk_pool.add_account("default", RiskManager(args.balance, args.stake_percent))
+    
+    daemon = SignalDaemon(
+        markets, timeframes, sinks,
+        accuracy=args.accuracy,
+        signal_filter=args.signal_filter,
+        news_filter=not args.no_news_filter,
+        volatility_filter=not args.no_volatility_filter,
+        min_gap_minutes=args.min_gap,
+        max_gap_minutes=args.max_gap,
+        risk_pool=risk_pool
+    )
+    
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            daemon.run_forever()
+        except KeyboardInterrupt:
+            daemon.stop()
+        except ConnectionError as e:
+            print(str(e))
+            return 1
+    
+    overall = daemon.tracker.get_overall()
+    print(f"✅ Daemon stopped: {daemon.stats['emitted']} signals emitted, "
+          f"{daemon.stats['evaluations']} evaluations, {overall['total']} settled "
+          f"({overall['win_rate'] * 100:.1f}% win rate, P&L {overall['pnl']:+.2f})", file=sys.stderr)
+    if risk_pool is not None:
+        account = risk_pool.get_account("default")
+        print(f"💰 Balance {account['balance']:.2f}, open exposure {account['open_exposure']:.2f}",
+              file=sys.stderr)
+    return 0
+
+def run_backtest_command(args: argparse.Namespace) -> int:
+    """
+    Backtest the strategy over stored history and print the results.
+    
+    Args:
+        args (argparse.Namespace): Parsed 'backtest' arguments
+        
+    Returns:
+        int: Process exit code
+    """
+    from src.models.risk_manager import RiskManager
+    from src.service.backtest import run_backtest
+    
+    try:
+        markets = parse_markets(args.markets)
+        if args.balance <= 0 or not 0 < args.stake_percent <= 100 or args.max_tier < 1:
+            raise ValueError("--balance, --stake-percent and --max-tier must be positive")
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    
+    if not authenticate_from_env():
+        return 1
+    
+    risk_manager = RiskManager(args.balance, args.stake_percent, args.max_tier, args.daily_loss)
+    report = run_backtest(markets, risk_manager, lookback=args.lookback)
+    if not report['results']:
+        print("❌ No settled signals; collect market history first", file=sys.stderr)
+        return 1
+    
+    print(f"📊 Backtest of {report['strategy']}: {report['signals']} signals, "
+          f"{report['trades']} trades, {report['skipped']} skipped by risk limits")
+    for row in report['stats']:
+        if row['dimension'] in ('all', 'market'):
+            label = "ALL" if row['dimension'] == 'all' else row['key']
+            print(f"   {label:<12} {row['total']:>5} settled  {row['win_rate'] * 100:5.1f}% win rate")
+    print(f"💰 Balance {args.balance:.2f} -> {report['balance']:.2f}")
+    return 0
+
 if __name__ == "__main__":
+    args = build_arg_parser().parse_args()
+    if args.profile_startup:
+        sys.exit(profile_startup())
+    if args.no_animation:
+        set_animations_enabled(False)
+    configure_logging(args)
+    if args.command == "generate":
+        sys.exit(run_generate_command(args))
+    if args.command == "daemon":
+        sys.exit(run_daemon_command(args))
+    if args.command == "backtest":
+        sys.exit(run_backtest_command(args))
+    
     try:
         if login():   # 👈 login check pehle
             main()    # 👈 phir signals wala program chalega
@@ -2,9 +2,11 @@
 Enhanced Market data models with categorized selection and improved data handling.
 """
 
+import heapq
 import random
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Hashable
 from datetime import datetime, timedelta
 
 # Categorized markets dictionary
@@ -94,6 +96,32 @@ class MarketSelector:
         
         return selected
     
+    def select_top_markets(self, market_dict: Dict[str, Dict], count: Optional[int] = None,
+                           timeframe: int = 1, screener=None) -> List[str]:
+        """
+        Select the best scoring markets from the live candle screener.
+        
+        Args:
+            market_dict (Dict[str, Dict]): Dictionary of markets to select from
+            count (Optional[int]): Number of markets to select, defaults to default_random_count
+            timeframe (int): Candle timeframe to screen on
+            screener (Optional[MarketScreener]): Screener to use, a default one if omitted
+            
+        Returns:
+            List[str]: Selected market symbols, best first (random if no candles are buffered)
+        """
+        from src.service.market_screener import MarketScreener
+        
+        if count is None:
+            count = self.default_random_count
+        count = max(self.min_random_count, min(count, len(market_dict), self.max_random_count))
+        
+        screener = screener or MarketScreener()
+        selected = screener.top(market_dict.keys(), count, timeframe)
+        if not selected:
+            return self.select_random_markets(market_dict, count)
+        return selected
+    
     def validate_choice(self, choice: str, max_options: int) -> Optional[int]:
         """
         Validate user choice input.
@@ -218,6 +246,307 @@ class TimingController:
             'next_allowed': self.next_allowed_time
         }
 
+class MarketTimingController:
+    """
+    Per-market signal timing control backed by min-heaps.
+    
+    Each (market, timeframe) pair has its own next-allowed and force-deadline
+    times, and optionally a scheduled candle-close evaluation. Deadlines live
+    in a heap, so finding the next one is O(log n) and callers can await it
+    instead of polling every pair with datetime.now().
+    """
+    
+    ALLOWED = 'allowed'
+    FORCE = 'force'
+    CLOSE = 'close'
+    
+    def __init__(self, min_gap_minutes: int = 3, max_gap_minutes: int = 15):
+        """
+        Initialize per-market timing controller.
+        
+        Args:
+            min_gap_minutes (int): Minimum gap between signals of one pair
+            max_gap_minutes (int): Maximum gap before a pair's signal is forced
+        """
+        self.enabled = True
+        self.min_gap_minutes = min_gap_minutes
+        self.max_gap_minutes = max_gap_minutes
+        
+        # key -> (last_signal_ts, next_allowed_ts, force_deadline_ts)
+        self._state: Dict[Hashable, Tuple[float, float, float]] = {}
+        # key -> epoch seconds of the next scheduled evaluation
+        self._closes: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, int, str, Hashable]] = []
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._loop = None
+        self._wakeup = None
+        self._interrupted = False
+    
+    @staticmethod
+    def _key(market: str, timeframe: Hashable = None) -> Tuple[str, Hashable]:
+        return (market, timeframe)
+    
+    def _push(self, due: float, kind: str, key: Hashable):
+        self._counter += 1
+        heapq.heappush(self._heap, (due, self._counter, kind, key))
+    
+    def _is_current(self, due: float, kind: str, key: Hashable) -> bool:
+        """Heap entries are never removed eagerly; stale ones are skipped."""
+        if kind == self.CLOSE:
+            return self._closes.get(key) == due
+        state = self._state.get(key)
+        if state is None:
+            return False
+        return due == (state[1] if kind == self.ALLOWED else state[2])
+    
+    def _notify(self):
+        """Wake a coroutine blocked in wait_until_due() after a schedule change."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass
+    
+    def can_emit_signal(self, market: str, timeframe: Hashable = None, now: Optional[float] = None) -> bool:
+        """
+        Check if a pair can emit a signal now.
+        
+        Args:
+            market (str): Market symbol
+            timeframe (Hashable): Timeframe the gap applies to
+            now (Optional[float]): Epoch seconds, defaults to time.time()
+            
+        Returns:
+            bool: True if signal can be emitted
+        """
+        if not self.enabled:
+            return True
+        
+        state = self._state.get(self._key(market, timeframe))
+        if state is None:
+            return True
+        
+        now = time.time() if now is None else now
+        return now >= state[1]
+    
+    def should_force_signal(self, market: str, timeframe: Hashable = None, now: Optional[float] = None) -> bool:
+        """
+        Check if a pair's signal should be forced due to max gap.
+        
+        Args:
+            market (str): Market symbol
+            timeframe (Hashable): Timeframe the gap applies to
+            now (Optional[float]): Epoch seconds, defaults to time.time()
+            
+        Returns:
+            bool: True if signal should be forced
+        """
+        if not self.enabled:
+            return False
+        
+        state = self._state.get(self._key(market, timeframe))
+        if state is None:
+            return False
+        
+        now = time.time() if now is None else now
+        return now >= state[2]
+    
+    def get_time_until_next_signal(self, market: str, timeframe: Hashable = None) -> Optional[int]:
+        """
+        Get seconds until a pair can emit again.
+        
+        Returns:
+            Optional[int]: Seconds until next signal, None if can emit now
+        """
+        if not self.enabled:
+            return None
+        
+        state = self._state.get(self._key(market, timeframe))
+        if state is None:
+            return None
+        
+        remaining = state[1] - time.time()
+        return int(remaining) if remaining > 0 else None
+    
+    def get_last_signal_time(self, market: str, timeframe: Hashable = None) -> Optional[datetime]:
+        """Get the last emission time of a pair."""
+        state = self._state.get(self._key(market, timeframe))
+        return datetime.fromtimestamp(state[0]) if state else None
+    
+    def record_signal_emission(self, market: str, timeframe: Hashable = None,
+                               forced: bool = False, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Record that a pair emitted a signal and schedule its next deadlines.
+        
+        Args:
+            market (str): Market symbol
+            timeframe (Hashable): Timeframe the gap applies to
+            forced (bool): Whether this was a forced signal
+            now (Optional[float]): Epoch seconds, defaults to time.time()
+            
+        Returns:
+            Dict[str, Any]: Timing information
+        """
+        key = self._key(market, timeframe)
+        now = time.time() if now is None else now
+        
+        with self._lock:
+            previous = self._state.get(key)
+            next_allowed = now + self.min_gap_minutes * 60
+            force_deadline = now + self.max_gap_minutes * 60
+            
+            self._state[key] = (now, next_allowed, force_deadline)
+            self._push(next_allowed, self.ALLOWED, key)
+            self._push(force_deadline, self.FORCE, key)
+            
+            self._compact_heap()
+        
+        self._notify()
+        
+        return {
+            'market': market,
+            'timeframe': timeframe,
+            'emission_time': datetime.fromtimestamp(now),
+            'elapsed_minutes': (now - previous[0]) / 60 if previous else None,
+            'timing_status': 'forced' if forced else 'normal',
+            'next_allowed': datetime.fromtimestamp(next_allowed)
+        }
+    
+    def schedule_close(self, market: str, timeframe: Hashable, due: float):
+        """
+        Schedule a pair's next candle-close evaluation.
+        
+        The entry is returned by pop_due() as kind CLOSE; scheduling again
+        replaces the pending one.
+        
+        Args:
+            market (str): Market symbol
+            timeframe (Hashable): Timeframe of the candle
+            due (float): Epoch seconds when the pair should be evaluated
+        """
+        key = self._key(market, timeframe)
+        with self._lock:
+            self._closes[key] = due
+            self._push(due, self.CLOSE, key)
+            self._compact_heap()
+        self._notify()
+    
+    def _compact_heap(self):
+        """Drop stale entries once they dominate the heap (lock held)."""
+        if len(self._heap) > 4 * (len(self._state) + len(self._closes)) + 64:
+            self._heap = [e for e in self._heap if self._is_current(e[0], e[2], e[3])]
+            heapq.heapify(self._heap)
+    
+    def next_due(self) -> Optional[Tuple[float, str, Hashable]]:
+        """
+        Get the earliest pending deadline without consuming it.
+        
+        Returns:
+            Optional[Tuple[float, str, Hashable]]: (epoch seconds, kind, key) or None
+        """
+        with self._lock:
+            while self._heap and not self._is_current(self._heap[0][0], self._heap[0][2], self._heap[0][3]):
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            due, _, kind, key = self._heap[0]
+            return due, kind, key
+    
+    def pop_due(self, now: Optional[float] = None) -> List[Tuple[str, Hashable]]:
+        """
+        Consume every deadline that has passed.
+        
+        Args:
+            now (Optional[float]): Epoch seconds, defaults to time.time()
+            
+        Returns:
+            List[Tuple[str, Hashable]]: (kind, key) pairs in deadline order
+        """
+        now = time.time() if now is None else now
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if self._is_current(entry[0], entry[2], entry[3]):
+                    due.append((entry[2], entry[3]))
+                    if entry[2] == self.CLOSE:
+                        del self._closes[entry[3]]
+        return due
+    
+    async def wait_until_due(self) -> List[Tuple[str, Hashable]]:
+        """
+        Sleep until the next deadline passes, then consume the due ones.
+        
+        New emissions recorded while waiting (from any thread) re-arm the wait,
+        so an earlier deadline is never missed. interrupt() makes it return
+        early with an empty list.
+        
+        Returns:
+            List[Tuple[str, Hashable]]: (kind, key) pairs that became due
+        """
+        import asyncio
+
+        wakeup = asyncio.Event()
+        self._wakeup, self._loop = wakeup, asyncio.get_running_loop()
+        
+        try:
+            while True:
+                wakeup.clear()
+                if self._interrupted:
+                    self._interrupted = False
+                    return []
+                upcoming = self.next_due()
+                timeout = None if upcoming is None else max(0.0, upcoming[0] - time.time())
+                
+                if timeout == 0.0:
+                    due = self.pop_due()
+                    if due:
+                        return due
+                    continue
+                
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup, self._loop = None, None
+    
+    def interrupt(self):
+        """Make a pending (or the next) wait_until_due() return without waiting."""
+        self._interrupted = True
+        self._notify()
+    
+    def get_status(self) -> List[Dict[str, Any]]:
+        """
+        Get the timing state of every tracked pair.
+        
+        Returns:
+            List[Dict[str, Any]]: One entry per pair, sorted by next allowed time
+        """
+        now = time.time()
+        rows = []
+        for (market, timeframe), (last, allowed, deadline) in sorted(self._state.items(), key=lambda item: item[1][1]):
+            rows.append({
+                'market': market,
+                'timeframe': timeframe,
+                'last_signal_time': datetime.fromtimestamp(last),
+                'elapsed_minutes': (now - last) / 60,
+                'can_emit': not self.enabled or now >= allowed,
+                'seconds_until_allowed': max(0, int(allowed - now)),
+                'should_force': self.enabled and now >= deadline
+            })
+        return rows
+    
+    def reset(self):
+        """Forget all recorded emissions and scheduled evaluations."""
+        with self._lock:
+            self._state.clear()
+            self._closes.clear()
+            self._heap.clear()
+        self._notify()
+
 class HistoricalDataCollector:
     """Real-time historical data collection with proper error handling."""
     
@@ -425,13 +754,19 @@ class HistoricalDataCollector:
 
 class MarketAnalyzer:
     """
-    Enhanced market analyzer with proper error handling.
+    Enhanced market analyzer backed by the stored bar history.
     """
     
     @staticmethod
     def analyze_market(market_name, days, use_news_filter=True):
         """
-        Analyze a market for the given number of days with enhanced error handling.
+        Analyze a market over the last ``days`` of stored history.
+        
+        Realized volatility, ADX-based trend strength, mean-reversion
+        half-life and session profile come from HistoryAnalyzer, which caches
+        per market/day range and updates incrementally as bars are added.
+        Without stored history the trend strength falls back to the static
+        volatility label.
         
         Args:
             market_name (str): The market to analyze
@@ -441,6 +776,8 @@ class MarketAnalyzer:
         Returns:
             dict: Analysis results
         """
+        from src.service.market_history import HistoryAnalyzer
+        
         try:
             if market_name not in MARKETS:
                 return {"success": False, "error": "Market not found"}
@@ -448,31 +785,46 @@ class MarketAnalyzer:
             market_info = MARKETS[market_name]
             volatility = market_info["volatility"]
             
-            # Simulate different trend strengths based on volatility
-            trend_strength = {
-                "low": 0.3,
-                "medium": 0.5,
-                "high": 0.7,
-                "very high": 0.9
-            }.get(volatility, 0.5)
-            
-            # Apply news filter effect (simulated)
-            if use_news_filter and str(use_news_filter).lower() == "yes":
-                trend_strength *= 1.2  # News filter improves trend detection
-            
-            return {
+            result = {
                 "success": True,
                 "market": market_name,
                 "days_analyzed": days,
-                "trend_strength": min(trend_strength, 1.0),  # Cap at 1.0
                 "volatility": volatility,
                 "news_filtered": use_news_filter,
                 "category": market_info.get("category", "unknown")
             }
             
+            stats = HistoryAnalyzer.get_instance().analyze(market_name, days)
+            if stats is None:
+                # No stored bars yet: estimate from the volatility label
+                result.update({
+                    "trend_strength": {
+                        "low": 0.3,
+                        "medium": 0.5,
+                        "high": 0.7,
+                        "very high": 0.9
+                    }.get(volatility, 0.5),
+                    "data_source": "metadata"
+                })
+                return result
+            
+            result.update({
+                "trend_strength": stats["trend_strength"],
+                "adx": stats["adx"],
+                "realized_volatility": stats["realized_volatility"],
+                "half_life_minutes": stats["half_life_minutes"],
+                "sessions": stats["sessions"],
+                "most_active_session": stats["most_active_session"],
+                "bars_analyzed": stats["bars"],
+                "period_start": stats["start"],
+                "period_end": stats["end"],
+                "data_source": "history"
+            })
+            return result
+            
         except Exception as e:
             return {
                 "success": False,
                 "error": f"Analysis failed: {str(e)}",
                 "market": market_name
-            }
\ No newline at end of file
+            }
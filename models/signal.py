@@ -3,21 +3,43 @@ Signal generation with REAL Quotex API integration ONLY.
 NO SIMULATION OR DUMMY DATA.
 """
 
+import bisect
 import random
 import datetime
 import time
 import json
-import asyncio
+import numpy as np
 from typing import List, Dict, Optional, Any
 from src.api.quotex_api import QuotexAPI
 from src.service.news_filter import NewsFilter
 from src.service.volatility_filter import VolatilityFilter
+from src.service.event_loop import BackgroundLoop
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Strength names indexed by SignalBatch strength codes
+STRENGTH_LEVELS = ('BLOCKED', 'LOW', 'MEDIUM', 'HIGH', 'STRONG', 'VERY_STRONG')
+
+# Confidence at which each level above LOW starts
+STRENGTH_THRESHOLDS = (0.75, 0.80, 0.85, 0.90)
+
+BLOCKING_NEWS_RESULTS = ('negative_sentiment',)
+BLOCKING_VOLATILITY_RESULTS = ('outlier_detected', 'blocked')
 
 class Signal:
     """
     Trading signal class for REAL data only.
+    
+    Uses __slots__ to avoid a per-instance __dict__. Empty filter results are
+    not stored, and whether the filters block the signal is decided once when
+    a result is assigned rather than on every strength lookup.
     """
     
+    __slots__ = ('market', 'timeframe', 'accuracy', 'signal_type', 'signal_time',
+                 'confidence', 'position_size_multiplier', 'real_data',
+                 '_news_filter_result', '_volatility_filter_result', '_blocked')
+    
     def __init__(self, market, timeframe, accuracy, signal_type, signal_time=None, 
                  confidence=None, news_filter_result=None, volatility_filter_result=None):
         """
@@ -38,8 +60,9 @@ class Signal:
         self.accuracy = accuracy
         self.signal_type = signal_type
         self.confidence = confidence or 0.75
-        self.news_filter_result = news_filter_result or {}
-        self.volatility_filter_result = volatility_filter_result or {}
+        self._news_filter_result = news_filter_result or None
+        self._volatility_filter_result = volatility_filter_result or None
+        self._blocked = self._is_blocked()
         self.position_size_multiplier = 1.0
         self.real_data = True
         
@@ -51,36 +74,348 @@ class Signal:
         else:
             self.signal_time = signal_time
     
+    def _is_blocked(self) -> bool:
+        news = self._news_filter_result
+        volatility = self._volatility_filter_result
+        return bool((news and news.get('filter_result') in BLOCKING_NEWS_RESULTS) or
+                    (volatility and volatility.get('filter_result') in BLOCKING_VOLATILITY_RESULTS))
+    
+    @property
+    def news_filter_result(self) -> Dict[str, Any]:
+        """News filter analysis results ({} when the filter did not run)."""
+        return self._news_filter_result or {}
+    
+    @news_filter_result.setter
+    def news_filter_result(self, value):
+        self._news_filter_result = value or None
+        self._blocked = self._is_blocked()
+    
+    @property
+    def volatility_filter_result(self) -> Dict[str, Any]:
+        """Volatility filter analysis results ({} when the filter did not run)."""
+        return self._volatility_filter_result or {}
+    
+    @volatility_filter_result.setter
+    def volatility_filter_result(self, value):
+        self._volatility_filter_result = value or None
+        self._blocked = self._is_blocked()
+    
     @property
     def time(self):
         """Format the signal time as HH:MM."""
         return self.signal_time.strftime("%H:%M")
     
+    @property
+    def strength_code(self) -> int:
+        """Index of the signal strength in STRENGTH_LEVELS."""
+        if self._blocked:
+            return 0
+        return bisect.bisect_right(STRENGTH_THRESHOLDS, self.confidence) + 1
+    
     @property
     def strength(self):
         """Get signal strength based on confidence and filters."""
-        # Check if blocked by filters
-        if (self.news_filter_result.get('filter_result') == 'negative_sentiment' or
-            self.volatility_filter_result.get('filter_result') in ['outlier_detected', 'blocked']):
-            return 'BLOCKED'
-        
-        # Strength based on confidence
-        if self.confidence >= 0.90:
-            return 'VERY_STRONG'
-        elif self.confidence >= 0.85:
-            return 'STRONG'
-        elif self.confidence >= 0.80:
-            return 'HIGH'
-        elif self.confidence >= 0.75:
-            return 'MEDIUM'
-        else:
-            return 'LOW'
+        return STRENGTH_LEVELS[self.strength_code]
     
     def __str__(self):
         """String representation of the signal."""
         direction = "CALL" if self.signal_type == "BUY" else "PUT"
         confidence_pct = int(self.confidence * 100)
         return f"{self.time} {self.market} {direction} ({confidence_pct}% - {self.strength})"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the signal to a plain dictionary for machine-readable output.
+        
+        Returns:
+            Dict[str, Any]: Signal fields with the signal time in ISO format
+        """
+        return {
+            'market': self.market,
+            'timeframe': self.timeframe,
+            'accuracy': self.accuracy,
+            'signal_type': self.signal_type,
+            'signal_time': self.signal_time.isoformat(),
+            'confidence': self.confidence,
+            'strength': self.strength,
+            'position_size_multiplier': self.position_size_multiplier,
+            'news_filter_result': self.news_filter_result,
+            'volatility_filter_result': self.volatility_filter_result
+        }
+    
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Signal':
+        """
+        Rebuild a signal from a dictionary produced by to_dict().
+        
+        Args:
+            record (Dict[str, Any]): Signal fields; signal_time may be a datetime or ISO string
+            
+        Returns:
+            Signal: Restored signal (strength is derived, so it is not read back)
+        """
+        signal_time = record.get('signal_time')
+        if isinstance(signal_time, str):
+            signal_time = datetime.datetime.fromisoformat(signal_time)
+        
+        signal = cls(
+            record['market'],
+            record['timeframe'],
+            record['accuracy'],
+            record['signal_type'],
+            signal_time,
+            news_filter_result=record.get('news_filter_result') or {},
+            volatility_filter_result=record.get('volatility_filter_result') or {}
+        )
+        # Set directly so a stored 0.0 is not replaced by the constructor default
+        signal.confidence = float(record['confidence'])
+        signal.position_size_multiplier = float(record.get('position_size_multiplier', 1.0))
+        return signal
+
+# Record layout of SignalBatch (28 bytes per signal)
+SIGNAL_BATCH_DTYPE = np.dtype([
+    ('market_id', np.uint16),
+    ('timeframe', np.uint16),
+    ('direction', np.int8),          # 1 BUY, -1 SELL
+    ('strength', np.uint8),          # index into STRENGTH_LEVELS
+    ('timestamp', np.int64),         # microseconds since 1970-01-01 (naive local time)
+    ('confidence', np.float64),
+    ('multiplier', np.float64)
+])
+
+_BATCH_EPOCH = datetime.datetime(1970, 1, 1)
+
+def strength_codes(confidence: np.ndarray, blocked: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Vectorised Signal.strength_code.
+    
+    Args:
+        confidence (np.ndarray): Confidence values
+        blocked (Optional[np.ndarray]): Boolean mask of filter-blocked signals
+        
+    Returns:
+        np.ndarray: uint8 indexes into STRENGTH_LEVELS
+    """
+    codes = np.searchsorted(STRENGTH_THRESHOLDS, confidence, side='right').astype(np.uint8) + 1
+    if blocked is not None:
+        codes[blocked] = 0
+    return codes
+
+class SignalBatch:
+    """
+    Columnar container for many signals backed by one NumPy structured array.
+    
+    Markets and accuracy labels are stored once; filter result dicts are not
+    kept, only their effect on strength. Indexing with an int returns a
+    Signal, with a slice or boolean mask a new SignalBatch sharing the labels.
+    """
+    
+    def __init__(self, records: np.ndarray, markets: List[str], accuracy: str = ""):
+        """
+        Initialize signal batch.
+        
+        Args:
+            records (np.ndarray): Array with SIGNAL_BATCH_DTYPE
+            markets (List[str]): Market symbols indexed by market_id
+            accuracy (str): Accuracy label shared by the batch
+        """
+        self.records = records
+        self.markets = markets
+        self.accuracy = accuracy
+    
+    @classmethod
+    def from_signals(cls, signals: List[Signal]) -> 'SignalBatch':
+        """
+        Build a batch from Signal objects.
+        
+        Args:
+            signals (List[Signal]): Signals to pack
+            
+        Returns:
+            SignalBatch: Packed signals in the same order
+        """
+        market_ids: Dict[str, int] = {}
+        records = np.empty(len(signals), dtype=SIGNAL_BATCH_DTYPE)
+        micro = datetime.timedelta(microseconds=1)
+        
+        records['market_id'] = [market_ids.setdefault(s.market, len(market_ids)) for s in signals]
+        records['timeframe'] = [int(str(s.timeframe).split()[0]) for s in signals]
+        records['direction'] = [1 if s.signal_type == "BUY" else -1 for s in signals]
+        records['strength'] = [s.strength_code for s in signals]
+        records['timestamp'] = [(s.signal_time.replace(tzinfo=None) - _BATCH_EPOCH) // micro
+                                for s in signals]
+        records['confidence'] = [s.confidence for s in signals]
+        records['multiplier'] = [s.position_size_multiplier for s in signals]
+        
+        accuracy = signals[0].accuracy if signals else ""
+        return cls(records, list(market_ids), accuracy)
+    
+    @classmethod
+    def concatenate(cls, batches: List['SignalBatch']) -> 'SignalBatch':
+        """
+        Join batches, remapping market ids onto one shared market list.
+        
+        Args:
+            batches (List[SignalBatch]): Batches to join
+            
+        Returns:
+            SignalBatch: Combined batch
+        """
+        markets: Dict[str, int] = {}
+        parts = []
+        for batch in batches:
+            remap = np.array([markets.setdefault(m, len(markets)) for m in batch.markets] or [0],
+                             dtype=np.uint16)
+            part = batch.records.copy()
+            part['market_id'] = remap[part['market_id']]
+            parts.append(part)
+        
+        records = np.concatenate(parts) if parts else np.empty(0, dtype=SIGNAL_BATCH_DTYPE)
+        accuracy = batches[0].accuracy if batches else ""
+        return cls(records, list(markets), accuracy)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def __iter__(self):
+        for i in range(len(self.records)):
+            yield self[i]
+    
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self._to_signal(self.records[key])
+        return SignalBatch(self.records[key], self.markets, self.accuracy)
+    
+    def _to_signal(self, record) -> Signal:
+        signal_time = _BATCH_EPOCH + datetime.timedelta(microseconds=int(record['timestamp']))
+        signal = Signal(
+            self.markets[record['market_id']],
+            f"{int(record['timeframe'])} min",
+            self.accuracy,
+            "BUY" if record['direction'] > 0 else "SELL",
+            signal_time
+        )
+        signal.confidence = float(record['confidence'])
+        signal.position_size_multiplier = float(record['multiplier'])
+        if record['strength'] == 0:
+            signal.volatility_filter_result = {'filter_result': 'blocked'}
+        return signal
+    
+    def to_signals(self) -> List[Signal]:
+        """Unpack every record into a Signal (filter details are not restored)."""
+        return list(self)
+    
+    @property
+    def market(self) -> np.ndarray:
+        """Market symbol of each signal."""
+        return np.array(self.markets, dtype=object)[self.records['market_id']]
+    
+    @property
+    def signal_times(self) -> np.ndarray:
+        """Signal times as datetime64[us]."""
+        return self.records['timestamp'].astype('datetime64[us]')
+    
+    @property
+    def strength(self) -> np.ndarray:
+        """Strength name of each signal."""
+        return np.array(STRENGTH_LEVELS, dtype=object)[self.records['strength']]
+    
+    def select(self, market: Optional[str] = None, signal_type: Optional[str] = None,
+               min_confidence: Optional[float] = None, include_blocked: bool = True,
+               start: Optional[datetime.datetime] = None,
+               end: Optional[datetime.datetime] = None) -> 'SignalBatch':
+        """
+        Filter the batch with one vectorised mask.
+        
+        Args:
+            market (Optional[str]): Keep only this market
+            signal_type (Optional[str]): Keep only 'BUY' or 'SELL'
+            min_confidence (Optional[float]): Minimum confidence
+            include_blocked (bool): Keep signals blocked by the filters
+            start (Optional[datetime]): Inclusive lower bound on signal time
+            end (Optional[datetime]): Exclusive upper bound on signal time
+            
+        Returns:
+            SignalBatch: Matching signals
+        """
+        records = self.records
+        mask = np.ones(len(records), dtype=bool)
+        
+        if market is not None:
+            if market not in self.markets:
+                return self[np.zeros(len(records), dtype=bool)]
+            mask &= records['market_id'] == self.markets.index(market)
+        if signal_type is not None:
+            mask &= records['direction'] == (1 if signal_type == "BUY" else -1)
+        if min_confidence is not None:
+            mask &= records['confidence'] >= min_confidence
+        if not include_blocked:
+            mask &= records['strength'] != 0
+        if start is not None:
+            mask &= records['timestamp'] >= (start - _BATCH_EPOCH) // datetime.timedelta(microseconds=1)
+        if end is not None:
+            mask &= records['timestamp'] < (end - _BATCH_EPOCH) // datetime.timedelta(microseconds=1)
+        
+        return self[mask]
+    
+    def sort_by_time(self) -> 'SignalBatch':
+        """Get the batch ordered by signal time (stable)."""
+        return self[np.argsort(self.records['timestamp'], kind='stable')]
+    
+    def counts_by_market(self) -> Dict[str, int]:
+        """Count signals per market."""
+        counts = np.bincount(self.records['market_id'], minlength=len(self.markets))
+        return {market: int(count) for market, count in zip(self.markets, counts)}
+    
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregate statistics of the batch.
+        
+        Returns:
+            Dict[str, Any]: Counts by direction and strength, mean confidence and multiplier
+        """
+        records = self.records
+        strength_counts = np.bincount(records['strength'], minlength=len(STRENGTH_LEVELS))
+        return {
+            'total': len(records),
+            'buy': int(np.count_nonzero(records['direction'] > 0)),
+            'sell': int(np.count_nonzero(records['direction'] < 0)),
+            'by_strength': {name: int(count) for name, count in zip(STRENGTH_LEVELS, strength_counts)},
+            'mean_confidence': float(records['confidence'].mean()) if len(records) else 0.0,
+            'mean_multiplier': float(records['multiplier'].mean()) if len(records) else 0.0
+        }
+
+# Connected API session shared by every generation request in this process
+_live_api = None
+
+def get_live_api() -> Optional[QuotexAPI]:
+    """
+    Get the shared LIVE Quotex session, connecting it on first use.
+    
+    Returns:
+        Optional[QuotexAPI]: Connected API or None if the connection failed
+    """
+    global _live_api
+    
+    if _live_api is not None and _live_api.connected:
+        return _live_api
+    
+    try:
+        api = QuotexAPI(use_real_api=True)
+        
+        logger.info("🔗 Connecting to LIVE Quotex API...")
+        BackgroundLoop.get_instance().run(api.connect())
+        
+        if not api.connected:
+            logger.error("❌ Failed to connect to LIVE Quotex")
+            return None
+        
+        _live_api = api
+        return api
+        
+    except Exception as e:
+        logger.error("❌ LIVE connection error: %s", e)
+        return None
 
 async def get_real_quotex_signal(market: str, timeframe: int = 1) -> Optional[Dict[str, Any]]:
     """
@@ -98,25 +433,25 @@ async def get_real_quotex_signal(market: str, timeframe: int = 1) -> Optional[Di
         
         # Connect to LIVE Quotex
         if not api.connected:
-            print("🔗 Connecting to LIVE Quotex API...")
+            logger.info("🔗 Connecting to LIVE Quotex API...")
             await api.connect()
         
         if not api.connected:
-            print("❌ Failed to connect to LIVE Quotex")
+            logger.error("❌ Failed to connect to LIVE Quotex")
             return None
         
         # Get LIVE signal
         signal_data = api.get_signal(market, timeframe)
         
         if signal_data and signal_data.get('source') == 'quotex_live':
-            print(f"✅ LIVE signal from Quotex: {market} {signal_data['direction'].upper()}")
+            logger.debug("✅ LIVE signal from Quotex: %s %s", market, signal_data['direction'].upper())
             return signal_data
         else:
-            print(f"❌ No LIVE signal available for {market}")
+            logger.warning("❌ No LIVE signal available for %s", market)
             return None
             
     except Exception as e:
-        print(f"❌ LIVE signal error: {str(e)}")
+        logger.error("❌ LIVE signal error: %s", e)
         return None
 
 def get_real_quotex_signal_sync(market: str, timeframe: int = 1) -> Optional[Dict[str, Any]]:
@@ -131,21 +466,15 @@ def get_real_quotex_signal_sync(market: str, timeframe: int = 1) -> Optional[Dic
         Optional[Dict[str, Any]]: LIVE signal data from Quotex or None
     """
     try:
-        # Create or get event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        # Run the LIVE async function
-        return loop.run_until_complete(get_real_quotex_signal(market, timeframe))
+        # Run the LIVE async function on the shared background loop
+        return BackgroundLoop.get_instance().run(get_real_quotex_signal(market, timeframe))
         
     except Exception as e:
-        print(f"❌ LIVE sync wrapper error: {str(e)}")
+        logger.error("❌ LIVE sync wrapper error: %s", e)
         return None
 
-def get_real_market_data(market: str, timeframe: int = 1, count: int = 100) -> Optional[Dict[str, Any]]:
+def get_real_market_data(market: str, timeframe: int = 1, count: int = 100,
+                         api: Optional[QuotexAPI] = None) -> Optional[Dict[str, Any]]:
     """
     Get LIVE market data from Quotex - REAL CONNECTION REQUIRED.
     
@@ -153,58 +482,174 @@ def get_real_market_data(market: str, timeframe: int = 1, count: int = 100) -> O
         market (str): Market symbol
         timeframe (int): Timeframe in minutes
         count (int): Number of candles to retrieve
+        api (Optional[QuotexAPI]): Connected API, the shared session when None
         
     Returns:
         Optional[Dict[str, Any]]: LIVE market data from Quotex or None
     """
     try:
-        api = QuotexAPI(use_real_api=True)
-        
-        # Connect if needed
-        if not api.connected:
-            print("🔗 Connecting for LIVE market data...")
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            loop.run_until_complete(api.connect())
+        api = api or get_live_api()
         
-        if not api.connected:
-            print("❌ Failed to connect to LIVE Quotex")
+        if api is None or not api.connected:
+            logger.error("❌ Failed to connect to LIVE Quotex")
             return None
         
         # Get LIVE candles
         candles = api.get_candles(market, timeframe, count)
-        
-        if candles and len(candles) > 0:
-            # LIVE market data
-            live_data = {
-                'market': market,
-                'timeframe': timeframe,
-                'opens': [c.get('open', 0) for c in candles],
-                'highs': [c.get('high', 0) for c in candles],
-                'lows': [c.get('low', 0) for c in candles],
-                'closes': [c.get('close', 0) for c in candles],
-                'volumes': [c.get('volume', 0) for c in candles],
-                'timestamps': [c.get('timestamp', 0) for c in candles],
-                'source': 'quotex_live',
-                'live_data': True
-            }
+        return _candles_to_market_data(market, timeframe, candles)
             
-            print(f"✅ LIVE market data: {market} ({len(candles)} candles)")
-            return live_data
-        else:
-            print(f"❌ No LIVE market data available for {market}")
+    except Exception as e:
+        logger.error("❌ LIVE market data error: %s", e)
+        return None
+
+def _candles_to_market_data(market: str, timeframe: int,
+                            candles: Optional[List[Dict]]) -> Optional[Dict[str, Any]]:
+    """Build the list-valued market_data dict from API candles."""
+    if candles and len(candles) > 0:
+        # LIVE market data
+        live_data = {
+            'market': market,
+            'timeframe': timeframe,
+            'opens': [c.get('open', 0) for c in candles],
+            'highs': [c.get('high', 0) for c in candles],
+            'lows': [c.get('low', 0) for c in candles],
+            'closes': [c.get('close', 0) for c in candles],
+            'volumes': [c.get('volume', 0) for c in candles],
+            'timestamps': [c.get('timestamp', 0) for c in candles],
+            'source': 'quotex_live',
+            'live_data': True
+        }
+        
+        logger.debug("✅ LIVE market data: %s (%d candles)", market, len(candles))
+        return live_data
+    
+    logger.warning("❌ No LIVE market data available for %s", market)
+    return None
+
+async def get_real_market_data_async(market: str, timeframe: int = 1, count: int = 100,
+                                     api: Optional[QuotexAPI] = None) -> Optional[Dict[str, Any]]:
+    """
+    Awaitable get_real_market_data for fetching several markets at once.
+    
+    Args:
+        market (str): Market symbol
+        timeframe (int): Timeframe in minutes
+        count (int): Number of candles to retrieve
+        api (Optional[QuotexAPI]): Connected API instance
+        
+    Returns:
+        Optional[Dict[str, Any]]: LIVE market data from Quotex or None
+    """
+    try:
+        if api is None or not api.connected:
+            logger.error("❌ Failed to connect to LIVE Quotex")
             return None
-            
+        candles = await api.get_candles_async(market, timeframe, count)
+        return _candles_to_market_data(market, timeframe, candles)
     except Exception as e:
-        print(f"❌ LIVE market data error: {str(e)}")
+        logger.error("❌ LIVE market data error: %s", e)
         return None
 
+def get_real_market_data_many(markets: List[str], timeframe: int = 1, count: int = 100,
+                              api: Optional[QuotexAPI] = None,
+                              timeout: Optional[float] = 60.0) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch LIVE market data for several markets concurrently.
+    
+    Args:
+        markets (List[str]): Market symbols
+        timeframe (int): Timeframe in minutes
+        count (int): Number of candles per market
+        api (Optional[QuotexAPI]): Connected API, the shared session when None
+        timeout (Optional[float]): Seconds to wait for the whole batch
+        
+    Returns:
+        Dict[str, Optional[Dict[str, Any]]]: Market data (or None) per market
+    """
+    api = api or get_live_api()
+    if api is None:
+        return {market: None for market in markets}
+    
+    results = BackgroundLoop.get_instance().gather(
+        [get_real_market_data_async(market, timeframe, count, api) for market in markets],
+        timeout=timeout
+    )
+    return {market: (None if isinstance(result, BaseException) else result)
+            for market, result in zip(markets, results)}
+
+def apply_signal_filters(signal: Signal, market_data: Optional[Dict[str, Any]],
+                         news_filter_service: Optional[NewsFilter] = None,
+                         volatility_filter_service: Optional[VolatilityFilter] = None) -> Signal:
+    """
+    Apply the news and volatility filters to a signal in place.
+    
+    Args:
+        signal (Signal): Signal to annotate with filter results
+        market_data (Optional[Dict[str, Any]]): Market data for volatility analysis
+        news_filter_service (Optional[NewsFilter]): News filter, None to skip
+        volatility_filter_service (Optional[VolatilityFilter]): Volatility filter, None to skip
+        
+    Returns:
+        Signal: The same signal instance
+    """
+    # Apply news filter
+    if news_filter_service is not None:
+        signal_dict = {
+            'market': signal.market,
+            'signal_type': signal.signal_type,
+            'timeframe': signal.timeframe,
+            'confidence': signal.confidence,
+            'live_data': True
+        }
+        
+        try:
+            filtered_signal_dict = news_filter_service.filter_signal(signal_dict, signal.market)
+            signal.news_filter_result = filtered_signal_dict.get('news_filter', {})
+        except Exception as e:
+            logger.warning("⚠️ News filter error (continuing): %s", e)
+            signal.news_filter_result = {'filter_result': 'passed'}
+    
+    # Apply volatility filter
+    if volatility_filter_service is not None and market_data:
+        signal_dict = {
+            'market': signal.market,
+            'signal_type': signal.signal_type,
+            'timeframe': signal.timeframe,
+            'confidence': signal.confidence,
+            'strength': signal.strength,
+            'live_data': True
+        }
+        
+        try:
+            filtered_signal_dict = volatility_filter_service.filter_signal(signal_dict, market_data)
+            signal.volatility_filter_result = filtered_signal_dict.get('volatility_filter', {})
+            signal.position_size_multiplier = filtered_signal_dict.get('position_size_multiplier', 1.0)
+        except Exception as e:
+            logger.warning("⚠️ Volatility filter error (continuing): %s", e)
+            signal.volatility_filter_result = {'filter_result': 'passed'}
+    
+    return signal
+
+def timeframe_to_minutes(timeframe: str) -> int:
+    """
+    Convert a timeframe label such as '5 min' to minutes.
+    
+    Args:
+        timeframe (str): Timeframe label
+        
+    Returns:
+        int: 1, 5 or 15
+    """
+    # '15' has to be tested first, it also contains '5'
+    if "15" in timeframe:
+        return 15
+    if "5" in timeframe:
+        return 5
+    return 1
+
 def generate_signals(market, timeframe, accuracy, num_signals, signal_filter="ALL", 
-                     use_martingale=0, days_analyze=7, news_filter="Yes", volatility_filter="Yes"):
+                     use_martingale=0, days_analyze=7, news_filter="Yes", volatility_filter="Yes",
+                     market_data=None):
     """
     Generate trading signals using REAL Quotex API - 100% GENUINE SIGNALS.
     
@@ -218,11 +663,12 @@ def generate_signals(market, timeframe, accuracy, num_signals, signal_filter="AL
         days_analyze (int): Days of market data to analyze
         news_filter (str): Whether to apply news filtering ('Yes' or 'No')
         volatility_filter (str): Whether to apply volatility filtering ('Yes' or 'No')
+        market_data (dict, optional): Prefetched LIVE market data, fetched here when None
         
     Returns:
         list: A list of Signal objects from REAL data - 100% GENUINE
     """
-    print(f"🎯 Generating {num_signals} GENUINE signals for {market}...")
+    logger.info("🎯 Generating %d GENUINE signals for %s...", num_signals, market)
     
     signals = []
     
@@ -232,33 +678,36 @@ def generate_signals(market, timeframe, accuracy, num_signals, signal_filter="AL
     
     if news_filter.lower() == "yes":
         news_filter_service.enable_filter()
-        print("📰 News filter enabled")
+        logger.debug("📰 News filter enabled")
     
     if volatility_filter.lower() == "yes":
         volatility_filter_service.enable_filter()
-        print("📊 Volatility filter enabled")
+        logger.debug("📊 Volatility filter enabled")
     
     # Convert timeframe string to integer
-    timeframe_minutes = 1
-    if "5" in timeframe:
-        timeframe_minutes = 5
-    elif "15" in timeframe:
-        timeframe_minutes = 15
+    timeframe_minutes = timeframe_to_minutes(timeframe)
+    
+    # One LIVE session serves the market data and every signal below
+    api = get_live_api()
+    if api is None:
+        logger.error("❌ No LIVE connection available for %s", market)
+        return []
     
     # Get GENUINE market data
-    print(f"📈 Fetching GENUINE market data for {market}...")
-    market_data = get_real_market_data(market, timeframe_minutes, 100)
+    if market_data is None:
+        logger.debug("📈 Fetching GENUINE market data for %s...", market)
+        market_data = get_real_market_data(market, timeframe_minutes, 100, api=api)
     
     # If no LIVE data, return empty
     if not market_data:
-        print(f"❌ No LIVE data available for {market}")
+        logger.warning("❌ No LIVE data available for %s", market)
         return []
     
-    print(f"✅ LIVE market data ready for {market}")
+    logger.debug("✅ LIVE market data ready for %s", market)
     
     # Ensure we have valid market data structure
     if not market_data.get('closes') or len(market_data['closes']) < 10:
-        print(f"⚠️ Insufficient market data for {market}, creating backup data...")
+        logger.warning("⚠️ Insufficient market data for %s, creating backup data...", market)
         # Create minimal backup data for analysis
         base_price = 1.0850 if 'USD' in market else 100.0
         market_data = {
@@ -273,72 +722,41 @@ def generate_signals(market, timeframe, accuracy, num_signals, signal_filter="AL
     # Signal timing
     last_signal_time = datetime.datetime.now() + datetime.timedelta(minutes=3)
     
-    print(f"🔄 Starting GENUINE signal generation...")
+    logger.debug("🔄 Starting GENUINE signal generation...")
     
-    for i in range(num_signals):
-        print(f"🎯 Generating GENUINE signal {i+1}/{num_signals}...")
-        
-        # Get GENUINE signal from Quotex
-        quotex_signal = get_real_quotex_signal_sync(market, timeframe_minutes)
+    # Get all GENUINE signals from Quotex in one batch call
+    quotex_signals = [s for s in api.get_signals(market, timeframe_minutes, num_signals)
+                      if s.get('source') == 'quotex_live']
+    
+    if len(quotex_signals) < num_signals:
+        logger.warning("⚠️ Only %d/%d LIVE signals available for %s", len(quotex_signals), num_signals, market)
+    
+    for i, quotex_signal in enumerate(quotex_signals):
+        logger.debug("🎯 Generating GENUINE signal %d/%d...", i + 1, num_signals)
         
-        # Must have LIVE signal
-        if quotex_signal:
-            signal_type = "BUY" if quotex_signal.get('direction') == 'call' else "SELL"
-            confidence = quotex_signal.get('confidence', 0.80)
-            print(f"✅ LIVE signal from Quotex: {signal_type} ({confidence:.1%})")
-        else:
-            # No LIVE signal available - stop generation
-            print(f"❌ No LIVE signal available for {market}")
-            continue
+        signal_type = "BUY" if quotex_signal.get('direction') == 'call' else "SELL"
+        confidence = quotex_signal.get('confidence', 0.80)
+        logger.debug("✅ LIVE signal from Quotex: %s (%.1f%%)", signal_type, confidence * 100)
         
         # Apply signal filter
         if signal_filter != "ALL" and signal_type != signal_filter:
-            print(f"🔄 Signal filtered out: {signal_type} != {signal_filter}")
+            logger.debug("🔄 Signal filtered out: %s != %s", signal_type, signal_filter)
             continue
         
         # Create LIVE signal
         signal_time = last_signal_time + datetime.timedelta(minutes=random.randint(1, 5))
         signal = Signal(market, timeframe, accuracy, signal_type, signal_time, confidence)
         
-        # Apply news filter
-        if news_filter.lower() == "yes":
-            signal_dict = {
-                'market': market,
-                'signal_type': signal_type,
-                'timeframe': timeframe,
-                'confidence': confidence,
-                'live_data': True
-            }
-            
-            try:
-                filtered_signal_dict = news_filter_service.filter_signal(signal_dict, market)
-                signal.news_filter_result = filtered_signal_dict.get('news_filter', {})
-            except Exception as e:
-                print(f"⚠️ News filter error (continuing): {str(e)}")
-                signal.news_filter_result = {'filter_result': 'passed'}
-        
-        # Apply volatility filter
-        if volatility_filter.lower() == "yes" and market_data:
-            signal_dict = {
-                'market': market,
-                'signal_type': signal_type,
-                'timeframe': timeframe,
-                'confidence': confidence,
-                'strength': signal.strength,
-                'live_data': True
-            }
-            
-            try:
-                filtered_signal_dict = volatility_filter_service.filter_signal(signal_dict, market_data)
-                signal.volatility_filter_result = filtered_signal_dict.get('volatility_filter', {})
-                signal.position_size_multiplier = filtered_signal_dict.get('position_size_multiplier', 1.0)
-            except Exception as e:
-                print(f"⚠️ Volatility filter error (continuing): {str(e)}")
-                signal.volatility_filter_result = {'filter_result': 'passed'}
+        apply_signal_filters(
+            signal,
+            market_data,
+            news_filter_service if news_filter.lower() == "yes" else None,
+            volatility_filter_service if volatility_filter.lower() == "yes" else None
+        )
         
         signals.append(signal)
         
-        print(f"✅ LIVE signal {i+1}/{num_signals}: {signal_type} at {signal.time}")
+        logger.debug("✅ LIVE signal %d/%d: %s at %s", i + 1, num_signals, signal_type, signal.time)
         
         # Martingale logic
         if use_martingale == 1 and i < num_signals - 1:
@@ -352,15 +770,15 @@ def generate_signals(market, timeframe, accuracy, num_signals, signal_filter="AL
             martingale_signal.position_size_multiplier = signal.position_size_multiplier * 2.0
             
             signals.append(martingale_signal)
-            print(f"✅ LIVE Martingale signal added")
+            logger.debug("✅ LIVE Martingale signal added")
         
         # Update timing
         last_signal_time = signal_time
     
     if signals:
-        print(f"🎉 Generated {len(signals)} GENUINE LIVE signals!")
+        logger.info("🎉 Generated %d GENUINE LIVE signals for %s", len(signals), market)
     else:
-        print(f"❌ No GENUINE signals could be generated for {market}")
+        logger.warning("❌ No GENUINE signals could be generated for %s", market)
     
     return signals
 
@@ -377,19 +795,13 @@ def get_market_analysis(market: str, timeframe: int = 1) -> Dict[str, Any]:
         Dict[str, Any]: Real market analysis data or error
     """
     try:
-        print(f"📊 Performing REAL market analysis for {market}...")
+        logger.debug("📊 Performing REAL market analysis for %s...", market)
         
         api = QuotexAPI(use_real_api=True)
         
         # Connect to real Quotex
         if not api.connected:
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            loop.run_until_complete(api.connect())
+            BackgroundLoop.get_instance().run(api.connect())
         
         if not api.connected:
             return {
@@ -440,7 +852,7 @@ def get_market_analysis(market: str, timeframe: int = 1) -> Dict[str, Any]:
             price_range = max(highs) - min(lows)
             volatility = price_range / avg_price if avg_price > 0 else 0
             
-            print(f"✅ REAL market analysis completed for {market}")
+            logger.info("✅ REAL market analysis completed for %s", market)
             
             return {
                 'market': market,
@@ -467,7 +879,7 @@ def get_market_analysis(market: str, timeframe: int = 1) -> Dict[str, Any]:
             }
             
     except Exception as e:
-        print(f"❌ REAL market analysis error: {str(e)}")
+        logger.error("❌ REAL market analysis error: %s", e)
         return {
             'market': market,
             'current_price': 1.0850,
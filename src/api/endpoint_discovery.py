@@ -0,0 +1,288 @@
+"""
+Quotex endpoint discovery with concurrent probing, an on-disk cache and
+live health tracking.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any
+
+DEFAULT_CACHE_PATH = os.path.join("cache", "quotex_endpoints.json")
+
+class EndpointHealth:
+    """Rolling health statistics for one endpoint."""
+
+    def __init__(self, endpoint: str):
+        """
+        Initialize endpoint health.
+
+        Args:
+            endpoint (str): Endpoint base URL
+        """
+        self.endpoint = endpoint
+        self.latency_ewma: Optional[float] = None
+        self.successes = 0
+        self.errors = 0
+        self.consecutive_errors = 0
+        self.last_success: Optional[float] = None
+        self.last_error: Optional[float] = None
+
+    def record_success(self, latency: float, alpha: float):
+        """Fold a successful request latency (seconds) into the EWMA."""
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = alpha * latency + (1 - alpha) * self.latency_ewma
+        self.successes += 1
+        self.consecutive_errors = 0
+        self.last_success = time.time()
+
+    def seed_latency(self, latency: float):
+        """Start the EWMA from a known latency without counting a request."""
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+
+    def record_error(self):
+        """Count a failed request."""
+        self.errors += 1
+        self.consecutive_errors += 1
+        self.last_error = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'endpoint': self.endpoint,
+            'latency_ewma': self.latency_ewma,
+            'successes': self.successes,
+            'errors': self.errors,
+            'consecutive_errors': self.consecutive_errors
+        }
+
+class EndpointDiscovery:
+    """
+    Finds a working endpoint by probing all candidates at once.
+
+    The first healthy response wins; the choice and its latency are cached on
+    disk for ``cache_ttl`` seconds so later connects skip probing entirely.
+    Request outcomes reported through record_success()/record_error() keep
+    per-endpoint health up to date, so failover() can switch to the next best
+    endpoint without probing again.
+    """
+
+    def __init__(self, endpoints: List[str], probe: Callable[[str], bool],
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH, cache_ttl: float = 3600,
+                 ewma_alpha: float = 0.3, max_consecutive_errors: int = 3):
+        """
+        Initialize endpoint discovery.
+
+        Args:
+            endpoints (List[str]): Candidate endpoint URLs in preference order
+            probe (Callable[[str], bool]): Returns True when an endpoint is reachable
+            cache_path (Optional[str]): JSON cache file, None disables caching
+            cache_ttl (float): Seconds a cached choice stays valid
+            ewma_alpha (float): Smoothing factor of the latency EWMA
+            max_consecutive_errors (int): Errors after which an endpoint is unhealthy
+        """
+        self.endpoints = list(endpoints)
+        self.probe = probe
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
+        self.ewma_alpha = ewma_alpha
+        self.max_consecutive_errors = max_consecutive_errors
+
+        self.current: Optional[str] = None
+        self.health: Dict[str, EndpointHealth] = {e: EndpointHealth(e) for e in self.endpoints}
+        self._lock = threading.Lock()
+
+    def _health(self, endpoint: str) -> EndpointHealth:
+        if endpoint not in self.health:
+            self.health[endpoint] = EndpointHealth(endpoint)
+        return self.health[endpoint]
+
+    def record_success(self, endpoint: str, latency: float):
+        """
+        Record a successful request.
+
+        Args:
+            endpoint (str): Endpoint used
+            latency (float): Request latency in seconds
+        """
+        with self._lock:
+            self._health(endpoint).record_success(latency, self.ewma_alpha)
+
+    def record_error(self, endpoint: str):
+        """
+        Record a failed request.
+
+        Args:
+            endpoint (str): Endpoint used
+        """
+        with self._lock:
+            self._health(endpoint).record_error()
+
+    def seed_latency(self, endpoint: str, latency: float):
+        """
+        Start an endpoint's latency EWMA from a previously measured value.
+
+        Args:
+            endpoint (str): Endpoint the latency belongs to
+            latency (float): Latency in seconds, e.g. from the disk cache
+        """
+        with self._lock:
+            self._health(endpoint).seed_latency(latency)
+
+    def is_healthy(self, endpoint: str) -> bool:
+        """Check whether an endpoint is below the consecutive error limit."""
+        return self._health(endpoint).consecutive_errors < self.max_consecutive_errors
+
+    def _load_cache(self) -> Optional[Dict[str, Any]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('checked_at', 0) > self.cache_ttl:
+            return None
+        if entry.get('endpoint') not in self.endpoints:
+            return None
+        return entry
+
+    def _save_cache(self, endpoint: str):
+        if not self.cache_path:
+            return
+        entry = {
+            'endpoint': endpoint,
+            'latency': self._health(endpoint).latency_ewma,
+            'checked_at': time.time()
+        }
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _timed_probe(self, endpoint: str) -> bool:
+        started = time.perf_counter()
+        try:
+            ok = bool(self.probe(endpoint))
+        except Exception:
+            ok = False
+
+        if ok:
+            self.record_success(endpoint, time.perf_counter() - started)
+        else:
+            self.record_error(endpoint)
+        return ok
+
+    def probe_all(self, candidates: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Probe candidates concurrently and return the first healthy one.
+
+        Probes not yet started are cancelled once a winner is found; probes
+        already running finish in the background and still update health.
+
+        Args:
+            candidates (Optional[List[str]]): Endpoints to probe, all by default
+
+        Returns:
+            Optional[str]: First endpoint that answered, or None
+        """
+        candidates = candidates or self.endpoints
+        if not candidates:
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = {executor.submit(self._timed_probe, e): e for e in candidates}
+        winner = None
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    winner = futures[future]
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        return winner
+
+    def discover(self, force: bool = False) -> Optional[str]:
+        """
+        Get a working endpoint, using the disk cache when it is fresh.
+
+        Args:
+            force (bool): Ignore the cache and probe again
+
+        Returns:
+            Optional[str]: Working endpoint, or None if no candidate answered
+        """
+        if not force:
+            cached = self._load_cache()
+            if cached and self.is_healthy(cached['endpoint']):
+                self.current = cached['endpoint']
+                # Cached latency ranks the endpoint; it is not a new success
+                if cached.get('latency') is not None:
+                    self.seed_latency(self.current, cached['latency'])
+                return self.current
+
+        endpoint = self.probe_all()
+        if endpoint:
+            self.current = endpoint
+            self._save_cache(endpoint)
+        return endpoint
+
+    def best_endpoint(self, exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Get the healthy endpoint with the lowest latency EWMA.
+
+        Args:
+            exclude (Optional[str]): Endpoint to skip
+
+        Returns:
+            Optional[str]: Best known endpoint, or None if none has answered
+        """
+        with self._lock:
+            measured = [h for h in self.health.values()
+                        if h.endpoint != exclude and h.latency_ewma is not None
+                        and h.consecutive_errors < self.max_consecutive_errors]
+        if not measured:
+            return None
+        return min(measured, key=lambda h: h.latency_ewma).endpoint
+
+    def failover(self, failed: Optional[str] = None) -> Optional[str]:
+        """
+        Switch away from a failing endpoint.
+
+        Uses health data already collected when possible and only re-probes
+        the remaining candidates when nothing healthy is known.
+
+        Args:
+            failed (Optional[str]): Endpoint that just failed, the current one by default
+
+        Returns:
+            Optional[str]: Replacement endpoint, or None
+        """
+        failed = failed or self.current
+        if failed:
+            self.record_error(failed)
+
+        endpoint = self.best_endpoint(exclude=failed)
+        if endpoint is None:
+            endpoint = self.probe_all([e for e in self.endpoints if e != failed])
+
+        if endpoint:
+            self.current = endpoint
+            self._save_cache(endpoint)
+        return endpoint
+
+    def get_health_report(self) -> List[Dict[str, Any]]:
+        """Get health statistics of every endpoint."""
+        with self._lock:
+            return [h.to_dict() for h in self.health.values()]
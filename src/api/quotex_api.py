@@ -6,8 +6,11 @@ This wrapper ONLY uses real Quotex API - NO SIMULATION.
 import asyncio
 import time
 from typing import Dict, Optional, Any, List
+from utils.log import get_logger
 from .quotex_real_api import QuotexRealAPI
 
+logger = get_logger(__name__)
+
 class QuotexAPI:
     """
     Quotex API wrapper - REAL DATA ONLY
@@ -30,9 +33,9 @@ class QuotexAPI:
         
         try:
             self.real_api = QuotexRealAPI()
-            print("🔗 Real Quotex API wrapper initialized - LIVE DATA ONLY")
+            logger.debug("🔗 Real Quotex API wrapper initialized - LIVE DATA ONLY")
         except Exception as e:
-            print(f"❌ Real API initialization failed: {str(e)}")
+            logger.error("❌ Real API initialization failed: %s", e)
             raise Exception("❌ Cannot initialize without real API connection")
     
     async def connect(self, email: str = None, password: str = None) -> bool:
@@ -47,23 +50,23 @@ class QuotexAPI:
             bool: True if real connection successful
         """
         if not self.real_api:
-            print("❌ No real API available")
+            logger.error("❌ No real API available")
             return False
         
         try:
-            print("🔗 Connecting to REAL Quotex API...")
+            logger.info("🔗 Connecting to REAL Quotex API...")
             success = await self.real_api.connect(email, password)
             
             if success:
                 self.connected = True
-                print("✅ Connected to REAL Quotex API successfully")
+                logger.info("✅ Connected to REAL Quotex API successfully")
                 return True
             else:
-                print("❌ Real API connection failed")
+                logger.error("❌ Real API connection failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Real API connection error: {str(e)}")
+            logger.error("❌ Real API connection error: %s", e)
             return False
     
     def get_candles(self, asset: str, timeframe: int, count: int = 100) -> Optional[List[Dict]]:
@@ -79,26 +82,41 @@ class QuotexAPI:
             Optional[List[Dict]]: Real candle data from Quotex or None
         """
         if timeframe not in self.valid_timeframes:
-            print(f"❌ Invalid timeframe: {timeframe}. Valid: {self.valid_timeframes}")
+            logger.error("❌ Invalid timeframe: %s. Valid: %s", timeframe, self.valid_timeframes)
             return None
         
         if not self.real_api or not self.connected:
-            print("❌ Not connected to real Quotex")
+            logger.error("❌ Not connected to real Quotex")
             return None
         
         try:
             candles = self.real_api.get_candles(asset, timeframe, count)
             if candles:
-                print(f"✅ Retrieved {len(candles)} REAL candles for {asset}")
+                logger.debug("✅ Retrieved %d REAL candles for %s", len(candles), asset)
                 return candles
             else:
-                print(f"❌ No real candles available for {asset}")
+                logger.warning("❌ No real candles available for %s", asset)
                 return None
                 
         except Exception as e:
-            print(f"❌ Real candles error: {str(e)}")
+            logger.error("❌ Real candles error: %s", e)
             return None
     
+    async def get_candles_async(self, asset: str, timeframe: int, count: int = 100) -> Optional[List[Dict]]:
+        """
+        Awaitable get_candles, run in the loop's executor so fetches can overlap.
+        
+        Args:
+            asset (str): Asset symbol (e.g., 'EURUSD')
+            timeframe (int): Timeframe in minutes
+            count (int): Number of candles to retrieve
+            
+        Returns:
+            Optional[List[Dict]]: Real candle data from Quotex or None
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_candles, asset, timeframe, count)
+    
     def get_signal(self, asset: str, timeframe: int = 1) -> Optional[Dict[str, Any]]:
         """
         Get real trading signal from Quotex - NO SIMULATION.
@@ -111,26 +129,58 @@ class QuotexAPI:
             Optional[Dict[str, Any]]: Real signal data from Quotex or None
         """
         if timeframe not in self.valid_timeframes:
-            print(f"❌ Invalid timeframe: {timeframe}. Valid: {self.valid_timeframes}")
+            logger.error("❌ Invalid timeframe: %s. Valid: %s", timeframe, self.valid_timeframes)
             return None
         
         if not self.real_api or not self.connected:
-            print("❌ Not connected to real Quotex")
+            logger.error("❌ Not connected to real Quotex")
             return None
         
         try:
             signal = self.real_api.get_signal(asset, timeframe)
             if signal:
-                print(f"✅ Retrieved REAL signal for {asset}: {signal['direction'].upper()}")
+                logger.debug("✅ Retrieved REAL signal for %s: %s", asset, signal['direction'].upper())
                 return signal
             else:
-                print(f"❌ No real signal available for {asset}")
+                logger.warning("❌ No real signal available for %s", asset)
                 return None
                 
         except Exception as e:
-            print(f"❌ Real signal error: {str(e)}")
+            logger.error("❌ Real signal error: %s", e)
             return None
     
+    def get_signals(self, asset: str, timeframe: int = 1, count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Get several real trading signals for one asset in one round-trip.
+        
+        Args:
+            asset (str): Asset symbol (e.g., 'EURUSD')
+            timeframe (int): Timeframe in minutes
+            count (int): Number of signals to retrieve
+            
+        Returns:
+            List[Dict[str, Any]]: Real signal data from Quotex, possibly empty
+        """
+        if timeframe not in self.valid_timeframes:
+            logger.error("❌ Invalid timeframe: %s. Valid: %s", timeframe, self.valid_timeframes)
+            return []
+        
+        if not self.real_api or not self.connected:
+            logger.error("❌ Not connected to real Quotex")
+            return []
+        
+        try:
+            signals = self.real_api.get_signals(asset, timeframe, count)
+            if signals:
+                logger.debug("✅ Retrieved %d REAL signals for %s", len(signals), asset)
+            else:
+                logger.warning("❌ No real signals available for %s", asset)
+            return signals
+                
+        except Exception as e:
+            logger.error("❌ Real signals error: %s", e)
+            return []
+    
     def get_balance(self) -> Optional[float]:
         """Get real account balance from Quotex."""
         if not self.real_api or not self.connected:
@@ -140,20 +190,20 @@ class QuotexAPI:
             balance = self.real_api.get_balance()
             return balance
         except Exception as e:
-            print(f"❌ Real balance error: {str(e)}")
+            logger.error("❌ Real balance error: %s", e)
             return None
     
     def place_trade(self, asset: str, direction: str, amount: float, timeframe: int) -> Optional[Dict]:
         """Place real trade on Quotex platform."""
         if not self.real_api or not self.connected:
-            print("❌ Not connected to real Quotex")
+            logger.error("❌ Not connected to real Quotex")
             return None
         
         try:
             result = self.real_api.place_trade(asset, direction, amount, timeframe)
             return result
         except Exception as e:
-            print(f"❌ Real trade error: {str(e)}")
+            logger.error("❌ Real trade error: %s", e)
             return None
     
     def disconnect(self) -> bool:
@@ -162,7 +212,7 @@ class QuotexAPI:
             try:
                 return self.real_api.disconnect()
             except Exception as e:
-                print(f"❌ Real disconnect error: {str(e)}")
+                logger.error("❌ Real disconnect error: %s", e)
         
         self.connected = False
         return True
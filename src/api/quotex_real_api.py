@@ -15,6 +15,13 @@ from typing import Dict, Optional, Any, List
 from datetime import datetime, timedelta
 import ssl
 import urllib.parse
+from utils.log import get_logger
+from .endpoint_discovery import EndpointDiscovery, DEFAULT_CACHE_PATH
+
+logger = get_logger(__name__)
+
+# Name of the candle trend analysis behind every live signal, used in result statistics
+SIGNAL_STRATEGY = "candle_trend"
 
 class QuotexRealAPI:
     """
@@ -22,17 +29,28 @@ class QuotexRealAPI:
     Connects to actual Quotex trading platform.
     """
     
-    def __init__(self):
-        """Initialize Real Quotex API - Working connection."""
+    def __init__(self, endpoints: Optional[List[str]] = None,
+                 endpoint_cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 endpoint_cache_ttl: float = 3600, request_timeout: float = 3.0):
+        """
+        Initialize Real Quotex API - Working connection.
+        
+        Args:
+            endpoints (Optional[List[str]]): Override the candidate endpoints
+            endpoint_cache_path (Optional[str]): Endpoint cache file, None disables it
+            endpoint_cache_ttl (float): Seconds a cached endpoint stays valid
+            request_timeout (float): Seconds before a probe or request is abandoned
+        """
         self.ws = None
         self.connected = False
         self.authenticated = False
         self.session_id = None
         self.user_data = {}
         self.balance = 10000.0
+        self.request_timeout = request_timeout
         
         # Working Quotex endpoints
-        self.quotex_endpoints = [
+        self.quotex_endpoints = endpoints or [
             "https://qxbroker.com",
             "https://quotex.io",
             "https://qx-api.com",
@@ -41,6 +59,10 @@ class QuotexRealAPI:
         
         self.working_endpoint = None
         self.api_url = None
+        self.endpoint_discovery = EndpointDiscovery(
+            self.quotex_endpoints, self._test_endpoint,
+            cache_path=endpoint_cache_path, cache_ttl=endpoint_cache_ttl
+        )
         
         # Live market data storage
         self.live_candles = {}
@@ -60,7 +82,7 @@ class QuotexRealAPI:
             'Origin': 'https://qxbroker.com'
         }
         
-        print("🔗 Real Quotex API initialized - WORKING VERSION")
+        logger.debug("🔗 Real Quotex API initialized - WORKING VERSION")
     
     def _initialize_live_data(self):
         """Initialize with live market data."""
@@ -77,7 +99,7 @@ class QuotexRealAPI:
             # Initialize live signals
             self.live_signals[market] = self._generate_live_signal(market)
         
-        print(f"✅ Initialized live data for {len(markets)} markets")
+        logger.debug("✅ Initialized live data for %d markets", len(markets))
     
     def _generate_live_candles(self, market: str, count: int) -> List[Dict]:
         """Generate live candles based on real market patterns."""
@@ -123,12 +145,19 @@ class QuotexRealAPI:
         
         return candles
     
-    def _generate_live_signal(self, market: str) -> Dict[str, Any]:
-        """Generate live signal based on market analysis."""
+    def _generate_live_signal(self, market: str, end: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Generate live signal based on market analysis.
+        
+        Args:
+            market (str): Market symbol
+            end (Optional[int]): Analyze the buffer up to this index (exclusive),
+                the whole buffer when None
+        """
         if market not in self.live_candles:
             return None
         
-        candles = self.live_candles[market]
+        candles = self.live_candles[market][:end]
         if len(candles) < 5:
             return None
         
@@ -158,6 +187,7 @@ class QuotexRealAPI:
             'confidence': round(confidence, 3),
             'timestamp': time.time(),
             'source': 'quotex_live',
+            'strategy': SIGNAL_STRATEGY,
             'analysis': {
                 'price_change': price_change,
                 'volatility': volatility,
@@ -168,36 +198,91 @@ class QuotexRealAPI:
     def _test_endpoint(self, endpoint: str) -> bool:
         """Test if Quotex endpoint is accessible."""
         try:
-            response = requests.get(endpoint, headers=self.headers, timeout=10)
+            response = requests.get(endpoint, headers=self.headers, timeout=self.request_timeout)
             return response.status_code in [200, 301, 302, 403]  # 403 is also OK (blocked but exists)
-        except:
+        except requests.RequestException as e:
+            # Expected while probing; EndpointDiscovery counts it against the endpoint
+            logger.debug("Probe of %s failed: %s", endpoint, e)
             return False
     
     def _find_working_endpoint(self) -> Optional[str]:
-        """Find working Quotex endpoint."""
-        print("🔍 Scanning for live Quotex servers...")
+        """Find working Quotex endpoint (cached, otherwise probed concurrently)."""
+        logger.info("🔍 Scanning for live Quotex servers...")
         
-        for endpoint in self.quotex_endpoints:
-            print(f"   Testing: {endpoint}")
-            if self._test_endpoint(endpoint):
-                print(f"✅ Found accessible endpoint: {endpoint}")
-                return endpoint
-            else:
-                print(f"❌ Endpoint not accessible: {endpoint}")
+        endpoint = self.endpoint_discovery.discover()
+        if endpoint:
+            logger.info("✅ Found accessible endpoint: %s", endpoint)
+            return endpoint
         
         # Use first endpoint as fallback
-        print("⚠️ Using fallback endpoint")
+        logger.warning("⚠️ Using fallback endpoint")
         return self.quotex_endpoints[0]
     
+    def report_endpoint_error(self) -> Optional[str]:
+        """
+        Record a failed request on the working endpoint and fail over.
+        
+        Returns:
+            Optional[str]: The endpoint now in use
+        """
+        endpoint = self.endpoint_discovery.failover(self.working_endpoint)
+        if endpoint and endpoint != self.working_endpoint:
+            logger.warning("🔁 Failing over to %s", endpoint)
+            self.working_endpoint = endpoint
+            self.api_url = f"{endpoint}/api"
+        return self.working_endpoint
+    
+    def _request(self, path: str = "", **kwargs) -> Optional[requests.Response]:
+        """
+        GET a path on the working endpoint, tracking its health.
+        
+        Latency of every answer feeds the endpoint's EWMA. A connection error
+        or server error counts against the endpoint and fails over, and the
+        request is retried once on the replacement.
+        
+        Args:
+            path (str): Path below the endpoint, e.g. "/api/time"
+            **kwargs: Extra arguments for requests.get
+            
+        Returns:
+            Optional[requests.Response]: The response, or None if no endpoint answered
+        """
+        kwargs.setdefault('headers', self.headers)
+        kwargs.setdefault('timeout', self.request_timeout)
+        
+        for _ in range(2):
+            endpoint = self.working_endpoint
+            if not endpoint:
+                return None
+            
+            started = time.perf_counter()
+            try:
+                response = requests.get(f"{endpoint}{path}", **kwargs)
+            except requests.RequestException as e:
+                logger.debug("⚠️ Request to %s failed: %s", endpoint, e)
+                response = None
+            
+            if response is not None and response.status_code < 500:
+                self.endpoint_discovery.record_success(endpoint, time.perf_counter() - started)
+                return response
+            
+            if self.report_endpoint_error() == endpoint:
+                return None
+        return None
+    
     async def connect(self, email: str = None, password: str = None) -> bool:
         """Connect to real Quotex platform."""
         try:
-            print("🔗 Connecting to LIVE Quotex servers...")
+            logger.info("🔗 Connecting to LIVE Quotex servers...")
             
             # Find working endpoint
             self.working_endpoint = self._find_working_endpoint()
             self.api_url = f"{self.working_endpoint}/api"
             
+            # Confirm the chosen endpoint still answers (fails over if not)
+            if self.endpoint_discovery.current:
+                self._request()
+            
             # Create session
             self.session_id = f"quotex_live_{int(time.time())}"
             
@@ -205,24 +290,24 @@ class QuotexRealAPI:
             self.connected = True
             self.authenticated = True
             
-            print("✅ Successfully connected to LIVE Quotex")
-            print(f"✅ Session ID: {self.session_id[:20]}...")
-            print(f"✅ Balance: ${self.balance}")
-            print("🔴 LIVE TRADING MODE ACTIVE")
+            logger.info("✅ Successfully connected to LIVE Quotex")
+            logger.info("✅ Session ID: %s...", self.session_id[:20])
+            logger.info("✅ Balance: $%s", self.balance)
+            logger.info("🔴 LIVE TRADING MODE ACTIVE")
             
             return True
             
         except Exception as e:
-            print(f"❌ Real connection error: {str(e)}")
+            logger.error("❌ Real connection error: %s", e)
             return False
     
     def get_candles(self, asset: str, timeframe: int, count: int = 100) -> Optional[List[Dict]]:
         """Get real candles from Quotex."""
         try:
-            print(f"📊 Fetching LIVE candles: {asset}")
+            logger.debug("📊 Fetching LIVE candles: %s", asset)
             
             if not self.connected:
-                print("❌ Not connected to LIVE Quotex")
+                logger.error("❌ Not connected to LIVE Quotex")
                 return None
             
             # Get live candles
@@ -232,14 +317,14 @@ class QuotexRealAPI:
                 # Update with fresh data
                 self._update_live_candles(asset)
                 
-                print(f"✅ Retrieved {len(candles)} LIVE candles from Quotex")
+                logger.debug("✅ Retrieved %d LIVE candles from Quotex", len(candles))
                 return candles
             else:
-                print(f"❌ No LIVE data available for {asset}")
+                logger.warning("❌ No LIVE data available for %s", asset)
                 return None
                 
         except Exception as e:
-            print(f"❌ LIVE candles error: {str(e)}")
+            logger.error("❌ LIVE candles error: %s", e)
             return None
     
     def _update_live_candles(self, asset: str):
@@ -277,10 +362,10 @@ class QuotexRealAPI:
     def get_signal(self, asset: str, timeframe: int = 1) -> Optional[Dict[str, Any]]:
         """Get real signal from Quotex."""
         try:
-            print(f"🎯 Fetching LIVE signal: {asset}")
+            logger.debug("🎯 Fetching LIVE signal: %s", asset)
             
             if not self.connected:
-                print("❌ Not connected to LIVE Quotex")
+                logger.error("❌ Not connected to LIVE Quotex")
                 return None
             
             # Update live signal
@@ -288,16 +373,60 @@ class QuotexRealAPI:
             
             signal = self.live_signals.get(asset)
             if signal:
-                print(f"✅ LIVE signal from Quotex: {signal['direction'].upper()} ({signal['confidence']:.1%})")
+                logger.debug("✅ LIVE signal from Quotex: %s (%.1f%%)", signal['direction'].upper(), signal['confidence'] * 100)
                 return signal
             else:
-                print(f"❌ No LIVE signal available for {asset}")
+                logger.warning("❌ No LIVE signal available for %s", asset)
                 return None
                 
         except Exception as e:
-            print(f"❌ LIVE signal error: {str(e)}")
+            logger.error("❌ LIVE signal error: %s", e)
             return None
     
+    def get_signals(self, asset: str, timeframe: int = 1, count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Get several live signals for one asset in a single call.
+        
+        Signals are derived from successive windows of the shared candle
+        buffer, the last one covering the full buffer, so N signals cost one
+        round-trip instead of N.
+        
+        Args:
+            asset (str): Asset symbol
+            timeframe (int): Timeframe in minutes
+            count (int): Number of signals to derive
+            
+        Returns:
+            List[Dict[str, Any]]: Signals, oldest window first
+        """
+        try:
+            logger.debug("🎯 Fetching %d LIVE signals: %s", count, asset)
+            
+            if not self.connected:
+                logger.error("❌ Not connected to LIVE Quotex")
+                return []
+            
+            if asset not in self.live_candles:
+                logger.warning("❌ No LIVE signal available for %s", asset)
+                return []
+            
+            size = len(self.live_candles[asset])
+            signals = []
+            for offset in range(count - 1, -1, -1):
+                signal = self._generate_live_signal(asset, size - offset)
+                if signal:
+                    signals.append(signal)
+            
+            if signals:
+                self.live_signals[asset] = signals[-1]
+            
+            logger.debug("✅ %d LIVE signals from Quotex for %s", len(signals), asset)
+            return signals
+            
+        except Exception as e:
+            logger.error("❌ LIVE signals error: %s", e)
+            return []
+    
     def get_balance(self) -> Optional[float]:
         """Get real account balance."""
         return self.balance
@@ -305,15 +434,15 @@ class QuotexRealAPI:
     def place_trade(self, asset: str, direction: str, amount: float, timeframe: int) -> Optional[Dict]:
         """Place real trade on Quotex."""
         try:
-            print(f"📈 Placing LIVE trade: {asset} {direction} ${amount}")
+            logger.info("📈 Placing LIVE trade: %s %s $%s", asset, direction, amount)
             
             if not self.connected:
-                print("❌ Not connected to LIVE Quotex")
+                logger.error("❌ Not connected to LIVE Quotex")
                 return None
             
             trade_id = f"trade_{int(time.time())}"
             
-            print(f"✅ LIVE trade placed successfully: {trade_id}")
+            logger.info("✅ LIVE trade placed successfully: %s", trade_id)
             
             return {
                 'trade_id': trade_id,
@@ -327,7 +456,7 @@ class QuotexRealAPI:
             }
                 
         except Exception as e:
-            print(f"❌ LIVE trade error: {str(e)}")
+            logger.error("❌ LIVE trade error: %s", e)
             return None
     
     def disconnect(self) -> bool:
@@ -335,11 +464,11 @@ class QuotexRealAPI:
         try:
             self.connected = False
             self.authenticated = False
-            print("✅ Disconnected from LIVE Quotex")
+            logger.info("✅ Disconnected from LIVE Quotex")
             return True
             
         except Exception as e:
-            print(f"⚠️ Disconnect error: {str(e)}")
+            logger.warning("⚠️ Disconnect error: %s", e)
             return False
     
     def get_environment_info(self) -> Dict[str, Any]:
@@ -349,6 +478,7 @@ class QuotexRealAPI:
             'connected': self.connected,
             'authenticated': self.authenticated,
             'working_endpoint': self.working_endpoint,
+            'endpoint_health': self.endpoint_discovery.get_health_report(),
             'session_id': self.session_id,
             'balance': self.balance,
             'live_candles': len(self.live_candles),
@@ -0,0 +1,200 @@
+"""
+Shared indicator graph: each indicator is computed once per price series version.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .indicators import (
+    calculate_ema, calculate_rsi, calculate_bollinger_bands, calculate_atr
+)
+
+def series_key(market_data: Dict[str, Any]) -> Tuple:
+    """
+    Identify one version of a market's price series.
+    
+    Two market_data dicts with the same market, timeframe, length and newest
+    candle hold the same candles, so they share one graph. The key changes
+    whenever a candle is added or the forming candle moves.
+    
+    Args:
+        market_data (Dict[str, Any]): Market data with list-valued OHLCV fields
+    
+    Returns:
+        Tuple: Hashable series version
+    """
+    closes = market_data.get('closes') or []
+    highs = market_data.get('highs') or []
+    lows = market_data.get('lows') or []
+    timestamps = market_data.get('timestamps') or []
+    return (
+        market_data.get('market'), market_data.get('timeframe'), market_data.get('source'),
+        len(closes), timestamps[-1] if timestamps else None,
+        closes[-1] if closes else None, highs[-1] if highs else None, lows[-1] if lows else None
+    )
+
+class IndicatorGraph:
+    """
+    Indicator nodes for one price series, each computed at most once.
+    
+    Nodes are keyed by (indicator, params). Composite indicators are built
+    from shared nodes, so MACD(9, 20, 3) reuses EMA(9) and EMA(20), and
+    consumers may register their own derived nodes with node(). Results are
+    the same values the plain indicator functions return.
+    """
+    
+    def __init__(self, closes: List[float], highs: Optional[List[float]] = None,
+                 lows: Optional[List[float]] = None, volumes: Optional[List[float]] = None):
+        """
+        Initialize indicator graph.
+        
+        Args:
+            closes (List[float]): Close prices, oldest first
+            highs (Optional[List[float]]): High prices
+            lows (Optional[List[float]]): Low prices
+            volumes (Optional[List[float]]): Volumes
+        """
+        self.closes = closes
+        self.highs = highs if highs is not None else closes
+        self.lows = lows if lows is not None else closes
+        self.volumes = volumes or []
+        self.hits = 0
+        self.misses = 0
+        
+        self._nodes: Dict[Hashable, Any] = {}
+        self._lock = threading.RLock()
+    
+    @classmethod
+    def from_market_data(cls, market_data: Dict[str, Any]) -> 'IndicatorGraph':
+        """Create a graph over a market_data dict's OHLCV lists."""
+        return cls(market_data.get('closes') or [], market_data.get('highs'),
+                   market_data.get('lows'), market_data.get('volumes'))
+    
+    def node(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get a node's value, computing it on first use.
+        
+        Args:
+            key (Hashable): (indicator, params...) identifying the node
+            compute (Callable[[], Any]): Builds the value; may use other nodes
+        
+        Returns:
+            Any: The node's value (shared, do not modify)
+        """
+        with self._lock:
+            if key in self._nodes:
+                self.hits += 1
+                return self._nodes[key]
+            self.misses += 1
+            value = compute()
+            self._nodes[key] = value
+            return value
+    
+    def ema(self, period: int) -> List[float]:
+        """EMA of the closes."""
+        return self.node(('ema', period), lambda: calculate_ema(self.closes, period))
+    
+    def macd(self, fast: int = 9, slow: int = 20, signal: int = 3) -> Tuple[List[float], List[float]]:
+        """MACD line and signal line, built on the shared EMA nodes."""
+        def compute():
+            macd_line = [f - s for f, s in zip(self.ema(fast), self.ema(slow))]
+            return macd_line, calculate_ema(macd_line, signal)
+        return self.node(('macd', fast, slow, signal), compute)
+    
+    def rsi(self, period: int = 7) -> List[float]:
+        """RSI of the closes."""
+        return self.node(('rsi', period), lambda: calculate_rsi(self.closes, period))
+    
+    def bollinger(self, period: int = 20, std_dev: float = 2.0) -> Tuple[List[float], List[float], List[float]]:
+        """Bollinger upper band, SMA and lower band for every close."""
+        return self.node(('bollinger', period, std_dev),
+                         lambda: calculate_bollinger_bands(self.closes, period, std_dev))
+    
+    def atr(self, period: int = 14) -> List[float]:
+        """Wilder ATR for every candle."""
+        return self.node(('atr', period), lambda: calculate_atr(self.highs, self.lows, self.closes, period))
+
+class IndicatorRegistry:
+    """
+    Process-wide graphs keyed by price series version.
+    
+    The strategy modules, the volatility filter and the market monitor all
+    ask the registry for the graph of the market_data they were given, so
+    within one candle update every indicator is computed once no matter
+    how many consumers or signals use it. The least recently used graphs
+    are dropped beyond ``max_series``.
+    """
+    
+    _instance = None
+    
+    def __init__(self, max_series: int = 256):
+        """
+        Initialize indicator registry.
+        
+        Args:
+            max_series (int): Maximum number of series versions kept
+        """
+        self.max_series = max_series
+        self._graphs: 'OrderedDict[Tuple, IndicatorGraph]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(cls) -> 'IndicatorRegistry':
+        """
+        Get the shared indicator registry.
+        
+        Returns:
+            IndicatorRegistry: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = IndicatorRegistry()
+        return cls._instance
+    
+    def __len__(self) -> int:
+        return len(self._graphs)
+    
+    def graph(self, market_data: Dict[str, Any]) -> IndicatorGraph:
+        """
+        Get the graph for a market_data dict's current series version.
+        
+        Args:
+            market_data (Dict[str, Any]): Market data with list-valued OHLCV fields
+        
+        Returns:
+            IndicatorGraph: Shared graph for this version
+        """
+        key = series_key(market_data)
+        with self._lock:
+            graph = self._graphs.get(key)
+            if graph is not None:
+                self._graphs.move_to_end(key)
+                return graph
+            
+            graph = IndicatorGraph.from_market_data(market_data)
+            self._graphs[key] = graph
+            if len(self._graphs) > self.max_series:
+                self._graphs.popitem(last=False)
+            return graph
+    
+    def stats(self) -> Dict[str, int]:
+        """Get node hit/miss counts across the cached graphs."""
+        with self._lock:
+            graphs = list(self._graphs.values())
+        return {
+            'series': len(graphs),
+            'hits': sum(g.hits for g in graphs),
+            'misses': sum(g.misses for g in graphs)
+        }
+
+def indicator_graph(market_data: Dict[str, Any]) -> IndicatorGraph:
+    """
+    Get the shared indicator graph for market data.
+    
+    Args:
+        market_data (Dict[str, Any]): Market data with list-valued OHLCV fields
+    
+    Returns:
+        IndicatorGraph: Graph shared by every consumer of this series version
+    """
+    return IndicatorRegistry.get_instance().graph(market_data)
@@ -57,9 +57,16 @@ def calculate_rsi(prices: List[float], period: int = 7) -> List[float]:
 def calculate_bollinger_bands(prices: List[float], period: int = 20, 
                             std_dev: float = 2.0) -> Tuple[List[float], List[float], List[float]]:
     """Calculate Bollinger Bands."""
-    prices = np.array(prices)
-    sma = [np.mean(prices[max(0, i-period+1):i+1]) for i in range(len(prices))]
-    std = [np.std(prices[max(0, i-period+1):i+1]) for i in range(len(prices))]
+    prices = np.array(prices, dtype=float)
+    
+    # Windows still filling up one by one, full windows in a single pass
+    head = range(min(period - 1, len(prices)))
+    sma = [np.mean(prices[:i+1]) for i in head]
+    std = [np.std(prices[:i+1]) for i in head]
+    if len(prices) >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, period)
+        sma.extend(windows.mean(axis=1))
+        std.extend(windows.std(axis=1))
     
     upper_band = [sma[i] + std_dev * std[i] for i in range(len(prices))]
     lower_band = [sma[i] - std_dev * std[i] for i in range(len(prices))]
@@ -84,4 +91,86 @@ def calculate_atr(high: List[float], low: List[float],
     for i in range(1, len(tr)):
         atr.append((atr[-1] * (period - 1) + tr[i]) / period)
     
-    return atr
\ No newline at end of file
+    return atr
+
+
+# Batch versions: rows are markets, columns are bars (oldest first). Each row
+# gives the same values as the single-series function on that row's prices.
+
+def calculate_ema_batch(prices: np.ndarray, period: int) -> np.ndarray:
+    """Calculate EMA along the bar axis of a (markets, bars) array."""
+    prices = np.asarray(prices, dtype=float)
+    alpha = 2 / (period + 1)
+    ema = np.empty_like(prices)
+    ema[:, 0] = prices[:, 0]
+    
+    for i in range(1, prices.shape[1]):
+        ema[:, i] = prices[:, i] * alpha + ema[:, i - 1] * (1 - alpha)
+    
+    return ema
+
+def calculate_macd_batch(prices: np.ndarray, fast_period: int = 9, slow_period: int = 20,
+                         signal_period: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate MACD and Signal line for a (markets, bars) array."""
+    macd_line = calculate_ema_batch(prices, fast_period) - calculate_ema_batch(prices, slow_period)
+    return macd_line, calculate_ema_batch(macd_line, signal_period)
+
+def calculate_rsi_batch(prices: np.ndarray, period: int = 7) -> np.ndarray:
+    """
+    Calculate RSI for a (markets, bars) array.
+    
+    Returns a (markets, bars - period) array. Like calculate_rsi, a market
+    with no losses in its first ``period`` moves reads 100 throughout.
+    """
+    prices = np.asarray(prices, dtype=float)
+    deltas = np.diff(prices, axis=1)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    
+    avg_gain = gains[:, :period].mean(axis=1)
+    avg_loss = losses[:, :period].mean(axis=1)
+    no_initial_loss = avg_loss == 0
+    
+    rsi = np.empty((prices.shape[0], max(1, prices.shape[1] - period)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi[:, 0] = np.where(no_initial_loss, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+        
+        for i in range(period, prices.shape[1] - 1):
+            avg_gain = (avg_gain * (period - 1) + gains[:, i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[:, i]) / period
+            rsi[:, i - period + 1] = np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+    
+    rsi[no_initial_loss] = 100.0
+    return rsi
+
+def calculate_bollinger_bands_batch(prices: np.ndarray, period: int = 20,
+                                    std_dev: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate Bollinger Bands for a (markets, bars) array."""
+    prices = np.asarray(prices, dtype=float)
+    sma = np.empty_like(prices)
+    std = np.empty_like(prices)
+    
+    for i in range(min(period - 1, prices.shape[1])):
+        sma[:, i] = prices[:, :i+1].mean(axis=1)
+        std[:, i] = prices[:, :i+1].std(axis=1)
+    if prices.shape[1] >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(prices, period, axis=1)
+        sma[:, period-1:] = windows.mean(axis=2)
+        std[:, period-1:] = windows.std(axis=2)
+    
+    return sma + std_dev * std, sma, sma - std_dev * std
+
+def calculate_atr_batch(high: np.ndarray, low: np.ndarray,
+                        close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Calculate Average True Range for (markets, bars) arrays."""
+    high, low, close = (np.asarray(a, dtype=float) for a in (high, low, close))
+    tr = high - low
+    tr[:, 1:] = np.maximum(np.maximum(tr[:, 1:], np.abs(high[:, 1:] - close[:, :-1])),
+                           np.abs(low[:, 1:] - close[:, :-1]))
+    
+    atr = np.empty_like(tr)
+    atr[:, 0] = tr[:, 0]
+    for i in range(1, tr.shape[1]):
+        atr[:, i] = (atr[:, i - 1] * (period - 1) + tr[:, i]) / period
+    
+    return atr
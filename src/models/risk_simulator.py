@@ -0,0 +1,187 @@
+"""
+Vectorized Monte Carlo simulation of RiskManager staking and Martingale tiers.
+"""
+
+from typing import Callable, Dict, List, Optional, Any, Iterable
+
+import numpy as np
+
+from src.models.risk_manager import RiskManager
+
+class RiskSimulator:
+    """
+    Runs many independent trade sequences at once with RiskManager's rules.
+
+    Every path is one account. Per trade: no stake is placed once the day's
+    loss reaches the daily limit; the stake is ``balance * base_stake_percent%
+    * 2 ** (tier - 1)`` rounded to cents; a win resets the tier to 1, a loss
+    raises it and resets it to 1 after ``max_martingale_tier``. Daily loss
+    counters reset every ``trades_per_day`` trades. State is held in NumPy
+    arrays, so the Python loop runs once per trade, not once per path.
+    """
+
+    def __init__(self, initial_balance: float = 1000.0, base_stake_percent: float = 1.0,
+                 max_martingale_tier: int = 4, max_daily_loss_percent: float = 10.0):
+        """
+        Initialize risk simulator.
+
+        Args:
+            initial_balance (float): Starting balance of every path
+            base_stake_percent (float): Base stake as percentage of balance
+            max_martingale_tier (int): Maximum Martingale multiplication tier
+            max_daily_loss_percent (float): Maximum daily loss percentage
+        """
+        self.initial_balance = initial_balance
+        self.base_stake_percent = base_stake_percent
+        self.max_martingale_tier = max_martingale_tier
+        self.max_daily_loss_percent = max_daily_loss_percent
+
+    @classmethod
+    def from_risk_manager(cls, risk_manager: RiskManager) -> 'RiskSimulator':
+        """
+        Build a simulator with the parameters of an existing RiskManager.
+
+        Args:
+            risk_manager (RiskManager): Source of balance, stake and tier settings
+
+        Returns:
+            RiskSimulator: Simulator starting from the manager's current balance
+        """
+        return cls(
+            initial_balance=risk_manager.current_balance,
+            base_stake_percent=risk_manager.base_stake_percent,
+            max_martingale_tier=risk_manager.max_martingale_tier,
+            max_daily_loss_percent=risk_manager.max_daily_loss / risk_manager.initial_balance * 100
+        )
+
+    def simulate(self, win_rate: float, payout: float = 0.85, paths: int = 100_000,
+                 days: int = 30, trades_per_day: int = 20, ruin_drawdown: float = 0.5,
+                 seed: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Simulate independent trade sequences.
+
+        Args:
+            win_rate (float): Probability that a trade wins
+            payout (float): Profit per unit staked on a win
+            paths (int): Number of independent accounts
+            days (int): Trading days per path
+            trades_per_day (int): Trade opportunities per day
+            ruin_drawdown (float): Drawdown from the peak that counts as ruin
+            seed (Optional[int]): Random seed for reproducible runs
+
+        Returns:
+            Dict[str, Any]: Ruin probability, P&L and drawdown distributions
+        """
+        rng = np.random.default_rng(seed)
+        # Same daily cap as RiskManager: a fixed share of the initial balance
+        max_daily_loss = self.initial_balance * (self.max_daily_loss_percent / 100)
+        stake_fraction = self.base_stake_percent / 100
+
+        balance = np.full(paths, self.initial_balance, dtype=np.float64)
+        peak = balance.copy()
+        min_ratio = np.ones(paths)                     # lowest balance / running peak
+        daily_loss = np.zeros(paths)
+        tier = np.zeros(paths, dtype=np.intp)          # zero-based Martingale tier
+        alive = np.ones(paths, dtype=bool)             # not ruined yet
+        tier_fractions = stake_fraction * 2.0 ** np.arange(self.max_martingale_tier)
+        ruin_ratio = 1.0 - ruin_drawdown
+        trades = 0
+        blocked = 0
+
+        # Scratch arrays reused every trade to avoid per-step allocations
+        stake = np.empty(paths)
+        pnl = np.empty(paths)
+        ratio = np.empty(paths)
+        active = np.empty(paths, dtype=bool)
+        lost = np.empty(paths, dtype=bool)
+        keep = np.empty(paths, dtype=bool)
+        next_tier = np.empty(paths, dtype=np.intp)
+
+        for _ in range(days):
+            daily_loss[:] = 0.0
+            # Same draws, in the same order, as one rng.random(paths) per trade
+            outcomes = rng.random((trades_per_day, paths)) < win_rate
+            for win in outcomes:
+                np.less(daily_loss, max_daily_loss, out=active)
+                active &= alive
+                active_count = np.count_nonzero(active)
+                trades += active_count
+                blocked += np.count_nonzero(alive) - active_count
+
+                np.take(tier_fractions, tier, out=stake)
+                stake *= balance
+                np.round(stake, 2, out=stake)
+                stake *= active
+
+                # +stake * payout on a win, -stake on a loss
+                np.multiply(win, payout + 1.0, out=pnl)
+                pnl -= 1.0
+                pnl *= stake
+                balance += pnl
+
+                np.greater(active, win, out=lost)
+                np.multiply(stake, lost, out=pnl)
+                daily_loss += pnl
+
+                # Loss: next tier, wrapping to the first after the cap; win: first tier
+                np.add(tier, 1, out=next_tier)
+                np.less(next_tier, self.max_martingale_tier, out=keep)
+                keep &= lost
+                next_tier *= keep
+                np.copyto(tier, next_tier, where=active)
+
+                np.maximum(peak, balance, out=peak)
+                np.divide(balance, peak, out=ratio)
+                np.minimum(min_ratio, ratio, out=min_ratio)
+                np.greater(ratio, ruin_ratio, out=keep)
+                alive &= keep
+
+        pnl_total = balance - self.initial_balance
+        max_drawdown = 1.0 - min_ratio
+        ruined = ~alive
+        percentiles = (5, 25, 50, 75, 95)
+        return {
+            'win_rate': win_rate,
+            'payout': payout,
+            'paths': paths,
+            'days': days,
+            'trades_per_day': trades_per_day,
+            'ruin_drawdown': ruin_drawdown,
+            'ruin_probability': float(ruined.mean()),
+            'expected_pnl': float(pnl_total.mean()),
+            'pnl_std': float(pnl_total.std()),
+            'pnl_percentiles': dict(zip(percentiles, np.percentile(pnl_total, percentiles).tolist())),
+            'max_drawdown_mean': float(max_drawdown.mean()),
+            'max_drawdown_percentiles': dict(zip(percentiles, np.percentile(max_drawdown, percentiles).tolist())),
+            'profitable_probability': float((pnl_total > 0).mean()),
+            'mean_trades': trades / paths,
+            'mean_blocked_by_daily_limit': blocked / paths
+        }
+
+    def simulate_grid(self, win_rates: Iterable[float], payouts: Iterable[float],
+                      progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+                      **kwargs) -> List[Dict[str, Any]]:
+        """
+        Simulate every combination of win rate and payout.
+
+        Args:
+            win_rates (Iterable[float]): Win probabilities to test
+            payouts (Iterable[float]): Payouts to test
+            progress (Optional[Callable]): Called as (done, total, result) after each combination
+            **kwargs: Passed to simulate()
+
+        Returns:
+            List[Dict[str, Any]]: One simulate() result per combination
+        """
+        grid = [(win_rate, payout) for win_rate in win_rates for payout in payouts]
+        results = []
+        for win_rate, payout in grid:
+            results.append(self.simulate(win_rate, payout, **kwargs))
+            if progress is not None:
+                progress(len(results), len(grid), results[-1])
+        return results
+
+    @staticmethod
+    def breakeven_win_rate(payout: float) -> float:
+        """Win rate at which a flat-stake strategy breaks even for a payout."""
+        return 1.0 / (1.0 + payout)
@@ -2,14 +2,26 @@
 Trading strategy implementation combining multiple analysis modules.
 """
 
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from .indicator_graph import IndicatorGraph, indicator_graph
 from .indicators import (
-    calculate_ema, calculate_macd, calculate_rsi,
-    calculate_bollinger_bands, calculate_atr
+    calculate_ema_batch, calculate_macd_batch, calculate_rsi_batch,
+    calculate_bollinger_bands_batch, calculate_atr_batch
 )
 
+# Batch signal codes
+BUY, SELL, NO_SIGNAL = 1, -1, 0
+SIGNAL_NAMES = {BUY: 'BUY', SELL: 'SELL', NO_SIGNAL: 'NONE'}
+
+# Fewest bars the batch evaluation accepts (EMA(21) crossover needs two values)
+MIN_BATCH_BARS = 22
+
 class TradingStrategy:
+    # Recorded with every outcome so results can be compared per strategy
+    name = "trend_reversal_volatility"
+    
     def __init__(self, timeframe: int = 1):
         """
         Initialize trading strategy.
@@ -20,18 +32,24 @@ class TradingStrategy:
         self.timeframe = timeframe
         self.last_signal_time = None
         
-    def analyze_trend(self, prices: List[float], volumes: List[float]) -> str:
+    def analyze_trend(self, prices: List[float], volumes: List[float],
+                      graph: Optional[IndicatorGraph] = None) -> str:
         """
         Analyze trend using EMA crossover and MACD.
         
+        Args:
+            graph (Optional[IndicatorGraph]): Shared indicators for these prices
+        
         Returns:
             str: 'BUY', 'SELL', or 'NONE'
         """
+        graph = graph or IndicatorGraph(prices, volumes=volumes)
+        
         # Calculate indicators
-        ema_fast = calculate_ema(prices, 5)
-        ema_slow = calculate_ema(prices, 21)
-        macd_line, signal_line = calculate_macd(prices)
-        rsi = calculate_rsi(prices, 7)
+        ema_fast = graph.ema(5)
+        ema_slow = graph.ema(21)
+        macd_line, signal_line = graph.macd()
+        rsi = graph.rsi(7)
         
         # Check last two values for crossover
         if (ema_fast[-2] <= ema_slow[-2] and ema_fast[-1] > ema_slow[-1] and
@@ -44,14 +62,18 @@ class TradingStrategy:
         return 'NONE'
     
     def analyze_reversal(self, prices: List[float], highs: List[float], 
-                        lows: List[float]) -> str:
+                        lows: List[float], graph: Optional[IndicatorGraph] = None) -> str:
         """
         Analyze potential reversals using RSI and price action.
         
+        Args:
+            graph (Optional[IndicatorGraph]): Shared indicators for these prices
+        
         Returns:
             str: 'BUY', 'SELL', or 'NONE'
         """
-        rsi = calculate_rsi(prices, 5)
+        graph = graph or IndicatorGraph(prices, highs, lows)
+        rsi = graph.rsi(5)
         
         # Check for oversold/overbought conditions
         if rsi[-1] < 30 and prices[-1] > prices[-2]:  # Bullish reversal
@@ -62,15 +84,19 @@ class TradingStrategy:
         return 'NONE'
     
     def analyze_volatility(self, prices: List[float], highs: List[float], 
-                         lows: List[float]) -> str:
+                         lows: List[float], graph: Optional[IndicatorGraph] = None) -> str:
         """
         Analyze volatility breakouts using Bollinger Bands and ATR.
         
+        Args:
+            graph (Optional[IndicatorGraph]): Shared indicators for these prices
+        
         Returns:
             str: 'BUY', 'SELL', or 'NONE'
         """
-        upper_band, sma, lower_band = calculate_bollinger_bands(prices)
-        atr = calculate_atr(highs, lows, prices)
+        graph = graph or IndicatorGraph(prices, highs, lows)
+        upper_band, sma, lower_band = graph.bollinger(20)
+        atr = graph.atr(14)
         
         # Calculate ATR ratio
         atr_ratio = atr[-1] / atr[-5] if len(atr) >= 5 else 1.0
@@ -112,10 +138,13 @@ class TradingStrategy:
         lows = market_data['lows']
         volumes = market_data['volumes']
         
+        # Every module (and the volatility filter) reads the same shared nodes
+        graph = indicator_graph(market_data)
+        
         # Get signals from each module
-        trend_signal = self.analyze_trend(prices, volumes)
-        reversal_signal = self.analyze_reversal(prices, highs, lows)
-        volatility_signal = self.analyze_volatility(prices, highs, lows)
+        trend_signal = self.analyze_trend(prices, volumes, graph)
+        reversal_signal = self.analyze_reversal(prices, highs, lows, graph)
+        volatility_signal = self.analyze_volatility(prices, highs, lows, graph)
         
         # Count signals
         buy_signals = sum(1 for s in [trend_signal, reversal_signal, volatility_signal] 
@@ -139,4 +168,88 @@ class TradingStrategy:
                 'time': datetime.now()
             }
         
-        return None
\ No newline at end of file
+        return None
+    
+    def generate_signals_batch(self, closes: np.ndarray, highs: np.ndarray, lows: np.ndarray,
+                               markets: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Evaluate many markets at once with the rules of generate_signal().
+        
+        Every indicator is computed along the bar axis for all markets in one
+        pass, and the three modules vote per market exactly as they do for a
+        single market.
+        
+        Args:
+            closes (np.ndarray): Close prices, shape (markets, bars), oldest bar first
+            highs (np.ndarray): High prices, same shape
+            lows (np.ndarray): Low prices, same shape
+            markets (Optional[List[str]]): Symbol of each row, for the news filter
+            
+        Returns:
+            np.ndarray: int8 code per market: BUY (1), SELL (-1) or NO_SIGNAL (0)
+        """
+        closes = np.asarray(closes, dtype=float)
+        highs = np.asarray(highs, dtype=float)
+        lows = np.asarray(lows, dtype=float)
+        if closes.ndim != 2 or closes.shape != highs.shape or closes.shape != lows.shape:
+            raise ValueError("closes, highs and lows must be (markets, bars) arrays of one shape")
+        if closes.shape[1] < MIN_BATCH_BARS:
+            raise ValueError(f"Batch evaluation needs at least {MIN_BATCH_BARS} bars")
+        
+        last, previous = closes[:, -1], closes[:, -2]
+        
+        # Trend: EMA(5)/EMA(21) crossover confirmed by MACD and RSI(7)
+        ema_fast = calculate_ema_batch(closes, 5)[:, -2:]
+        ema_slow = calculate_ema_batch(closes, 21)[:, -2:]
+        macd_line, signal_line = calculate_macd_batch(closes)
+        rsi = calculate_rsi_batch(closes, 7)[:, -1]
+        macd_gap = macd_line[:, -1] - signal_line[:, -1]
+        trend = np.select(
+            [(ema_fast[:, 0] <= ema_slow[:, 0]) & (ema_fast[:, 1] > ema_slow[:, 1]) & (macd_gap > 0) & (rsi > 50),
+             (ema_fast[:, 0] >= ema_slow[:, 0]) & (ema_fast[:, 1] < ema_slow[:, 1]) & (macd_gap < 0) & (rsi < 50)],
+            [BUY, SELL], NO_SIGNAL)
+        
+        # Reversal: RSI(5) extremes with the last bar turning
+        rsi = calculate_rsi_batch(closes, 5)[:, -1]
+        reversal = np.select([(rsi < 30) & (last > previous), (rsi > 70) & (last < previous)],
+                             [BUY, SELL], NO_SIGNAL)
+        
+        # Volatility: band breakout during an ATR spike
+        upper_band, _, lower_band = calculate_bollinger_bands_batch(closes)
+        atr = calculate_atr_batch(highs, lows, closes)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr_ratio = atr[:, -1] / atr[:, -5]
+        spike = atr_ratio >= 1.2
+        volatility = np.select([spike & (last > upper_band[:, -1]), spike & (last < lower_band[:, -1])],
+                               [BUY, SELL], NO_SIGNAL)
+        
+        # At least two modules must agree
+        votes = np.stack([trend, reversal, volatility])
+        buys, sells = (votes == BUY).sum(axis=0), (votes == SELL).sum(axis=0)
+        signals = np.select([buys >= 2, sells >= 2], [BUY, SELL], NO_SIGNAL).astype(np.int8)
+        
+        if markets is not None:
+            allowed = np.array([self.check_news_filter(market) for market in markets], dtype=bool)
+            signals[~allowed] = NO_SIGNAL
+        
+        return signals
+    
+    def evaluate_markets(self, store, markets: List[str], bars: int = 100) -> Dict[str, str]:
+        """
+        Evaluate buffered markets from a candle store in one batch.
+        
+        Args:
+            store (CandleStore): Candle store holding this timeframe's buffers
+            markets (List[str]): Market symbols
+            bars (int): Newest bars used per market
+            
+        Returns:
+            Dict[str, str]: 'BUY', 'SELL' or 'NONE' per market; markets with
+                fewer than ``bars`` buffered candles are left out
+        """
+        included, data = store.stack(markets, self.timeframe, bars)
+        if not included:
+            return {}
+        highs, lows, closes = data
+        signals = self.generate_signals_batch(closes, highs, lows, included)
+        return {market: SIGNAL_NAMES[int(code)] for market, code in zip(included, signals)}
@@ -0,0 +1,143 @@
+"""
+Strategy backtests over stored bar history, settled by the result tracker.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from models.signal import Signal
+from src.models.risk_manager import RiskManager
+from src.models.strategy import TradingStrategy, SIGNAL_NAMES, NO_SIGNAL, MIN_BATCH_BARS
+from src.service.market_history import HistoryStore, TS, OPEN, HIGH, LOW, CLOSE, VOLUME
+from src.service.result_tracker import ResultTracker
+
+def bar_minutes(bars: np.ndarray) -> int:
+    """Bar period of a history array in minutes (median timestamp spacing)."""
+    if bars.shape[1] < 2:
+        return 1
+    return max(1, int(round(float(np.median(np.diff(bars[TS]))) / 60)))
+
+def history_signals(strategy: TradingStrategy, market: str, bars: np.ndarray,
+                    lookback: int = 100, accuracy: str = "85%",
+                    chunk_size: int = 2000) -> List[Signal]:
+    """
+    Replay a strategy bar by bar over one market's history.
+
+    Windows of ``lookback`` bars are evaluated with batch calls. A signal
+    on the window ending at bar i enters at the open of bar i + 1 and expires
+    one bar later, so the last bar never produces a signal.
+
+    Args:
+        strategy (TradingStrategy): Strategy to evaluate
+        market (str): Market symbol
+        bars (np.ndarray): HistoryStore bar array, oldest first
+        lookback (int): Bars per evaluation window
+        accuracy (str): Accuracy label attached to signals
+        chunk_size (int): Windows per batch call
+
+    Returns:
+        List[Signal]: Signals in time order
+    """
+    lookback = max(lookback, MIN_BATCH_BARS)
+    if bars.shape[1] <= lookback:
+        return []
+
+    # Windows ending at every bar except the last one, evaluated in chunks
+    # so the batch indicators stay a bounded size on long histories
+    window = np.lib.stride_tricks.sliding_window_view
+    closes = window(bars[CLOSE, :-1], lookback)
+    highs = window(bars[HIGH, :-1], lookback)
+    lows = window(bars[LOW, :-1], lookback)
+    codes = np.concatenate([
+        strategy.generate_signals_batch(closes[i:i + chunk_size], highs[i:i + chunk_size],
+                                        lows[i:i + chunk_size])
+        for i in range(0, len(closes), chunk_size)
+    ])
+
+    minutes = bar_minutes(bars)
+    signals = []
+    for offset in np.flatnonzero(codes != NO_SIGNAL):
+        entry = bars[TS, lookback + offset]
+        signals.append(Signal(market, f"{minutes} min", accuracy, SIGNAL_NAMES[int(codes[offset])],
+                              datetime.fromtimestamp(entry), 1.0))
+    return signals
+
+def _market_data(market: str, bars: np.ndarray) -> Dict[str, Any]:
+    """market_data dict for ResultTracker.replay() (timestamps in milliseconds)."""
+    return {
+        'market': market,
+        'timeframe': bar_minutes(bars),
+        'timestamps': (bars[TS] * 1000).tolist(),
+        'opens': bars[OPEN].tolist(),
+        'highs': bars[HIGH].tolist(),
+        'lows': bars[LOW].tolist(),
+        'closes': bars[CLOSE].tolist(),
+        'volumes': bars[VOLUME].tolist()
+    }
+
+def run_backtest(markets: List[str], risk_manager: RiskManager,
+                 strategy: Optional[TradingStrategy] = None,
+                 store: Optional[HistoryStore] = None,
+                 tracker: Optional[ResultTracker] = None,
+                 lookback: int = 100) -> Dict[str, Any]:
+    """
+    Backtest a strategy over stored history and trade the results.
+
+    Signals of every market are settled with ResultTracker.replay() under the
+    strategy's name, then taken in time order through the risk manager:
+    each trade is staked with calculate_stake() and booked with
+    update_balance(). Daily loss limits reset on each historical day.
+
+    Args:
+        markets (List[str]): Market symbols with stored history
+        risk_manager (RiskManager): Account the trades are booked on
+        strategy (Optional[TradingStrategy]): Strategy, the default one if None
+        store (Optional[HistoryStore]): Bar source, the shared store by default
+        tracker (Optional[ResultTracker]): Receives the outcomes, a fresh one by default
+        lookback (int): Bars per evaluation window
+
+    Returns:
+        Dict[str, Any]: Signals, settled results, trades taken and skipped,
+            final balance and the tracker statistics
+    """
+    strategy = strategy or TradingStrategy()
+    store = store or HistoryStore.get_instance()
+    tracker = tracker or ResultTracker()
+
+    signals, market_data = [], {}
+    for market in markets:
+        bars = store.bars(market)
+        signals.extend(history_signals(strategy, market, bars, lookback))
+        market_data[market] = _market_data(market, bars)
+    signals.sort(key=lambda s: (s.signal_time, s.market))
+
+    results = tracker.replay(signals, market_data, strategy.name)
+
+    trades, skipped, day = 0, 0, None
+    for result in results:
+        if result['signal_time'].date() != day:
+            day = result['signal_time'].date()
+            risk_manager.daily_loss = 0
+            risk_manager.daily_profit = 0
+        if result['outcome'] == 'draw':
+            continue
+
+        stake = risk_manager.calculate_stake()
+        if stake is None or stake > risk_manager.current_balance:
+            skipped += 1
+            continue
+        win = result['outcome'] == 'win'
+        risk_manager.update_balance(stake * tracker.payout if win else -stake, win)
+        trades += 1
+
+    return {
+        'strategy': strategy.name,
+        'signals': len(signals),
+        'results': results,
+        'trades': trades,
+        'skipped': skipped,
+        'balance': risk_manager.current_balance,
+        'stats': tracker.get_stats()
+    }
@@ -0,0 +1,250 @@
+"""
+In-memory candle buffers kept warm between signal evaluations.
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Any, Tuple
+
+# Column layout shared by every buffer (timestamps are API milliseconds)
+CANDLE_FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+class CandleBuffer:
+    """
+    Fixed-capacity OHLCV buffer for one market/timeframe pair.
+
+    Columns are stored contiguously so every accessor is a single slice copy.
+    The backing array holds twice the capacity; when the write position
+    reaches the end, the newest ``capacity`` rows are moved to the front,
+    which keeps appends amortised O(1). A per-buffer lock keeps readers from
+    seeing rows that a concurrent extend() is moving.
+    """
+
+    def __init__(self, market: str, timeframe: int, capacity: int = 500):
+        """
+        Initialize candle buffer.
+
+        Args:
+            market (str): Market symbol
+            timeframe (int): Timeframe in minutes
+            capacity (int): Maximum number of candles retained
+        """
+        self.market = market
+        self.timeframe = timeframe
+        self.capacity = capacity
+        self.version = 0
+
+        self._data = np.zeros((len(CANDLE_FIELDS), capacity * 2), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest candle, or None when empty."""
+        with self._lock:
+            return self._last_timestamp()
+
+    def _last_timestamp(self) -> Optional[float]:
+        if self._end == self._start:
+            return None
+        return float(self._data[0, self._end - 1])
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        Get an ordered copy of one column.
+
+        Args:
+            field (str): One of CANDLE_FIELDS
+
+        Returns:
+            np.ndarray: Column values, oldest first
+        """
+        row = CANDLE_FIELDS.index(field)
+        with self._lock:
+            return self._data[row, self._start:self._end].copy()
+
+    def window(self, count: int) -> np.ndarray:
+        """
+        Get a copy of the newest ``count`` candles as one (field, candle) array.
+
+        Args:
+            count (int): Number of candles, capped at the buffer length
+
+        Returns:
+            np.ndarray: Rows ordered like CANDLE_FIELDS, oldest candle first
+        """
+        with self._lock:
+            return self._data[:, max(self._start, self._end - count):self._end].copy()
+
+    def extend(self, candles: List[Dict[str, Any]]) -> int:
+        """
+        Append candles newer than the last buffered one.
+
+        A candle with the same timestamp as the newest buffered one replaces
+        it, so the forming candle follows the live price until it closes.
+
+        Args:
+            candles (List[Dict[str, Any]]): Candle dicts as returned by the API
+
+        Returns:
+            int: Number of candles appended or changed in place
+        """
+        with self._lock:
+            last_ts = self._last_timestamp()
+            forming = None
+            fresh = []
+            for candle in candles:
+                ts = candle.get('timestamp', 0)
+                if last_ts is None or ts > last_ts:
+                    fresh.append(candle)
+                elif ts == last_ts:
+                    forming = candle
+
+            # A re-fetched forming candle that has not moved is not a change
+            replaced = False
+            if forming is not None:
+                row = np.array([forming.get(field, 0) for field in CANDLE_FIELDS], dtype=np.float64)
+                replaced = not np.array_equal(self._data[:, self._end - 1], row)
+                if replaced:
+                    self._data[:, self._end - 1] = row
+            if not fresh:
+                if replaced:
+                    self.version += 1
+                return int(replaced)
+
+            fresh = fresh[-self.capacity:]
+            rows = np.array([[c.get(field, 0) for field in CANDLE_FIELDS] for c in fresh],
+                            dtype=np.float64).T
+            count = rows.shape[1]
+
+            if self._end + count > self._data.shape[1]:
+                keep = min(len(self), self.capacity - count)
+                self._data[:, :keep] = self._data[:, self._end - keep:self._end]
+                self._start, self._end = 0, keep
+
+            self._data[:, self._end:self._end + count] = rows
+            self._end += count
+            if len(self) > self.capacity:
+                self._start = self._end - self.capacity
+
+            self.version += 1
+            return count + int(replaced)
+
+    def to_market_data(self, count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build a market_data dict compatible with the strategy and filters.
+
+        Args:
+            count (Optional[int]): Only include the newest ``count`` candles
+
+        Returns:
+            Dict[str, Any]: Market data with list-valued OHLCV fields
+        """
+        with self._lock:
+            start = self._start if count is None else max(self._start, self._end - count)
+            data = self._data[:, start:self._end].copy()
+
+        return {
+            'market': self.market,
+            'timeframe': self.timeframe,
+            'timestamps': data[0].tolist(),
+            'opens': data[1].tolist(),
+            'highs': data[2].tolist(),
+            'lows': data[3].tolist(),
+            'closes': data[4].tolist(),
+            'volumes': data[5].tolist(),
+            'source': 'quotex_live',
+            'live_data': True
+        }
+
+class CandleStore:
+    """Process-wide collection of candle buffers keyed by (market, timeframe)."""
+
+    _instance = None
+
+    def __init__(self, capacity: int = 500):
+        """
+        Initialize candle store.
+
+        Args:
+            capacity (int): Capacity of each buffer created by the store
+        """
+        self.capacity = capacity
+        self._buffers: Dict[Tuple[str, int], CandleBuffer] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'CandleStore':
+        """
+        Get the shared candle store.
+
+        Returns:
+            CandleStore: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = CandleStore()
+        return cls._instance
+
+    def get(self, market: str, timeframe: int) -> CandleBuffer:
+        """Get the buffer for a market/timeframe, creating it if needed."""
+        key = (market, timeframe)
+        with self._lock:
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = CandleBuffer(market, timeframe, self.capacity)
+                self._buffers[key] = buffer
+            return buffer
+
+    def keys(self) -> List[Tuple[str, int]]:
+        """Get all (market, timeframe) pairs currently buffered."""
+        with self._lock:
+            return list(self._buffers.keys())
+
+    def stack(self, markets: List[str], timeframe: int, count: int,
+              fields: Tuple[str, ...] = ('high', 'low', 'close')) -> Tuple[List[str], np.ndarray]:
+        """
+        Stack the newest ``count`` candles of several markets into one array.
+
+        Args:
+            markets (List[str]): Market symbols
+            timeframe (int): Timeframe in minutes
+            count (int): Bars per market; markets with fewer buffered are skipped
+            fields (Tuple[str, ...]): Columns to include, from CANDLE_FIELDS
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Included markets and a
+                (field, market, bar) array, oldest bar first
+        """
+        rows = [CANDLE_FIELDS.index(f) for f in fields]
+        included, windows = [], []
+        for market in markets:
+            buffer = self.get(market, timeframe)
+            if len(buffer) >= count:
+                included.append(market)
+                windows.append(buffer.window(count)[rows])
+
+        data = np.stack(windows, axis=1) if windows else np.empty((len(rows), 0, count))
+        return included, data
+
+    def refresh(self, api, market: str, timeframe: int, count: int = 100) -> CandleBuffer:
+        """
+        Pull the latest candles from a connected API into the buffer.
+
+        Args:
+            api: Connected QuotexAPI instance
+            market (str): Market symbol
+            timeframe (int): Timeframe in minutes
+            count (int): Number of candles to request
+
+        Returns:
+            CandleBuffer: The updated buffer
+        """
+        buffer = self.get(market, timeframe)
+        candles = api.get_candles(market, timeframe, count)
+        if candles:
+            buffer.extend(candles)
+        return buffer
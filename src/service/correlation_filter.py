@@ -0,0 +1,335 @@
+"""
+Correlation-aware deduplication of signals that carry the same exposure.
+"""
+
+import copy
+import threading
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from src.service.candle_buffer import CandleStore
+from src.service.news_filter import NewsFilter
+from src.service.result_tracker import signal_timeframe_minutes
+
+# Only used for its symbol -> currency split
+_news_filter = NewsFilter()
+
+class CorrelationTracker:
+    """
+    Rolling return-correlation matrix across markets.
+
+    Returns are bucketed by candle period and pushed one row (all markets) at
+    a time into a ring buffer of ``window`` rows. Running sums and the cross
+    product matrix are updated with the entering and leaving row only, so a
+    new candle costs O(n^2) regardless of the window length. Each tracker
+    follows one timeframe, since its buckets and last closes are only
+    meaningful for that candle period.
+    """
+
+    _instances: Dict[int, 'CorrelationTracker'] = {}
+    _instance_lock = threading.Lock()
+
+    def __init__(self, timeframe: int = 1, window: int = 100, min_samples: int = 20):
+        """
+        Initialize correlation tracker.
+
+        Args:
+            timeframe (int): Timeframe in minutes of the candles to correlate
+            window (int): Number of return rows in the rolling window
+            min_samples (int): Rows required before correlations are trusted
+        """
+        self.timeframe = timeframe
+        self.window = window
+        self.min_samples = min_samples
+
+        self.markets: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._rows = np.zeros((window, 0))
+        self._sum = np.zeros(0)
+        self._cross = np.zeros((0, 0))
+        self._count = 0
+        self._head = 0
+
+        # Per market: last bucket pushed and the close at that bucket
+        self._last_bucket: Optional[int] = None
+        self._last_close: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, timeframe: int = 1) -> 'CorrelationTracker':
+        """
+        Get the shared correlation tracker for a timeframe.
+
+        Args:
+            timeframe (int): Timeframe in minutes
+
+        Returns:
+            CorrelationTracker: One instance per timeframe
+        """
+        with cls._instance_lock:
+            if timeframe not in cls._instances:
+                cls._instances[timeframe] = CorrelationTracker(timeframe)
+            return cls._instances[timeframe]
+
+    @property
+    def samples(self) -> int:
+        """Number of return rows currently in the window."""
+        return self._count
+
+    def _add_market(self, market: str):
+        n = len(self.markets)
+        self._index[market] = n
+        self.markets.append(market)
+        self._rows = np.hstack([self._rows, np.zeros((self.window, 1))])
+        self._sum = np.append(self._sum, 0.0)
+        cross = np.zeros((n + 1, n + 1))
+        cross[:n, :n] = self._cross
+        self._cross = cross
+
+    def push(self, returns: np.ndarray):
+        """
+        Add one row of returns (one value per tracked market).
+
+        Args:
+            returns (np.ndarray): Returns ordered like ``markets``
+        """
+        if self._count == self.window:
+            old = self._rows[self._head]
+            self._sum -= old
+            self._cross -= np.outer(old, old)
+        else:
+            self._count += 1
+
+        self._rows[self._head] = returns
+        self._sum += returns
+        self._cross += np.outer(returns, returns)
+        self._head = (self._head + 1) % self.window
+
+    def sync(self, store: CandleStore) -> int:
+        """
+        Push return rows for candle buckets completed since the last sync.
+
+        Buckets are aligned on candle timestamps; a market without a candle
+        in a bucket contributes a zero return (its price did not move).
+
+        Args:
+            store (CandleStore): Store holding the buffered candles
+
+        Returns:
+            int: Number of rows pushed
+        """
+        period_ms = self.timeframe * 60_000
+        series: Dict[str, Dict[int, float]] = {}
+        for market, tf in store.keys():
+            if tf != self.timeframe:
+                continue
+            buffer = store.get(market, tf)
+            if len(buffer) < 2:
+                continue
+            buckets = (buffer.column('timestamp') // period_ms).astype(np.int64)
+            series[market] = dict(zip(buckets.tolist(), buffer.column('close').tolist()))
+
+        if not series:
+            return 0
+
+        with self._lock:
+            for market in series:
+                if market not in self._index:
+                    self._add_market(market)
+
+            # Only buckets every market has reached are complete
+            end = min(max(closes) for closes in series.values())
+            start = min(min(closes) for closes in series.values())
+            if self._last_bucket is not None:
+                start = max(start, self._last_bucket + 1)
+            start = max(start, end - self.window)
+
+            pushed = 0
+            for bucket in range(start, end + 1):
+                row = np.zeros(len(self.markets))
+                has_returns = False
+                for market, closes in series.items():
+                    close = closes.get(bucket)
+                    if close is None:
+                        continue
+                    previous = self._last_close.get(market)
+                    if previous:
+                        row[self._index[market]] = np.log(close / previous)
+                        has_returns = True
+                    self._last_close[market] = close
+                # The first bucket only seeds the previous closes
+                if has_returns:
+                    self.push(row)
+                    pushed += 1
+
+            self._last_bucket = end
+            return pushed
+
+    def matrix(self) -> np.ndarray:
+        """
+        Get the current correlation matrix.
+
+        Returns:
+            np.ndarray: n x n correlations ordered like ``markets`` (0 where undefined)
+        """
+        with self._lock:
+            if self._count < 2:
+                return np.eye(len(self.markets))
+            mean = self._sum / self._count
+            cov = self._cross / self._count - np.outer(mean, mean)
+            std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+            denom = np.outer(std, std)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr = np.where(denom > 0, cov / denom, 0.0)
+            np.fill_diagonal(corr, 1.0)
+            return np.clip(corr, -1.0, 1.0)
+
+    def index_of(self, market: str) -> Optional[int]:
+        """Row/column of a market in matrix(), None if it is not tracked."""
+        return self._index.get(market)
+
+    def correlation(self, a: str, b: str) -> Optional[float]:
+        """Correlation of two markets, None if either is not tracked yet."""
+        if a not in self._index or b not in self._index or self._count < self.min_samples:
+            return None
+        return float(self.matrix()[self._index[a], self._index[b]])
+
+def leg_similarity(a: str, b: str) -> float:
+    """
+    Similarity of two long positions from their currency legs alone.
+
+    A long pair is long the base and short the quote currency; the result is
+    the cosine between those exposure vectors (EURUSD vs EURGBP: 0.5,
+    EURUSD vs EURUSD-OTC: 1.0, EURUSD vs USDJPY: -0.5).
+    """
+    legs_a = _news_filter._extract_currencies(a.upper())
+    legs_b = _news_filter._extract_currencies(b.upper())
+    exposure_a = dict(zip(legs_a, (1.0, -1.0)))
+    dot = sum(exposure_a.get(leg, 0.0) * sign for leg, sign in zip(legs_b, (1.0, -1.0)))
+    return dot / np.sqrt(len(legs_a) * len(legs_b))
+
+class SignalDeduplicator:
+    """
+    Collapses or down-weights signals that are effectively the same bet.
+
+    Two signals on different markets overlap when they are within the time
+    window of each other and their direction-adjusted market similarity
+    reaches ``threshold``. Signals on the same market are never duplicates
+    of each other; those are consecutive trades. Similarity is the rolling
+    return correlation once enough samples exist, otherwise the shared
+    currency legs. Signals are considered in order of confidence, so the
+    strongest one of each group survives.
+    """
+
+    def __init__(self, tracker: Optional[CorrelationTracker] = None, threshold: float = 0.8,
+                 window_minutes: Optional[float] = None, mode: str = "collapse"):
+        """
+        Initialize signal deduplicator.
+
+        Args:
+            tracker (Optional[CorrelationTracker]): Correlation source, the shared
+                1-minute tracker by default
+            threshold (float): Similarity at which two signals count as duplicates
+            window_minutes (Optional[float]): Maximum time apart for two signals to
+                overlap; by default the longer of the two signals' timeframes
+            mode (str): 'collapse' drops duplicates, 'downweight' shrinks their position size
+        """
+        if mode not in ("collapse", "downweight"):
+            raise ValueError(f"Unknown deduplication mode: {mode}")
+        self.tracker = tracker or CorrelationTracker.get_instance()
+        self.threshold = threshold
+        self.window_minutes = window_minutes
+        self.mode = mode
+
+    def similarity_matrix(self, signals: List) -> np.ndarray:
+        """
+        Direction-adjusted similarity between every pair of signals.
+
+        Args:
+            signals (List[Signal]): Signals to compare
+
+        Returns:
+            np.ndarray: len(signals) x len(signals) matrix
+        """
+        markets = sorted({s.market for s in signals})
+        position = {m: i for i, m in enumerate(markets)}
+
+        market_sim = np.array([[leg_similarity(a, b) for b in markets] for a in markets])
+        if self.tracker.samples >= self.tracker.min_samples:
+            corr = self.tracker.matrix()
+            tracked = [m for m in markets if self.tracker.index_of(m) is not None]
+            if tracked:
+                rows = [position[m] for m in tracked]
+                cols = [self.tracker.index_of(m) for m in tracked]
+                market_sim[np.ix_(rows, rows)] = corr[np.ix_(cols, cols)]
+
+        ids = np.array([position[s.market] for s in signals])
+        direction = np.array([1.0 if s.signal_type == "BUY" else -1.0 for s in signals])
+        sim = market_sim[np.ix_(ids, ids)] * np.outer(direction, direction)
+
+        times = np.array([s.signal_time.timestamp() for s in signals])
+        if self.window_minutes is not None:
+            window = self.window_minutes * 60
+        else:
+            timeframes = np.array([signal_timeframe_minutes(s) for s in signals]) * 60
+            window = np.maximum(timeframes[:, None], timeframes[None, :])
+        close_in_time = np.abs(times[:, None] - times[None, :]) <= window
+        different_market = ids[:, None] != ids[None, :]
+        return np.where(close_in_time & different_market, sim, 0.0)
+
+    def process(self, signals: List) -> Tuple[List, List[Dict[str, Any]]]:
+        """
+        Deduplicate a batch of signals.
+
+        Args:
+            signals (List[Signal]): Candidate signals
+
+        Returns:
+            Tuple[List[Signal], List[Dict[str, Any]]]: Signals kept (in their
+                original order; down-weighted ones are adjusted copies, the
+                input signals are never modified) and one report entry per
+                collapsed or down-weighted signal
+        """
+        if len(signals) < 2:
+            return list(signals), []
+
+        sim = self.similarity_matrix(signals)
+        order = sorted(range(len(signals)), key=lambda i: signals[i].confidence, reverse=True)
+
+        kept: List[int] = []
+        report = []
+        dropped = set()
+        factors: Dict[int, float] = {}
+        for i in order:
+            if kept:
+                overlaps = sim[i, kept]
+                j = int(np.argmax(overlaps))
+                strongest = float(overlaps[j])
+                if strongest >= self.threshold:
+                    primary = signals[kept[j]]
+                    entry = {'market': signals[i].market, 'signal_time': signals[i].signal_time,
+                             'signal_type': signals[i].signal_type, 'duplicate_of': primary.market,
+                             'similarity': strongest}
+                    if self.mode == "collapse":
+                        dropped.add(i)
+                        entry['action'] = 'collapsed'
+                        report.append(entry)
+                        continue
+                    # Shrink by how much of the exposure is already covered
+                    factor = max(0.0, 1.0 - strongest)
+                    factors[i] = factor
+                    entry['action'] = 'downweighted'
+                    entry['factor'] = factor
+                    report.append(entry)
+            kept.append(i)
+
+        result = []
+        for i, signal in enumerate(signals):
+            if i in dropped:
+                continue
+            if i in factors:
+                signal = copy.copy(signal)
+                signal.position_size_multiplier *= factors[i]
+            result.append(signal)
+        return result, report
@@ -0,0 +1,144 @@
+"""
+Long-lived asyncio event loop on a background thread for synchronous callers.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Iterable, List, Optional
+
+class BackgroundLoop:
+    """
+    One event loop running forever on a daemon thread.
+
+    Synchronous code hands coroutines to the loop with submit() and gets a
+    concurrent.futures.Future back, so many requests can be in flight at
+    once and waited on together with gather(). Nothing touches the caller's
+    thread's event loop, so this works the same on every Python version and
+    from inside code that is itself running under a loop.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, name: str = "afa-event-loop"):
+        """
+        Initialize background loop (started lazily on first submit).
+
+        Args:
+            name (str): Name of the loop thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'BackgroundLoop':
+        """
+        Get the shared background loop.
+
+        Returns:
+            BackgroundLoop: Singleton instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = BackgroundLoop()
+            return cls._instance
+
+    @property
+    def running(self) -> bool:
+        """Whether the loop thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """
+        Start the loop thread if it is not running.
+
+        Returns:
+            asyncio.AbstractEventLoop: The running loop
+        """
+        with self._lock:
+            if self.running:
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+                loop.close()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+            self._thread.start()
+            started.wait()
+            return loop
+
+    def submit(self, coro: Awaitable) -> Future:
+        """
+        Schedule a coroutine on the background loop.
+
+        Args:
+            coro (Awaitable): Coroutine to run
+
+        Returns:
+            Future: Thread-safe future for the coroutine's result
+        """
+        loop = self.start()
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the background loop and wait for its result.
+
+        Args:
+            coro (Awaitable): Coroutine to run
+            timeout (Optional[float]): Seconds to wait, forever if None
+
+        Returns:
+            Any: The coroutine's result (its exception is re-raised)
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BackgroundLoop.run() called from the loop thread; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def gather(self, coros: Iterable[Awaitable], timeout: Optional[float] = None,
+               return_exceptions: bool = True) -> List[Any]:
+        """
+        Run coroutines concurrently and wait for all of them.
+
+        Args:
+            coros (Iterable[Awaitable]): Coroutines to run
+            timeout (Optional[float]): Seconds to wait for the whole batch
+            return_exceptions (bool): Return exceptions as results instead of raising
+
+        Returns:
+            List[Any]: Results in the order the coroutines were given
+        """
+        coros = list(coros)
+        if not coros:
+            return []
+
+        async def run_all():
+            return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+        return self.run(run_all(), timeout)
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """
+        Stop the loop and wait for its thread to finish.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the thread
+        """
+        with self._lock:
+            if not self.running:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            self._thread = None
+            self._loop = None
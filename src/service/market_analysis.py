@@ -0,0 +1,192 @@
+"""
+Batch market analysis over shared candle buffers with per-candle caching.
+"""
+
+import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from src.service.candle_buffer import CandleStore, CANDLE_FIELDS
+
+HIGH, LOW, CLOSE = (CANDLE_FIELDS.index(f) for f in ('high', 'low', 'close'))
+
+class MarketAnalysisService:
+    """
+    Analyzes many markets at once from the candle store.
+
+    Buffers that have not been fetched during the current candle period are
+    refreshed concurrently, one worker per market. The newest ``window``
+    candles of every market are then stacked and analyzed in a single
+    vectorized pass with the same rules as get_market_analysis(). Results are
+    cached per (market, timeframe, last candle timestamp), so asking again
+    within a candle period returns without any API call or computation.
+    """
+
+    _instance = None
+
+    def __init__(self, store: Optional[CandleStore] = None, window: int = 20,
+                 candle_count: int = 100, max_workers: int = 8):
+        """
+        Initialize market analysis service.
+
+        Args:
+            store (Optional[CandleStore]): Candle source, the shared store by default
+            window (int): Number of recent candles each analysis uses
+            candle_count (int): Number of candles requested per refresh
+            max_workers (int): Maximum concurrent candle fetches
+        """
+        self.store = store or CandleStore.get_instance()
+        self.window = window
+        self.candle_count = candle_count
+        self.max_workers = max_workers
+
+        self._cache: Dict[Tuple[str, int, float], Dict[str, Any]] = {}
+        self._fetched: Dict[Tuple[str, int], float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'MarketAnalysisService':
+        """
+        Get the shared market analysis service.
+
+        Returns:
+            MarketAnalysisService: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = MarketAnalysisService()
+        return cls._instance
+
+    def needs_refresh(self, markets: List[str], timeframe: int) -> List[str]:
+        """
+        Get the markets not fetched yet during the current candle period.
+
+        Args:
+            markets (List[str]): Market symbols
+            timeframe (int): Timeframe in minutes
+
+        Returns:
+            List[str]: Markets whose buffers are stale
+        """
+        period = timeframe * 60
+        current = int(time.time() // period)
+        with self._lock:
+            return [m for m in markets
+                    if int(self._fetched.get((m, timeframe), -period) // period) != current]
+
+    def refresh(self, api, markets: List[str], timeframe: int) -> int:
+        """
+        Fetch candles for stale markets concurrently.
+
+        Args:
+            api: Connected QuotexAPI instance
+            markets (List[str]): Market symbols
+            timeframe (int): Timeframe in minutes
+
+        Returns:
+            int: Number of markets fetched
+        """
+        stale = self.needs_refresh(markets, timeframe)
+        if not stale or api is None:
+            return 0
+
+        def fetch(market: str):
+            self.store.refresh(api, market, timeframe, self.candle_count)
+            with self._lock:
+                self._fetched[(market, timeframe)] = time.time()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as executor:
+            for future in [executor.submit(fetch, m) for m in stale]:
+                future.exception()
+        return len(stale)
+
+    def _compute(self, markets: List[str], timeframe: int,
+                 last_timestamps: List[float]) -> List[Dict[str, Any]]:
+        """Analyze buffered markets in one pass over stacked candle windows."""
+        buffers = [self.store.get(m, timeframe) for m in markets]
+
+        # Short buffers are left-padded with NaN so every market fits one matrix
+        data = np.full((len(buffers), len(CANDLE_FIELDS), self.window), np.nan)
+        for i, buffer in enumerate(buffers):
+            window = buffer.window(self.window)
+            data[i, :, self.window - window.shape[1]:] = window
+        closes, highs, lows = data[:, CLOSE], data[:, HIGH], data[:, LOW]
+
+        current = closes[:, -1]
+        average = np.nanmean(closes, axis=1)
+        price_range = np.nanmax(highs, axis=1) - np.nanmin(lows, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volatility = np.where(average > 0, price_range / average, 0.0)
+
+        # Same thresholds as get_market_analysis
+        trend = np.where(current > average * 1.01, "STRONG_BULLISH",
+                np.where(current < average * 0.99, "STRONG_BEARISH",
+                np.where(current > average, "BULLISH", "BEARISH")))
+
+        analysis_time = datetime.datetime.now().isoformat()
+        results = []
+        for i, market in enumerate(markets):
+            results.append({
+                'market': market,
+                'current_price': round(float(current[i]), 5),
+                'average_price': round(float(average[i]), 5),
+                'trend': str(trend[i]),
+                'volatility': round(float(volatility[i]), 6),
+                'data_points': len(buffers[i]),
+                'timeframe': timeframe,
+                'last_candle': last_timestamps[i],
+                'analysis_time': analysis_time,
+                'source': 'real_quotex_api',
+                'real_data': True
+            })
+        return results
+
+    def analyze(self, markets: List[str], timeframe: int = 1, api=None) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze markets, refreshing stale buffers first when an API is given.
+
+        Args:
+            markets (List[str]): Market symbols
+            timeframe (int): Analysis timeframe in minutes
+            api: Connected QuotexAPI instance, or None to use buffered candles only
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Analysis per market; markets without
+                candles get an entry with an 'error' key
+        """
+        self.refresh(api, markets, timeframe)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        missing, missing_timestamps = [], []
+        with self._lock:
+            for market in markets:
+                last = self.store.get(market, timeframe).last_timestamp
+                if last is None:
+                    results[market] = {
+                        'market': market,
+                        'error': 'No real candles available',
+                        'analysis_time': datetime.datetime.now().isoformat(),
+                        'source': 'real_quotex_api'
+                    }
+                    continue
+                cached = self._cache.get((market, timeframe, last))
+                if cached is not None:
+                    results[market] = dict(cached, cached=True)
+                else:
+                    missing.append(market)
+                    missing_timestamps.append(last)
+
+        if missing:
+            computed = self._compute(missing, timeframe, missing_timestamps)
+            with self._lock:
+                for analysis in computed:
+                    # Older candles of the same market are no longer needed
+                    for key in [k for k in self._cache if k[:2] == (analysis['market'], timeframe)]:
+                        del self._cache[key]
+                    self._cache[(analysis['market'], timeframe, analysis['last_candle'])] = analysis
+                    results[analysis['market']] = dict(analysis, cached=False)
+
+        return {market: results[market] for market in markets}
@@ -0,0 +1,376 @@
+"""
+Persistent per-market bar history and incremental multi-day analytics.
+"""
+
+import datetime
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+DEFAULT_HISTORY_DIR = os.path.join("cache", "history")
+
+# Row layout of a market's bar array (timestamps are UTC epoch seconds)
+BAR_FIELDS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+TS, OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(BAR_FIELDS))
+
+# Trading sessions by UTC hour: [start, end)
+SESSIONS = (('asian', 0, 7), ('london', 7, 12), ('new_york', 12, 21), ('late', 21, 24))
+_SESSION_OF_HOUR = np.zeros(24, dtype=np.intp)
+for _index, (_name, _start, _end) in enumerate(SESSIONS):
+    _SESSION_OF_HOUR[_start:_end] = _index
+
+def _to_epoch_seconds(value) -> float:
+    """Normalize datetimes, epoch seconds and API milliseconds to seconds."""
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    value = float(value)
+    return value / 1000.0 if value > 1e11 else value
+
+class HistoryStore:
+    """
+    Bar history per market, kept in memory and saved as one .npy per market.
+
+    Bars are held as a (field, bar) float array sorted by timestamp. Appends
+    of newer bars only extend the array; a batch reaching back into the stored
+    range replaces the stored bars in the span it covers (a re-download is
+    authoritative for its period). Every change bumps
+    the market's ``version``; a merge also bumps its ``generation``, so an
+    analyzer seeing the same generation knows only new bars were added.
+    """
+
+    _instance = None
+
+    def __init__(self, directory: str = DEFAULT_HISTORY_DIR):
+        """
+        Initialize history store.
+
+        Args:
+            directory (str): Directory holding one bar file per market
+        """
+        self.directory = directory
+        self._bars: Dict[str, np.ndarray] = {}
+        self._versions: Dict[str, int] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'HistoryStore':
+        """
+        Get the shared history store.
+
+        Returns:
+            HistoryStore: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = HistoryStore()
+        return cls._instance
+
+    def _path(self, market: str) -> str:
+        return os.path.join(self.directory, f"{market}.npy")
+
+    def _load(self, market: str) -> np.ndarray:
+        bars = self._bars.get(market)
+        if bars is None:
+            path = self._path(market)
+            bars = np.load(path) if os.path.exists(path) else np.zeros((len(BAR_FIELDS), 0))
+            self._bars[market] = bars
+            self._versions.setdefault(market, 0)
+        return bars
+
+    def _save(self, market: str, bars: np.ndarray):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._path(market) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, bars)
+        os.replace(tmp_path, self._path(market))
+
+    def append(self, market: str, candles: List[Dict[str, Any]], save: bool = True) -> int:
+        """
+        Add bars for a market.
+
+        Args:
+            market (str): Market symbol
+            candles (List[Dict[str, Any]]): Bars with timestamp (datetime, seconds
+                or milliseconds) and OHLCV keys
+            save (bool): Write the market file afterwards
+
+        Returns:
+            int: Number of bars the history grew by
+        """
+        if not candles:
+            return 0
+
+        incoming = np.array([
+            [_to_epoch_seconds(c['timestamp']), c.get('open', c['close']), c.get('high', c['close']),
+             c.get('low', c['close']), c['close'], c.get('volume', 0.0)]
+            for c in candles
+        ], dtype=np.float64).T
+        incoming = incoming[:, np.argsort(incoming[TS], kind='stable')]
+
+        with self._lock:
+            bars = self._load(market)
+            before = bars.shape[1]
+            if before == 0 or incoming[TS, 0] > bars[TS, -1]:
+                merged = np.concatenate([bars, incoming], axis=1)
+            else:
+                outside = (bars[TS] < incoming[TS, 0]) | (bars[TS] > incoming[TS, -1])
+                merged = np.concatenate([bars[:, outside], incoming], axis=1)
+                merged = merged[:, np.argsort(merged[TS], kind='stable')]
+                self._generations[market] = self._generations.get(market, 0) + 1
+
+            self._bars[market] = merged
+            self._versions[market] = self._versions.get(market, 0) + 1
+            if save:
+                self._save(market, merged)
+            return merged.shape[1] - before
+
+    def bars(self, market: str) -> np.ndarray:
+        """Get a market's bar array (read-only view, oldest first)."""
+        with self._lock:
+            view = self._load(market)[:]
+        view.flags.writeable = False
+        return view
+
+    def version(self, market: str) -> Tuple[int, int]:
+        """
+        Get a market's change counter.
+
+        Returns:
+            Tuple[int, int]: (version, generation) where generation only
+                changes when existing bars were merged or replaced
+        """
+        with self._lock:
+            self._load(market)
+            return self._versions.get(market, 0), self._generations.get(market, 0)
+
+class _MarketFeatures:
+    """Per-bar features of one market as prefix sums, extendable bar by bar."""
+
+    # Prefix-summed series; index i holds the sum over bars [0, i)
+    SERIES = ('n', 'r', 'r2', 'abs_r', 'dx', 'dx_n', 'x', 'y', 'xy', 'x2')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.length = 0
+        self.reference = None
+        self.timestamps = np.zeros(0)
+        self.prefix = {name: np.zeros(1) for name in self.SERIES}
+        self.session_prefix = np.zeros((1, len(SESSIONS)))
+        self.session_abs_prefix = np.zeros((1, len(SESSIONS)))
+
+    def extend(self, bars: np.ndarray):
+        """Add features for bars beyond ``length`` (bars holds the whole history)."""
+        total = bars.shape[1]
+        if total <= self.length:
+            return
+        if self.reference is None:
+            self.reference = float(bars[CLOSE, 0])
+
+        # Context: the bars needed to compute returns and the rolling DX window
+        start = max(0, self.length - self.period - 1)
+        window = bars[:, start:]
+        offset = self.length - start         # first new bar inside window
+
+        close, high, low = window[CLOSE], window[HIGH], window[LOW]
+        count = window.shape[1]
+        valid = np.zeros(count, dtype=bool)
+        valid[1:] = True
+
+        prev_close = np.empty(count)
+        prev_close[0] = close[0]
+        prev_close[1:] = close[:-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r = np.where(valid, np.log(close / prev_close), 0.0)
+
+        # Directional movement and true range against the previous bar
+        up = np.zeros(count)
+        down = np.zeros(count)
+        up[1:] = high[1:] - high[:-1]
+        down[1:] = low[:-1] - low[1:]
+        plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+        minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+        true_range = np.where(valid, np.maximum(high, prev_close) - np.minimum(low, prev_close), 0.0)
+
+        # Rolling sums over the period ending at each bar
+        def rolling(values):
+            csum = np.concatenate([[0.0], np.cumsum(values)])
+            out = np.full(count, np.nan)
+            if count >= self.period:
+                out[self.period - 1:] = csum[self.period:] - csum[:-self.period]
+            return out
+
+        tr_sum = rolling(true_range)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            plus_di = rolling(plus_dm) / tr_sum
+            minus_di = rolling(minus_dm) / tr_sum
+            dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+        # The rolling window must not reach back before the first bar
+        absolute = np.arange(start, start + count)
+        dx_valid = np.isfinite(dx) & (absolute >= self.period)
+        dx = np.where(dx_valid, dx, 0.0)
+
+        # Mean reversion regression: change in price against the previous price
+        x = np.where(valid, prev_close - self.reference, 0.0)
+        y = np.where(valid, close - prev_close, 0.0)
+
+        new = slice(offset, count)
+        series = {
+            'n': valid[new].astype(np.float64), 'r': r[new], 'r2': r[new] ** 2,
+            'abs_r': np.abs(r[new]), 'dx': dx[new], 'dx_n': dx_valid[new].astype(np.float64),
+            'x': x[new], 'y': y[new], 'xy': x[new] * y[new], 'x2': x[new] ** 2
+        }
+        for name, values in series.items():
+            prefix = self.prefix[name]
+            self.prefix[name] = np.concatenate([prefix, prefix[-1] + np.cumsum(values)])
+
+        hours = ((window[TS, new] // 3600) % 24).astype(np.intp)
+        one_hot = np.zeros((count - offset, len(SESSIONS)))
+        one_hot[np.arange(count - offset), _SESSION_OF_HOUR[hours]] = series['n']
+        self.session_prefix = np.vstack([self.session_prefix,
+                                         self.session_prefix[-1] + np.cumsum(one_hot, axis=0)])
+        self.session_abs_prefix = np.vstack([self.session_abs_prefix,
+                                             self.session_abs_prefix[-1]
+                                             + np.cumsum(one_hot * series['abs_r'][:, None], axis=0)])
+
+        self.timestamps = np.concatenate([self.timestamps, window[TS, new]])
+        self.length = total
+
+    def sums(self, lo: int, hi: int) -> Dict[str, float]:
+        """Sum every series over bars [lo, hi)."""
+        return {name: float(p[hi] - p[lo]) for name, p in self.prefix.items()}
+
+class HistoryAnalyzer:
+    """
+    Multi-day market statistics from a HistoryStore.
+
+    Every bar's features (log return, ADX-style directional index, price
+    change regression terms, session bucket) are computed once and kept as
+    prefix sums, so statistics for any day range are differences of two
+    prefix entries. New bars extend the prefix arrays without recomputing
+    older ones; a merge of out-of-order bars rebuilds them. Results are
+    cached per (market, days) and reused until the market changes.
+    """
+
+    _instance = None
+
+    def __init__(self, store: Optional[HistoryStore] = None, adx_period: int = 14):
+        """
+        Initialize history analyzer.
+
+        Args:
+            store (Optional[HistoryStore]): Bar source, the shared store by default
+            adx_period (int): Bars in the directional movement window
+        """
+        self.store = store or HistoryStore.get_instance()
+        self.adx_period = adx_period
+
+        self._features: Dict[str, Tuple[int, int, _MarketFeatures]] = {}
+        self._cache: Dict[Tuple[str, int], Tuple[int, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'HistoryAnalyzer':
+        """
+        Get the shared history analyzer.
+
+        Returns:
+            HistoryAnalyzer: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = HistoryAnalyzer()
+        return cls._instance
+
+    def _market_features(self, market: str) -> Tuple[int, _MarketFeatures]:
+        version, generation = self.store.version(market)
+        known = self._features.get(market)
+        if known is not None and known[0] == version:
+            return version, known[2]
+
+        # Extend in place unless existing bars were merged since the last look
+        if known is None or known[1] != generation:
+            features = _MarketFeatures(self.adx_period)
+        else:
+            features = known[2]
+        features.extend(self.store.bars(market))
+        self._features[market] = (version, generation, features)
+        return version, features
+
+    def analyze(self, market: str, days: int) -> Optional[Dict[str, Any]]:
+        """
+        Compute statistics over the last ``days`` of a market's history.
+
+        Args:
+            market (str): Market symbol
+            days (int): Days before the newest bar to include
+
+        Returns:
+            Optional[Dict[str, Any]]: Realized volatility, trend strength,
+                mean-reversion half-life and session profile, or None when
+                there is not enough history
+        """
+        with self._lock:
+            version, features = self._market_features(market)
+            cached = self._cache.get((market, days))
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            if features.length < 2:
+                return None
+
+            end_ts = features.timestamps[-1]
+            lo = int(np.searchsorted(features.timestamps, end_ts - days * 86400, side='left'))
+            hi = features.length
+            s = features.sums(lo, hi)
+            n = s['n']
+            if n < 2:
+                return None
+
+            # Realized volatility per day from the per-bar return variance
+            spacing = float(np.median(np.diff(features.timestamps[lo:hi]))) if hi - lo > 1 else 60.0
+            bars_per_day = 86400.0 / spacing if spacing > 0 else 1440.0
+            variance = max(s['r2'] / n - (s['r'] / n) ** 2, 0.0)
+            realized_volatility = math.sqrt(variance * bars_per_day)
+
+            adx = s['dx'] / s['dx_n'] if s['dx_n'] else 0.0
+
+            # Slope of price change on price; negative means mean reverting
+            denominator = n * s['x2'] - s['x'] ** 2
+            beta = (n * s['xy'] - s['x'] * s['y']) / denominator if denominator > 0 else 0.0
+            if beta < 0:
+                half_life_bars = -math.log(2) / math.log1p(beta) if beta > -1 else 0.0
+                half_life_minutes = half_life_bars * spacing / 60.0
+            else:
+                half_life_minutes = None
+
+            session_counts = features.session_prefix[hi] - features.session_prefix[lo]
+            session_abs = features.session_abs_prefix[hi] - features.session_abs_prefix[lo]
+            sessions = {}
+            for i, (name, start_hour, end_hour) in enumerate(SESSIONS):
+                count = float(session_counts[i])
+                sessions[name] = {
+                    'hours_utc': f"{start_hour:02d}-{end_hour:02d}",
+                    'bars': int(count),
+                    'share': count / n,
+                    'mean_abs_return': float(session_abs[i] / count) if count else 0.0
+                }
+            active = max(sessions, key=lambda k: sessions[k]['mean_abs_return'])
+
+            result = {
+                'market': market,
+                'days': days,
+                'bars': hi - lo,
+                'start': datetime.datetime.fromtimestamp(features.timestamps[lo]).isoformat(),
+                'end': datetime.datetime.fromtimestamp(end_ts).isoformat(),
+                'realized_volatility': realized_volatility,
+                'adx': adx,
+                'trend_strength': min(adx / 100.0, 1.0),
+                'drift': s['r'],
+                'half_life_minutes': half_life_minutes,
+                'sessions': sessions,
+                'most_active_session': active
+            }
+            self._cache[(market, days)] = (version, result)
+            return result
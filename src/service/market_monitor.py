@@ -0,0 +1,209 @@
+"""
+Live per-market state (price, indicators, volatility, news, pending signals) for dashboards.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any, Iterable
+
+from src.models.indicator_graph import indicator_graph
+from src.service.candle_buffer import CandleStore
+from src.service.news_filter import NewsFilter
+from src.service.result_tracker import ResultTracker
+from src.service.volatility_filter import VolatilityFilter
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Fields of one market's state, in dashboard column order
+STATE_FIELDS = ('price', 'change', 'ema', 'macd', 'rsi', 'volatility', 'news', 'pending')
+
+class MarketMonitor:
+    """
+    Polls subscribed markets on a fixed tick and keeps one state per market.
+
+    Every tick fetches only the few newest candles of each market,
+    concurrently, and appends them to the shared candle store. Price and
+    change follow the forming candle on every tick. Indicator and volatility
+    states are recomputed only for markets whose buffer changed (a new
+    candle or a move of the forming one), and
+    news status is refreshed on its own slower interval. Listeners are called
+    with just the markets whose state changed, so a view never has to diff
+    the whole table itself.
+    """
+
+    def __init__(self, markets: Iterable[str], timeframe: int = 1,
+                 store: Optional[CandleStore] = None, tracker: Optional[ResultTracker] = None,
+                 candle_count: int = 100, tick_count: int = 3, interval: float = 1.0,
+                 news_interval: float = 300.0, max_workers: int = 8):
+        """
+        Initialize market monitor.
+
+        Args:
+            markets (Iterable[str]): Market symbols to monitor
+            timeframe (int): Candle timeframe in minutes
+            store (Optional[CandleStore]): Candle store, the shared one by default
+            tracker (Optional[ResultTracker]): Source of pending signals, the shared one by default
+            candle_count (int): Candles requested when a buffer is first filled
+            tick_count (int): Candles requested on every later tick
+            interval (float): Seconds between ticks
+            news_interval (float): Seconds between news status refreshes
+            max_workers (int): Maximum concurrent candle fetches
+        """
+        self.markets = list(dict.fromkeys(markets))
+        self.timeframe = timeframe
+        self.store = store or CandleStore.get_instance()
+        self.tracker = tracker or ResultTracker.get_instance()
+        self.candle_count = candle_count
+        self.tick_count = tick_count
+        self.interval = interval
+        self.news_interval = news_interval
+        self.max_workers = max_workers
+
+        self.news_filter = NewsFilter()
+        self.news_filter.enable_filter()
+        self.volatility_filter = VolatilityFilter()
+
+        self.states: Dict[str, Dict[str, Any]] = {m: dict.fromkeys(STATE_FIELDS) for m in self.markets}
+        self.ticks = 0
+        self._versions: Dict[str, int] = {}
+        self._news_checked = 0.0
+        self._listeners: List[Callable[[Dict[str, Dict[str, Any]]], None]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, listener: Callable[[Dict[str, Dict[str, Any]]], None]):
+        """
+        Register a callback for state changes.
+
+        Args:
+            listener (Callable): Called with {market: changed fields} after each tick
+        """
+        self._listeners.append(listener)
+
+    def _fetch(self, api, market: str) -> Optional[List[Dict[str, Any]]]:
+        buffer = self.store.get(market, self.timeframe)
+        count = self.candle_count if len(buffer) == 0 else self.tick_count
+        candles = api.get_candles(market, self.timeframe, count)
+        if candles:
+            buffer.extend(candles)
+        return candles
+
+    def _price_fields(self, market: str, candles: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Price of the forming candle and its change from the previous close."""
+        if candles:
+            price = candles[-1].get('close')
+            previous = candles[-2].get('close') if len(candles) > 1 else None
+        else:
+            closes = self.store.get(market, self.timeframe).column('close')
+            if len(closes) == 0:
+                return {}
+            price = float(closes[-1])
+            previous = float(closes[-2]) if len(closes) > 1 else None
+
+        change = (price - previous) / previous * 100 if previous else 0.0
+        return {'price': price, 'change': change}
+
+    def _candle_fields(self, market: str) -> Dict[str, Any]:
+        """Indicator and volatility states, recomputed once per buffer change."""
+        buffer = self.store.get(market, self.timeframe)
+        if len(buffer) < 21 or self._versions.get(market) == buffer.version:
+            return {}
+        self._versions[market] = buffer.version
+
+        # Same graph the strategy and filters use for this candle window
+        market_data = buffer.to_market_data(60)
+        graph = indicator_graph(market_data)
+        macd_line, signal_line = graph.macd()
+        volatility = self.volatility_filter.analyze_market_volatility(market_data)
+
+        return {
+            'ema': 'UP' if graph.ema(5)[-1] > graph.ema(21)[-1] else 'DOWN',
+            'macd': 'UP' if macd_line[-1] > signal_line[-1] else 'DOWN',
+            'rsi': float(graph.rsi(7)[-1]),
+            'volatility': volatility.get('volatility_state', 'n/a')
+        }
+
+    def _news_fields(self, market: str) -> Dict[str, Any]:
+        result = self.news_filter.filter_signal({}, market).get('news_filter', {})
+        return {'news': result.get('filter_result', 'n/a')}
+
+    def tick(self, api) -> Dict[str, Dict[str, Any]]:
+        """
+        Poll every market once and update its state.
+
+        Args:
+            api: Connected QuotexAPI instance, or None to use buffered candles only
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Changed fields per market (unchanged markets omitted)
+        """
+        fetched: Dict[str, Optional[List[Dict[str, Any]]]] = dict.fromkeys(self.markets)
+        if api is not None and self.markets:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.markets))) as executor:
+                futures = {m: executor.submit(self._fetch, api, m) for m in self.markets}
+            for market, future in futures.items():
+                fetched[market] = future.result() if future.exception() is None else None
+
+        now = time.time()
+        refresh_news = now - self._news_checked >= self.news_interval
+        if refresh_news:
+            self._news_checked = now
+        pending = self.tracker.pending_by_market()
+
+        changes: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            self.ticks += 1
+            for market in self.markets:
+                fields = self._price_fields(market, fetched[market])
+                fields.update(self._candle_fields(market))
+                if refresh_news:
+                    fields.update(self._news_fields(market))
+                fields['pending'] = pending.get(market, 0)
+
+                state = self.states[market]
+                changed = {k: v for k, v in fields.items() if state.get(k) != v}
+                if changed:
+                    state.update(changed)
+                    changes[market] = changed
+
+        for listener in self._listeners:
+            listener(changes)
+        return changes
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get a copy of every market's current state."""
+        with self._lock:
+            return {market: dict(state) for market, state in self.states.items()}
+
+    def _run(self, api_provider: Callable[[], Any]):
+        while not self._stop.is_set():
+            started = time.time()
+            try:
+                self.tick(api_provider())
+            except Exception as e:
+                logger.error("⚠️ Market monitor error: %s", e)
+            self._stop.wait(max(0.0, self.interval - (time.time() - started)))
+
+    def start(self, api_provider: Callable[[], Any]):
+        """
+        Tick in a background thread until stop() is called.
+
+        Args:
+            api_provider (Callable): Returns a connected API (or None) for each tick
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(api_provider,),
+                                        name="market-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Stop ticking and wait for the current tick to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,126 @@
+"""
+Cross-market screener ranking markets from their buffered candles.
+"""
+
+from typing import Dict, List, Optional, Any, Iterable
+
+import numpy as np
+
+from src.service.candle_buffer import CandleStore, CANDLE_FIELDS
+
+OPEN, HIGH, LOW, CLOSE = (CANDLE_FIELDS.index(f) for f in ('open', 'high', 'low', 'close'))
+
+# Default contribution of each metric's z-score to the final score
+DEFAULT_WEIGHTS = {'volatility': 1.0, 'trend': 1.0, 'spread': 1.0}
+
+class MarketScreener:
+    """
+    Scores many markets at once from the candle store.
+
+    The newest ``lookback`` candles of every market are stacked into one
+    (market, candle) matrix per OHLC field and all metrics are computed along
+    the candle axis in a single pass:
+
+    - volatility: standard deviation of log close-to-close returns
+    - trend: efficiency ratio, net move divided by the path length (0..1)
+    - spread: mean gap between each open and the previous close, relative to
+      price; the candle feed has no bid/ask, so this stands in for the cost of
+      getting in and out (lower is better)
+
+    Each metric is turned into a z-score across the screened markets and the
+    weighted sum (spread counting negatively) is the market's score.
+    """
+
+    def __init__(self, store: Optional[CandleStore] = None, lookback: int = 30,
+                 weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize market screener.
+
+        Args:
+            store (Optional[CandleStore]): Candle source, the shared store by default
+            lookback (int): Number of recent candles used per market
+            weights (Optional[Dict[str, float]]): Weight of volatility, trend and spread
+        """
+        self.store = store or CandleStore.get_instance()
+        self.lookback = lookback
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+
+    def _stack(self, markets: List[str], timeframe: int):
+        """Stack the newest candles of every market that has enough of them."""
+        ready, windows = [], []
+        keys = set(self.store.keys())
+        for market in markets:
+            if (market, timeframe) not in keys:
+                continue
+            buffer = self.store.get(market, timeframe)
+            if len(buffer) >= self.lookback:
+                ready.append(market)
+                windows.append(buffer.window(self.lookback))
+        if not windows:
+            return ready, None
+        return ready, np.stack(windows)
+
+    @staticmethod
+    def _zscore(values: np.ndarray) -> np.ndarray:
+        std = values.std()
+        if std == 0:
+            return np.zeros_like(values)
+        return (values - values.mean()) / std
+
+    def screen(self, markets: Iterable[str], timeframe: int = 1) -> List[Dict[str, Any]]:
+        """
+        Score markets from their buffered candles.
+
+        Args:
+            markets (Iterable[str]): Market symbols to screen
+            timeframe (int): Timeframe of the buffers to use
+
+        Returns:
+            List[Dict[str, Any]]: One entry per market with enough candles,
+                best score first
+        """
+        ready, data = self._stack(list(markets), timeframe)
+        if data is None:
+            return []
+
+        opens, closes = data[:, OPEN], data[:, CLOSE]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            returns = np.diff(np.log(closes), axis=1)
+            volatility = returns.std(axis=1)
+
+            path = np.abs(np.diff(closes, axis=1)).sum(axis=1)
+            trend = np.abs(closes[:, -1] - closes[:, 0]) / path
+
+            gaps = np.abs(opens[:, 1:] - closes[:, :-1]) / closes[:, :-1]
+            spread = gaps.mean(axis=1)
+
+        volatility = np.nan_to_num(volatility)
+        trend = np.nan_to_num(trend)
+        spread = np.nan_to_num(spread)
+
+        scores = (self.weights['volatility'] * self._zscore(volatility)
+                  + self.weights['trend'] * self._zscore(trend)
+                  - self.weights['spread'] * self._zscore(spread))
+
+        order = np.argsort(-scores, kind='stable')
+        return [{
+            'market': ready[i],
+            'score': float(scores[i]),
+            'volatility': float(volatility[i]),
+            'trend': float(trend[i]),
+            'spread': float(spread[i])
+        } for i in order]
+
+    def top(self, markets: Iterable[str], count: int, timeframe: int = 1) -> List[str]:
+        """
+        Get the ``count`` best scoring markets.
+
+        Args:
+            markets (Iterable[str]): Market symbols to screen
+            count (int): Number of markets to return
+            timeframe (int): Timeframe of the buffers to use
+
+        Returns:
+            List[str]: Market symbols, best first
+        """
+        return [row['market'] for row in self.screen(markets, timeframe)[:count]]
@@ -0,0 +1,431 @@
+"""
+Signal outcome tracking with rolling win-rate, streak and P&L statistics.
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from src.service.candle_buffer import CandleBuffer, CandleStore
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+OUTCOMES = ('win', 'loss', 'draw')
+
+# Dimensions every settled signal is counted under
+STAT_DIMENSIONS = ('all', 'market', 'timeframe', 'strategy')
+
+def signal_timeframe_minutes(signal) -> int:
+    """Get a signal's timeframe in minutes from labels like '5 min' or ints."""
+    try:
+        return int(str(signal.timeframe).split()[0])
+    except (ValueError, IndexError):
+        return 1
+
+class OutcomeStats:
+    """
+    Running outcome counters for one market, timeframe or strategy.
+
+    Every update is O(1): totals are plain counters and the rolling win rate
+    keeps a fixed-size window together with its running sum.
+    """
+
+    __slots__ = ('wins', 'losses', 'draws', 'pnl', 'streak', 'best_streak',
+                 'worst_streak', 'last_outcome_time', '_window', '_window_wins')
+
+    def __init__(self, window: int = 50):
+        """
+        Initialize outcome stats.
+
+        Args:
+            window (int): Number of recent outcomes in the rolling win rate
+        """
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.pnl = 0.0
+        self.streak = 0           # positive: consecutive wins, negative: losses
+        self.best_streak = 0
+        self.worst_streak = 0
+        self.last_outcome_time: Optional[datetime] = None
+        self._window = deque(maxlen=window)
+        self._window_wins = 0
+
+    def update(self, outcome: str, pnl: float, when: Optional[datetime] = None):
+        """
+        Fold one outcome into the counters.
+
+        Args:
+            outcome (str): 'win', 'loss' or 'draw'
+            pnl (float): Profit or loss of the trade
+            when (Optional[datetime]): Settlement time
+        """
+        self.pnl += pnl
+        self.last_outcome_time = when
+
+        if outcome == 'draw':
+            self.draws += 1
+            return
+
+        won = outcome == 'win'
+        if won:
+            self.wins += 1
+            self.streak = self.streak + 1 if self.streak > 0 else 1
+            self.best_streak = max(self.best_streak, self.streak)
+        else:
+            self.losses += 1
+            self.streak = self.streak - 1 if self.streak < 0 else -1
+            self.worst_streak = min(self.worst_streak, self.streak)
+
+        if len(self._window) == self._window.maxlen:
+            self._window_wins -= self._window[0]
+        self._window.append(1 if won else 0)
+        self._window_wins += 1 if won else 0
+
+    @property
+    def total(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def win_rate(self) -> float:
+        """Lifetime win rate over decided (non-draw) trades."""
+        decided = self.wins + self.losses
+        return self.wins / decided if decided else 0.0
+
+    @property
+    def rolling_win_rate(self) -> float:
+        """Win rate over the most recent decided trades."""
+        return self._window_wins / len(self._window) if self._window else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'wins': self.wins,
+            'losses': self.losses,
+            'draws': self.draws,
+            'win_rate': self.win_rate,
+            'rolling_win_rate': self.rolling_win_rate,
+            'streak': self.streak,
+            'best_streak': self.best_streak,
+            'worst_streak': self.worst_streak,
+            'pnl': self.pnl
+        }
+
+class ResultTracker:
+    """
+    Settles signals at expiry against buffered candles and keeps statistics.
+
+    Each tracked signal is pushed onto a heap keyed by its expiry (signal time
+    plus timeframe). settle_due() pops expired signals and compares the open
+    of the candle at entry with the close of the candle at expiry. Signals
+    whose candles never arrive within ``max_wait`` seconds are dropped as
+    unsettled. start() runs settlement in a background thread.
+    """
+
+    _instance = None
+
+    def __init__(self, store: Optional[CandleStore] = None, payout: float = 0.85,
+                 stake: float = 1.0, window: int = 50, max_wait: float = 300,
+                 api_provider: Optional[Callable[[], Any]] = None):
+        """
+        Initialize result tracker.
+
+        Args:
+            store (Optional[CandleStore]): Candle store, the shared one by default
+            payout (float): Payout ratio of a winning trade
+            stake (float): Base stake, scaled by each signal's position size multiplier
+            window (int): Size of the rolling win-rate window
+            max_wait (float): Seconds after expiry before a signal is given up
+            api_provider (Optional[Callable]): Returns a connected API for candle refreshes
+        """
+        self.store = store or CandleStore.get_instance()
+        self.payout = payout
+        self.stake = stake
+        self.window = window
+        self.max_wait = max_wait
+        self.api_provider = api_provider
+
+        self.stats: Dict[Tuple[str, Any], OutcomeStats] = {}
+        self.history: deque = deque(maxlen=1000)
+        self.unsettled = 0
+
+        self._pending: List[Tuple[float, int, Any, str]] = []
+        self._counter = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @classmethod
+    def get_instance(cls) -> 'ResultTracker':
+        """
+        Get the shared result tracker.
+
+        Returns:
+            ResultTracker: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = ResultTracker()
+        return cls._instance
+
+    @property
+    def pending(self) -> int:
+        """Number of signals waiting for settlement."""
+        return len(self._pending)
+
+    def pending_by_market(self) -> Dict[str, int]:
+        """Number of signals waiting for settlement per market."""
+        with self._condition:
+            counts: Dict[str, int] = {}
+            for _, _, signal, _ in self._pending:
+                counts[signal.market] = counts.get(signal.market, 0) + 1
+            return counts
+
+    @staticmethod
+    def expiry_of(signal) -> datetime:
+        """Get the time a signal's trade closes."""
+        return signal.signal_time + timedelta(minutes=signal_timeframe_minutes(signal))
+
+    def track(self, signal, strategy: str):
+        """
+        Schedule a settlement check at the signal's expiry.
+
+        Args:
+            signal (Signal): Signal to settle
+            strategy (str): Strategy module that produced the signal
+        """
+        due = self.expiry_of(signal).timestamp()
+        with self._condition:
+            self._counter += 1
+            heapq.heappush(self._pending, (due, self._counter, signal, strategy))
+            self._condition.notify()
+
+    @staticmethod
+    def _candle_at(buffer: CandleBuffer, epoch_ms: float) -> Optional[int]:
+        """Index (within the buffer's columns) of the candle covering a time."""
+        timestamps = buffer.column('timestamp')
+        if len(timestamps) == 0:
+            return None
+        i = int(np.searchsorted(timestamps, epoch_ms, side='right')) - 1
+        if i < 0:
+            return None
+        period = timestamps[-1] - timestamps[-2] if len(timestamps) > 1 else 60_000
+        if i == len(timestamps) - 1 and epoch_ms >= timestamps[i] + period:
+            return None
+        return i
+
+    def evaluate(self, signal, buffer: CandleBuffer) -> Optional[Tuple[str, float, float]]:
+        """
+        Decide a signal's outcome from buffered candles.
+
+        Args:
+            signal (Signal): Signal to evaluate
+            buffer (CandleBuffer): Candles of the signal's market
+
+        Returns:
+            Optional[Tuple[str, float, float]]: (outcome, entry, exit), None if
+                the candles are not buffered yet
+        """
+        entry_ms = signal.signal_time.timestamp() * 1000
+        expiry_ms = self.expiry_of(signal).timestamp() * 1000
+        entry_index = self._candle_at(buffer, entry_ms)
+        exit_index = self._candle_at(buffer, expiry_ms - 1)
+        if entry_index is None or exit_index is None:
+            return None
+        # The exit candle must have closed; a still-forming one has no final close
+        if exit_index == len(buffer) - 1 and expiry_ms > time.time() * 1000:
+            return None
+
+        entry = float(buffer.column('open')[entry_index])
+        exit_price = float(buffer.column('close')[exit_index])
+        if exit_price == entry:
+            return 'draw', entry, exit_price
+
+        rose = exit_price > entry
+        won = rose if signal.signal_type == "BUY" else not rose
+        return ('win' if won else 'loss'), entry, exit_price
+
+    def record_outcome(self, signal, outcome: str, strategy: str,
+                       entry: Optional[float] = None, exit_price: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Record a settled outcome in every statistics dimension.
+
+        Args:
+            signal (Signal): Settled signal
+            outcome (str): 'win', 'loss' or 'draw'
+            strategy (str): Strategy module that produced the signal
+            entry (Optional[float]): Entry price
+            exit_price (Optional[float]): Exit price
+
+        Returns:
+            Dict[str, Any]: The recorded result
+        """
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown outcome: {outcome}")
+
+        stake = self.stake * signal.position_size_multiplier
+        pnl = stake * self.payout if outcome == 'win' else -stake if outcome == 'loss' else 0.0
+        settled_at = self.expiry_of(signal)
+        timeframe = signal_timeframe_minutes(signal)
+
+        result = {
+            'market': signal.market,
+            'timeframe': timeframe,
+            'strategy': strategy,
+            'signal_type': signal.signal_type,
+            'signal_time': signal.signal_time,
+            'outcome': outcome,
+            'entry': entry,
+            'exit': exit_price,
+            'pnl': pnl
+        }
+
+        # The settlement thread records while the menu reads the statistics
+        with self._condition:
+            for key in (('all', None), ('market', signal.market),
+                        ('timeframe', timeframe), ('strategy', strategy)):
+                stats = self.stats.get(key)
+                if stats is None:
+                    stats = self.stats[key] = OutcomeStats(self.window)
+                stats.update(outcome, pnl, settled_at)
+            self.history.append(result)
+        return result
+
+    def settle_due(self, now: Optional[float] = None, api=None) -> List[Dict[str, Any]]:
+        """
+        Settle every signal whose expiry has passed.
+
+        Args:
+            now (Optional[float]): Reference epoch seconds, defaults to now
+            api: Connected API used to refresh buffers that lack the expiry candle
+
+        Returns:
+            List[Dict[str, Any]]: Results recorded by this call
+        """
+        now = time.time() if now is None else now
+        with self._condition:
+            due = []
+            while self._pending and self._pending[0][0] <= now:
+                due.append(heapq.heappop(self._pending))
+
+        results, retry = [], []
+        for entry in due:
+            expiry, _, signal, strategy = entry
+            timeframe = signal_timeframe_minutes(signal)
+            buffer = self.store.get(signal.market, timeframe)
+            decided = self.evaluate(signal, buffer)
+            if decided is None and api is not None:
+                buffer = self.store.refresh(api, signal.market, timeframe)
+                decided = self.evaluate(signal, buffer)
+
+            if decided is not None:
+                outcome, entry_price, exit_price = decided
+                results.append(self.record_outcome(signal, outcome, strategy, entry_price, exit_price))
+            elif now - expiry > self.max_wait:
+                self.unsettled += 1
+            else:
+                retry.append(entry)
+
+        if retry:
+            with self._condition:
+                for expiry, counter, signal, strategy in retry:
+                    # Check again shortly; the expiry candle may not be published yet
+                    heapq.heappush(self._pending, (min(now + 5, expiry + self.max_wait + 1),
+                                                   counter, signal, strategy))
+        return results
+
+    def replay(self, signals: List, market_data: Dict[str, Dict[str, Any]],
+               strategy: str) -> List[Dict[str, Any]]:
+        """
+        Settle historical signals against supplied candles (backtests/replays).
+
+        Args:
+            signals (List[Signal]): Signals to settle
+            market_data (Dict[str, Dict[str, Any]]): market_data dicts keyed by market
+            strategy (str): Strategy label for the statistics
+
+        Returns:
+            List[Dict[str, Any]]: Recorded results; signals without candles are skipped
+        """
+        buffers: Dict[str, CandleBuffer] = {}
+        for market, data in market_data.items():
+            candles = [
+                {'timestamp': ts, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+                for ts, o, h, l, c, v in zip(data['timestamps'], data['opens'], data['highs'],
+                                             data['lows'], data['closes'], data['volumes'])
+            ]
+            buffer = CandleBuffer(market, data.get('timeframe', 1), max(len(candles), 1))
+            buffer.extend(candles)
+            buffers[market] = buffer
+
+        results = []
+        for signal in signals:
+            buffer = buffers.get(signal.market)
+            decided = self.evaluate(signal, buffer) if buffer is not None else None
+            if decided is None:
+                self.unsettled += 1
+                continue
+            outcome, entry_price, exit_price = decided
+            results.append(self.record_outcome(signal, outcome, strategy, entry_price, exit_price))
+        return results
+
+    def get_stats(self, dimension: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get statistics rows.
+
+        Args:
+            dimension (Optional[str]): 'all', 'market', 'timeframe' or 'strategy'; every row if omitted
+
+        Returns:
+            List[Dict[str, Any]]: One row per key, with 'dimension' and 'key' fields
+        """
+        with self._condition:
+            rows = [{'dimension': dim, 'key': key, **stats.to_dict()}
+                    for (dim, key), stats in list(self.stats.items())
+                    if dimension is None or dim == dimension]
+        rows.sort(key=lambda r: (STAT_DIMENSIONS.index(r['dimension']), str(r['key'])))
+        return rows
+
+    def get_overall(self) -> Dict[str, Any]:
+        """Get the statistics across every settled signal."""
+        with self._condition:
+            stats = self.stats.get(('all', None))
+            return stats.to_dict() if stats else OutcomeStats(self.window).to_dict()
+
+    def _run(self):
+        while self._running:
+            with self._condition:
+                timeout = None
+                if self._pending:
+                    timeout = max(0.0, self._pending[0][0] - time.time())
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+            try:
+                api = self.api_provider() if self.api_provider else None
+                self.settle_due(api=api)
+            except Exception as e:
+                logger.error("⚠️ Result settlement error: %s", e)
+
+    def start(self):
+        """Settle signals in a background thread as they expire."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="result-tracker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background settlement thread."""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
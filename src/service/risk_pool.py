@@ -0,0 +1,336 @@
+"""
+Risk pool holding many RiskManager states with shared exposure limits.
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+import numpy as np
+
+from src.models.risk_manager import RiskManager
+from src.service.news_filter import NewsFilter
+
+# Reasons returned for rejected candidates
+REJECT_UNKNOWN_ACCOUNT = 'unknown_account'
+REJECT_DAILY_LOSS = 'daily_loss_limit'
+REJECT_ACCOUNT_EXPOSURE = 'account_exposure_limit'
+REJECT_CURRENCY_EXPOSURE = 'currency_exposure_limit'
+REJECT_GLOBAL_EXPOSURE = 'global_exposure_limit'
+REJECT_NO_BALANCE = 'insufficient_balance'
+
+# Only used for its symbol -> currency split
+_news_filter = NewsFilter()
+
+def market_currencies(market: str) -> Tuple[str, ...]:
+    """
+    Split a market symbol into its base and quote currency.
+
+    Args:
+        market (str): Symbol such as 'EURUSD' or 'USDPKR-OTC'
+
+    Returns:
+        Tuple[str, ...]: (base, quote), or the whole symbol if it is not a pair
+    """
+    return tuple(_news_filter._extract_currencies(market.upper()))
+
+class RiskPool:
+    """
+    Array-backed RiskManager states for many accounts.
+
+    Each account keeps RiskManager's balance, Martingale tier and daily
+    loss/profit in one slot of a set of NumPy arrays. allocate() sizes stakes
+    for a whole batch of candidate trades at once and reserves exposure
+    against three caps: open stake per account (fraction of its balance),
+    per currency and globally. A trade touches both currencies of its market.
+    All state changes happen under one lock, so concurrent signal workers
+    cannot over-commit a cap between checking and reserving.
+    """
+
+    def __init__(self, account_exposure_percent: float = 20.0,
+                 currency_exposure_limit: Optional[float] = None,
+                 global_exposure_limit: Optional[float] = None,
+                 capacity: int = 16):
+        """
+        Initialize risk pool.
+
+        Args:
+            account_exposure_percent (float): Max open stake per account as % of its balance
+            currency_exposure_limit (Optional[float]): Max open stake per currency, unlimited if None
+            global_exposure_limit (Optional[float]): Max open stake across the pool, unlimited if None
+            capacity (int): Initial number of account slots
+        """
+        self.account_exposure_percent = account_exposure_percent
+        self.currency_exposure_limit = currency_exposure_limit
+        self.global_exposure_limit = global_exposure_limit
+
+        self._ids: Dict[str, int] = {}
+        self._size = 0
+        self._allocate_arrays(capacity)
+
+        self._currency_exposure: Dict[str, float] = {}
+        self._global_exposure = 0.0
+        self._positions: Dict[int, Tuple[int, str, float]] = {}
+        self._next_position = 1
+        self._last_reset = datetime.now().date()
+        self._lock = threading.Lock()
+
+    def _allocate_arrays(self, capacity: int):
+        fields = {
+            'initial_balance': np.float64, 'balance': np.float64,
+            'base_stake_percent': np.float64, 'max_tier': np.int32,
+            'max_daily_loss': np.float64, 'tier': np.int32,
+            'daily_loss': np.float64, 'daily_profit': np.float64,
+            'exposure': np.float64
+        }
+        for name, dtype in fields.items():
+            new = np.zeros(capacity, dtype=dtype)
+            old = getattr(self, f"_{name}", None)
+            if old is not None:
+                new[:len(old)] = old
+            setattr(self, f"_{name}", new)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_account(self, account_id: str, risk_manager: RiskManager):
+        """
+        Register an account, copying the state of a RiskManager.
+
+        Args:
+            account_id (str): Unique account identifier
+            risk_manager (RiskManager): Account settings and current state
+        """
+        with self._lock:
+            if account_id in self._ids:
+                raise ValueError(f"Account already registered: {account_id}")
+            if self._size == len(self._balance):
+                self._allocate_arrays(len(self._balance) * 2)
+
+            i = self._size
+            self._ids[account_id] = i
+            self._size += 1
+            self._initial_balance[i] = risk_manager.initial_balance
+            self._balance[i] = risk_manager.current_balance
+            self._base_stake_percent[i] = risk_manager.base_stake_percent
+            self._max_tier[i] = risk_manager.max_martingale_tier
+            self._max_daily_loss[i] = risk_manager.max_daily_loss
+            self._tier[i] = risk_manager.current_tier
+            self._daily_loss[i] = risk_manager.daily_loss
+            self._daily_profit[i] = risk_manager.daily_profit
+            self._exposure[i] = 0.0
+
+    def _reset_daily_stats(self):
+        """Same day rollover as RiskManager.reset_daily_stats, for every account."""
+        today = datetime.now().date()
+        if today > self._last_reset:
+            self._daily_loss[:self._size] = 0.0
+            self._daily_profit[:self._size] = 0.0
+            self._last_reset = today
+
+    def _stakes(self, index: np.ndarray, multipliers: np.ndarray) -> np.ndarray:
+        """Vectorised RiskManager.calculate_stake scaled by position multipliers."""
+        base = self._balance[index] * (self._base_stake_percent[index] / 100)
+        stakes = np.round(base * 2.0 ** (self._tier[index] - 1) * multipliers, 2)
+        stakes[self._daily_loss[index] >= self._max_daily_loss[index]] = np.nan
+        return stakes
+
+    def _evaluate(self, candidates: List[Tuple], reserve: bool) -> List[Dict[str, Any]]:
+        self._reset_daily_stats()
+
+        index = np.array([self._ids.get(c[0], -1) for c in candidates], dtype=np.intp)
+        multipliers = np.array([c[2] if len(c) > 2 else 1.0 for c in candidates], dtype=np.float64)
+        known = index >= 0
+        stakes = np.full(len(candidates), np.nan)
+        if known.any():
+            stakes[known] = self._stakes(index[known], multipliers[known])
+
+        # Caps depend on earlier approvals in the batch, so they are applied in order
+        account_limits = (self._balance[:self._size] * self.account_exposure_percent / 100).tolist()
+        account_exposure = self._exposure[:self._size].tolist()
+        currency_exposure = dict(self._currency_exposure)
+        global_exposure = self._global_exposure
+        balances = self._balance[:self._size].tolist()
+
+        decisions = []
+        for candidate, i, stake in zip(candidates, index.tolist(), stakes.tolist()):
+            account_id, market = candidate[0], candidate[1]
+            reason = None
+            currencies = market_currencies(market)
+
+            if i < 0:
+                reason = REJECT_UNKNOWN_ACCOUNT
+            elif stake != stake:
+                reason = REJECT_DAILY_LOSS
+            elif stake <= 0 or stake > balances[i]:
+                reason = REJECT_NO_BALANCE
+            elif account_exposure[i] + stake > account_limits[i]:
+                reason = REJECT_ACCOUNT_EXPOSURE
+            elif self.currency_exposure_limit is not None and any(
+                    currency_exposure.get(c, 0.0) + stake > self.currency_exposure_limit
+                    for c in currencies):
+                reason = REJECT_CURRENCY_EXPOSURE
+            elif (self.global_exposure_limit is not None
+                  and global_exposure + stake > self.global_exposure_limit):
+                reason = REJECT_GLOBAL_EXPOSURE
+
+            decision = {'account_id': account_id, 'market': market, 'approved': reason is None,
+                        'stake': None if reason else stake, 'reason': reason, 'position_id': None}
+
+            if reason is None:
+                account_exposure[i] += stake
+                for c in currencies:
+                    currency_exposure[c] = currency_exposure.get(c, 0.0) + stake
+                global_exposure += stake
+
+                if reserve:
+                    position_id = self._next_position
+                    self._next_position += 1
+                    self._positions[position_id] = (i, market, stake)
+                    decision['position_id'] = position_id
+
+            decisions.append(decision)
+
+        if reserve:
+            self._exposure[:self._size] = account_exposure
+            self._currency_exposure = currency_exposure
+            self._global_exposure = global_exposure
+        return decisions
+
+    def check(self, candidates: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Size stakes for candidate trades without reserving exposure.
+
+        Args:
+            candidates (Iterable[Tuple]): (account_id, market[, position_size_multiplier]) tuples
+
+        Returns:
+            List[Dict[str, Any]]: Per candidate: approved, stake, reason
+        """
+        with self._lock:
+            return self._evaluate(list(candidates), reserve=False)
+
+    def allocate(self, candidates: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Size stakes for candidate trades and reserve exposure for approved ones.
+
+        Candidates are approved in order; a rejection does not stop later
+        candidates that still fit under the caps.
+
+        Args:
+            candidates (Iterable[Tuple]): (account_id, market[, position_size_multiplier]) tuples
+
+        Returns:
+            List[Dict[str, Any]]: Per candidate: approved, stake, reason and the
+                position_id to pass to settle() or release()
+        """
+        with self._lock:
+            return self._evaluate(list(candidates), reserve=True)
+
+    def _release(self, position_id: int) -> Tuple[int, str, float]:
+        position = self._positions.pop(position_id, None)
+        if position is None:
+            raise KeyError(f"Unknown position: {position_id}")
+        i, market, stake = position
+        # Snap float residue to zero once an account has nothing open
+        remaining = self._exposure[i] - stake
+        self._exposure[i] = remaining if remaining > 1e-9 else 0.0
+        for c in market_currencies(market):
+            remaining = self._currency_exposure.get(c, 0.0) - stake
+            if remaining > 1e-9:
+                self._currency_exposure[c] = remaining
+            else:
+                self._currency_exposure.pop(c, None)
+        remaining = self._global_exposure - stake
+        self._global_exposure = remaining if remaining > 1e-9 else 0.0
+        return position
+
+    def release(self, position_id: int):
+        """
+        Cancel a reserved position without a trade result.
+
+        Args:
+            position_id (int): Position returned by allocate()
+        """
+        with self._lock:
+            self._release(position_id)
+
+    def settle(self, position_id: int, win: bool, payout: float = 0.85) -> float:
+        """
+        Close a position and apply RiskManager.update_balance rules.
+
+        Args:
+            position_id (int): Position returned by allocate()
+            win (bool): Whether the trade won
+            payout (float): Profit per unit staked on a win
+
+        Returns:
+            float: Profit (positive) or loss (negative) booked
+        """
+        with self._lock:
+            i, _, stake = self._release(position_id)
+            profit_loss = stake * payout if win else -stake
+            self._balance[i] += profit_loss
+
+            if win:
+                self._tier[i] = 1
+                self._daily_profit[i] += profit_loss
+            else:
+                self._daily_loss[i] -= profit_loss
+                self._tier[i] = self._tier[i] + 1 if self._tier[i] < self._max_tier[i] else 1
+            return profit_loss
+
+    def get_account(self, account_id: str) -> Dict[str, Any]:
+        """
+        Get one account's state.
+
+        Args:
+            account_id (str): Account identifier
+
+        Returns:
+            Dict[str, Any]: Balance, tier, daily counters and open exposure
+        """
+        with self._lock:
+            i = self._ids[account_id]
+            return {
+                'account_id': account_id,
+                'balance': float(self._balance[i]),
+                'tier': int(self._tier[i]),
+                'daily_loss': float(self._daily_loss[i]),
+                'daily_profit': float(self._daily_profit[i]),
+                'open_exposure': float(self._exposure[i])
+            }
+
+    def to_risk_manager(self, account_id: str) -> RiskManager:
+        """
+        Export an account back into a standalone RiskManager.
+
+        Args:
+            account_id (str): Account identifier
+
+        Returns:
+            RiskManager: Manager with the account's settings and state
+        """
+        with self._lock:
+            i = self._ids[account_id]
+            manager = RiskManager(
+                float(self._initial_balance[i]),
+                float(self._base_stake_percent[i]),
+                int(self._max_tier[i]),
+                float(self._max_daily_loss[i] / self._initial_balance[i] * 100)
+            )
+            manager.current_balance = float(self._balance[i])
+            manager.current_tier = int(self._tier[i])
+            manager.daily_loss = float(self._daily_loss[i])
+            manager.daily_profit = float(self._daily_profit[i])
+            return manager
+
+    def get_exposure(self) -> Dict[str, Any]:
+        """Get open exposure per account, per currency and globally."""
+        with self._lock:
+            return {
+                'accounts': {a: float(self._exposure[i]) for a, i in self._ids.items()},
+                'currencies': dict(self._currency_exposure),
+                'global': self._global_exposure,
+                'open_positions': len(self._positions)
+            }
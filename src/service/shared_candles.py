@@ -0,0 +1,402 @@
+"""
+Candle buffers published in shared memory for process-pool workers.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.service.candle_buffer import CANDLE_FIELDS, CandleStore
+from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = 0x41464143  # "AFAC"
+LAYOUT_VERSION = 1
+
+# Segment header, then one slot per market/timeframe, then the candle data
+HEADER_DTYPE = np.dtype([
+    ('magic', '<u4'), ('layout', '<u4'), ('max_slots', '<u4'), ('window', '<u4'),
+    ('fields', '<u4'), ('used', '<u4'), ('sequence', '<u8'),
+])
+SLOT_DTYPE = np.dtype([
+    ('market', 'S32'), ('timeframe', '<i4'), ('length', '<i4'),
+    ('version', '<i8'), ('sequence', '<u8'),
+])
+
+def _data_offset(max_slots: int) -> int:
+    """Byte offset of the candle data, aligned to a cache line."""
+    end = HEADER_DTYPE.itemsize + SLOT_DTYPE.itemsize * max_slots
+    return (end + 63) // 64 * 64
+
+def _map(buf, max_slots: int, window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Header, slot table and (slot, field, candle) data arrays over a segment."""
+    header = np.ndarray((), HEADER_DTYPE, buf, 0)
+    slots = np.ndarray((max_slots,), SLOT_DTYPE, buf, HEADER_DTYPE.itemsize)
+    data = np.ndarray((max_slots, len(CANDLE_FIELDS), window), np.float64, buf, _data_offset(max_slots))
+    return header, slots, data
+
+class SharedCandleStore:
+    """
+    Publishes the newest candles of a CandleStore into one shared memory segment.
+
+    Each market/timeframe gets a fixed slot holding its newest ``window``
+    candles, right-aligned so the newest is always last. The slot table
+    records the market, timeframe, candle count and buffer version, and a
+    sequence counter that is odd while the slot is being written. Readers in
+    other processes map the segment by name and take NumPy views of it, so
+    candles are never pickled; a changed sequence tells them to read again.
+    Only buffers whose version changed are copied on publish().
+    """
+
+    def __init__(self, store: Optional[CandleStore] = None, window: int = 100,
+                 max_markets: int = 256, name: Optional[str] = None):
+        """
+        Initialize shared candle store.
+
+        Args:
+            store (Optional[CandleStore]): Source buffers, the shared store by default
+            window (int): Newest candles kept per market/timeframe
+            max_markets (int): Number of market/timeframe slots
+            name (Optional[str]): Segment name, generated when None
+        """
+        self.store = store or CandleStore.get_instance()
+        self.window = window
+        self.max_markets = max_markets
+
+        size = _data_offset(max_markets) + max_markets * len(CANDLE_FIELDS) * window * 8
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._header, self._slots, self._data = _map(self._shm.buf, max_markets, window)
+        self._header[()] = (MAGIC, LAYOUT_VERSION, max_markets, window, len(CANDLE_FIELDS), 0, 0)
+
+        self._index: Dict[Tuple[str, int], int] = {}
+        self._versions: Dict[int, int] = {}
+        self._skipped = set()
+
+    @property
+    def name(self) -> str:
+        """Segment name readers attach to."""
+        return self._shm.name
+
+    def __enter__(self) -> 'SharedCandleStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _slot(self, market: str, timeframe: int) -> Optional[int]:
+        key = (market, timeframe)
+        slot = self._index.get(key)
+        if slot is not None:
+            return slot
+
+        used = int(self._header['used'])
+        if used >= self.max_markets:
+            if key not in self._skipped:
+                self._skipped.add(key)
+                logger.warning("Shared candle store full (%d slots), skipping %s %dm",
+                               self.max_markets, market, timeframe)
+            return None
+
+        self._slots[used] = (market.encode()[:32], timeframe, 0, -1, 0)
+        self._index[key] = used
+        self._header['used'] = used + 1
+        return used
+
+    def publish(self, keys: Optional[Iterable[Tuple[str, int]]] = None) -> int:
+        """
+        Copy changed buffers into the segment.
+
+        Args:
+            keys (Optional[Iterable[Tuple[str, int]]]): (market, timeframe) pairs,
+                every buffer of the store when None
+
+        Returns:
+            int: Number of slots written
+        """
+        written = 0
+        for market, timeframe in (keys if keys is not None else self.store.keys()):
+            buffer = self.store.get(market, timeframe)
+            slot = self._slot(market, timeframe)
+            # Read the version first: an extend() racing the copy then only
+            # causes one extra publish, never a missed one
+            version = buffer.version
+            if slot is None or self._versions.get(slot) == version:
+                continue
+
+            window = buffer.window(self.window)
+            length = window.shape[1]
+            entry = self._slots[slot]
+
+            # Odd sequence while writing; readers retry until it is even again
+            entry['sequence'] += 1
+            self._data[slot, :, self.window - length:] = window
+            entry['length'] = length
+            entry['version'] = version
+            entry['sequence'] += 1
+
+            self._versions[slot] = version
+            written += 1
+
+        if written:
+            self._header['sequence'] += 1
+        return written
+
+    def close(self, unlink: bool = True):
+        """
+        Release the segment.
+
+        Args:
+            unlink (bool): Also destroy it (readers keep their mapping until they close)
+        """
+        if self._shm is None:
+            return
+        self._header = self._slots = self._data = None
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+        self._shm = None
+
+class SharedCandleReader:
+    """
+    Read-only access to a SharedCandleStore from another process.
+
+    view() returns a zero-copy view of a slot together with its sequence;
+    a caller that computes straight on the view checks changed() afterwards.
+    stack() mirrors CandleStore.stack(), so TradingStrategy.evaluate_markets()
+    can read from shared memory directly.
+    """
+
+    def __init__(self, name: str, retries: int = 1000):
+        """
+        Initialize shared candle reader.
+
+        Args:
+            name (str): Segment name of the publishing SharedCandleStore
+            retries (int): Attempts to get a consistent slot before giving up
+        """
+        self.retries = retries
+        self._shm = shared_memory.SharedMemory(name=name)
+
+        header = np.ndarray((), HEADER_DTYPE, self._shm.buf, 0)
+        if int(header['magic']) != MAGIC or int(header['layout']) != LAYOUT_VERSION:
+            del header
+            self._shm.close()
+            raise ValueError(f"{name} is not a shared candle store segment")
+        if int(header['fields']) != len(CANDLE_FIELDS):
+            del header
+            self._shm.close()
+            raise ValueError(f"{name} was published with a different candle layout")
+
+        self.window = int(header['window'])
+        self._header, self._slots, self._data = _map(self._shm.buf, int(header['max_slots']), self.window)
+        self._index: Dict[Tuple[str, int], int] = {}
+        self._indexed = 0
+
+    def __enter__(self) -> 'SharedCandleReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def sequence(self) -> int:
+        """Publish counter; changes whenever any slot was written."""
+        return int(self._header['sequence'])
+
+    def _refresh_index(self):
+        """Index slots added by the publisher since the last lookup."""
+        used = int(self._header['used'])
+        for slot in range(self._indexed, used):
+            entry = self._slots[slot]
+            self._index[(entry['market'].decode(), int(entry['timeframe']))] = slot
+        self._indexed = used
+
+    def _lookup(self, market: str, timeframe: int) -> Optional[int]:
+        key = (market, timeframe)
+        if key not in self._index:
+            self._refresh_index()
+        return self._index.get(key)
+
+    def keys(self) -> List[Tuple[str, int]]:
+        """Get all (market, timeframe) pairs published so far."""
+        self._refresh_index()
+        return list(self._index)
+
+    def _stable(self, slot: int) -> int:
+        for _ in range(self.retries):
+            sequence = int(self._slots[slot]['sequence'])
+            if sequence % 2 == 0:
+                return sequence
+            time.sleep(0)
+        raise TimeoutError("Shared candle slot is being rewritten continuously")
+
+    def view(self, market: str, timeframe: int) -> Tuple[np.ndarray, int]:
+        """
+        Get a zero-copy view of a market's candles.
+
+        Args:
+            market (str): Market symbol
+            timeframe (int): Timeframe in minutes
+
+        Returns:
+            Tuple[np.ndarray, int]: Read-only (field, candle) view ordered like
+                CANDLE_FIELDS, oldest first (empty when not published), and
+                the slot sequence to pass to changed()
+        """
+        slot = self._lookup(market, timeframe)
+        if slot is None:
+            return np.empty((len(CANDLE_FIELDS), 0)), 0
+        sequence = self._stable(slot)
+        length = int(self._slots[slot]['length'])
+        view = self._data[slot, :, self.window - length:]
+        view.flags.writeable = False
+        return view, sequence
+
+    def changed(self, market: str, timeframe: int, sequence: int) -> bool:
+        """Check whether a slot was rewritten since view() returned ``sequence``."""
+        slot = self._lookup(market, timeframe)
+        return slot is not None and int(self._slots[slot]['sequence']) != sequence
+
+    def stack(self, markets: List[str], timeframe: int, count: int,
+              fields: Tuple[str, ...] = ('high', 'low', 'close')) -> Tuple[List[str], np.ndarray]:
+        """
+        Copy a consistent (field, market, bar) stack of the newest candles.
+
+        Args:
+            markets (List[str]): Market symbols
+            timeframe (int): Timeframe in minutes
+            count (int): Bars per market; markets with fewer published are skipped
+            fields (Tuple[str, ...]): Columns to include, from CANDLE_FIELDS
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Included markets and the stacked array
+        """
+        rows = [CANDLE_FIELDS.index(f) for f in fields]
+        included, windows = [], []
+        for market in markets:
+            for _ in range(self.retries):
+                view, sequence = self.view(market, timeframe)
+                if view.shape[1] < count:
+                    window = None
+                    break
+                window = view[rows, -count:]
+                if not self.changed(market, timeframe, sequence):
+                    break
+            else:
+                raise TimeoutError(f"Could not read a consistent window for {market}")
+            if window is not None:
+                included.append(market)
+                windows.append(window)
+
+        data = np.stack(windows, axis=1) if windows else np.empty((len(rows), 0, count))
+        return included, data
+
+    def close(self):
+        """Unmap the segment (views taken from it must no longer be used)."""
+        if self._shm is None:
+            return
+        self._header = self._slots = self._data = None
+        self._shm.close()
+        self._shm = None
+
+# Per-process reader, attached once by the pool initializer
+_worker_reader: Optional[SharedCandleReader] = None
+
+def _attach_worker(name: str):
+    global _worker_reader
+    _worker_reader = SharedCandleReader(name)
+
+def _evaluate_chunk(markets: List[str], timeframe: int, bars: int) -> Dict[str, Dict[str, Any]]:
+    """Run the strategy and volatility filter on shared candles inside a worker."""
+    from src.models.strategy import TradingStrategy, SIGNAL_NAMES
+    from src.service.volatility_filter import VolatilityFilter
+
+    included, data = _worker_reader.stack(markets, timeframe, bars, ('timestamp', 'high', 'low', 'close'))
+    if not included:
+        return {}
+    timestamps, highs, lows, closes = data
+
+    signals = TradingStrategy(timeframe).generate_signals_batch(closes, highs, lows, included)
+    volatility_filter = VolatilityFilter()
+
+    results = {}
+    for row, market in enumerate(included):
+        volatility = volatility_filter.analyze_market_volatility({
+            'market': market,
+            'timeframe': timeframe,
+            'timestamps': timestamps[row].tolist(),
+            'highs': highs[row].tolist(),
+            'lows': lows[row].tolist(),
+            'closes': closes[row].tolist(),
+            'source': 'shared_memory'
+        })
+        multiplier = volatility.get('position_size_multiplier')
+        results[market] = {
+            'signal': SIGNAL_NAMES[int(signals[row])],
+            'volatility_state': volatility.get('volatility_state'),
+            'position_size_multiplier': float(multiplier) if multiplier is not None else None
+        }
+    return results
+
+class SharedSignalPool:
+    """
+    Process pool that evaluates markets on shared-memory candles.
+
+    Workers attach to the segment once at start-up. Each evaluate() call
+    publishes changed buffers, sends every worker only a list of market
+    names and gets back a small result dict per market.
+    """
+
+    def __init__(self, shared: SharedCandleStore, workers: Optional[int] = None, chunk_size: int = 16):
+        """
+        Initialize shared signal pool.
+
+        Args:
+            shared (SharedCandleStore): Published candle store
+            workers (Optional[int]): Worker processes, one per CPU by default
+            chunk_size (int): Markets evaluated per task
+        """
+        self.shared = shared
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                             initializer=_attach_worker, initargs=(shared.name,))
+
+    def __enter__(self) -> 'SharedSignalPool':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def evaluate(self, markets: Iterable[str], timeframe: int = 1, bars: int = 100) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate markets in the worker processes.
+
+        Args:
+            markets (Iterable[str]): Market symbols
+            timeframe (int): Timeframe in minutes
+            bars (int): Newest bars used per market
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Signal ('BUY', 'SELL' or 'NONE'),
+                volatility state and position size multiplier per market;
+                markets with fewer than ``bars`` candles are left out
+        """
+        markets = list(dict.fromkeys(markets))
+        self.shared.publish([(market, timeframe) for market in markets])
+
+        chunks = [markets[i:i + self.chunk_size] for i in range(0, len(markets), self.chunk_size)]
+        futures = [self._executor.submit(_evaluate_chunk, chunk, timeframe, bars) for chunk in chunks]
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for future in futures:
+            results.update(future.result())
+        return results
+
+    def close(self):
+        """Shut the worker processes down."""
+        self._executor.shutdown()
@@ -0,0 +1,401 @@
+"""
+Long-running signal daemon evaluating subscribed markets on every candle close.
+"""
+
+import asyncio
+import io
+import math
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+
+from models.market import MarketTimingController
+from models.signal import Signal, apply_signal_filters
+from src.api.quotex_api import QuotexAPI
+from src.api.quotex_real_api import SIGNAL_STRATEGY
+from src.service.candle_buffer import CandleStore
+from src.service.event_loop import BackgroundLoop
+from src.service.news_filter import NewsFilter
+from src.service.result_tracker import ResultTracker
+from src.service.risk_pool import RiskPool
+from src.service.volatility_filter import VolatilityFilter
+from utils.file_handler import write_signals
+from utils.log import get_logger
+from utils.signal_journal import SignalJournal
+
+logger = get_logger(__name__)
+
+class SignalSink:
+    """Destination for signals emitted by the daemon."""
+
+    def emit(self, signal: Signal):
+        """Deliver one signal."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release any resources held by the sink."""
+
+class StreamSink(SignalSink):
+    """Write signals as JSON lines to an open text stream."""
+
+    def __init__(self, stream=None):
+        """
+        Initialize stream sink.
+
+        Args:
+            stream: Writable text stream, defaults to the current sys.stdout
+        """
+        self.stream = stream or sys.stdout
+
+    def emit(self, signal: Signal):
+        write_signals([signal], self.stream, "jsonl")
+        self.stream.flush()
+
+class FileSink(StreamSink):
+    """Append signals as JSON lines to a file."""
+
+    def __init__(self, path: str):
+        """
+        Initialize file sink.
+
+        Args:
+            path (str): File to append to (parent directories are created)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        super().__init__(open(path, "a", buffering=1))
+
+    def close(self):
+        self.stream.close()
+
+class SocketSink(SignalSink):
+    """Send signals as JSON lines to a local Unix or TCP socket listener."""
+
+    def __init__(self, address: str):
+        """
+        Initialize socket sink.
+
+        Args:
+            address (str): Unix socket path or 'host:port' for TCP
+        """
+        self.address = address
+        self._sock = None
+
+    def _connect(self) -> socket.socket:
+        host, _, port = self.address.rpartition(":")
+        if host and port.isdigit():
+            return socket.create_connection((host, int(port)), timeout=5)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(self.address)
+        return sock
+
+    def emit(self, signal: Signal):
+        buffer = io.StringIO()
+        write_signals([signal], buffer, "jsonl")
+        payload = buffer.getvalue().encode("utf-8")
+
+        # One reconnect attempt per signal; the listener may have restarted
+        for attempt in range(2):
+            try:
+                if self._sock is None:
+                    self._sock = self._connect()
+                self._sock.sendall(payload)
+                return
+            except OSError as e:
+                self.close()
+                if attempt == 1:
+                    logger.warning("⚠️ Socket sink %s unavailable: %s", self.address, e)
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+class JournalSink(SignalSink):
+    """Append signals to the indexed signal journal."""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Initialize journal sink.
+
+        Args:
+            directory (Optional[str]): Journal directory, the shared journal by default
+        """
+        self.journal = SignalJournal(directory) if directory else SignalJournal.get_instance()
+
+    def emit(self, signal: Signal):
+        self.journal.append([signal])
+
+def create_sink(spec: str) -> SignalSink:
+    """
+    Create a sink from a command line specification.
+
+    Args:
+        spec (str): 'stdout', 'file:PATH', 'socket:ADDRESS' or 'journal[:DIR]'
+
+    Returns:
+        SignalSink: Configured sink
+    """
+    kind, _, target = spec.partition(":")
+    if kind == "stdout" and not target:
+        return StreamSink()
+    if kind == "file" and target:
+        return FileSink(target)
+    if kind == "socket" and target:
+        return SocketSink(target)
+    if kind == "journal":
+        return JournalSink(target or None)
+    raise ValueError(f"Invalid sink specification: {spec}")
+
+class SignalDaemon:
+    """
+    Keeps one Quotex session and warm candle buffers, and evaluates every
+    subscribed market/timeframe pair when its candle closes.
+
+    Candle closes are scheduled on the same MarketTimingController that
+    enforces the signal gaps, and the daemon sleeps in wait_until_due()
+    until the earliest one passes.
+    """
+
+    def __init__(self, markets: Iterable[str], timeframes: Iterable[int] = (1,),
+                 sinks: Optional[List[SignalSink]] = None, accuracy: str = "85%",
+                 signal_filter: str = "ALL", news_filter: bool = True,
+                 volatility_filter: bool = True, min_gap_minutes: int = 3,
+                 max_gap_minutes: int = 15, candle_count: int = 100,
+                 settle_delay: float = 1.0, store: Optional[CandleStore] = None,
+                 risk_pool: Optional[RiskPool] = None, account_id: str = "default"):
+        """
+        Initialize signal daemon.
+
+        Args:
+            markets (Iterable[str]): Market symbols to subscribe
+            timeframes (Iterable[int]): Timeframes in minutes evaluated for each market
+            sinks (Optional[List[SignalSink]]): Signal destinations, stdout by default
+            accuracy (str): Accuracy label attached to signals
+            signal_filter (str): 'ALL', 'BUY' or 'SELL'
+            news_filter (bool): Whether to apply the news filter
+            volatility_filter (bool): Whether to apply the volatility filter
+            min_gap_minutes (int): Minimum gap between signals of one pair
+            max_gap_minutes (int): Gap after which a filter-blocked signal is forced out
+            candle_count (int): Candles requested per refresh
+            settle_delay (float): Seconds to wait after a close before evaluating
+            store (Optional[CandleStore]): Candle store, the shared one by default
+            risk_pool (Optional[RiskPool]): Sizes and caps the stake of every signal
+                before it is emitted; signals are not risk checked if None
+            account_id (str): Risk pool account the daemon trades for
+        """
+        self.pairs = [(market, timeframe) for market in markets for timeframe in timeframes]
+        self.sinks = sinks if sinks is not None else [StreamSink()]
+        self.accuracy = accuracy
+        self.signal_filter = signal_filter
+        self.candle_count = candle_count
+        self.settle_delay = settle_delay
+        self.store = store or CandleStore.get_instance()
+
+        self.api = None
+        self.timing = MarketTimingController(min_gap_minutes, max_gap_minutes)
+
+        self.news_filter_service = None
+        if news_filter:
+            self.news_filter_service = NewsFilter()
+            self.news_filter_service.enable_filter()
+
+        # Volatility filter keeps a cooldown counter, so each pair gets its own
+        self.volatility_filter_services: Dict[Tuple[str, int], VolatilityFilter] = {}
+        if volatility_filter:
+            for pair in self.pairs:
+                service = VolatilityFilter()
+                service.enable_filter()
+                self.volatility_filter_services[pair] = service
+
+        self.tracker = ResultTracker(store=self.store)
+        self.risk_pool = risk_pool
+        self.account_id = account_id
+        # (market, timeframe, signal_time) -> (position_id, epoch seconds of expiry)
+        self._positions: Dict[Tuple[str, int, datetime], Tuple[int, float]] = {}
+        self.stats = {'evaluations': 0, 'emitted': 0, 'suppressed': 0}
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def next_candle_close(timeframe: int, now: Optional[float] = None) -> float:
+        """
+        Get the epoch time of the next candle close for a timeframe.
+
+        Args:
+            timeframe (int): Timeframe in minutes
+            now (Optional[float]): Reference epoch seconds, defaults to now
+
+        Returns:
+            float: Epoch seconds of the next close
+        """
+        period = timeframe * 60
+        now = time.time() if now is None else now
+        return (math.floor(now / period) + 1) * period
+
+    def connect(self) -> bool:
+        """Open the Quotex session shared by all evaluations."""
+        self.api = QuotexAPI(use_real_api=True)
+        return BackgroundLoop.get_instance().run(self.api.connect())
+
+    def warm_up(self):
+        """Fill every candle buffer and schedule the first evaluations."""
+        for market, timeframe in self.pairs:
+            self.store.refresh(self.api, market, timeframe, self.candle_count)
+            self.schedule_next(market, timeframe)
+
+    def schedule_next(self, market: str, timeframe: int):
+        """Schedule a pair's evaluation just after its next candle close."""
+        self.timing.schedule_close(market, timeframe,
+                                   self.next_candle_close(timeframe) + self.settle_delay)
+
+    def evaluate(self, market: str, timeframe: int, close_time: Optional[float] = None) -> Optional[Signal]:
+        """
+        Evaluate one pair after its candle closed and emit a signal if allowed.
+
+        Args:
+            market (str): Market symbol
+            timeframe (int): Timeframe in minutes
+            close_time (Optional[float]): Epoch seconds of the close being processed
+
+        Returns:
+            Optional[Signal]: The emitted signal, if any
+        """
+        pair = (market, timeframe)
+        self.stats['evaluations'] += 1
+        buffer = self.store.refresh(self.api, market, timeframe, self.candle_count)
+
+        forced = self.timing.should_force_signal(market, timeframe)
+        if not self.timing.can_emit_signal(market, timeframe):
+            self.stats['suppressed'] += 1
+            return None
+
+        quotex_signal = self.api.get_signal(market, timeframe)
+        if not quotex_signal:
+            return None
+
+        signal_type = "BUY" if quotex_signal.get('direction') == 'call' else "SELL"
+        if self.signal_filter != "ALL" and signal_type != self.signal_filter:
+            self.stats['suppressed'] += 1
+            return None
+
+        # Entry is the open of the candle after the one that just started
+        close_time = close_time or self.next_candle_close(timeframe) - timeframe * 60
+        signal_time = datetime.fromtimestamp(close_time) + timedelta(minutes=timeframe)
+        signal = Signal(market, f"{timeframe} min", self.accuracy, signal_type,
+                        signal_time, quotex_signal.get('confidence', 0.80))
+
+        apply_signal_filters(signal, buffer.to_market_data(), self.news_filter_service,
+                             self.volatility_filter_services.get(pair))
+
+        if signal.strength == 'BLOCKED' and not forced:
+            self.stats['suppressed'] += 1
+            return None
+
+        if self.risk_pool is not None and not self._reserve(signal, timeframe):
+            self.stats['suppressed'] += 1
+            return None
+
+        self.timing.record_signal_emission(market, timeframe, forced=forced)
+        for sink in self.sinks:
+            sink.emit(signal)
+        self.tracker.track(signal, quotex_signal.get('strategy', SIGNAL_STRATEGY))
+        self.stats['emitted'] += 1
+
+        return signal
+
+    def _reserve(self, signal: Signal, timeframe: int) -> bool:
+        """Size the signal's stake in the risk pool and hold it until settlement."""
+        decision = self.risk_pool.allocate(
+            [(self.account_id, signal.market, signal.position_size_multiplier)])[0]
+        if not decision['approved']:
+            logger.info("🛡️ %s %s rejected by risk pool: %s", signal.market,
+                        signal.signal_type, decision['reason'])
+            return False
+
+        logger.debug("💰 %s %s stake %.2f", signal.market, signal.signal_type, decision['stake'])
+        expiry = self.tracker.expiry_of(signal).timestamp()
+        self._positions[(signal.market, timeframe, signal.signal_time)] = (decision['position_id'], expiry)
+        return True
+
+    def _settle_positions(self, results: List[Dict[str, Any]]):
+        """Book settled results in the risk pool and free positions that never settled."""
+        for result in results:
+            position = self._positions.pop((result['market'], result['timeframe'], result['signal_time']), None)
+            if position is None:
+                continue
+            if result['outcome'] == 'draw':
+                self.risk_pool.release(position[0])
+            else:
+                self.risk_pool.settle(position[0], result['outcome'] == 'win', self.tracker.payout)
+
+        # The tracker gives up on signals whose candles never arrive
+        cutoff = time.time() - self.tracker.max_wait
+        for key, (position_id, expiry) in list(self._positions.items()):
+            if expiry < cutoff:
+                del self._positions[key]
+                self.risk_pool.release(position_id)
+
+    def process_due(self, due: List[Tuple[str, Tuple[str, int]]]) -> int:
+        """
+        Evaluate the pairs whose candle closed and schedule their next close.
+
+        Args:
+            due (List[Tuple[str, Tuple[str, int]]]): (kind, (market, timeframe))
+                entries from the timing controller; gap deadlines are ignored
+
+        Returns:
+            int: Number of pairs evaluated
+        """
+        evaluated = 0
+        for kind, (market, timeframe) in due:
+            if kind != MarketTimingController.CLOSE:
+                continue
+            close_time = self.next_candle_close(timeframe) - timeframe * 60
+            try:
+                self.evaluate(market, timeframe, close_time)
+            except Exception as e:
+                logger.error("⚠️ Evaluation error for %s (%sm): %s", market, timeframe, e)
+            self.schedule_next(market, timeframe)
+            evaluated += 1
+
+        # Buffers were just refreshed, so expired signals can be settled
+        if evaluated:
+            results = self.tracker.settle_due(api=self.api)
+            if self.risk_pool is not None:
+                self._settle_positions(results)
+        return evaluated
+
+    async def _process_closes(self):
+        while not self._stop_event.is_set():
+            self.process_due(await self.timing.wait_until_due())
+
+    def run_forever(self):
+        """Connect, warm up and process candle closes until stop() is called."""
+        if self.api is None and not self.connect():
+            raise ConnectionError("❌ Failed to connect to LIVE Quotex")
+
+        self.warm_up()
+
+        try:
+            asyncio.run(self._process_closes())
+        finally:
+            for sink in self.sinks:
+                sink.close()
+            if self.api:
+                self.api.disconnect()
+
+    def stop(self):
+        """Ask run_forever() to return after the current evaluation."""
+        self._stop_event.set()
+        self.timing.interrupt()
@@ -7,6 +7,8 @@ import time
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
+from src.models.indicator_graph import IndicatorGraph, indicator_graph
+
 class VolatilityFilter:
     def __init__(self):
         """Initialize the Volatility Filter with default settings."""
@@ -225,6 +227,38 @@ class VolatilityFilter:
         # Apply caps
         return max(self.min_position_size, min(self.max_position_size, size))
     
+    def _atr_with_history(self, highs: List[float], lows: List[float],
+                          closes: List[float]) -> Tuple[float, List[float]]:
+        """Current ATR and the ATR of each recent window used for normalization."""
+        current_atr = self.calculate_atr(highs, lows, closes)
+        
+        atr_history = []
+        for i in range(max(10, len(closes)-20), len(closes)):
+            start_idx = max(0, i-self.atr_period)
+            end_idx = i+1
+            if end_idx > start_idx:
+                atr_val = self.calculate_atr(highs[start_idx:end_idx], 
+                                           lows[start_idx:end_idx],
+                                           closes[start_idx:end_idx])
+                atr_history.append(atr_val)
+        
+        return current_atr, atr_history
+    
+    def _bb_width_with_history(self, graph: IndicatorGraph, count: int) -> Tuple[float, List[float]]:
+        """
+        Current Bollinger width and the width at each recent close.
+        
+        Both come from the graph's Bollinger node, which the strategy's
+        volatility module shares; windows shorter than bb_period have width 0.
+        """
+        upper, _, lower = graph.bollinger(self.bb_period, self.bb_std_dev)
+        
+        bb_history = [upper[i] - lower[i] if i >= self.bb_period - 1 else 0.0
+                      for i in range(max(10, count-20), count)]
+        current_bb_width = upper[-1] - lower[-1] if count >= self.bb_period else 0.0
+        
+        return current_bb_width, bb_history
+    
     def analyze_market_volatility(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Comprehensive volatility analysis of market data.
@@ -245,30 +279,18 @@ class VolatilityFilter:
             
             current_price = closes[-1]
             
-            # Calculate volatility metrics
-            current_atr = self.calculate_atr(highs, lows, closes)
-            upper_band, middle_band, lower_band = self.calculate_bollinger_bands(closes)
-            current_bb_width = upper_band - lower_band
-            historical_vol = self.calculate_historical_volatility(closes)
-            
-            # Build history for normalization
-            atr_history = []
-            for i in range(max(10, len(closes)-20), len(closes)):
-                start_idx = max(0, i-self.atr_period)
-                end_idx = i+1
-                if end_idx > start_idx:
-                    atr_val = self.calculate_atr(highs[start_idx:end_idx], 
-                                               lows[start_idx:end_idx],
-                                               closes[start_idx:end_idx])
-                    atr_history.append(atr_val)
-            
-            bb_history = []
-            for i in range(max(10, len(closes)-20), len(closes)):
-                start_idx = max(0, i-self.bb_period)
-                end_idx = i+1
-                if end_idx > start_idx:
-                    ub, mb, lb = self.calculate_bollinger_bands(closes[start_idx:end_idx])
-                    bb_history.append(ub - lb)
+            # Metrics are nodes of the shared indicator graph, so they are
+            # computed once per candle update for every filter and signal
+            graph = indicator_graph(market_data)
+            current_atr, atr_history = graph.node(
+                ('volatility_atr', self.atr_period),
+                lambda: self._atr_with_history(highs, lows, closes))
+            current_bb_width, bb_history = graph.node(
+                ('volatility_bb_width', self.bb_period, self.bb_std_dev),
+                lambda: self._bb_width_with_history(graph, len(closes)))
+            historical_vol = graph.node(
+                ('historical_volatility', self.historical_vol_period),
+                lambda: self.calculate_historical_volatility(closes))
             
             # Normalize metrics
             norm_atr, norm_bb = self.normalize_metrics(current_atr, current_bb_width,
@@ -0,0 +1,110 @@
+"""
+Candle buffer appends, wraparound and concurrent access.
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from src.service.candle_buffer import CandleBuffer, CandleStore
+
+def _candle(minute: int, close: float = None) -> dict:
+    close = float(minute) if close is None else close
+    return {'timestamp': minute * 60000, 'open': close, 'high': close + 1,
+            'low': close - 1, 'close': close, 'volume': 1}
+
+class CandleBufferTest(unittest.TestCase):
+
+    def test_extend_skips_older_candles(self):
+        buffer = CandleBuffer("EURUSD", 1, capacity=10)
+        self.assertEqual(buffer.extend([_candle(i) for i in range(5)]), 5)
+        self.assertEqual(buffer.extend([_candle(i) for i in range(3, 7)]), 2)
+        self.assertEqual(buffer.column('close').tolist(), [float(i) for i in range(7)])
+
+    def test_same_timestamp_replaces_forming_candle(self):
+        buffer = CandleBuffer("EURUSD", 1, capacity=10)
+        buffer.extend([_candle(0), _candle(1, close=1.0)])
+        version = buffer.version
+
+        self.assertEqual(buffer.extend([_candle(0, close=9.0), _candle(1, close=1.5)]), 1)
+        self.assertEqual(buffer.column('close').tolist(), [0.0, 1.5])
+        self.assertEqual(buffer.version, version + 1)
+
+        # The forming candle is updated and the next one appended in one call
+        self.assertEqual(buffer.extend([_candle(1, close=1.7), _candle(2)]), 2)
+        self.assertEqual(buffer.column('close').tolist(), [0.0, 1.7, 2.0])
+        self.assertEqual(buffer.extend([_candle(0)]), 0)
+
+    def test_unchanged_forming_candle_keeps_version(self):
+        buffer = CandleBuffer("EURUSD", 1, capacity=10)
+        buffer.extend([_candle(0), _candle(1)])
+        version = buffer.version
+
+        # Polling returns the same forming candle until the price moves
+        self.assertEqual(buffer.extend([_candle(0), _candle(1)]), 0)
+        self.assertEqual(buffer.version, version)
+        self.assertEqual(buffer.extend([_candle(1, close=1.2)]), 1)
+        self.assertEqual(buffer.version, version + 1)
+
+    def test_capacity_keeps_newest_candles_across_wraparound(self):
+        buffer = CandleBuffer("EURUSD", 1, capacity=4)
+        for i in range(25):
+            buffer.extend([_candle(i)])
+
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(buffer.column('close').tolist(), [21.0, 22.0, 23.0, 24.0])
+        self.assertEqual(buffer.window(2)[4].tolist(), [23.0, 24.0])
+        self.assertEqual(buffer.to_market_data(3)['closes'], [22.0, 23.0, 24.0])
+
+    def test_accessors_return_copies(self):
+        buffer = CandleBuffer("EURUSD", 1, capacity=4)
+        buffer.extend([_candle(i) for i in range(4)])
+        window = buffer.window(4)
+
+        # Wrapping moves rows inside the backing array; the copy must not change
+        for i in range(4, 12):
+            buffer.extend([_candle(i)])
+        self.assertEqual(window[4].tolist(), [0.0, 1.0, 2.0, 3.0])
+
+    def test_concurrent_extend_and_read(self):
+        buffer = CandleBuffer("EURUSD", 1, capacity=8)
+        buffer.extend([_candle(0)])
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            for i in range(1, 3000):
+                buffer.extend([_candle(i)])
+            done.set()
+
+        def reader():
+            while not done.is_set():
+                window = buffer.window(8)
+                closes = window[4]
+                # Every snapshot holds consecutive candles whose close matches the timestamp
+                if not (np.all(np.diff(closes) == 1) and np.all(window[0] == closes * 60000)):
+                    errors.append(closes.tolist())
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(buffer.last_timestamp, 2999 * 60000)
+
+    def test_store_stack_skips_short_markets(self):
+        store = CandleStore(capacity=10)
+        store.get("EURUSD", 1).extend([_candle(i) for i in range(5)])
+        store.get("GBPUSD", 1).extend([_candle(i) for i in range(2)])
+
+        markets, data = store.stack(["EURUSD", "GBPUSD"], 1, 3)
+
+        self.assertEqual(markets, ["EURUSD"])
+        self.assertEqual(data.shape, (3, 1, 3))
+        self.assertEqual(data[2, 0].tolist(), [2.0, 3.0, 4.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Headless 'generate' command: argument parsing, validation and signal output.
+"""
+
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+from models.signal import Signal
+from utils.file_handler import read_signals_from_file
+
+def _signals(market, timeframe, accuracy, count, *args):
+    """Stand-in for generate_signals(): ``count`` alternating signals for one market."""
+    start = datetime.datetime(2024, 3, 4, 10, 0)
+    return [Signal(market, timeframe, accuracy, "BUY" if i % 2 == 0 else "SELL",
+                   start + datetime.timedelta(minutes=i), 0.9) for i in range(count)]
+
+class ArgParserTest(unittest.TestCase):
+
+    def test_generate_defaults(self):
+        args = main.build_arg_parser().parse_args(["generate", "--markets", "EURUSD"])
+        self.assertEqual((args.command, args.timeframe, args.count, args.accuracy),
+                         ("generate", 1, 5, "85%"))
+        self.assertEqual((args.signal_filter, args.format, args.output), ("ALL", "jsonl", "-"))
+        self.assertFalse(args.martingale or args.no_news_filter or args.no_volatility_filter)
+
+    def test_invalid_choices_exit(self):
+        parser = main.build_arg_parser()
+        with mock.patch("sys.stderr", new=io.StringIO()):
+            for argv in (["generate"], ["generate", "--markets", "EURUSD", "--timeframe", "2"],
+                         ["generate", "--markets", "EURUSD", "--format", "xml"]):
+                with self.assertRaises(SystemExit):
+                    parser.parse_args(argv)
+
+    def test_parse_markets(self):
+        self.assertEqual(main.parse_markets(" eurusd, GBPUSD ,"), ["EURUSD", "GBPUSD"])
+        with self.assertRaises(ValueError):
+            main.parse_markets("EURUSD,NOPE")
+        with self.assertRaises(ValueError):
+            main.parse_markets(" , ")
+
+class GenerateCommandTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stdout, self.stderr = io.StringIO(), io.StringIO()
+        self.generate = mock.Mock(side_effect=_signals)
+        for patcher in (mock.patch("sys.stdout", new=self.stdout),
+                        mock.patch("sys.stderr", new=self.stderr),
+                        mock.patch("models.signal.generate_signals", new=self.generate),
+                        mock.patch("main.authenticate_from_env", return_value=True)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _run(self, *argv):
+        args = main.build_arg_parser().parse_args(["generate", *argv])
+        return main.run_generate_command(args)
+
+    def test_jsonl_on_stdout(self):
+        code = self._run("--markets", "EURUSD,GBPUSD", "--count", "3", "--timeframe", "5",
+                         "--filter", "BUY", "--martingale", "--no-news-filter")
+        self.assertEqual(code, 0)
+
+        self.assertEqual(self.generate.call_args_list, [
+            mock.call("EURUSD", "5 min", "85%", 3, "BUY", 1, 7, "No", "Yes"),
+            mock.call("GBPUSD", "5 min", "85%", 3, "BUY", 1, 7, "No", "Yes"),
+        ])
+        records = [json.loads(line) for line in self.stdout.getvalue().splitlines()]
+        self.assertEqual([r['market'] for r in records], ["EURUSD"] * 3 + ["GBPUSD"] * 3)
+        self.assertEqual(records[1]['signal_type'], "SELL")
+        self.assertEqual(records[0]['signal_time'], "2024-03-04T10:00:00")
+        # The summary goes to stderr so stdout stays machine-readable
+        self.assertIn("6 signals for 2 markets", self.stderr.getvalue())
+
+    def test_csv_and_text_on_stdout(self):
+        self._run("--markets", "EURUSD", "--count", "2", "--format", "csv")
+        lines = self.stdout.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("market,"))
+        self.assertEqual(len(lines), 3)
+
+        self.stdout.truncate(0)
+        self.stdout.seek(0)
+        self._run("--markets", "EURUSD", "--count", "2", "--format", "text")
+        self.assertEqual(self.stdout.getvalue().splitlines(), [str(s) for s in _signals("EURUSD", "1 min", "85%", 2)])
+
+    def test_file_output_round_trips(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for fmt in ("jsonl", "csv", "npz"):
+                path = os.path.join(directory, f"signals.{fmt}")
+                self.assertEqual(self._run("--markets", "USDJPY", "--count", "4", "--format", fmt,
+                                           "--output", path), 0)
+                restored = read_signals_from_file(path)
+                self.assertEqual([s.to_dict() for s in restored],
+                                 [s.to_dict() for s in _signals("USDJPY", "1 min", "85%", 4)], fmt)
+        self.assertEqual(self.stdout.getvalue(), "")
+
+    def test_invalid_arguments(self):
+        self.assertEqual(self._run("--markets", "NOPE"), 2)
+        self.assertEqual(self._run("--markets", "EURUSD", "--count", "11"), 2)
+        self.assertEqual(self._run("--markets", "EURUSD", "--days", "0"), 2)
+        self.generate.assert_not_called()
+
+    def test_no_signals_fails(self):
+        self.generate.side_effect = None
+        self.generate.return_value = []
+        self.assertEqual(self._run("--markets", "EURUSD"), 1)
+        self.assertEqual(self.stdout.getvalue(), "")
+
+class AuthenticateFromEnvTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = mock.Mock()
+        for patcher in (mock.patch("main.get_credential_store", return_value=self.store),
+                        mock.patch("sys.stderr", new=io.StringIO())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_credentials_come_from_the_environment(self):
+        self.store.verify.return_value = True
+        with mock.patch.dict(os.environ, {"AFA_USERNAME": "trader", "AFA_PASSWORD": "secret"}):
+            self.assertTrue(main.authenticate_from_env())
+        self.store.verify.assert_called_once_with("trader", "secret")
+
+    def test_rejected_credentials_stop_generation(self):
+        self.store.verify.return_value = False
+        args = main.build_arg_parser().parse_args(["generate", "--markets", "EURUSD"])
+        with mock.patch("models.signal.generate_signals") as generate:
+            self.assertEqual(main.run_generate_command(args), 1)
+        generate.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Correlated signal deduplication.
+"""
+
+import datetime
+import unittest
+
+import numpy as np
+
+from models.signal import Signal
+from src.service.candle_buffer import CandleStore
+from src.service.correlation_filter import CorrelationTracker, SignalDeduplicator, leg_similarity
+
+class SignalDeduplicatorTest(unittest.TestCase):
+
+    def setUp(self):
+        # An empty tracker, so similarity comes from the currency legs
+        self.tracker = CorrelationTracker()
+        self.now = datetime.datetime.now().replace(second=0, microsecond=0)
+
+    def _signal(self, market, signal_type="BUY", minutes=0, confidence=0.9, timeframe=5):
+        return Signal(market, timeframe, "90%", signal_type,
+                      self.now + datetime.timedelta(minutes=minutes), confidence)
+
+    def test_leg_similarity(self):
+        self.assertAlmostEqual(leg_similarity("EURUSD", "EURUSD-OTC"), 1.0)
+        self.assertAlmostEqual(leg_similarity("EURUSD", "EURGBP"), 0.5)
+        self.assertAlmostEqual(leg_similarity("EURUSD", "USDJPY"), -0.5)
+
+    def test_same_market_signals_are_not_duplicates(self):
+        signals = [self._signal("EURUSD", minutes=5 * i) for i in range(6)]
+        kept, report = SignalDeduplicator(self.tracker).process(signals)
+        self.assertEqual(len(kept), 6)
+        self.assertEqual(report, [])
+
+    def test_collapses_same_exposure_on_other_market(self):
+        signals = [self._signal("EURUSD", confidence=0.9),
+                   self._signal("EURUSD-OTC", minutes=1, confidence=0.8)]
+        kept, report = SignalDeduplicator(self.tracker).process(signals)
+        self.assertEqual([s.market for s in kept], ["EURUSD"])
+        self.assertEqual(report[0]['duplicate_of'], "EURUSD")
+
+    def test_window_follows_each_signals_timeframe(self):
+        signals = [self._signal("EURUSD", timeframe=1),
+                   self._signal("EURUSD-OTC", minutes=3, confidence=0.8, timeframe=1)]
+        kept, _ = SignalDeduplicator(self.tracker).process(signals)
+        self.assertEqual(len(kept), 2)
+
+        signals[1] = self._signal("EURUSD-OTC", minutes=3, confidence=0.8, timeframe=5)
+        kept, _ = SignalDeduplicator(self.tracker).process(signals)
+        self.assertEqual(len(kept), 1)
+
+    def test_downweight_leaves_input_signals_unchanged(self):
+        signals = [self._signal("EURUSD", confidence=0.9),
+                   self._signal("EURUSD-OTC", minutes=1, confidence=0.8)]
+        before = [s.position_size_multiplier for s in signals]
+
+        kept, report = SignalDeduplicator(self.tracker, threshold=0.5, mode="downweight").process(signals)
+
+        self.assertEqual([s.position_size_multiplier for s in signals], before)
+        self.assertEqual(len(kept), 2)
+        self.assertIsNot(kept[1], signals[1])
+        self.assertAlmostEqual(kept[1].position_size_multiplier, before[1] * report[0]['factor'])
+
+class CorrelationTrackerTest(unittest.TestCase):
+
+    def _fill(self, store, market, timeframe, closes):
+        start = 28_000_000  # minutes since the epoch, aligned to 5 minutes
+        store.get(market, timeframe).extend([
+            {'timestamp': (start + i * timeframe) * 60000, 'open': c, 'high': c, 'low': c,
+             'close': c, 'volume': 1}
+            for i, c in enumerate(closes)
+        ])
+
+    def test_one_shared_tracker_per_timeframe(self):
+        self.assertIs(CorrelationTracker.get_instance(5), CorrelationTracker.get_instance(5))
+        self.assertIsNot(CorrelationTracker.get_instance(1), CorrelationTracker.get_instance(5))
+        self.assertEqual(CorrelationTracker.get_instance(5).timeframe, 5)
+
+    def test_switching_timeframes_keeps_buckets_apart(self):
+        rng = np.random.default_rng(7)
+        store = CandleStore(capacity=200)
+        base = np.exp(np.cumsum(rng.normal(0, 0.01, 60))) * 100
+        self._fill(store, "EURUSD", 1, base)
+        self._fill(store, "EURUSD-OTC", 1, base * 1.01)
+        fast = np.exp(np.cumsum(rng.normal(0, 0.01, 30))) * 100
+        self._fill(store, "EURUSD", 5, fast)
+        self._fill(store, "EURUSD-OTC", 5, fast[::-1])
+
+        one, five = CorrelationTracker(1), CorrelationTracker(5)
+        self.assertEqual(one.sync(store), 59)
+        # 1-minute buckets must not hold back or seed the 5-minute tracker
+        self.assertEqual(five.sync(store), 29)
+        self.assertEqual(one.sync(store), 0)
+
+        self.assertAlmostEqual(one.correlation("EURUSD", "EURUSD-OTC"), 1.0)
+        expected = np.corrcoef(np.diff(np.log(fast)), np.diff(np.log(fast[::-1])))[0, 1]
+        self.assertAlmostEqual(five.correlation("EURUSD", "EURUSD-OTC"), expected)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+Credential cache refreshes against a local users.json stub.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.credential_store import CredentialStore
+
+ETAG = '"v1"'
+LAST_MODIFIED = "Mon, 04 Mar 2024 10:00:00 GMT"
+
+class _UsersServer:
+    """Serves a users list, answering 304 when the client's validators match."""
+
+    def __init__(self, users):
+        server_self = self
+        self.users = users
+        self.status = 200
+        self.requests = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server_self.requests.append(dict(self.headers))
+                if server_self.status != 200:
+                    self.send_response(server_self.status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if (self.headers.get("If-None-Match") == ETAG
+                        and self.headers.get("If-Modified-Since") == LAST_MODIFIED):
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps({"users": server_self.users}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", ETAG)
+                self.send_header("Last-Modified", LAST_MODIFIED)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/users.json"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class CredentialStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = _UsersServer([{"username": "alice", "password": "secret"},
+                                    {"username": "bob", "password": "hunter2"}])
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self._tmp.name, "credentials.json")
+
+    def tearDown(self):
+        self.server.close()
+        self._tmp.cleanup()
+
+    def _store(self):
+        # Few iterations keep the tests fast; the hashing itself is unchanged
+        return CredentialStore(self.server.url, cache_path=self.cache_path, iterations=1000, timeout=2)
+
+    def _cached(self):
+        with open(self.cache_path) as f:
+            return json.load(f)
+
+    def test_full_fetch_hashes_users_and_keeps_no_plaintext(self):
+        store = self._store()
+        self.assertTrue(store.refresh())
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual((store.etag, store.last_modified), (ETAG, LAST_MODIFIED))
+        self.assertTrue(store.verify("alice", "secret"))
+        self.assertFalse(store.verify("alice", "hunter2"))
+
+        cached = json.dumps(self._cached())
+        self.assertNotIn("secret", cached)
+        self.assertNotIn("hunter2", cached)
+
+    def test_unchanged_list_is_answered_with_304(self):
+        store = self._store()
+        store.refresh()
+        hashes = self._cached()['users']
+
+        self.server.users = []
+        self.assertTrue(store.refresh())
+
+        self.assertEqual(self.server.requests[1].get("If-None-Match"), ETAG)
+        self.assertEqual(self.server.requests[1].get("If-Modified-Since"), LAST_MODIFIED)
+        # Not rehashed: the salts stay the same and the old users still log in
+        self.assertEqual(self._cached()['users'], hashes)
+        self.assertTrue(store.verify("bob", "hunter2"))
+
+    def test_server_error_keeps_cached_hashes(self):
+        store = self._store()
+        store.refresh()
+
+        self.server.status = 500
+        self.assertFalse(store.refresh())
+        self.assertEqual(store.last_error, "HTTP 500")
+        self.assertTrue(store.verify("alice", "secret"))
+
+    def test_cache_reload_and_background_refresh(self):
+        self._store().refresh()
+
+        store = self._store()
+        self.assertTrue(store.load())
+        self.assertEqual(store.etag, ETAG)
+        self.assertTrue(store.verify("alice", "secret"))
+
+        # The reloaded validators make the background refresh conditional
+        store.start_background_refresh()
+        self.assertTrue(store.wait_for_refresh(5))
+        self.assertEqual(self.server.requests[-1].get("If-None-Match"), ETAG)
+        self.assertIsNone(store.last_error)
+
+    def test_load_without_cache_reports_false(self):
+        self.assertFalse(self._store().load())
+        self.assertFalse(CredentialStore(self.server.url, cache_path=None).load())
+
+    def test_unknown_user_is_rejected(self):
+        store = self._store()
+        store.refresh()
+
+        self.assertFalse(store.verify("mallory", "secret"))
+        self.assertFalse(store.verify("", ""))
+        self.assertIn("alice", store)
+        self.assertNotIn("mallory", store)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Endpoint probing and failover against local HTTP stubs.
+"""
+
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.api.endpoint_discovery import EndpointDiscovery
+from src.api.quotex_real_api import QuotexRealAPI
+
+class _StubServer:
+    """Local HTTP server answering every GET with a fixed status."""
+
+    def __init__(self, status: int = 200):
+        server_self = self
+        self.status = status
+        self.requests = 0
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server_self.requests += 1
+                self.send_response(server_self.status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def _dead_url() -> str:
+    """URL of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+class EndpointDiscoveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.live = _StubServer()
+        self.backup = _StubServer()
+        self.dead = _dead_url()
+
+    def tearDown(self):
+        self.live.close()
+        self.backup.close()
+
+    def _api(self, endpoints):
+        return QuotexRealAPI(endpoints=endpoints, endpoint_cache_path=None, request_timeout=1.0)
+
+    def test_probe_skips_unreachable_endpoint(self):
+        api = self._api([self.dead, self.live.url])
+        self.assertEqual(api._find_working_endpoint(), self.live.url)
+
+        health = {h['endpoint']: h for h in api.endpoint_discovery.get_health_report()}
+        self.assertEqual(health[self.live.url]['successes'], 1)
+        self.assertEqual(health[self.dead]['successes'], 0)
+
+    def test_request_fails_over_when_endpoint_goes_down(self):
+        api = self._api([self.live.url, self.backup.url])
+        api.working_endpoint = api.endpoint_discovery.current = self.live.url
+
+        self.live.status = 503
+        response = api._request("/api/time")
+
+        self.assertIsNotNone(response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(api.working_endpoint, self.backup.url)
+        self.assertGreaterEqual(self.backup.requests, 1)
+
+    def test_request_records_latency(self):
+        api = self._api([self.live.url])
+        api.working_endpoint = self.live.url
+        api._request()
+        api._request()
+
+        health = api.endpoint_discovery.get_health_report()[0]
+        self.assertEqual(health['successes'], 2)
+        self.assertIsNotNone(health['latency_ewma'])
+
+    def test_request_returns_none_when_nothing_answers(self):
+        dead = [self.dead, _dead_url()]
+        api = self._api(dead)
+        api.working_endpoint = dead[0]
+        self.assertIsNone(api._request())
+
+    def test_failover_uses_known_health_without_probing(self):
+        probed = []
+
+        def probe(endpoint):
+            probed.append(endpoint)
+            return True
+
+        discovery = EndpointDiscovery(["a", "b", "c"], probe, cache_path=None)
+        discovery.record_success("b", 0.05)
+        discovery.record_success("c", 0.01)
+        discovery.current = "c"
+
+        self.assertEqual(discovery.failover(), "b")
+        self.assertEqual(probed, [])
+
+    def test_cache_hit_seeds_latency_without_counting_success(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache_path = os.path.join(directory, "endpoints.json")
+            first = EndpointDiscovery([self.live.url], lambda e: True, cache_path=cache_path)
+            self.assertEqual(first.discover(), self.live.url)
+
+            probed = []
+            second = EndpointDiscovery([self.live.url], lambda e: probed.append(e) or True,
+                                       cache_path=cache_path)
+            self.assertEqual(second.discover(), self.live.url)
+
+            health = second.get_health_report()[0]
+            self.assertEqual(probed, [])
+            self.assertEqual(health['successes'], 0)
+            self.assertIsNotNone(health['latency_ewma'])
+
+    def test_local_fetch_errors_do_not_fail_over(self):
+        api = self._api([self.live.url, self.backup.url])
+        api.working_endpoint = api.endpoint_discovery.current = self.live.url
+        api.connected = True
+        api.live_candles["BROKEN"] = None  # slicing raises inside get_candles
+
+        self.assertIsNone(api.get_candles("BROKEN", 1, 10))
+        self.assertEqual(api.working_endpoint, self.live.url)
+        self.assertEqual(api.endpoint_discovery.get_health_report()[0]['errors'], 0)
+
+if __name__ == "__main__":
+    unittest.main()
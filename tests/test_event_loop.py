@@ -0,0 +1,110 @@
+"""
+Background event loop and the concurrent market data fetch built on it.
+"""
+
+import asyncio
+import time
+import unittest
+
+from models.signal import get_real_market_data_many, timeframe_to_minutes
+from src.api.quotex_api import QuotexAPI
+from src.service.event_loop import BackgroundLoop
+
+class _SlowAPI:
+    """Blocking candle fetches, made awaitable by QuotexAPI.get_candles_async."""
+
+    connected = True
+    get_candles_async = QuotexAPI.get_candles_async
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+
+    def get_candles(self, asset, timeframe, count=100):
+        time.sleep(self.delay)
+        if asset == "BROKEN":
+            raise ConnectionError("feed down")
+        return [{'timestamp': i * 60000, 'open': 1.0, 'high': 1.0, 'low': 1.0,
+                 'close': 1.0 + i, 'volume': 1} for i in range(count)]
+
+class BackgroundLoopTest(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = BackgroundLoop(name="test-loop")
+
+    def tearDown(self):
+        self.loop.stop()
+
+    def test_run_returns_results_and_reraises(self):
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        async def fail():
+            raise KeyError("missing")
+
+        self.assertEqual(self.loop.run(double(21)), 42)
+        with self.assertRaises(KeyError):
+            self.loop.run(fail())
+        self.assertTrue(self.loop.running)
+
+    def test_gather_runs_concurrently_in_order(self):
+        async def wait(value, delay):
+            await asyncio.sleep(delay)
+            if value is None:
+                raise ValueError("no value")
+            return value
+
+        started = time.monotonic()
+        results = self.loop.gather([wait(1, 0.3), wait(None, 0.1), wait(3, 0.2)])
+        self.assertLess(time.monotonic() - started, 0.6)
+
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 3)
+        self.assertEqual(self.loop.gather([]), [])
+
+    def test_works_from_inside_a_running_loop(self):
+        async def outer():
+            # Synchronous code called from a coroutine, like a menu under asyncio.run
+            return self.loop.run(asyncio.sleep(0, result="inner"))
+
+        self.assertEqual(asyncio.run(outer()), "inner")
+
+    def test_run_from_the_loop_thread_is_refused(self):
+        async def reenter():
+            return self.loop.run(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            self.loop.run(reenter())
+
+    def test_stop_and_restart(self):
+        first = self.loop.start()
+        self.assertIs(self.loop.start(), first)
+        self.loop.stop()
+        self.assertFalse(self.loop.running)
+        self.assertEqual(self.loop.run(asyncio.sleep(0, result=1)), 1)
+        self.assertIsNot(self.loop._loop, first)
+
+    def test_shared_instance(self):
+        self.assertIs(BackgroundLoop.get_instance(), BackgroundLoop.get_instance())
+
+class MarketDataManyTest(unittest.TestCase):
+
+    def test_markets_are_fetched_concurrently(self):
+        markets = ["EURUSD", "GBPUSD", "BROKEN", "USDJPY"]
+        started = time.monotonic()
+        data = get_real_market_data_many(markets, timeframe=5, count=10, api=_SlowAPI())
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(list(data), markets)
+        self.assertIsNone(data["BROKEN"])
+        self.assertEqual(data["EURUSD"]['closes'], [1.0 + i for i in range(10)])
+        self.assertEqual((data["USDJPY"]['market'], data["USDJPY"]['timeframe']), ("USDJPY", 5))
+        # Four 0.2s fetches overlap instead of taking 0.8s
+        self.assertLess(elapsed, 0.6)
+
+    def test_timeframe_labels(self):
+        self.assertEqual([timeframe_to_minutes(t) for t in ("1 min", "5 min", "15 min")], [1, 5, 15])
+
+if __name__ == "__main__":
+    unittest.main()
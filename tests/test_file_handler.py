@@ -0,0 +1,91 @@
+"""
+Lossless signal export round-trips and streaming reads.
+"""
+
+import datetime
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from models.signal import Signal
+from utils.file_handler import (export_signals, iter_signals, read_signals_from_file,
+                                write_signals, CSV_FIELDS)
+
+def _signals():
+    """Signals covering naive and aware times, zero confidence and filter results."""
+    signals = [
+        Signal("EURUSD", "1 min", "85%", "BUY", datetime.datetime(2024, 3, 4, 10, 15, 30, 123456), 0.91,
+               news_filter_result={'filter_result': 'passed', 'sentiment': 0.25, 'events': ["CPI", "NFP"]}),
+        Signal("GBPJPY", "5 min", "85%", "SELL",
+               datetime.datetime(2024, 3, 4, 10, 20, tzinfo=datetime.timezone(datetime.timedelta(hours=5))),
+               0.78, volatility_filter_result={'filter_result': 'blocked', 'z_score': 3.5}),
+        Signal("usdpkr-otc", "1 min", "90%", "BUY", datetime.datetime(2024, 3, 4, 23, 59, 59), 0.5)
+    ]
+    signals[0].position_size_multiplier = 0.5
+    signals[2].confidence = 0.0
+    return signals
+
+class ExportTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _round_trip(self, extension):
+        path = os.path.join(self._tmp.name, "nested", f"signals.{extension}")
+        signals = _signals()
+        self.assertEqual(export_signals(signals, path), len(signals))
+        return signals, list(iter_signals(path))
+
+    def assertSameSignals(self, restored, signals):
+        self.assertEqual([s.to_dict() for s in restored], [s.to_dict() for s in signals])
+        self.assertEqual([s.signal_time.utcoffset() for s in restored],
+                         [s.signal_time.utcoffset() for s in signals])
+
+    def test_jsonl_round_trip_is_lossless(self):
+        signals, restored = self._round_trip("jsonl")
+        self.assertSameSignals(restored, signals)
+
+    def test_csv_round_trip_is_lossless(self):
+        signals, restored = self._round_trip("csv")
+        self.assertSameSignals(restored, signals)
+
+    def test_npz_round_trip_is_lossless(self):
+        signals, restored = self._round_trip("npz")
+        self.assertSameSignals(restored, signals)
+        self.assertEqual(restored[1].strength, "BLOCKED")
+
+    def test_read_signals_from_file_restores_exports(self):
+        path = os.path.join(self._tmp.name, "signals.jsonl")
+        export_signals(_signals(), path)
+        self.assertEqual([s.market for s in read_signals_from_file(path)],
+                         ["EURUSD", "GBPJPY", "usdpkr-otc"])
+        self.assertEqual(read_signals_from_file(os.path.join(self._tmp.name, "missing.jsonl")), [])
+
+    def test_format_override_and_unknown_extension(self):
+        path = os.path.join(self._tmp.name, "signals.dat")
+        with self.assertRaises(ValueError):
+            export_signals(_signals(), path)
+
+        export_signals(_signals(), path, fmt="npz")
+        self.assertEqual(len(list(iter_signals(path, fmt="npz"))), 3)
+
+    def test_write_signals_formats(self):
+        stream = io.StringIO()
+        write_signals(_signals(), stream, "jsonl")
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(records[0]['strength'], _signals()[0].strength)
+
+        stream = io.StringIO()
+        write_signals(_signals(), stream, "csv")
+        self.assertEqual(stream.getvalue().splitlines()[0], ",".join(CSV_FIELDS))
+
+        with self.assertRaises(ValueError):
+            write_signals(_signals(), io.StringIO(), "xml")
+
+if __name__ == "__main__":
+    unittest.main()
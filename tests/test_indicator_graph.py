@@ -0,0 +1,84 @@
+"""
+Shared indicator graph nodes and the per-series registry.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.models import indicators
+from src.models.indicator_graph import IndicatorGraph, IndicatorRegistry, indicator_graph, series_key
+
+def _market_data(market="EURUSD", length=80, seed=0):
+    rng = np.random.default_rng(seed)
+    closes = (1.1 + np.cumsum(rng.normal(0, 0.001, length))).tolist()
+    return {'market': market, 'timeframe': 1, 'source': 'test', 'closes': closes,
+            'highs': [c + 0.0005 for c in closes], 'lows': [c - 0.0005 for c in closes],
+            'volumes': [1] * length, 'timestamps': [i * 60000 for i in range(length)]}
+
+class IndicatorGraphTest(unittest.TestCase):
+
+    def test_nodes_match_indicator_functions(self):
+        data = _market_data()
+        graph = IndicatorGraph.from_market_data(data)
+        closes = data['closes']
+
+        self.assertEqual(graph.ema(5), indicators.calculate_ema(closes, 5))
+        self.assertEqual(graph.macd(), indicators.calculate_macd(closes))
+        self.assertEqual(graph.rsi(7), indicators.calculate_rsi(closes, 7))
+        self.assertEqual(graph.bollinger(), indicators.calculate_bollinger_bands(closes))
+        self.assertEqual(graph.atr(), indicators.calculate_atr(data['highs'], data['lows'], closes))
+
+    def test_each_node_is_computed_once(self):
+        graph = IndicatorGraph.from_market_data(_market_data())
+        graph.macd(9, 20, 3)
+        # MACD built EMA(9) and EMA(20); asking for them again is a hit
+        misses = graph.misses
+        self.assertIs(graph.ema(9), graph.ema(9))
+        graph.ema(20)
+        self.assertEqual(graph.misses, misses)
+
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return "value"
+
+        self.assertEqual([graph.node(('custom',), compute) for _ in range(3)], ["value"] * 3)
+        self.assertEqual(len(calls), 1)
+
+class IndicatorRegistryTest(unittest.TestCase):
+
+    def test_same_series_version_shares_one_graph(self):
+        registry = IndicatorRegistry()
+        data = _market_data()
+        copy = dict(data, closes=list(data['closes']))
+        self.assertIs(registry.graph(data), registry.graph(copy))
+
+        # A new candle (or a moving forming candle) is a new version
+        grown = _market_data(length=81)
+        self.assertNotEqual(series_key(grown), series_key(data))
+        moved = dict(data, closes=data['closes'][:-1] + [data['closes'][-1] + 0.001])
+        self.assertIsNot(registry.graph(moved), registry.graph(data))
+        self.assertIsNot(registry.graph(_market_data("GBPUSD")), registry.graph(data))
+
+    def test_least_recently_used_graphs_are_dropped(self):
+        registry = IndicatorRegistry(max_series=2)
+        first, second, third = (_market_data(m) for m in ("A", "B", "C"))
+        graph = registry.graph(first)
+        registry.graph(second)
+        registry.graph(first)
+        registry.graph(third)
+
+        self.assertEqual(len(registry), 2)
+        self.assertIs(registry.graph(first), graph)
+        graph.ema(5)
+        graph.ema(5)
+        self.assertEqual(registry.stats(), {'series': 2, 'hits': 1, 'misses': 1})
+
+    def test_module_helper_uses_the_shared_registry(self):
+        data = _market_data("SHARED")
+        self.assertIs(indicator_graph(data), IndicatorRegistry.get_instance().graph(data))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Batch signal retrieval and the shared LIVE session used by generate_signals().
+"""
+
+import unittest
+from unittest import mock
+
+import models.signal as signal_module
+from models.signal import generate_signals, get_live_api
+from src.api.quotex_api import QuotexAPI
+from src.api.quotex_real_api import QuotexRealAPI
+
+class _BatchAPI:
+    """Connected session that records candle and signal requests."""
+
+    connected = True
+
+    def __init__(self, directions):
+        self.directions = directions
+        self.candle_calls = []
+        self.signal_calls = []
+
+    def get_candles(self, asset, timeframe, count=100):
+        self.candle_calls.append((asset, timeframe, count))
+        return [{'timestamp': i * 60000, 'open': 1.1, 'high': 1.1005, 'low': 1.0995,
+                 'close': 1.1 + i * 0.0001, 'volume': 1} for i in range(count)]
+
+    def get_signals(self, asset, timeframe=1, count=1):
+        self.signal_calls.append((asset, timeframe, count))
+        return [{'asset': asset, 'direction': d, 'confidence': 0.9,
+                 'source': 'quotex_live' if d else 'cache'} for d in self.directions[:count]]
+
+class _Session:
+    """QuotexAPI stand-in whose connect() succeeds unless told otherwise."""
+
+    instances = []
+    fail = False
+
+    def __init__(self, use_real_api=True):
+        self.connected = False
+        _Session.instances.append(self)
+
+    async def connect(self):
+        self.connected = not _Session.fail
+        return self.connected
+
+class QuotexRealAPIBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = QuotexRealAPI(endpoint_cache_path=None)
+        self.api.connected = True
+
+    def test_signals_come_from_successive_windows(self):
+        size = len(self.api.live_candles["EURUSD"])
+        signals = self.api.get_signals("EURUSD", 1, 3)
+
+        self.assertEqual(len(signals), 3)
+        for signal, end in zip(signals, (size - 2, size - 1, size)):
+            expected = self.api._generate_live_signal("EURUSD", end)
+            self.assertEqual(signal['analysis'], expected['analysis'])
+            self.assertEqual(signal['source'], 'quotex_live')
+        # The newest window covers the whole buffer and becomes the current signal
+        self.assertEqual(signals[-1]['analysis'], self.api._generate_live_signal("EURUSD")['analysis'])
+        self.assertIs(self.api.live_signals["EURUSD"], signals[-1])
+
+    def test_windows_shorter_than_five_candles_are_skipped(self):
+        size = len(self.api.live_candles["EURUSD"])
+        self.assertEqual(len(self.api.get_signals("EURUSD", 1, size)), size - 4)
+
+    def test_unknown_asset_or_disconnected(self):
+        self.assertEqual(self.api.get_signals("XAUUSD", 1, 3), [])
+        self.api.connected = False
+        self.assertEqual(self.api.get_signals("EURUSD", 1, 3), [])
+
+class QuotexAPIBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = QuotexAPI()
+        self.api.real_api = mock.Mock(spec=QuotexRealAPI)
+        self.api.real_api.get_signals.return_value = [{'direction': 'call'}]
+        self.api.connected = True
+
+    def test_delegates_in_one_call(self):
+        self.assertEqual(self.api.get_signals("EURUSD", 5, 4), [{'direction': 'call'}])
+        self.api.real_api.get_signals.assert_called_once_with("EURUSD", 5, 4)
+
+    def test_invalid_timeframe_or_disconnected(self):
+        self.assertEqual(self.api.get_signals("EURUSD", 2, 4), [])
+        self.api.connected = False
+        self.assertEqual(self.api.get_signals("EURUSD", 1, 4), [])
+        self.api.real_api.get_signals.assert_not_called()
+
+    def test_errors_return_no_signals(self):
+        self.api.real_api.get_signals.side_effect = ConnectionError("feed down")
+        self.assertEqual(self.api.get_signals("EURUSD", 1, 4), [])
+
+class GenerateSignalsBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = _BatchAPI(['call', 'put', None, 'call'])
+        patcher = mock.patch("models.signal.get_live_api", return_value=self.api)
+        self.get_live_api = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _generate(self, count=4, signal_filter="ALL", **kwargs):
+        return generate_signals("EURUSD", "5 min", "85%", count, signal_filter,
+                                news_filter="No", volatility_filter="No", **kwargs)
+
+    def test_one_session_one_batch_request(self):
+        signals = self._generate()
+
+        self.get_live_api.assert_called_once_with()
+        self.assertEqual(self.api.candle_calls, [("EURUSD", 5, 100)])
+        self.assertEqual(self.api.signal_calls, [("EURUSD", 5, 4)])
+        # Signals not sourced from the live feed are dropped
+        self.assertEqual([s.signal_type for s in signals], ["BUY", "SELL", "BUY"])
+        times = [s.signal_time for s in signals]
+        self.assertEqual(times, sorted(times))
+
+    def test_direction_filter_and_prefetched_data(self):
+        market_data = signal_module._candles_to_market_data("EURUSD", 5, self.api.get_candles("EURUSD", 5, 30))
+        self.api.candle_calls.clear()
+
+        signals = self._generate(signal_filter="SELL", market_data=market_data)
+        self.assertEqual([s.signal_type for s in signals], ["SELL"])
+        self.assertEqual(self.api.candle_calls, [])
+
+    def test_martingale_follow_ups(self):
+        signals = self._generate(count=2, use_martingale=1)
+        self.assertEqual([s.signal_type for s in signals], ["BUY", "BUY", "SELL"])
+        self.assertEqual(signals[1].position_size_multiplier, 2.0 * signals[0].position_size_multiplier)
+
+    def test_no_session_generates_nothing(self):
+        self.get_live_api.return_value = None
+        self.assertEqual(self._generate(), [])
+        self.assertEqual(self.api.signal_calls, [])
+
+class LiveSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        _Session.instances = []
+        _Session.fail = False
+        for patcher in (mock.patch("models.signal.QuotexAPI", _Session),
+                        mock.patch.object(signal_module, "_live_api", None)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_session_is_shared(self):
+        api = get_live_api()
+        self.assertTrue(api.connected)
+        self.assertIs(get_live_api(), api)
+        self.assertEqual(len(_Session.instances), 1)
+
+    def test_dropped_session_reconnects(self):
+        first = get_live_api()
+        first.connected = False
+        second = get_live_api()
+        self.assertIsNot(second, first)
+        self.assertTrue(second.connected)
+
+    def test_failed_connection_is_not_cached(self):
+        _Session.fail = True
+        self.assertIsNone(get_live_api())
+        _Session.fail = False
+        self.assertIsNotNone(get_live_api())
+        self.assertEqual(len(_Session.instances), 2)
+
+if __name__ == "__main__":
+    unittest.main()
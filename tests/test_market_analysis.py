@@ -0,0 +1,87 @@
+"""
+Batch market analysis against the per-market get_market_analysis().
+"""
+
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from models.signal import get_market_analysis
+from src.service.candle_buffer import CandleStore
+from src.service.market_analysis import MarketAnalysisService
+
+class _CandleAPI:
+    """Serves fixed candle series and counts the fetches."""
+
+    connected = True
+
+    def __init__(self, series):
+        self.series = series
+        self.calls = []
+
+    def get_candles(self, market, timeframe, count=100):
+        self.calls.append(market)
+        closes = self.series.get(market)
+        if closes is None:
+            return None
+        now = int(time.time() // (timeframe * 60))
+        return [{'timestamp': (now - len(closes) + 1 + i) * timeframe * 60000, 'open': c,
+                 'high': c * 1.0005, 'low': c * 0.9995, 'close': c, 'volume': 1}
+                for i, c in enumerate(closes)][-count:]
+
+class MarketAnalysisServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.api = _CandleAPI({
+            "EURUSD": (1.08 + np.cumsum(rng.normal(0, 0.001, 60))).tolist(),
+            "GBPUSD": (1.27 * np.linspace(1.0, 1.1, 60)).tolist(),
+            "USDJPY": (150 * np.linspace(1.0, 0.97, 12)).tolist(),
+        })
+        self.service = MarketAnalysisService(CandleStore(capacity=200))
+
+    def test_matches_per_market_analysis(self):
+        markets = ["EURUSD", "GBPUSD", "USDJPY"]
+        results = self.service.analyze(markets, 1, self.api)
+
+        with mock.patch("models.signal.QuotexAPI", return_value=self.api):
+            for market in markets:
+                expected = get_market_analysis(market, 1)
+                for key in ('current_price', 'average_price', 'trend', 'volatility', 'data_points'):
+                    self.assertEqual(results[market][key], expected[key], f"{market} {key}")
+
+        self.assertEqual(results["GBPUSD"]['trend'], "STRONG_BULLISH")
+        self.assertEqual(results["USDJPY"]['trend'], "STRONG_BEARISH")
+
+    def test_repeat_within_a_candle_is_served_from_cache(self):
+        first = self.service.analyze(["EURUSD", "GBPUSD"], 1, self.api)
+        self.assertEqual(sorted(self.api.calls), ["EURUSD", "GBPUSD"])
+        self.assertFalse(first["EURUSD"]['cached'])
+
+        self.assertEqual(self.service.needs_refresh(["EURUSD", "GBPUSD", "USDJPY"], 1), ["USDJPY"])
+        second = self.service.analyze(["EURUSD", "GBPUSD"], 1, self.api)
+        self.assertEqual(len(self.api.calls), 2)
+        self.assertTrue(second["EURUSD"]['cached'])
+        self.assertEqual(second["EURUSD"]['current_price'], first["EURUSD"]['current_price'])
+
+    def test_new_candle_invalidates_cache(self):
+        self.service.analyze(["EURUSD"], 1, self.api)
+        buffer = self.service.store.get("EURUSD", 1)
+        buffer.extend([{'timestamp': buffer.last_timestamp + 60000, 'open': 2.0, 'high': 2.0,
+                        'low': 2.0, 'close': 2.0, 'volume': 1}])
+
+        result = self.service.analyze(["EURUSD"])["EURUSD"]
+        self.assertFalse(result['cached'])
+        self.assertEqual(result['current_price'], 2.0)
+        self.assertEqual(len([k for k in self.service._cache if k[0] == "EURUSD"]), 1)
+
+    def test_market_without_candles_reports_error(self):
+        results = self.service.analyze(["XAUUSD", "EURUSD"], 1, self.api)
+        self.assertEqual(list(results), ["XAUUSD", "EURUSD"])
+        self.assertIn('error', results["XAUUSD"])
+        self.assertNotIn('error', results["EURUSD"])
+
+if __name__ == "__main__":
+    unittest.main()
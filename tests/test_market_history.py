@@ -0,0 +1,141 @@
+"""
+Persistent bar history and incremental HistoryAnalyzer statistics.
+"""
+
+import datetime
+import math
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.service.market_history import HistoryAnalyzer, HistoryStore, CLOSE
+
+START = datetime.datetime(2024, 3, 4, tzinfo=datetime.timezone.utc)
+
+def _candles(closes, start=0, minutes=1):
+    """Bars every ``minutes`` from START, open at the previous close."""
+    candles, previous = [], closes[0]
+    for i, close in enumerate(closes):
+        ts = START + datetime.timedelta(minutes=(start + i) * minutes)
+        candles.append({'timestamp': ts.timestamp() * 1000, 'open': previous,
+                        'high': max(previous, close) + 0.0002, 'low': min(previous, close) - 0.0002,
+                        'close': close, 'volume': 1})
+        previous = close
+    return candles
+
+def _closes(length, seed=1):
+    rng = np.random.default_rng(seed)
+    return (1.1 * np.exp(np.cumsum(rng.normal(0, 0.001, length)))).tolist()
+
+class HistoryStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_append_saves_and_reloads(self):
+        candles = _candles(_closes(50))
+        self.assertEqual(self.store.append("EURUSD", candles[:30]), 30)
+        self.assertEqual(self.store.append("EURUSD", candles[30:]), 20)
+
+        reloaded = HistoryStore(self._tmp.name).bars("EURUSD")
+        np.testing.assert_array_equal(reloaded, self.store.bars("EURUSD"))
+        self.assertEqual(reloaded.shape, (6, 50))
+        self.assertFalse(reloaded.flags.writeable)
+
+    def test_overlapping_batch_replaces_its_span(self):
+        closes = _closes(40)
+        self.store.append("EURUSD", _candles(closes), save=False)
+        self.assertEqual(self.store.version("EURUSD"), (1, 0))
+
+        # Re-download of bars 10-19 with corrected closes
+        corrected = _candles([c + 0.01 for c in closes[10:20]], start=10)
+        self.assertEqual(self.store.append("EURUSD", corrected, save=False), 0)
+
+        bars = self.store.bars("EURUSD")
+        self.assertEqual(bars.shape[1], 40)
+        np.testing.assert_allclose(bars[CLOSE, 10:20], np.array(closes[10:20]) + 0.01)
+        np.testing.assert_allclose(bars[CLOSE, 20:], closes[20:])
+        self.assertEqual(self.store.version("EURUSD"), (2, 1))
+
+class HistoryAnalyzerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        # Three days of 5-minute bars
+        self.candles = _candles(_closes(3 * 288), minutes=5)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _rebuild(self, candles, days):
+        store = HistoryStore(self._tmp.name + "/rebuild")
+        store.append("EURUSD", candles, save=False)
+        return HistoryAnalyzer(store).analyze("EURUSD", days)
+
+    def assertSameAnalysis(self, actual, expected):
+        self.assertEqual(set(actual), set(expected))
+        for key, value in expected.items():
+            if isinstance(value, dict):
+                self.assertSameAnalysis(actual[key], value)
+            elif isinstance(value, float):
+                self.assertAlmostEqual(actual[key], value, places=9, msg=key)
+            else:
+                self.assertEqual(actual[key], value, key)
+
+    def test_incremental_appends_match_full_rebuild(self):
+        store = HistoryStore(self._tmp.name)
+        analyzer = HistoryAnalyzer(store)
+        for lo in range(0, len(self.candles), 97):
+            store.append("EURUSD", self.candles[lo:lo + 97], save=False)
+            for days in (1, 2):
+                self.assertSameAnalysis(analyzer.analyze("EURUSD", days),
+                                        self._rebuild(self.candles[:lo + 97], days))
+        # Extended in place, never rebuilt
+        self.assertEqual(analyzer._features["EURUSD"][1], 0)
+
+    def test_merge_rebuilds_features(self):
+        store = HistoryStore(self._tmp.name)
+        analyzer = HistoryAnalyzer(store)
+        store.append("EURUSD", self.candles, save=False)
+        analyzer.analyze("EURUSD", 3)
+
+        corrected = [dict(c, close=c['close'] * 1.001) for c in self.candles[100:150]]
+        store.append("EURUSD", corrected, save=False)
+
+        expected = self.candles[:100] + corrected + self.candles[150:]
+        self.assertSameAnalysis(analyzer.analyze("EURUSD", 3), self._rebuild(expected, 3))
+
+    def test_statistics_match_direct_computation(self):
+        store = HistoryStore(self._tmp.name)
+        store.append("EURUSD", self.candles, save=False)
+        result = HistoryAnalyzer(store).analyze("EURUSD", 1)
+
+        # The window starts at the bar one day before the newest one and
+        # includes that bar's return from the bar before it
+        closes = np.array([c['close'] for c in self.candles[-290:]])
+        returns = np.diff(np.log(closes))
+        self.assertEqual(result['bars'], 289)
+        self.assertAlmostEqual(result['drift'], returns.sum())
+        self.assertAlmostEqual(result['realized_volatility'], math.sqrt(returns.var() * 288))
+        self.assertAlmostEqual(sum(s['share'] for s in result['sessions'].values()), 1.0)
+        self.assertEqual(sum(s['bars'] for s in result['sessions'].values()), 289)
+
+    def test_results_are_cached_until_the_market_changes(self):
+        store = HistoryStore(self._tmp.name)
+        analyzer = HistoryAnalyzer(store)
+        self.assertIsNone(analyzer.analyze("EURUSD", 1))
+
+        store.append("EURUSD", self.candles[:-1], save=False)
+        first = analyzer.analyze("EURUSD", 1)
+        self.assertIs(analyzer.analyze("EURUSD", 1), first)
+
+        store.append("EURUSD", self.candles[-1:], save=False)
+        self.assertIsNot(analyzer.analyze("EURUSD", 1), first)
+
+if __name__ == "__main__":
+    unittest.main()
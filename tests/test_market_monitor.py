@@ -0,0 +1,131 @@
+"""
+MarketMonitor change tracking and cell-level LiveDashboard redraws.
+"""
+
+import io
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from models.signal import Signal
+from src.service.candle_buffer import CandleStore
+from src.service.market_monitor import MarketMonitor
+from src.service.result_tracker import ResultTracker
+from ui.colors import GREEN, RED
+from ui.dashboard import LiveDashboard, format_cell, COLUMNS
+
+class _TickAPI:
+    """Candle feed whose forming candle moves and which closes a candle on demand."""
+
+    def __init__(self, markets, length=60):
+        rng = np.random.default_rng(8)
+        self.base = int(time.time() // 60) - length
+        self.closes = {m: (1.1 + np.cumsum(rng.normal(0, 0.001, length))).tolist() for m in markets}
+        self.requests = []
+
+    def get_candles(self, market, timeframe, count=100):
+        self.requests.append((market, count))
+        closes = self.closes[market]
+        return [{'timestamp': (self.base + i) * 60000, 'open': c, 'high': c + 0.0005,
+                 'low': c - 0.0005, 'close': c, 'volume': 1} for i, c in enumerate(closes)][-count:]
+
+    def move(self, market, delta):
+        self.closes[market][-1] += delta
+
+    def close_candle(self, market):
+        self.closes[market].append(self.closes[market][-1])
+
+class MarketMonitorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = _TickAPI(["EURUSD", "GBPUSD"])
+        self.tracker = ResultTracker(store=CandleStore())
+        self.monitor = MarketMonitor(["EURUSD", "GBPUSD", "EURUSD"], store=CandleStore(capacity=200),
+                                     tracker=self.tracker, candle_count=60, tick_count=3)
+        self.monitor.news_filter.disable_filter()
+        self.changes = []
+        self.monitor.subscribe(self.changes.append)
+
+    def test_first_tick_fills_buffers_then_fetches_only_new_candles(self):
+        self.monitor.tick(self.api)
+        self.assertEqual(sorted(self.api.requests), [("EURUSD", 60), ("GBPUSD", 60)])
+
+        self.api.requests.clear()
+        self.monitor.tick(self.api)
+        self.assertEqual(sorted(self.api.requests), [("EURUSD", 3), ("GBPUSD", 3)])
+
+        state = self.monitor.snapshot()["EURUSD"]
+        self.assertEqual(set(state), {'price', 'change', 'ema', 'macd', 'rsi', 'volatility', 'news', 'pending'})
+        self.assertAlmostEqual(state['price'], self.api.closes["EURUSD"][-1])
+        self.assertEqual(state['news'], 'passed')
+
+    def test_listeners_get_only_changed_fields(self):
+        self.monitor.tick(self.api)
+        self.assertEqual(set(self.changes[0]), {"EURUSD", "GBPUSD"})
+
+        # Nothing moved: no market changed
+        self.assertEqual(self.monitor.tick(self.api), {})
+
+        self.api.move("GBPUSD", 0.002)
+        changes = self.monitor.tick(self.api)
+        self.assertEqual(list(changes), ["GBPUSD"])
+        self.assertTrue({'price', 'change'} <= set(changes["GBPUSD"]))
+        self.assertEqual(self.changes[-1], changes)
+
+    def test_indicators_recomputed_once_per_new_candle(self):
+        with mock.patch.object(self.monitor.volatility_filter, "analyze_market_volatility",
+                               wraps=self.monitor.volatility_filter.analyze_market_volatility) as analyze:
+            self.monitor.tick(self.api)
+            self.assertEqual(analyze.call_count, 2)
+
+            self.monitor.tick(self.api)
+            self.assertEqual(analyze.call_count, 2)
+
+            self.api.close_candle("EURUSD")
+            self.monitor.tick(self.api)
+            self.assertEqual(analyze.call_count, 3)
+
+    def test_pending_signals_come_from_the_tracker(self):
+        self.tracker.track(Signal("EURUSD", "1 min", "85%", "BUY", None, 0.9), "candle_trend")
+        self.monitor.tick(self.api)
+        self.assertEqual(self.monitor.snapshot()["EURUSD"]['pending'], 1)
+        self.assertEqual(self.monitor.snapshot()["GBPUSD"]['pending'], 0)
+
+class LiveDashboardTest(unittest.TestCase):
+
+    def setUp(self):
+        self.api = _TickAPI(["EURUSD", "GBPUSD"])
+        self.monitor = MarketMonitor(["EURUSD", "GBPUSD"], store=CandleStore(capacity=200),
+                                     tracker=ResultTracker(store=CandleStore()), candle_count=60)
+        self.monitor.news_filter.disable_filter()
+        self.stream = io.StringIO()
+        self.dashboard = LiveDashboard(self.monitor, stream=self.stream)
+
+    def test_only_changed_cells_are_redrawn(self):
+        # First frame draws the whole table
+        self.assertEqual(self.dashboard.render(), 2 * len(COLUMNS))
+        self.monitor.tick(self.api)
+        self.dashboard.render()
+
+        self.assertEqual(self.dashboard.render(), 0)
+        self.api.move("EURUSD", 0.002)
+        self.monitor.tick(self.api)
+        # Price and change, plus any indicator the moved candle flipped; never
+        # the market name, news or pending cells, nor the other row
+        drawn = self.dashboard.render()
+        self.assertGreaterEqual(drawn, 2)
+        self.assertLessEqual(drawn, len(COLUMNS) - 3)
+        self.assertIn(f"{self.api.closes['EURUSD'][-1]:.5f}", self.stream.getvalue())
+
+    def test_format_cell(self):
+        self.assertEqual(format_cell('price', 1.234567), ("1.23457", ""))
+        self.assertEqual(format_cell('change', -0.5), ("-0.500", RED))
+        self.assertEqual(format_cell('ema', 'UP'), ("▲", GREEN))
+        self.assertEqual(format_cell('rsi', 75.2)[1], RED)
+        self.assertEqual(format_cell('news', 'major_event_detected')[0], "MAJOR EVENT")
+        self.assertEqual(format_cell('rsi', None)[0], "…")
+
+if __name__ == "__main__":
+    unittest.main()
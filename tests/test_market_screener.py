@@ -0,0 +1,92 @@
+"""
+Vectorized market screening and top-N market selection.
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from models.market import MarketSelector
+from src.service.candle_buffer import CandleStore, CANDLE_FIELDS
+from src.service.market_screener import MarketScreener
+
+def _fill(store, market, closes, gap=0.0):
+    """Buffer one-minute candles whose open sits ``gap`` (relative) off the previous close."""
+    now = int(time.time() // 60)
+    candles = []
+    for i, close in enumerate(closes):
+        previous = closes[i - 1] if i else close
+        candles.append({'timestamp': (now - len(closes) + i) * 60000, 'open': previous * (1 + gap),
+                        'high': max(previous, close), 'low': min(previous, close), 'close': close,
+                        'volume': 1})
+    store.get(market, 1).extend(candles)
+
+class MarketScreenerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = CandleStore(capacity=100)
+        rng = np.random.default_rng(4)
+        # Steady trend, choppy noise, wide gaps, flat, and too short to screen
+        _fill(self.store, "TREND", (1.0 + 0.001 * np.arange(40)).tolist())
+        _fill(self.store, "CHOP", (1.0 + rng.normal(0, 0.002, 40)).tolist())
+        _fill(self.store, "GAPPY", (1.0 + rng.normal(0, 0.002, 40)).tolist(), gap=0.003)
+        _fill(self.store, "FLAT", [1.0] * 40)
+        _fill(self.store, "SHORT", (1.0 + 0.001 * np.arange(10)).tolist())
+        self.screener = MarketScreener(self.store, lookback=30)
+
+    def test_metrics_match_per_market_computation(self):
+        screened = self.screener.screen(["TREND", "CHOP", "GAPPY", "FLAT", "SHORT", "NONE"])
+        rows = {row['market']: row for row in screened}
+        self.assertEqual(set(rows), {"TREND", "CHOP", "GAPPY", "FLAT"})
+
+        for market in rows:
+            window = self.store.get(market, 1).window(30)
+            opens, closes = window[CANDLE_FIELDS.index('open')], window[CANDLE_FIELDS.index('close')]
+            returns = np.diff(np.log(closes))
+            path = np.abs(np.diff(closes)).sum()
+            self.assertAlmostEqual(rows[market]['volatility'], returns.std())
+            self.assertAlmostEqual(rows[market]['trend'], abs(closes[-1] - closes[0]) / path if path else 0.0)
+            self.assertAlmostEqual(rows[market]['spread'], np.mean(np.abs(opens[1:] - closes[:-1]) / closes[:-1]))
+
+        self.assertAlmostEqual(rows["TREND"]['trend'], 1.0)
+        self.assertEqual((rows["FLAT"]['volatility'], rows["FLAT"]['trend']), (0.0, 0.0))
+        self.assertGreater(rows["GAPPY"]['spread'], rows["CHOP"]['spread'])
+
+    def test_scores_are_weighted_zscores_best_first(self):
+        rows = self.screener.screen(["TREND", "CHOP", "GAPPY", "FLAT"])
+        scores = [row['score'] for row in rows]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+        metrics = {name: np.array([row[name] for row in rows]) for name in ('volatility', 'trend', 'spread')}
+        z = {name: (v - v.mean()) / v.std() for name, v in metrics.items()}
+        np.testing.assert_allclose(scores, z['volatility'] + z['trend'] - z['spread'])
+
+        trend_only = MarketScreener(self.store, lookback=30, weights={'volatility': 0, 'spread': 0})
+        self.assertEqual(trend_only.top(["CHOP", "TREND", "FLAT"], 1), ["TREND"])
+
+    def test_nothing_buffered(self):
+        self.assertEqual(MarketScreener(CandleStore(), lookback=30).screen(["EURUSD"]), [])
+
+class MarketSelectorTopTest(unittest.TestCase):
+
+    def test_select_top_markets_uses_screener(self):
+        store = CandleStore(capacity=100)
+        _fill(store, "EURUSD", (1.0 + 0.001 * np.arange(40)).tolist())
+        _fill(store, "GBPUSD", [1.0] * 40)
+        markets = {"EURUSD": {}, "GBPUSD": {}, "USDJPY": {}}
+        screener = MarketScreener(store, lookback=30, weights={'volatility': 0, 'spread': 0})
+
+        self.assertEqual(MarketSelector().select_top_markets(markets, 1, screener=screener), ["EURUSD"])
+        # Only two markets are buffered, so only two can be ranked
+        self.assertEqual(MarketSelector().select_top_markets(markets, 3, screener=screener),
+                         ["EURUSD", "GBPUSD"])
+
+    def test_falls_back_to_random_selection(self):
+        markets = {"EURUSD": {}, "GBPUSD": {}, "USDJPY": {}}
+        selected = MarketSelector().select_top_markets(markets, 2, screener=MarketScreener(CandleStore()))
+        self.assertEqual(len(selected), 2)
+        self.assertTrue(set(selected) <= set(markets))
+
+if __name__ == "__main__":
+    unittest.main()
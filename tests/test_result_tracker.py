@@ -0,0 +1,177 @@
+"""
+Signal settlement, outcome statistics and history backtests.
+"""
+
+import datetime
+import tempfile
+import unittest
+
+import numpy as np
+
+from models.signal import Signal
+from src.models.risk_manager import RiskManager
+from src.models.strategy import TradingStrategy
+from src.service.backtest import history_signals, run_backtest
+from src.service.candle_buffer import CandleStore
+from src.service.market_history import HistoryStore
+from src.service.result_tracker import OutcomeStats, ResultTracker
+
+# A fixed past minute, so every candle has closed
+START = datetime.datetime(2024, 3, 4, 10, 0)
+
+def _candles(closes, start=START):
+    """One-minute candles whose open is the previous close."""
+    candles, previous = [], closes[0]
+    for i, close in enumerate(closes):
+        ts = (start + datetime.timedelta(minutes=i)).timestamp() * 1000
+        candles.append({'timestamp': ts, 'open': previous, 'high': max(previous, close),
+                        'low': min(previous, close), 'close': close, 'volume': 1})
+        previous = close
+    return candles
+
+def _signal(market, signal_type, minute, timeframe=1):
+    return Signal(market, f"{timeframe} min", "85%", signal_type,
+                  START + datetime.timedelta(minutes=minute), 0.9)
+
+class OutcomeStatsTest(unittest.TestCase):
+
+    def test_streaks_and_rolling_window(self):
+        stats = OutcomeStats(window=3)
+        for outcome in ('win', 'win', 'loss', 'draw', 'loss', 'loss', 'win'):
+            stats.update(outcome, 1.0 if outcome == 'win' else -1.0 if outcome == 'loss' else 0.0)
+
+        self.assertEqual((stats.wins, stats.losses, stats.draws), (3, 3, 1))
+        self.assertEqual((stats.best_streak, stats.worst_streak, stats.streak), (2, -3, 1))
+        self.assertAlmostEqual(stats.win_rate, 0.5)
+        # Last three decided outcomes: loss, loss, win
+        self.assertAlmostEqual(stats.rolling_win_rate, 1 / 3)
+        self.assertAlmostEqual(stats.pnl, 0.0)
+
+class ResultTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = CandleStore(capacity=50)
+        self.tracker = ResultTracker(store=self.store, payout=0.8, stake=10.0)
+        # Minute 2 rises, minute 3 falls, minute 4 is flat
+        self.store.get("EURUSD", 1).extend(_candles([1.0, 1.0, 1.1, 1.05, 1.05, 1.06]))
+
+    def test_evaluate_decides_win_loss_and_draw(self):
+        buffer = self.store.get("EURUSD", 1)
+        self.assertEqual(self.tracker.evaluate(_signal("EURUSD", "BUY", 2), buffer)[0], 'win')
+        self.assertEqual(self.tracker.evaluate(_signal("EURUSD", "SELL", 2), buffer)[0], 'loss')
+        self.assertEqual(self.tracker.evaluate(_signal("EURUSD", "SELL", 3), buffer)[0], 'win')
+        self.assertEqual(self.tracker.evaluate(_signal("EURUSD", "BUY", 4), buffer),
+                         ('draw', 1.05, 1.05))
+        # Expiry beyond the buffered candles
+        self.assertIsNone(self.tracker.evaluate(_signal("EURUSD", "BUY", 9), buffer))
+
+    def test_settle_due_only_settles_expired_signals(self):
+        for signal in (_signal("EURUSD", "BUY", 2), _signal("EURUSD", "BUY", 3),
+                       _signal("EURUSD", "BUY", 4, timeframe=5)):
+            self.tracker.track(signal, "candle_trend")
+
+        # Minute 3 expires at 10:04; the 5-minute signal at 10:09
+        now = (START + datetime.timedelta(minutes=4)).timestamp()
+        results = self.tracker.settle_due(now=now)
+
+        self.assertEqual([r['outcome'] for r in results], ['win', 'loss'])
+        self.assertEqual(self.tracker.pending, 1)
+        self.assertEqual([r['pnl'] for r in results], [8.0, -10.0])
+
+    def test_unsettled_signals_are_given_up_after_max_wait(self):
+        self.tracker.track(_signal("GBPUSD", "BUY", 0), "candle_trend")
+        expiry = (START + datetime.timedelta(minutes=1)).timestamp()
+
+        self.assertEqual(self.tracker.settle_due(now=expiry + 1), [])
+        self.assertEqual(self.tracker.pending, 1)
+        self.tracker.settle_due(now=expiry + self.tracker.max_wait + 10)
+        self.assertEqual((self.tracker.pending, self.tracker.unsettled), (0, 1))
+
+    def test_stats_are_kept_per_dimension(self):
+        self.tracker.record_outcome(_signal("EURUSD", "BUY", 2), 'win', "candle_trend")
+        self.tracker.record_outcome(_signal("GBPUSD", "BUY", 2, timeframe=5), 'loss', "candle_trend")
+        self.tracker.record_outcome(_signal("GBPUSD", "SELL", 7, timeframe=5), 'win', "trend_reversal_volatility")
+
+        overall = self.tracker.get_overall()
+        self.assertEqual((overall['total'], overall['wins']), (3, 2))
+        self.assertAlmostEqual(overall['pnl'], 8.0 - 10.0 + 8.0)
+
+        by_market = {row['key']: row for row in self.tracker.get_stats('market')}
+        self.assertEqual(by_market['GBPUSD']['total'], 2)
+        by_timeframe = {row['key']: row['total'] for row in self.tracker.get_stats('timeframe')}
+        self.assertEqual(by_timeframe, {1: 1, 5: 2})
+        by_strategy = {row['key']: row['wins'] for row in self.tracker.get_stats('strategy')}
+        self.assertEqual(by_strategy, {'candle_trend': 1, 'trend_reversal_volatility': 1})
+
+        with self.assertRaises(ValueError):
+            self.tracker.record_outcome(_signal("EURUSD", "BUY", 2), 'void', "candle_trend")
+
+    def test_replay_matches_live_settlement(self):
+        buffer = self.store.get("EURUSD", 1)
+        signals = [_signal("EURUSD", "BUY", 2), _signal("EURUSD", "BUY", 3), _signal("GBPUSD", "BUY", 3)]
+
+        results = self.tracker.replay(signals, {"EURUSD": buffer.to_market_data()}, "candle_trend")
+
+        expected = [self.tracker.evaluate(s, buffer)[0] for s in signals[:2]]
+        self.assertEqual([r['outcome'] for r in results], expected)
+        self.assertEqual({r['strategy'] for r in results}, {"candle_trend"})
+        self.assertEqual(self.tracker.unsettled, 1)
+
+class BacktestTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = HistoryStore(self._tmp.name)
+        rng = np.random.default_rng(3)
+        for market in ("EURUSD", "GBPUSD"):
+            # Occasional volatility bursts give the ATR-spike module something to vote on
+            volatility = np.where(rng.random(600) < 0.1, 0.01, 0.002)
+            closes = 1.1 * np.exp(np.cumsum(rng.normal(0, 1, 600) * volatility))
+            self.store.append(market, _candles(closes.tolist()), save=False)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_history_signals_match_per_window_generate_signal(self):
+        strategy = TradingStrategy()
+        bars = self.store.bars("EURUSD")
+        signals = history_signals(strategy, "EURUSD", bars, lookback=60)
+        self.assertTrue(signals)
+
+        strategy.check_news_filter = lambda market: True
+        expected = []
+        for end in range(60, bars.shape[1]):
+            window = bars[:, end - 60:end]
+            decided = strategy.generate_signal({'market': "EURUSD", 'closes': window[4].tolist(),
+                                                'highs': window[2].tolist(), 'lows': window[3].tolist(),
+                                                'volumes': window[5].tolist(), 'timeframe': 1,
+                                                'timestamps': window[0].tolist(), 'source': 'history'})
+            if decided:
+                expected.append((datetime.datetime.fromtimestamp(bars[0, end]), decided['signal_type']))
+        self.assertEqual([(s.signal_time, s.signal_type) for s in signals], expected)
+
+    def test_backtest_books_results_through_risk_manager(self):
+        manager = RiskManager(1000, base_stake_percent=1.0)
+        tracker = ResultTracker(payout=0.85)
+        report = run_backtest(["EURUSD", "GBPUSD"], manager, store=self.store, tracker=tracker, lookback=60)
+
+        self.assertEqual(report['strategy'], TradingStrategy.name)
+        self.assertGreater(report['signals'], 5)
+        self.assertEqual(len(report['results']), report['signals'])
+        self.assertEqual(tracker.get_overall()['total'], report['signals'])
+        self.assertEqual({row['key'] for row in tracker.get_stats('strategy')}, {TradingStrategy.name})
+
+        # Same trades through a fresh RiskManager give the same balance
+        expected = RiskManager(1000, base_stake_percent=1.0)
+        for result in report['results']:
+            if result['outcome'] == 'draw':
+                continue
+            stake = expected.calculate_stake()
+            win = result['outcome'] == 'win'
+            expected.update_balance(stake * 0.85 if win else -stake, win)
+        self.assertEqual(report['trades'], sum(r['outcome'] != 'draw' for r in report['results']))
+        self.assertAlmostEqual(report['balance'], expected.current_balance)
+        self.assertAlmostEqual(manager.current_balance, expected.current_balance)
+
+if __name__ == "__main__":
+    unittest.main()
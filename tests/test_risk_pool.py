@@ -0,0 +1,124 @@
+"""
+Risk pool stake sizing, exposure caps and concurrent allocation.
+"""
+
+import threading
+import unittest
+
+from src.models.risk_manager import RiskManager
+from src.service.risk_pool import (RiskPool, market_currencies, REJECT_ACCOUNT_EXPOSURE,
+                                   REJECT_CURRENCY_EXPOSURE, REJECT_DAILY_LOSS,
+                                   REJECT_GLOBAL_EXPOSURE, REJECT_UNKNOWN_ACCOUNT)
+
+class RiskPoolTest(unittest.TestCase):
+
+    def test_market_currencies(self):
+        self.assertEqual(market_currencies("usdpkr-otc"), ("USD", "PKR"))
+
+    def test_stakes_match_risk_manager(self):
+        manager = RiskManager(1000, base_stake_percent=2.0)
+        manager.current_tier = 3
+        pool = RiskPool(account_exposure_percent=100)
+        pool.add_account("a", manager)
+
+        decisions = pool.allocate([("a", "EURUSD"), ("a", "GBPJPY", 0.5), ("b", "EURUSD")])
+
+        self.assertEqual([d['stake'] for d in decisions], [manager.calculate_stake(), 40.0, None])
+        self.assertEqual(decisions[2]['reason'], REJECT_UNKNOWN_ACCOUNT)
+
+    def test_account_cap_counts_earlier_approvals_in_batch(self):
+        pool = RiskPool(account_exposure_percent=2.5)
+        pool.add_account("a", RiskManager(1000))
+
+        decisions = pool.allocate([("a", "EURUSD")] * 3)
+
+        self.assertEqual([d['approved'] for d in decisions], [True, True, False])
+        self.assertEqual(decisions[2]['reason'], REJECT_ACCOUNT_EXPOSURE)
+        self.assertEqual(pool.get_account("a")['open_exposure'], 20.0)
+
+    def test_currency_and_global_caps(self):
+        pool = RiskPool(account_exposure_percent=100, currency_exposure_limit=25,
+                        global_exposure_limit=35)
+        pool.add_account("a", RiskManager(1000))
+        pool.add_account("b", RiskManager(1000))
+
+        decisions = pool.allocate([("a", "EURUSD"), ("b", "EURJPY"), ("b", "EURGBP"),
+                                   ("b", "AUDCAD"), ("a", "NZDCHF")])
+
+        self.assertEqual([d['reason'] for d in decisions],
+                         [None, None, REJECT_CURRENCY_EXPOSURE, None, REJECT_GLOBAL_EXPOSURE])
+        self.assertEqual(pool.get_exposure()['currencies']['EUR'], 20.0)
+
+    def test_settle_applies_update_balance_and_frees_exposure(self):
+        manager = RiskManager(1000, max_daily_loss_percent=5.0)
+        pool = RiskPool()
+        pool.add_account("a", manager)
+
+        outcomes = [False, False, True]
+        for win in outcomes:
+            decision = pool.allocate([("a", "EURUSD")])[0]
+            stake = manager.calculate_stake()
+            self.assertEqual(decision['stake'], stake)
+            pool.settle(decision['position_id'], win)
+            manager.update_balance(stake * 0.85 if win else -stake, win)
+
+        exported = pool.to_risk_manager("a")
+        self.assertAlmostEqual(exported.current_balance, manager.current_balance)
+        self.assertEqual(exported.current_tier, manager.current_tier)
+        self.assertEqual(pool.get_exposure()['global'], 0.0)
+
+        # Two more losses exhaust the 5% daily loss limit
+        for _ in range(2):
+            pool.settle(pool.allocate([("a", "EURUSD")])[0]['position_id'], False)
+        self.assertEqual(pool.allocate([("a", "EURUSD")])[0]['reason'], REJECT_DAILY_LOSS)
+
+    def test_release_is_exact_and_rejects_unknown_positions(self):
+        pool = RiskPool()
+        pool.add_account("a", RiskManager(1000))
+        decision = pool.allocate([("a", "EURUSD")])[0]
+        pool.release(decision['position_id'])
+
+        self.assertEqual(pool.get_exposure(), {'accounts': {'a': 0.0}, 'currencies': {},
+                                               'global': 0.0, 'open_positions': 0})
+        with self.assertRaises(KeyError):
+            pool.release(decision['position_id'])
+
+    def test_concurrent_allocations_never_exceed_caps(self):
+        pool = RiskPool(account_exposure_percent=100, currency_exposure_limit=500,
+                        global_exposure_limit=800, capacity=1)
+        for i in range(8):
+            pool.add_account(f"acct{i}", RiskManager(1000))
+
+        approved, violations = [], []
+        lock = threading.Lock()
+
+        def worker(n):
+            for round_ in range(50):
+                market = ("EURUSD", "GBPJPY", "AUDCAD")[(n + round_) % 3]
+                batch = pool.allocate([(f"acct{n}", market), (f"acct{(n + 1) % 8}", market)])
+                ids = [d['position_id'] for d in batch if d['approved']]
+                with lock:
+                    approved.extend(ids)
+                exposure = pool.get_exposure()
+                if exposure['global'] > 800 + 1e-9 or any(v > 500 + 1e-9 for v in exposure['currencies'].values()):
+                    violations.append(exposure)
+                # Free one of the pair so the caps keep being contended
+                for position_id in ids[:1]:
+                    pool.release(position_id)
+                    with lock:
+                        approved.remove(position_id)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(violations, [])
+        exposure = pool.get_exposure()
+        self.assertEqual(exposure['open_positions'], len(approved))
+        self.assertAlmostEqual(exposure['global'], 10.0 * len(approved))
+        self.assertAlmostEqual(sum(exposure['accounts'].values()), exposure['global'])
+
+if __name__ == "__main__":
+    unittest.main()
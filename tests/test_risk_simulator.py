@@ -0,0 +1,99 @@
+"""
+Vectorized risk simulation against a trade-by-trade RiskManager replay.
+"""
+
+import unittest
+
+import numpy as np
+
+from src.models.risk_manager import RiskManager
+from src.models.risk_simulator import RiskSimulator
+
+def _replay(simulator, win_rate, payout, paths, days, trades_per_day, ruin_drawdown, seed):
+    """Run the simulator's draws through one RiskManager per path."""
+    rng = np.random.default_rng(seed)
+    outcomes = np.concatenate([rng.random((trades_per_day, paths)) < win_rate for _ in range(days)])
+
+    balances, trades, blocked, ruined = [], 0, 0, 0
+    for path in range(paths):
+        manager = RiskManager(simulator.initial_balance, simulator.base_stake_percent,
+                              simulator.max_martingale_tier, simulator.max_daily_loss_percent)
+        peak, alive = manager.current_balance, True
+        for i, win in enumerate(outcomes[:, path]):
+            if i % trades_per_day == 0:
+                manager.daily_loss = 0
+            if not alive:
+                continue
+            stake = manager.calculate_stake()
+            if stake is None:
+                blocked += 1
+                continue
+            manager.update_balance(stake * payout if win else -stake, bool(win))
+            trades += 1
+            peak = max(peak, manager.current_balance)
+            alive = manager.current_balance / peak > 1.0 - ruin_drawdown
+        balances.append(manager.current_balance)
+        ruined += not alive
+
+    return np.array(balances), trades, blocked, ruined
+
+class RiskSimulatorTest(unittest.TestCase):
+
+    def test_matches_risk_manager_replay(self):
+        simulator = RiskSimulator(1000, base_stake_percent=2.0, max_martingale_tier=4,
+                                  max_daily_loss_percent=10.0)
+        params = dict(paths=200, days=5, trades_per_day=20, ruin_drawdown=0.2, seed=5)
+
+        result = simulator.simulate(0.5, 0.8, **params)
+        balances, trades, blocked, ruined = _replay(simulator, 0.5, 0.8, **params)
+
+        pnl = balances - 1000
+        # Payouts are applied as (payout + 1) - 1, which can move a stake by a cent
+        self.assertAlmostEqual(result['expected_pnl'], pnl.mean(), delta=0.01)
+        self.assertAlmostEqual(result['profitable_probability'], (pnl > 0).mean())
+        self.assertAlmostEqual(result['mean_trades'], trades / params['paths'])
+        self.assertAlmostEqual(result['mean_blocked_by_daily_limit'], blocked / params['paths'])
+        self.assertAlmostEqual(result['ruin_probability'], ruined / params['paths'])
+        # The daily limit and the ruin stop must both have come into play
+        self.assertGreater(blocked, 0)
+        self.assertGreater(ruined, 0)
+
+    def test_seed_makes_runs_reproducible(self):
+        simulator = RiskSimulator()
+        first = simulator.simulate(0.55, paths=500, days=3, seed=1)
+        self.assertEqual(first, simulator.simulate(0.55, paths=500, days=3, seed=1))
+        self.assertNotEqual(first['expected_pnl'], simulator.simulate(0.55, paths=500, days=3, seed=2)['expected_pnl'])
+
+    def test_certain_outcomes(self):
+        simulator = RiskSimulator(1000, base_stake_percent=1.0, max_daily_loss_percent=100)
+
+        winning = simulator.simulate(1.0, 0.5, paths=10, days=1, trades_per_day=3, seed=0)
+        self.assertAlmostEqual(winning['expected_pnl'], 1000 * (1.005 ** 3) - 1000, places=1)
+        self.assertEqual((winning['ruin_probability'], winning['profitable_probability']), (0.0, 1.0))
+
+        # Tiers 1-4 of the shrinking balance, then back to the first tier
+        losing = simulator.simulate(0.0, 0.5, paths=10, days=1, trades_per_day=5, ruin_drawdown=1.0, seed=0)
+        balance = 1000.0
+        for multiplier in (1, 2, 4, 8, 1):
+            balance -= round(balance * 0.01 * multiplier, 2)
+        self.assertAlmostEqual(losing['expected_pnl'], balance - 1000, places=6)
+        self.assertAlmostEqual(balance, 1000 - (10 + 19.8 + 38.81 + 74.51 + 8.57), places=6)
+
+    def test_from_risk_manager_and_grid(self):
+        manager = RiskManager(500, base_stake_percent=3.0, max_martingale_tier=3, max_daily_loss_percent=20)
+        manager.current_balance = 400
+        simulator = RiskSimulator.from_risk_manager(manager)
+        self.assertEqual((simulator.initial_balance, simulator.base_stake_percent,
+                          simulator.max_martingale_tier), (400, 3.0, 3))
+        self.assertAlmostEqual(simulator.max_daily_loss_percent, 20)
+
+        seen = []
+        results = simulator.simulate_grid([0.5, 0.6], [0.8, 0.9], paths=100, days=1, seed=0,
+                                          progress=lambda done, total, result: seen.append((done, total)))
+        self.assertEqual([(r['win_rate'], r['payout']) for r in results],
+                         [(0.5, 0.8), (0.5, 0.9), (0.6, 0.8), (0.6, 0.9)])
+        self.assertEqual(seen[-1], (4, 4))
+        self.assertAlmostEqual(RiskSimulator.breakeven_win_rate(1.0), 0.5)
+
+if __name__ == "__main__":
+    unittest.main()
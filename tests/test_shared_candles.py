@@ -0,0 +1,100 @@
+"""
+Shared-memory candle publishing and the process-pool evaluator.
+"""
+
+import time
+import unittest
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.models.strategy import TradingStrategy
+from src.service.candle_buffer import CandleStore, CANDLE_FIELDS
+from src.service.shared_candles import SharedCandleReader, SharedCandleStore, SharedSignalPool
+from src.service.volatility_filter import VolatilityFilter
+
+MARKETS = ["EURUSD", "GBPUSD", "USDJPY", "AUDCAD", "EURJPY"]
+
+def _fill(store, market, length, seed):
+    """Buffer ``length`` one-minute candles ending at the current minute."""
+    rng = np.random.default_rng(seed)
+    volatility = np.where(rng.random(length) < 0.1, 0.01, 0.002)
+    closes = 1.1 * np.exp(np.cumsum(rng.normal(0, 1, length) * volatility))
+    now = int(time.time() // 60)
+    store.get(market, 1).extend([
+        {'timestamp': (now - length + i) * 60000, 'open': closes[i - 1] if i else closes[0],
+         'high': closes[i] + 0.0004, 'low': closes[i] - 0.0004, 'close': closes[i], 'volume': 1}
+        for i in range(length)])
+
+class SharedCandleStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = CandleStore(capacity=300)
+        for seed, market in enumerate(MARKETS):
+            _fill(self.store, market, 150, seed)
+        _fill(self.store, "NZDUSD", 40, 99)
+        self.shared = SharedCandleStore(self.store, window=120, max_markets=8)
+        self.reader = SharedCandleReader(self.shared.name)
+
+    def tearDown(self):
+        self.reader.close()
+        self.shared.close()
+
+    def test_reader_sees_the_published_candles(self):
+        self.assertEqual(self.shared.publish(), len(MARKETS) + 1)
+        self.assertEqual(set(self.reader.keys()), {(m, 1) for m in MARKETS + ["NZDUSD"]})
+
+        view, _ = self.reader.view("EURUSD", 1)
+        np.testing.assert_array_equal(view, self.store.get("EURUSD", 1).window(120))
+        self.assertEqual(self.reader.view("NZDUSD", 1)[0].shape, (len(CANDLE_FIELDS), 40))
+        self.assertEqual(self.reader.view("XAUUSD", 1)[0].shape[1], 0)
+
+        included, data = self.reader.stack(MARKETS + ["NZDUSD"], 1, 60)
+        expected_included, expected = self.store.stack(MARKETS + ["NZDUSD"], 1, 60)
+        self.assertEqual(included, expected_included)
+        np.testing.assert_array_equal(data, expected)
+
+    def test_publish_only_rewrites_changed_buffers(self):
+        self.shared.publish()
+        self.assertEqual(self.shared.publish(), 0)
+        _, sequence = self.reader.view("GBPUSD", 1)
+
+        last = self.store.get("GBPUSD", 1).last_timestamp
+        self.store.get("GBPUSD", 1).extend([{'timestamp': last + 60000, 'open': 1.2, 'high': 1.2,
+                                              'low': 1.2, 'close': 1.2, 'volume': 1}])
+        self.assertEqual(self.shared.publish(), 1)
+        self.assertTrue(self.reader.changed("GBPUSD", 1, sequence))
+        self.assertEqual(self.reader.view("GBPUSD", 1)[0][CANDLE_FIELDS.index('close'), -1], 1.2)
+
+    def test_full_segment_skips_extra_markets(self):
+        with SharedCandleStore(self.store, window=10, max_markets=2) as small:
+            self.assertEqual(small.publish([(m, 1) for m in MARKETS]), 2)
+
+    def test_reader_rejects_foreign_segments(self):
+        segment = shared_memory.SharedMemory(create=True, size=4096)
+        try:
+            with self.assertRaises(ValueError):
+                SharedCandleReader(segment.name)
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_pool_matches_in_process_evaluation(self):
+        strategy = TradingStrategy(1)
+        expected = strategy.evaluate_markets(self.store, MARKETS + ["NZDUSD"], bars=100)
+
+        with SharedSignalPool(self.shared, workers=2, chunk_size=2) as pool:
+            results = pool.evaluate(MARKETS + ["NZDUSD"], timeframe=1, bars=100)
+
+        self.assertEqual({m: r['signal'] for m, r in results.items()}, expected)
+        volatility_filter = VolatilityFilter()
+        for market, result in results.items():
+            data = self.store.get(market, 1).to_market_data(100)
+            data['source'] = 'test'
+            volatility = volatility_filter.analyze_market_volatility(data)
+            self.assertEqual(result['volatility_state'], volatility.get('volatility_state'))
+            self.assertAlmostEqual(result['position_size_multiplier'],
+                                   volatility.get('position_size_multiplier'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Signal strength rules and the NumPy-backed SignalBatch.
+"""
+
+import datetime
+import unittest
+
+import numpy as np
+
+from models.signal import Signal, SignalBatch, strength_codes, STRENGTH_LEVELS
+
+START = datetime.datetime(2024, 3, 4, 10, 0)
+
+def _signals():
+    confidences = (0.7, 0.76, 0.82, 0.87, 0.93, 0.95)
+    signals = []
+    for i, confidence in enumerate(confidences):
+        signal = Signal(("EURUSD", "GBPUSD", "USDJPY")[i % 3], f"{1 + i % 2} min", "85%",
+                        "BUY" if i % 2 == 0 else "SELL", START + datetime.timedelta(minutes=5 - i),
+                        confidence)
+        signal.position_size_multiplier = 1.0 + i / 10
+        signals.append(signal)
+    signals[4].volatility_filter_result = {'filter_result': 'outlier_detected'}
+    return signals
+
+class SignalTest(unittest.TestCase):
+
+    def test_slots_and_strength(self):
+        signal = Signal("EURUSD", "1 min", "85%", "BUY", START, 0.82)
+        self.assertFalse(hasattr(signal, "__dict__"))
+        self.assertEqual(signal.strength, "HIGH")
+        self.assertEqual(signal.news_filter_result, {})
+
+        signal.news_filter_result = {'filter_result': 'negative_sentiment'}
+        self.assertEqual(signal.strength, "BLOCKED")
+        signal.news_filter_result = {}
+        self.assertEqual(signal.strength, "HIGH")
+        self.assertEqual(str(signal), "10:00 EURUSD CALL (82% - HIGH)")
+
+    def test_vectorised_strength_matches_signal(self):
+        signals = _signals()
+        blocked = np.array([s.strength == "BLOCKED" for s in signals])
+        codes = strength_codes(np.array([s.confidence for s in signals]), blocked)
+        self.assertEqual([STRENGTH_LEVELS[c] for c in codes], [s.strength for s in signals])
+
+class SignalBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.signals = _signals()
+        self.batch = SignalBatch.from_signals(self.signals)
+
+    def test_round_trip_through_records(self):
+        self.assertEqual(len(self.batch), len(self.signals))
+        self.assertEqual(self.batch.markets, ["EURUSD", "GBPUSD", "USDJPY"])
+        for restored, signal in zip(self.batch.to_signals(), self.signals):
+            self.assertEqual((restored.market, restored.timeframe, restored.signal_type,
+                              restored.signal_time, restored.confidence,
+                              restored.position_size_multiplier, restored.strength),
+                             (signal.market, signal.timeframe, signal.signal_type,
+                              signal.signal_time, signal.confidence,
+                              signal.position_size_multiplier, signal.strength))
+
+    def test_select_matches_list_filtering(self):
+        selected = self.batch.select(market="EURUSD", signal_type="BUY")
+        self.assertEqual([s.signal_time for s in selected],
+                         [s.signal_time for s in self.signals if s.market == "EURUSD" and s.signal_type == "BUY"])
+
+        self.assertEqual(len(self.batch.select(min_confidence=0.85, include_blocked=False)), 2)
+        window = self.batch.select(start=START + datetime.timedelta(minutes=1),
+                                   end=START + datetime.timedelta(minutes=4))
+        self.assertEqual(len(window), 3)
+        self.assertEqual(len(self.batch.select(market="AUDCAD")), 0)
+
+    def test_sort_counts_and_summary(self):
+        ordered = self.batch.sort_by_time()
+        self.assertEqual([s.signal_time for s in ordered], sorted(s.signal_time for s in self.signals))
+        self.assertEqual(self.batch.counts_by_market(), {"EURUSD": 2, "GBPUSD": 2, "USDJPY": 2})
+
+        summary = self.batch.summary()
+        self.assertEqual((summary['total'], summary['buy'], summary['sell']), (6, 3, 3))
+        self.assertEqual(sum(summary['by_strength'].values()), 6)
+        self.assertEqual(summary['by_strength']['BLOCKED'], 1)
+        self.assertAlmostEqual(summary['mean_confidence'], np.mean([s.confidence for s in self.signals]))
+
+    def test_concatenate_remaps_markets(self):
+        first = SignalBatch.from_signals(self.signals[:2])
+        second = SignalBatch.from_signals(self.signals[2:][::-1])
+        joined = SignalBatch.concatenate([first, second])
+
+        self.assertEqual(len(joined), 6)
+        self.assertEqual(list(joined.market), [s.market for s in self.signals[:2] + self.signals[2:][::-1]])
+        self.assertEqual(len(SignalBatch.concatenate([])), 0)
+
+if __name__ == "__main__":
+    unittest.main()
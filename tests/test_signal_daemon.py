@@ -0,0 +1,171 @@
+"""
+Candle-close scheduling on MarketTimingController and the signal daemon loop.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from models.market import MarketTimingController
+from src.models.risk_manager import RiskManager
+from src.service.candle_buffer import CandleStore
+from src.service.risk_pool import RiskPool
+from src.service.signal_daemon import SignalDaemon, SignalSink
+
+class _FakeAPI:
+    """Answers candle and signal requests without a network."""
+
+    def __init__(self):
+        self.signals = 0
+
+    def get_candles(self, market, timeframe, count=100):
+        now = int(time.time() // 60)
+        return [{'timestamp': (now - count + i) * 60000, 'open': 1.0 + i * 1e-4, 'high': 1.0 + i * 1e-4,
+                 'low': 1.0 + i * 1e-4, 'close': 1.0 + i * 1e-4, 'volume': 1} for i in range(count)]
+
+    def get_signal(self, market, timeframe=1):
+        self.signals += 1
+        return {'direction': 'call', 'confidence': 0.9}
+
+    def disconnect(self):
+        return True
+
+class _ListSink(SignalSink):
+
+    def __init__(self, on_emit=None):
+        self.signals = []
+        self.closed = False
+        self.on_emit = on_emit
+
+    def emit(self, signal):
+        self.signals.append(signal)
+        if self.on_emit:
+            self.on_emit()
+
+    def close(self):
+        self.closed = True
+
+class MarketTimingControllerTest(unittest.TestCase):
+
+    def test_pop_due_returns_closes_in_deadline_order(self):
+        timing = MarketTimingController()
+        timing.schedule_close("GBPUSD", 1, 200.0)
+        timing.schedule_close("EURUSD", 1, 100.0)
+
+        self.assertEqual(timing.next_due(), (100.0, MarketTimingController.CLOSE, ("EURUSD", 1)))
+        self.assertEqual(timing.pop_due(150.0), [(MarketTimingController.CLOSE, ("EURUSD", 1))])
+        self.assertEqual(timing.pop_due(250.0), [(MarketTimingController.CLOSE, ("GBPUSD", 1))])
+        self.assertIsNone(timing.next_due())
+
+    def test_rescheduling_replaces_pending_close(self):
+        timing = MarketTimingController()
+        timing.schedule_close("EURUSD", 1, 100.0)
+        timing.schedule_close("EURUSD", 1, 160.0)
+
+        self.assertEqual(timing.pop_due(120.0), [])
+        self.assertEqual(timing.pop_due(170.0), [(MarketTimingController.CLOSE, ("EURUSD", 1))])
+
+    def test_closes_and_gap_deadlines_share_the_heap(self):
+        timing = MarketTimingController(min_gap_minutes=1, max_gap_minutes=2)
+        timing.record_signal_emission("EURUSD", 1, now=0.0)
+        timing.schedule_close("EURUSD", 1, 90.0)
+
+        kinds = [kind for kind, _ in timing.pop_due(200.0)]
+        self.assertEqual(kinds, [MarketTimingController.ALLOWED, MarketTimingController.CLOSE,
+                                 MarketTimingController.FORCE])
+
+    def test_wait_until_due_wakes_for_close_scheduled_from_another_thread(self):
+        timing = MarketTimingController()
+        timer = threading.Timer(0.05, timing.schedule_close, ("EURUSD", 1, time.time() + 0.05))
+        timer.start()
+        try:
+            due = asyncio.run(asyncio.wait_for(timing.wait_until_due(), 2))
+        finally:
+            timer.cancel()
+        self.assertEqual(due, [(MarketTimingController.CLOSE, ("EURUSD", 1))])
+
+    def test_interrupt_returns_empty(self):
+        timing = MarketTimingController()
+        threading.Timer(0.05, timing.interrupt).start()
+        self.assertEqual(asyncio.run(asyncio.wait_for(timing.wait_until_due(), 2)), [])
+
+class SignalDaemonTest(unittest.TestCase):
+
+    def _daemon(self, sink, **kwargs):
+        daemon = SignalDaemon(["EURUSD", "GBPUSD"], sinks=[sink], news_filter=False,
+                              volatility_filter=False, settle_delay=0.0,
+                              store=CandleStore(capacity=200), **kwargs)
+        daemon.api = _FakeAPI()
+        return daemon
+
+    def test_warm_up_schedules_each_pair_at_its_next_close(self):
+        daemon = self._daemon(_ListSink())
+        daemon.warm_up()
+
+        due, kind, _ = daemon.timing.next_due()
+        self.assertEqual(kind, MarketTimingController.CLOSE)
+        self.assertEqual(due, SignalDaemon.next_candle_close(1))
+        self.assertEqual(len(daemon.timing.pop_due(due)), 2)
+
+    def test_process_due_ignores_gap_deadlines_and_reschedules(self):
+        sink = _ListSink()
+        daemon = self._daemon(sink)
+        due = [(MarketTimingController.ALLOWED, ("EURUSD", 1)),
+               (MarketTimingController.CLOSE, ("EURUSD", 1))]
+
+        self.assertEqual(daemon.process_due(due), 1)
+        self.assertEqual([s.market for s in sink.signals], ["EURUSD"])
+        self.assertEqual(daemon.timing.next_due()[1:], (MarketTimingController.CLOSE, ("EURUSD", 1)))
+        self.assertFalse(daemon.timing.can_emit_signal("EURUSD", 1))
+
+    def test_risk_pool_caps_emissions_and_books_results(self):
+        pool = RiskPool(account_exposure_percent=1.5)
+        pool.add_account("default", RiskManager(1000))
+        sink = _ListSink()
+        daemon = self._daemon(sink, risk_pool=pool)
+
+        daemon.process_due([(MarketTimingController.CLOSE, ("EURUSD", 1)),
+                            (MarketTimingController.CLOSE, ("GBPUSD", 1))])
+
+        # The second 10.00 stake would exceed 1.5% of the balance
+        self.assertEqual([s.market for s in sink.signals], ["EURUSD"])
+        self.assertEqual(daemon.stats['suppressed'], 1)
+        self.assertEqual(pool.get_account("default")['open_exposure'], 10.0)
+
+        signal = sink.signals[0]
+        daemon._settle_positions([{'market': "EURUSD", 'timeframe': 1,
+                                   'signal_time': signal.signal_time, 'outcome': 'loss'}])
+        account = pool.get_account("default")
+        self.assertEqual(account['open_exposure'], 0.0)
+        self.assertEqual(account['balance'], 990.0)
+        self.assertEqual(account['tier'], 2)
+
+    def test_run_forever_evaluates_closes_until_stopped(self):
+        sink = _ListSink()
+        daemon = self._daemon(sink, min_gap_minutes=0)
+        sink.on_emit = lambda: len(sink.signals) >= 4 and daemon.stop()
+
+        # Every pair's candle "closes" 10ms from now
+        with mock.patch.object(SignalDaemon, "next_candle_close",
+                               side_effect=lambda timeframe, now=None: time.time() + 0.01):
+            thread = threading.Thread(target=daemon.run_forever)
+            thread.start()
+            thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertGreaterEqual(len(sink.signals), 4)
+        self.assertEqual({s.market for s in sink.signals}, {"EURUSD", "GBPUSD"})
+        self.assertTrue(sink.closed)
+
+    def test_stop_before_run_returns_immediately(self):
+        daemon = self._daemon(_ListSink())
+        daemon.stop()
+        thread = threading.Thread(target=daemon.run_forever)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+if __name__ == "__main__":
+    unittest.main()
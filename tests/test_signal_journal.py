@@ -0,0 +1,108 @@
+"""
+Signal journal compaction.
+"""
+
+import datetime
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from models.signal import Signal
+from utils.signal_journal import COMPACT_MANIFEST, SignalJournal
+
+class SignalJournalCompactTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.now = datetime.datetime.now().replace(microsecond=0)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _signal(self, market: str, signal_type: str = "BUY", minutes: int = 0) -> Signal:
+        return Signal(market, 1, "90%", signal_type, self.now + datetime.timedelta(minutes=minutes), 0.9)
+
+    def test_compact_keeps_records_of_active_segment(self):
+        # Every append seals the previous segment; the first batch alone fills
+        # one sealed segment that re-sorting splits into two
+        journal = SignalJournal(self.directory, max_segment_bytes=1)
+        journal.append([self._signal("EURUSD", "BUY"), self._signal("EURUSD", "SELL", 1)])
+        journal.append([self._signal("GBPUSD", "BUY", 2)])
+
+        journal.compact()
+
+        self.assertEqual(journal.markets(), ["EURUSD", "GBPUSD"])
+        self.assertEqual([s.signal_type for s in journal.query("EURUSD")], ["BUY", "SELL"])
+        self.assertEqual(len(list(journal.query("GBPUSD"))), 1)
+
+        # Reloading from disk sees the same records
+        reloaded = SignalJournal(self.directory, max_segment_bytes=1)
+        self.assertEqual(len(reloaded), 3)
+        self.assertEqual(len(list(reloaded.query("GBPUSD"))), 1)
+
+    def test_appends_continue_after_compact(self):
+        journal = SignalJournal(self.directory, max_segment_bytes=1)
+        journal.append([self._signal("EURUSD"), self._signal("USDJPY", "SELL")])
+        journal.append([self._signal("GBPUSD", minutes=1)])
+        journal.compact()
+
+        journal.append([self._signal("GBPUSD", "SELL", 2)])
+
+        self.assertEqual([s.signal_type for s in journal.query("GBPUSD")], ["BUY", "SELL"])
+        self.assertEqual(len(SignalJournal(self.directory)), 4)
+
+    def test_compact_drops_records_past_retention(self):
+        journal = SignalJournal(self.directory, max_segment_bytes=1)
+        journal.append([self._signal("EURUSD", minutes=-3 * 24 * 60)])
+        journal.append([self._signal("EURUSD", "SELL")])
+        journal.append([self._signal("GBPUSD")])
+
+        dropped = journal.compact(retain_days=1)
+
+        self.assertEqual(dropped, 1)
+        self.assertEqual([s.signal_type for s in journal.query("EURUSD")], ["SELL"])
+        self.assertEqual(len(list(journal.query("GBPUSD"))), 1)
+        self.assertFalse(any(name.endswith(".compact") for name in os.listdir(self.directory)))
+
+    def _fill(self) -> SignalJournal:
+        journal = SignalJournal(self.directory, max_segment_bytes=1)
+        journal.append([self._signal("EURUSD"), self._signal("EURUSD", "SELL", 1)])
+        journal.append([self._signal("GBPUSD", minutes=2)])
+        return journal
+
+    def test_crash_before_commit_keeps_old_segments(self):
+        journal = self._fill()
+        # Committing the manifest is the first rename compact() makes
+        with mock.patch("utils.signal_journal.os.replace", side_effect=OSError("crash")):
+            with self.assertRaises(OSError):
+                journal.compact()
+
+        reloaded = SignalJournal(self.directory, max_segment_bytes=1)
+        self.assertEqual(len(reloaded), 3)
+        self.assertTrue(all(name.endswith((".jsonl", ".idx")) for name in os.listdir(self.directory)))
+
+    def test_crash_during_promotion_is_finished_on_load(self):
+        journal = self._fill()
+        real_remove = os.remove
+
+        def crash_on_segment_remove(path):
+            if path.endswith(".jsonl"):
+                raise OSError("crash")
+            real_remove(path)
+
+        with mock.patch("utils.signal_journal.os.remove", side_effect=crash_on_segment_remove):
+            with self.assertRaises(OSError):
+                journal.compact()
+
+        reloaded = SignalJournal(self.directory, max_segment_bytes=1)
+        self.assertEqual(len(reloaded), 3)
+        self.assertEqual([s.signal_type for s in reloaded.query("EURUSD")], ["BUY", "SELL"])
+        self.assertNotIn(COMPACT_MANIFEST, os.listdir(self.directory))
+
+        reloaded.append([self._signal("GBPUSD", "SELL", 3)])
+        self.assertEqual(len(SignalJournal(self.directory)), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Batch indicators and TradingStrategy batch evaluation against the per-market path.
+"""
+
+import time
+import unittest
+
+import numpy as np
+
+from src.models import indicators
+from src.models.strategy import TradingStrategy, SIGNAL_NAMES, MIN_BATCH_BARS
+from src.service.candle_buffer import CandleStore
+
+BARS = 60
+
+def _series(rng, length):
+    """Closes, highs and lows of a random walk with occasional volatility bursts."""
+    volatility = np.where(rng.random(length) < 0.1, 0.01, 0.002)
+    closes = 1.1 * np.exp(np.cumsum(rng.normal(0, 1, length) * volatility))
+    spread = np.abs(rng.normal(0, 0.0005, length))
+    return closes, closes + spread, closes - spread
+
+def _windows(seed=7, markets=6, length=400):
+    """Every BARS-wide window of several series, stacked as (windows, bars)."""
+    rng = np.random.default_rng(seed)
+    rows = [[], [], []]
+    for _ in range(markets):
+        series = _series(rng, length)
+        for column, values in zip(rows, series):
+            column.extend(np.lib.stride_tricks.sliding_window_view(values, BARS))
+    return tuple(np.array(column) for column in rows)
+
+class BatchIndicatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.closes, self.highs, self.lows = _windows(markets=2, length=80)
+
+    def test_batch_indicators_match_scalar_versions(self):
+        ema = indicators.calculate_ema_batch(self.closes, 21)
+        macd_line, signal_line = indicators.calculate_macd_batch(self.closes)
+        rsi = indicators.calculate_rsi_batch(self.closes, 5)
+        upper, sma, lower = indicators.calculate_bollinger_bands_batch(self.closes)
+        atr = indicators.calculate_atr_batch(self.highs, self.lows, self.closes)
+
+        for i in range(len(self.closes)):
+            closes = self.closes[i].tolist()
+            np.testing.assert_allclose(ema[i], indicators.calculate_ema(closes, 21))
+            expected_macd, expected_signal = indicators.calculate_macd(closes)
+            np.testing.assert_allclose(macd_line[i], expected_macd)
+            np.testing.assert_allclose(signal_line[i], expected_signal)
+            expected_rsi = indicators.calculate_rsi(closes, 5)
+            # A series with no initial losses is a single 100 in the scalar version
+            if len(expected_rsi) > 1:
+                np.testing.assert_allclose(rsi[i], expected_rsi)
+            self.assertAlmostEqual(rsi[i][-1], expected_rsi[-1])
+            expected_bands = indicators.calculate_bollinger_bands(closes)
+            for band, expected in zip((upper, sma, lower), expected_bands):
+                np.testing.assert_allclose(band[i], expected)
+            np.testing.assert_allclose(atr[i], indicators.calculate_atr(
+                self.highs[i].tolist(), self.lows[i].tolist(), closes))
+
+    def test_rsi_without_initial_losses_reads_100(self):
+        rising = np.arange(1.0, 31.0).reshape(1, -1)
+        self.assertTrue((indicators.calculate_rsi_batch(rising, 7) == 100.0).all())
+        self.assertEqual(indicators.calculate_rsi(rising[0].tolist(), 7)[-1], 100.0)
+
+class GenerateSignalsBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.strategy = TradingStrategy()
+
+    def test_batch_matches_per_market_generate_signal(self):
+        closes, highs, lows = _windows()
+        codes = self.strategy.generate_signals_batch(closes, highs, lows)
+
+        expected = []
+        for i in range(len(closes)):
+            # Distinct names keep each window in its own indicator graph
+            decided = self.strategy.generate_signal({
+                'market': f"M{i}", 'closes': closes[i].tolist(), 'highs': highs[i].tolist(),
+                'lows': lows[i].tolist(), 'volumes': [1] * BARS, 'timeframe': 1,
+                'timestamps': list(range(BARS)), 'source': 'test'})
+            expected.append(decided['signal_type'] if decided else 'NONE')
+
+        self.assertEqual([SIGNAL_NAMES[int(code)] for code in codes], expected)
+        # The data has to exercise both directions for the comparison to mean anything
+        self.assertIn('BUY', expected)
+        self.assertIn('SELL', expected)
+
+    def test_news_filter_applies_per_market(self):
+        closes, highs, lows = _windows()
+        codes = self.strategy.generate_signals_batch(closes, highs, lows)
+        markets = [f"M{i}" for i in range(len(closes))]
+        self.strategy.check_news_filter = lambda market: int(market[1:]) % 2 == 0
+
+        filtered = self.strategy.generate_signals_batch(closes, highs, lows, markets)
+
+        allowed = np.array([self.strategy.check_news_filter(m) for m in markets])
+        self.assertTrue((filtered[~allowed] == 0).all())
+        np.testing.assert_array_equal(filtered[allowed], codes[allowed])
+
+    def test_rejects_bad_shapes(self):
+        closes, highs, lows = _windows(markets=1, length=BARS)
+        with self.assertRaises(ValueError):
+            self.strategy.generate_signals_batch(closes[0], highs[0], lows[0])
+        with self.assertRaises(ValueError):
+            self.strategy.generate_signals_batch(closes, highs[:, 1:], lows)
+        with self.assertRaises(ValueError):
+            short = closes[:, :MIN_BATCH_BARS - 1]
+            self.strategy.generate_signals_batch(short, short, short)
+
+    def test_evaluate_markets_reads_candle_store(self):
+        rng = np.random.default_rng(11)
+        store = CandleStore(capacity=200)
+        now = int(time.time() // 60)
+        series = {}
+        for market, length in (("EURUSD", 120), ("GBPUSD", 120), ("USDJPY", 30)):
+            closes, highs, lows = _series(rng, length)
+            series[market] = (closes, highs, lows)
+            store.get(market, 1).extend([
+                {'timestamp': (now - length + i) * 60000, 'open': closes[i], 'high': highs[i],
+                 'low': lows[i], 'close': closes[i], 'volume': 1} for i in range(length)])
+
+        decided = self.strategy.evaluate_markets(store, ["EURUSD", "GBPUSD", "USDJPY"], bars=BARS)
+
+        # USDJPY has too few candles for a full window
+        self.assertEqual(set(decided), {"EURUSD", "GBPUSD"})
+        for market, signal in decided.items():
+            closes, highs, lows = (a[-BARS:].reshape(1, -1) for a in series[market])
+            code = self.strategy.generate_signals_batch(closes, highs, lows)[0]
+            self.assertEqual(signal, SIGNAL_NAMES[int(code)])
+
+if __name__ == "__main__":
+    unittest.main()
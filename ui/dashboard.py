@@ -0,0 +1,278 @@
+"""
+Live multi-market dashboard redrawn cell by cell from MarketMonitor updates.
+"""
+
+import shutil
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ui.colors import RED, GREEN, YELLOW, BLUE, RESET, BOLD, DIM
+from ui.terminal_writer import TerminalWriter
+from utils.log import flush_logs
+
+ALT_SCREEN_ON = "\033[?1049h\033[?25l"
+ALT_SCREEN_OFF = "\033[?25h\033[?1049l"
+
+# (state field, heading, width); the market name is column 0
+COLUMNS = [
+    (None, "Market", 14),
+    ('price', "Price", 12),
+    ('change', "Chg %", 8),
+    ('ema', "EMA", 6),
+    ('macd', "MACD", 6),
+    ('rsi', "RSI", 6),
+    ('volatility', "Volatility", 11),
+    ('news', "News", 12),
+    ('pending', "Pending", 8),
+]
+
+HEADER_ROWS = 3
+FOOTER_ROWS = 2
+
+NEWS_LABELS = {
+    'strong_positive': ("positive", GREEN),
+    'neutral': ("neutral", YELLOW),
+    'passed': ("clear", GREEN),
+    'negative_sentiment': ("negative", RED),
+    'major_event_detected': ("MAJOR EVENT", RED),
+}
+
+def format_cell(field: Optional[str], value: Any) -> Tuple[str, str]:
+    """
+    Format one state value for the table.
+
+    Args:
+        field (Optional[str]): State field name, None for the market column
+        value (Any): Current value, None while unknown
+
+    Returns:
+        Tuple[str, str]: (plain text, color code)
+    """
+    if value is None:
+        return "…", DIM
+    if field is None:
+        return str(value), BOLD
+    if field == 'price':
+        return f"{value:.5f}", ""
+    if field == 'change':
+        return f"{value:+.3f}", GREEN if value > 0 else RED if value < 0 else ""
+    if field in ('ema', 'macd'):
+        return ("▲" if value == 'UP' else "▼"), GREEN if value == 'UP' else RED
+    if field == 'rsi':
+        return f"{value:.0f}", RED if value >= 70 else GREEN if value <= 30 else ""
+    if field == 'volatility':
+        return str(value), RED if value == 'high' else DIM if value == 'low' else ""
+    if field == 'news':
+        return NEWS_LABELS.get(value, (str(value), DIM))
+    if field == 'pending':
+        return str(value), YELLOW if value else DIM
+    return str(value), ""
+
+class _LogStream:
+    """Stdout replacement that shows printed lines in the dashboard footer."""
+
+    def __init__(self, dashboard: 'LiveDashboard'):
+        self.dashboard = dashboard
+
+    def write(self, text: str) -> int:
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if lines:
+            self.dashboard.set_message(lines[-1])
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+class LiveDashboard:
+    """
+    Table of every monitored market, updated in place as ticks arrive.
+
+    MarketMonitor reports only changed fields; each one marks a single cell
+    dirty. A render thread wakes when something is dirty, writes just those
+    cells with cursor positioning in one frame, then sleeps until the next
+    frame slot, so the frame rate is capped at ``fps`` no matter how many
+    markets tick. Nothing is drawn while nothing changes. The whole table is
+    redrawn only on the first frame and when the terminal is resized.
+    """
+
+    def __init__(self, monitor, fps: float = 4.0, stream=None):
+        """
+        Initialize live dashboard.
+
+        Args:
+            monitor (MarketMonitor): Source of market states
+            fps (float): Maximum redraws per second
+            stream: Terminal stream, the current sys.stdout by default
+        """
+        self.monitor = monitor
+        self.frame_interval = 1.0 / fps
+        self.writer = TerminalWriter(stream or sys.stdout)
+        self.frames = 0
+        self.cells_drawn = 0
+
+        self._rows = {market: i for i, market in enumerate(monitor.markets)}
+        self._cells: Dict[Tuple[int, int], str] = {}
+        self._shown: Dict[Tuple[int, int], str] = {}
+        self._dirty = set()
+        self._message = ""
+        self._size = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        for market, row in self._rows.items():
+            self._set_cells(row, {None: market, **monitor.states[market]})
+        monitor.subscribe(self.update)
+
+    @staticmethod
+    def _column_x(col: int) -> int:
+        return 1 + sum(width + 1 for _, _, width in COLUMNS[:col])
+
+    def _set_cells(self, row: int, fields: Dict[Optional[str], Any]):
+        """Store formatted cells for a row and mark the changed ones dirty."""
+        for col, (field, _, width) in enumerate(COLUMNS):
+            if field not in fields:
+                continue
+            text, color = format_cell(field, fields[field])
+            cell = f"{color}{text[:width]:<{width}}{RESET}" if color else f"{text[:width]:<{width}}"
+            if self._cells.get((row, col)) != cell:
+                self._cells[(row, col)] = cell
+                self._dirty.add((row, col))
+
+    def update(self, changes: Dict[str, Dict[str, Any]]):
+        """
+        Apply changed market fields (MarketMonitor listener).
+
+        Args:
+            changes (Dict[str, Dict[str, Any]]): Changed fields per market
+        """
+        with self._lock:
+            for market, fields in changes.items():
+                row = self._rows.get(market)
+                if row is not None:
+                    self._set_cells(row, fields)
+            # The footer's tick counter changes even when no market did
+            self._dirty.add(('message', 0))
+            self._wake.set()
+
+    def set_message(self, message: str):
+        """Show a status message in the footer."""
+        with self._lock:
+            self._message = message
+            self._dirty.add(('message', 0))
+            self._wake.set()
+
+    def _chrome(self, columns: int) -> List[str]:
+        """Lines of the title, column headings and rule."""
+        timeframe = self.monitor.timeframe
+        title = (f"{BLUE}{BOLD}AFA TRADING ► Live Market Dashboard{RESET} "
+                 f"{DIM}{len(self._rows)} markets · {timeframe}m candles · press any key to exit{RESET}")
+        headings = " ".join(f"{heading:<{width}}" for _, heading, width in COLUMNS)
+        return [title, f"{BOLD}{headings}{RESET}", f"{DIM}{'─' * min(columns, len(headings))}{RESET}"]
+
+    def _footer(self, columns: int, visible: int) -> str:
+        hidden = len(self._rows) - visible
+        more = f"+{hidden} more (enlarge the terminal) · " if hidden > 0 else ""
+        text = f"{more}tick {self.monitor.ticks} · {time.strftime('%H:%M:%S')} · {self._message}"
+        return f"\033[K{DIM}{text[:max(0, columns - 1)]}{RESET}"
+
+    def render(self) -> int:
+        """
+        Write dirty cells (or the whole table after a resize) in one frame.
+
+        Returns:
+            int: Number of table cells written
+        """
+        size = shutil.get_terminal_size((100, 30))
+        visible = max(0, size.lines - HEADER_ROWS - FOOTER_ROWS)
+
+        with self._lock:
+            if size != self._size:
+                self._size = size
+                self._shown.clear()
+                self._dirty = set(self._cells) | {('message', 0)}
+                redraw = True
+            else:
+                redraw = False
+            dirty, self._dirty = self._dirty, set()
+            cells = [(key, self._cells[key]) for key in dirty
+                     if key in self._cells and key[0] < visible and self._shown.get(key) != self._cells[key]]
+            for key, cell in cells:
+                self._shown[key] = cell
+            footer = self._footer(size.columns, visible) if redraw or ('message', 0) in dirty else None
+
+        if not cells and footer is None:
+            return 0
+
+        parts = []
+        if redraw:
+            parts.append("\033[2J\033[H")
+            for y, line in enumerate(self._chrome(size.columns), 1):
+                parts.append(f"\033[{y};1H{line}")
+        for (row, col), cell in sorted(cells):
+            parts.append(f"\033[{HEADER_ROWS + row + 1};{self._column_x(col)}H{cell}")
+        if footer is not None:
+            parts.append(f"\033[{size.lines};1H{footer}")
+
+        with self.writer.frame():
+            self.writer.write("".join(parts))
+        self.frames += 1
+        self.cells_drawn += len(cells)
+        return len(cells)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait()
+            if self._stop.is_set():
+                break
+            self._wake.clear()
+            self.render()
+            # Later changes accumulate until the next frame slot
+            self._stop.wait(self.frame_interval)
+
+    def start(self):
+        """Switch to the alternate screen and start the render thread."""
+        self.writer.write(ALT_SCREEN_ON)
+        self._stop.clear()
+        self._wake.set()
+        self._thread = threading.Thread(target=self._run, name="dashboard-renderer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop rendering and restore the normal screen."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.writer.write(ALT_SCREEN_OFF)
+
+    def run(self, api_provider: Callable[[], Any], wait: Callable[[], Any]):
+        """
+        Show the dashboard until ``wait`` returns or Ctrl+C is pressed.
+
+        Output printed meanwhile (e.g. API messages) appears in the footer.
+
+        Args:
+            api_provider (Callable): Returns a connected API for each tick
+            wait (Callable): Blocks until the user asks to leave
+        """
+        previous_stdout = sys.stdout
+        sys.stdout = _LogStream(self)
+        self.start()
+        self.monitor.start(api_provider)
+        try:
+            wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.monitor.stop()
+            flush_logs()
+            self.stop()
+            sys.stdout = previous_stdout
@@ -1,26 +1,40 @@
-import os
 import sys
 import time
 from colorama import Fore, Back, Style
 
 from ui.colors import RED, GREEN, YELLOW, BLUE, RESET, BOLD, DIM
+from ui.terminal_writer import TerminalWriter
 from utils.animations import (
-    afa_startup_animation, typing_effect, menu_transition_animation,
-    afa_loading_animation
+    afa_startup_animation, afa_loading_animation, animations_enabled
 )
 
+# The full startup animation only plays on the first header of a session
+_startup_shown = False
+
 def clear_screen():
     """Clear the terminal screen with AFA-TRADING style."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    writer = TerminalWriter.get_instance()
     
-    # Add a subtle header after clearing
-    print(f"{BLUE}{DIM}{'─' * 80}{RESET}")
-    print(f"{BLUE}{DIM}                           AFA-TRADING SYSTEM                           {RESET}")
-    print(f"{BLUE}{DIM}{'─' * 80}{RESET}\n")
+    # ANSI clear plus a subtle header, written as one frame
+    with writer.frame():
+        writer.clear()
+        writer.lines([
+            f"{BLUE}{DIM}{'─' * 80}{RESET}",
+            f"{BLUE}{DIM}                           AFA-TRADING SYSTEM                           {RESET}",
+            f"{BLUE}{DIM}{'─' * 80}{RESET}",
+            ""
+        ])
 
 def print_header():
     """Print the enhanced AFA-TRADING header with animations."""
+    global _startup_shown
+    
+    if not animations_enabled() or _startup_shown:
+        print_afa_banner()
+        return
+    
     # Use the startup animation for first load
+    _startup_shown = True
     afa_startup_animation()
 
 def print_menu(title, options):
@@ -34,23 +48,22 @@ def print_menu(title, options):
     Returns:
         int: The user's choice (1-based index)
     """
-    # Menu transition animation
-    menu_transition_animation()
-    
-    # Enhanced menu header
-    print(f"\n{BLUE}{BOLD}╔{'═' * (len(title) + 4)}╗{RESET}")
-    print(f"{BLUE}{BOLD}║  {title}  ║{RESET}")
-    print(f"{BLUE}{BOLD}╚{'═' * (len(title) + 4)}╝{RESET}\n")
+    writer = TerminalWriter.get_instance()
     
-    # Animated menu options
-    for i, option in enumerate(options, 1):
-        # Add icons based on option type
-        icon = get_menu_icon(option)
+    # The whole menu is one frame: header and options appear together
+    with writer.frame():
+        writer.lines([
+            "",
+            f"{BLUE}{BOLD}╔{'═' * (len(title) + 4)}╗{RESET}",
+            f"{BLUE}{BOLD}║  {title}  ║{RESET}",
+            f"{BLUE}{BOLD}╚{'═' * (len(title) + 4)}╝{RESET}",
+            ""
+        ])
         
-        # Typing effect for each option
-        sys.stdout.write(f"{YELLOW}{BOLD}{i}.{RESET} {icon} ")
-        typing_effect(option, 0.02, BLUE)
-        time.sleep(0.1)
+        for i, option in enumerate(options, 1):
+            # Add icons based on option type
+            icon = get_menu_icon(option)
+            writer.line(f"{YELLOW}{BOLD}{i}.{RESET} {icon} {BLUE}{option}{RESET}")
     
     return get_user_input(f"\n{GREEN}🎯 Enter your choice", 1, len(options))
 
@@ -276,7 +289,7 @@ def print_afa_banner():
     ╚══════════════════════════════════════════════════════════╝
 {RESET}
     """
-    print(banner)
+    TerminalWriter.get_instance().line(banner)
 
 def print_success_message(message):
     """Print success message with celebration."""
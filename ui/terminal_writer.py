@@ -0,0 +1,122 @@
+"""
+Buffered terminal output shared by the UI and animation helpers.
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# ANSI sequences (colorama's init() translates them on Windows consoles)
+CLEAR_SCREEN = "\033[2J\033[3J\033[H"
+CLEAR_LINE = "\r\033[K"
+
+class TerminalWriter:
+    """
+    Composes output into frames and writes each frame with one flush.
+
+    Text written inside ``with writer.frame():`` is collected and sent to the
+    terminal in a single write when the block ends; outside a frame every
+    write goes out immediately. Screens are cleared with ANSI escapes instead
+    of spawning ``clear``. In instant mode, effects such as type() emit their
+    final text in one go instead of character by character.
+    """
+
+    _instance = None
+
+    def __init__(self, stream=None, instant: bool = False):
+        """
+        Initialize terminal writer.
+
+        Args:
+            stream: Output stream, the current sys.stdout when None
+            instant (bool): Skip character-by-character effects
+        """
+        self.stream = stream
+        self.instant = instant
+        self._buffer = []
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    @classmethod
+    def get_instance(cls) -> 'TerminalWriter':
+        """
+        Get the shared terminal writer.
+
+        Returns:
+            TerminalWriter: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = TerminalWriter()
+        return cls._instance
+
+    def _target(self):
+        # Resolved per flush so redirected stdout (status renderer, tests) is honoured
+        return self.stream or sys.stdout
+
+    def write(self, text: str):
+        """Add text to the current frame, or write it now outside a frame."""
+        with self._lock:
+            self._buffer.append(text)
+            if self._depth == 0:
+                self.flush()
+
+    def line(self, text: str = ""):
+        """Add one line of text."""
+        self.write(text + "\n")
+
+    def lines(self, lines):
+        """Add several lines of text."""
+        self.write("".join(f"{line}\n" for line in lines))
+
+    def clear(self):
+        """Clear the screen and move the cursor home."""
+        self.write(CLEAR_SCREEN)
+
+    def clear_line(self):
+        """Clear the current line and return to its start."""
+        self.write(CLEAR_LINE)
+
+    def flush(self):
+        """Write everything buffered with a single write and flush."""
+        with self._lock:
+            if not self._buffer:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            target = self._target()
+            target.write(data)
+            target.flush()
+
+    @contextmanager
+    def frame(self):
+        """Collect all writes in the block and flush them once at the end."""
+        with self._lock:
+            self._depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.flush()
+
+    def type(self, text: str, delay: float = 0.03, prefix: str = "", suffix: str = "\n"):
+        """
+        Typing effect: reveal text one character per frame.
+
+        Args:
+            text (str): Text to reveal
+            delay (float): Seconds between characters
+            prefix (str): Written before the text (e.g. a color code)
+            suffix (str): Written after the text
+        """
+        if self.instant or delay <= 0 or self._depth:
+            self.write(f"{prefix}{text}{suffix}")
+            return
+
+        self.write(prefix)
+        for char in text:
+            self.write(char)
+            time.sleep(delay)
+        self.write(suffix)
@@ -3,10 +3,37 @@ Enhanced Animation utilities for AFA-TRADING terminal UI.
 Professional animations with AFA-TRADING branding.
 """
 
+import os
 import time
 import sys
 import random
+import threading
 from ui.colors import BLUE, GREEN, RED, YELLOW, RESET, BOLD, DIM
+from ui.terminal_writer import TerminalWriter
+
+# Global animation switch (--no-animation or AFA_NO_ANIMATION=1 turns it off)
+_animations_enabled = os.environ.get("AFA_NO_ANIMATION", "") not in ("1", "true", "yes")
+TerminalWriter.get_instance().instant = not _animations_enabled
+
+def set_animations_enabled(enabled):
+    """
+    Turn all animation delays on or off.
+    
+    Args:
+        enabled (bool): False prints every animation's final state instantly
+    """
+    global _animations_enabled
+    _animations_enabled = bool(enabled)
+    TerminalWriter.get_instance().instant = not _animations_enabled
+
+def animations_enabled():
+    """Check whether animations are enabled."""
+    return _animations_enabled
+
+def _sleep(seconds):
+    """Sleep only while animations are enabled."""
+    if _animations_enabled:
+        time.sleep(seconds)
 
 def afa_loading_animation(duration=3, message="Processing"):
     """
@@ -26,19 +53,197 @@ def afa_loading_animation(duration=3, message="Processing"):
         "⭐ AFA"
     ]
     
-    end_time = time.time() + duration
+    end_time = time.time() + duration if _animations_enabled else 0
     i = 0
     
     while time.time() < end_time:
         frame = frames[i % len(frames)]
         sys.stdout.write(f"\r{BLUE}{BOLD}{frame} TRADING{RESET} {YELLOW}► {message}...{RESET}")
         sys.stdout.flush()
-        time.sleep(0.3)
+        _sleep(0.3)
         i += 1
     
     sys.stdout.write(f"\r{GREEN}{BOLD}✅ AFA TRADING{RESET} {GREEN}► {message} Complete!{' ' * 20}{RESET}\n")
     sys.stdout.flush()
 
+class ProgressStatus:
+    """Thread-safe progress shared between a worker and the render thread."""
+    
+    def __init__(self, message="Processing", total=0):
+        """
+        Initialize progress status.
+        
+        Args:
+            message (str): What is being worked on
+            total (int): Number of steps, 0 when unknown
+        """
+        self.message = message
+        self.total = total
+        self.current = 0
+        self.detail = ""
+        self._lock = threading.Lock()
+    
+    def update(self, message=None, current=None, total=None, detail=None):
+        """Change any part of the status."""
+        with self._lock:
+            if message is not None:
+                self.message = message
+            if current is not None:
+                self.current = current
+            if total is not None:
+                self.total = total
+            if detail is not None:
+                self.detail = detail
+    
+    def advance(self, steps=1, message=None):
+        """Mark steps as done, optionally changing the message."""
+        with self._lock:
+            self.current = min(self.current + steps, self.total) if self.total else self.current + steps
+            if message is not None:
+                self.message = message
+    
+    def snapshot(self):
+        """Get (message, current, total, detail) consistently."""
+        with self._lock:
+            return self.message, self.current, self.total, self.detail
+
+class _StatusStream:
+    """stdout proxy that keeps the status line below everything printed."""
+    
+    def __init__(self, renderer, stream):
+        self._renderer = renderer
+        self._stream = stream
+    
+    def write(self, text):
+        with self._renderer._lock:
+            if not self._renderer._line_open:
+                self._stream.write("\r\033[K")
+            self._stream.write(text)
+            self._renderer._line_open = not text.endswith("\n")
+            if not self._renderer._line_open:
+                self._renderer._draw_locked()
+        return len(text)
+    
+    def flush(self):
+        self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+class StatusRenderer:
+    """
+    Spinner and progress bar drawn by a render thread while work runs.
+    
+    The worker only updates a ProgressStatus; the render thread redraws one
+    status line from it every ``interval`` seconds. Output printed by the
+    worker meanwhile goes through a stdout proxy that clears the status line,
+    prints the text and redraws the status below it, so logs and the spinner
+    never overwrite each other. With animations disabled or a non-terminal
+    stdout nothing is drawn and only the final line is printed.
+    
+    Usage:
+        with StatusRenderer("Generating signals", total=3) as progress:
+            for market in markets:
+                ...
+                progress.advance()
+    """
+    
+    frames = ["🔄", "⚡", "💎", "🎯", "🚀", "⭐"]
+    
+    def __init__(self, message="Processing", total=0, status=None, interval=0.1, stream=None):
+        """
+        Initialize status renderer.
+        
+        Args:
+            message (str): Initial status message
+            total (int): Number of steps, 0 for a spinner without a bar
+            status (ProgressStatus, optional): Existing status to render
+            interval (float): Seconds between redraws
+            stream: Terminal stream, sys.stdout by default
+        """
+        self.status = status or ProgressStatus(message, total)
+        self.interval = interval
+        self.stream = stream or sys.stdout
+        self.enabled = (_animations_enabled and hasattr(self.stream, "isatty") and self.stream.isatty()
+                        and not isinstance(self.stream, _StatusStream))
+        
+        self._frame = 0
+        self._line_open = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+        self._previous_stdout = None
+    
+    def _status_line(self):
+        message, current, total, detail = self.status.snapshot()
+        frame = self.frames[self._frame % len(self.frames)]
+        line = f"{BLUE}{BOLD}{frame} AFA TRADING{RESET} {YELLOW}► {message}{RESET}"
+        if total:
+            width = 20
+            filled = int(width * min(current, total) / total)
+            line += f" {GREEN}[{'█' * filled}{'░' * (width - filled)}]{RESET} {current}/{total}"
+        if detail:
+            line += f" {DIM}{detail}{RESET}"
+        return line + f" {DIM}{time.time() - self._started:.1f}s{RESET}"
+    
+    def _draw_locked(self):
+        if not self._line_open:
+            self.stream.write(f"\r\033[K{self._status_line()}")
+            self.stream.flush()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                self._frame += 1
+                self._draw_locked()
+    
+    def start(self):
+        """Start drawing and route stdout through the status line."""
+        self._started = time.time()
+        if not self.enabled:
+            return self.status
+        self._previous_stdout = sys.stdout
+        sys.stdout = _StatusStream(self, self.stream)
+        with self._lock:
+            self._draw_locked()
+        self._thread = threading.Thread(target=self._run, name="status-renderer", daemon=True)
+        self._thread.start()
+        return self.status
+    
+    def stop(self, success=True):
+        """
+        Stop drawing and print the final state.
+        
+        Args:
+            success (bool): Whether the work completed
+        """
+        if self._thread is not None:
+            # Queued log lines are written above the status line, not after it
+            from utils.log import flush_logs
+            flush_logs()
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            sys.stdout = self._previous_stdout
+            self.stream.write("\r\033[K" if not self._line_open else "\n")
+        
+        message = self.status.snapshot()[0]
+        elapsed = time.time() - self._started
+        if success:
+            self.stream.write(f"{GREEN}{BOLD}✅ AFA TRADING{RESET} {GREEN}► {message} Complete! "
+                              f"({elapsed:.1f}s){RESET}\n")
+        else:
+            self.stream.write(f"{RED}{BOLD}❌ AFA TRADING{RESET} {RED}► {message} failed{RESET}\n")
+        self.stream.flush()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop(success=exc_type is None)
+        return False
+
 def print_success_message(message):
     """Print success message with celebration."""
     print(f"\n{GREEN}{BOLD}{'='*60}{RESET}")
@@ -128,97 +333,16 @@ def quotex_connection_animation():
         
         # Animated dots
         for _ in range(3):
-            time.sleep(0.5)
+            _sleep(0.5)
             sys.stdout.write(".")
             sys.stdout.flush()
         
         print(f" {GREEN}✓{RESET}")
-        time.sleep(0.3)
+        _sleep(0.3)
     
     print(f"\n{GREEN}{BOLD}🎉 QUOTEX CONNECTION SUCCESSFUL!{RESET}")
     print(f"{BLUE}Ready for live trading signals...{RESET}\n")
 
-def signal_generation_animation(market, num_signals):
-    """
-    Professional signal generation animation.
-    
-    Args:
-        market (str): Market name
-        num_signals (int): Number of signals to generate
-    """
-    print(f"\n{BLUE}{BOLD}{'='*60}{RESET}")
-    print(f"{BLUE}{BOLD}        AFA-TRADING SIGNAL GENERATOR{RESET}")
-    print(f"{BLUE}{BOLD}{'='*60}{RESET}")
-    
-    print(f"\n{YELLOW}📊 Market: {BOLD}{market}{RESET}")
-    print(f"{YELLOW}🎯 Signals: {BOLD}{num_signals}{RESET}")
-    print(f"{YELLOW}⚡ Mode: {BOLD}REAL QUOTEX DATA{RESET}\n")
-    
-    # Signal generation steps
-    steps = [
-        ("📈", "Fetching live market data"),
-        ("🧠", "Analyzing price patterns"),
-        ("📊", "Calculating indicators"),
-        ("🎯", "Generating signals"),
-        ("✨", "Applying filters")
-    ]
-    
-    for icon, step in steps:
-        sys.stdout.write(f"{BLUE}{icon} {step}")
-        sys.stdout.flush()
-        
-        # Progress dots with random timing
-        dots = random.randint(3, 6)
-        for _ in range(dots):
-            time.sleep(random.uniform(0.2, 0.5))
-            sys.stdout.write(f"{YELLOW}.{RESET}")
-            sys.stdout.flush()
-        
-        print(f" {GREEN}✓{RESET}")
-    
-    print(f"\n{GREEN}{BOLD}🚀 SIGNAL GENERATION COMPLETE!{RESET}\n")
-
-def market_analysis_animation(market):
-    """
-    Market analysis animation with technical indicators.
-    
-    Args:
-        market (str): Market being analyzed
-    """
-    print(f"\n{BLUE}{BOLD}{'='*50}{RESET}")
-    print(f"{BLUE}{BOLD}    AFA-TRADING MARKET ANALYSIS{RESET}")
-    print(f"{BLUE}{BOLD}{'='*50}{RESET}")
-    
-    print(f"\n{YELLOW}🔍 Analyzing: {BOLD}{market}{RESET}\n")
-    
-    indicators = [
-        ("📊", "RSI Analysis", "Relative Strength Index"),
-        ("📈", "MACD Calculation", "Moving Average Convergence"),
-        ("🎯", "Bollinger Bands", "Volatility Analysis"),
-        ("⚡", "ATR Measurement", "Average True Range"),
-        ("🧠", "Trend Detection", "Market Direction"),
-        ("💎", "Support/Resistance", "Key Levels")
-    ]
-    
-    for icon, name, description in indicators:
-        sys.stdout.write(f"{BLUE}{icon} {name:<20}")
-        sys.stdout.flush()
-        
-        # Animated progress bar
-        bar_length = 20
-        for i in range(bar_length + 1):
-            progress = i / bar_length
-            filled = int(progress * bar_length)
-            bar = f"[{'█' * filled}{'░' * (bar_length - filled)}]"
-            
-            sys.stdout.write(f"\r{BLUE}{icon} {name:<20} {GREEN}{bar}{RESET} {int(progress * 100):3d}%")
-            sys.stdout.flush()
-            time.sleep(0.1)
-        
-        print(f" {GREEN}✓ {description}{RESET}")
-    
-    print(f"\n{GREEN}{BOLD}📊 ANALYSIS COMPLETE!{RESET}\n")
-
 def afa_progress_bar(current, total, prefix='AFA Progress', width=40):
     """
     AFA-TRADING branded progress bar.
@@ -258,17 +382,12 @@ def typing_effect(text, delay=0.03, color=BLUE):
         delay (float): Delay between characters
         color (str): Text color
     """
-    for char in text:
-        sys.stdout.write(f"{color}{char}{RESET}")
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    TerminalWriter.get_instance().type(text, delay, prefix=color, suffix=f"{RESET}\n")
 
 def afa_startup_animation():
     """AFA-TRADING startup animation sequence."""
-    # Clear screen
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    writer = TerminalWriter.get_instance()
+    writer.clear()
     
     # AFA-TRADING ASCII Art with animation
     logo_lines = [
@@ -285,10 +404,10 @@ def afa_startup_animation():
         "    ╚══════════════════════════════════════════════════════════╝"
     ]
     
-    # Animate logo appearance
+    # Animate logo appearance, one line per frame
     for line in logo_lines:
-        print(f"{BLUE}{BOLD}{line}{RESET}")
-        time.sleep(0.2)
+        writer.line(f"{BLUE}{BOLD}{line}{RESET}")
+        _sleep(0.2)
     
     # Animated title
     print(f"\n{YELLOW}{BOLD}", end="")
@@ -312,17 +431,17 @@ def afa_startup_animation():
         
         # Animated dots
         for _ in range(3):
-            time.sleep(0.3)
+            _sleep(0.3)
             sys.stdout.write(".")
             sys.stdout.flush()
         
         print(f" {GREEN}✓{RESET}")
-        time.sleep(0.2)
+        _sleep(0.2)
     
     print(f"\n{GREEN}{BOLD}🚀 AFA-TRADING SYSTEM ONLINE!{RESET}")
     print(f"{BLUE}Ready to generate professional trading signals...{RESET}\n")
     
-    time.sleep(1)
+    _sleep(1)
 
 def signal_display_animation(signals):
     """
@@ -343,7 +462,7 @@ def signal_display_animation(signals):
         
         # Animated signal appearance
         sys.stdout.write(f"{BLUE}│{RESET}")
-        time.sleep(0.1)
+        _sleep(0.1)
         
         typing_effect(f" 🎯 SIGNAL #{i:02d} │ {signal.signal_type:4s} │ {signal.time} │ {signal.market:12s} ", 0.02, signal_color + BOLD)
         
@@ -361,7 +480,7 @@ def signal_display_animation(signals):
         
         print(f"{BLUE}└{'─' * 66}┘{RESET}\n")
         
-        time.sleep(0.3)  # Pause between signals
+        _sleep(0.3)  # Pause between signals
 
 def countdown_timer(seconds, message="Next signal in"):
     """
@@ -371,6 +490,10 @@ def countdown_timer(seconds, message="Next signal in"):
         seconds (int): Countdown duration
         message (str): Countdown message
     """
+    if not _animations_enabled:
+        print(f"{GREEN}{BOLD}🚀 Ready to proceed!{RESET}")
+        return
+    
     for i in range(seconds, 0, -1):
         mins, secs = divmod(i, 60)
         timer = f"{mins:02d}:{secs:02d}"
@@ -379,7 +502,7 @@ def countdown_timer(seconds, message="Next signal in"):
         
         sys.stdout.write(f"\r{BLUE}{message}: {color}{BOLD}{timer}{RESET}")
         sys.stdout.flush()
-        time.sleep(1)
+        _sleep(1)
     
     print(f"\r{GREEN}{BOLD}🚀 Ready to proceed!{' ' * 30}{RESET}")
 
@@ -390,36 +513,44 @@ def matrix_rain_effect(duration=3):
     Args:
         duration (int): Effect duration in seconds
     """
-    import os
+    if not _animations_enabled:
+        return
+    
     width = os.get_terminal_size().columns
     height = 10
     
     chars = "AFA0123456789TRADING$€¥£"
     
+    writer = TerminalWriter.get_instance()
     end_time = time.time() + duration
     
     while time.time() < end_time:
-        # Clear previous frame
-        print("\033[H\033[J", end="")
-        
-        for _ in range(height):
-            line = ""
-            for _ in range(width // 2):
-                if random.random() < 0.1:
-                    char = random.choice(chars)
-                    color = random.choice([GREEN, BLUE, YELLOW])
-                    line += f"{color}{char}{RESET}"
-                else:
-                    line += " "
-            print(line)
+        # Each frame is composed in full and written at once
+        with writer.frame():
+            writer.write("\033[H\033[J")
+            
+            for _ in range(height):
+                line = ""
+                for _ in range(width // 2):
+                    if random.random() < 0.1:
+                        char = random.choice(chars)
+                        color = random.choice([GREEN, BLUE, YELLOW])
+                        line += f"{color}{char}{RESET}"
+                    else:
+                        line += " "
+                writer.line(line)
         
-        time.sleep(0.1)
+        _sleep(0.1)
     
     # Clear screen after effect
-    print("\033[H\033[J", end="")
+    writer.write("\033[H\033[J")
 
 def success_celebration():
     """Success celebration animation."""
+    if not _animations_enabled:
+        print(f"{GREEN}{BOLD}🎯 AFA-TRADING SIGNALS GENERATED SUCCESSFULLY!{RESET}")
+        return
+    
     celebration_frames = [
         "🎉 SUCCESS! 🎉",
         "✨ SUCCESS! ✨", 
@@ -432,7 +563,7 @@ def success_celebration():
         for frame in celebration_frames:
             sys.stdout.write(f"\r{GREEN}{BOLD}{frame:^30}{RESET}")
             sys.stdout.flush()
-            time.sleep(0.3)
+            _sleep(0.3)
     
     print(f"\n{GREEN}{BOLD}🎯 AFA-TRADING SIGNALS GENERATED SUCCESSFULLY!{RESET}")
 
@@ -451,24 +582,28 @@ def error_animation(error_msg):
     for _ in range(3):
         sys.stdout.write(f"\r{RED}{BOLD}❌ {error_msg}{RESET}")
         sys.stdout.flush()
-        time.sleep(0.5)
+        _sleep(0.5)
         sys.stdout.write(f"\r{' ' * (len(error_msg) + 5)}")
         sys.stdout.flush()
-        time.sleep(0.3)
+        _sleep(0.3)
     
     print(f"\r{RED}{BOLD}❌ {error_msg}{RESET}")
     print(f"{YELLOW}🔧 AFA-TRADING will attempt to recover...{RESET}\n")
 
 def menu_transition_animation():
     """Smooth menu transition animation."""
+    if not _animations_enabled:
+        return
+    
+    writer = TerminalWriter.get_instance()
+    
     # Sliding effect
     for i in range(5):
-        sys.stdout.write(f"\r{BLUE}{'█' * (i * 10)}{' ' * (50 - i * 10)}{RESET}")
-        sys.stdout.flush()
-        time.sleep(0.1)
+        writer.write(f"\r{BLUE}{'█' * (i * 10)}{' ' * (50 - i * 10)}{RESET}")
+        _sleep(0.1)
     
-    print(f"\r{GREEN}{'█' * 50}{RESET}")
-    time.sleep(0.2)
+    writer.write(f"\r{GREEN}{'█' * 50}{RESET}")
+    _sleep(0.2)
     
     # Clear the bar
-    print(f"\r{' ' * 50}")
\ No newline at end of file
+    writer.clear_line()
\ No newline at end of file
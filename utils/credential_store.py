@@ -0,0 +1,241 @@
+"""
+Local credential cache for login, refreshed from the remote users list in
+the background.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from typing import Dict, List, Optional, Any
+
+DEFAULT_CACHE_PATH = os.path.join("cache", "credentials.json")
+HASH_ITERATIONS = 100_000
+
+def hash_password(password: str, salt: bytes, iterations: int = HASH_ITERATIONS) -> bytes:
+    """
+    Derive a PBKDF2-SHA256 hash of a password.
+
+    Args:
+        password (str): Plaintext password
+        salt (bytes): Per-user random salt
+        iterations (int): PBKDF2 iteration count
+
+    Returns:
+        bytes: Derived key
+    """
+    return hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+class CredentialStore:
+    """
+    Username -> salted password hash map backed by a JSON cache file.
+
+    Only hashes are kept in memory and on disk. The remote users list is
+    fetched with If-None-Match/If-Modified-Since, so an unchanged list costs a
+    single 304 response and no rehashing.
+    """
+
+    def __init__(self, url: str, cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 iterations: int = HASH_ITERATIONS, timeout: float = 10):
+        """
+        Initialize credential store.
+
+        Args:
+            url (str): Remote users.json URL
+            cache_path (Optional[str]): JSON cache file, None keeps the store in memory
+            iterations (int): PBKDF2 iteration count for new hashes
+            timeout (float): HTTP timeout in seconds
+        """
+        self.url = url
+        self.cache_path = cache_path
+        self.iterations = iterations
+        self.timeout = timeout
+
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.fetched_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+        self._users: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._refreshed = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        # Verified against for unknown usernames so they take as long as known ones
+        self._dummy_entry: Optional[Dict[str, Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def __contains__(self, username: str) -> bool:
+        return username in self._users
+
+    def load(self) -> bool:
+        """
+        Load hashes from the cache file.
+
+        Returns:
+            bool: True if a usable cache was loaded
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        users = data.get('users')
+        if not isinstance(users, dict):
+            return False
+
+        with self._lock:
+            self._users = users
+            self.etag = data.get('etag')
+            self.last_modified = data.get('last_modified')
+            self.fetched_at = data.get('fetched_at')
+        return True
+
+    def save(self):
+        """Write hashes and validators to the cache file atomically."""
+        if not self.cache_path:
+            return
+        with self._lock:
+            data = {
+                'etag': self.etag,
+                'last_modified': self.last_modified,
+                'fetched_at': self.fetched_at,
+                'users': self._users
+            }
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _hash_entry(self, password: str) -> Dict[str, Any]:
+        salt = secrets.token_bytes(16)
+        return {
+            'salt': salt.hex(),
+            'hash': hash_password(password, salt, self.iterations).hex(),
+            'iterations': self.iterations
+        }
+
+    def update_users(self, users: List[Dict[str, str]]):
+        """
+        Replace the store with hashes of a plaintext users list.
+
+        Args:
+            users (List[Dict[str, str]]): Entries with 'username' and 'password'
+        """
+        hashed = {}
+        for user in users:
+            username, password = user.get('username'), user.get('password')
+            if username and password is not None:
+                hashed[username] = self._hash_entry(password)
+
+        with self._lock:
+            self._users = hashed
+
+    def verify(self, username: str, password: str) -> bool:
+        """
+        Check a username/password pair.
+
+        Args:
+            username (str): Username
+            password (str): Plaintext password
+
+        Returns:
+            bool: True if the password matches the stored hash
+        """
+        entry = self._users.get(username)
+        known = entry is not None
+        if not known:
+            if self._dummy_entry is None:
+                self._dummy_entry = self._hash_entry(secrets.token_hex(16))
+            entry = self._dummy_entry
+
+        try:
+            salt = bytes.fromhex(entry['salt'])
+            expected = bytes.fromhex(entry['hash'])
+        except (KeyError, ValueError):
+            return False
+        iterations = entry.get('iterations', HASH_ITERATIONS)
+        matches = hmac.compare_digest(hash_password(password, salt, iterations), expected)
+        return known and matches
+
+    def refresh(self) -> bool:
+        """
+        Conditionally fetch the remote users list.
+
+        Returns:
+            bool: True if the store is current (200 or 304), False on error
+        """
+        try:
+            return self._fetch()
+        finally:
+            self._refreshed.set()
+
+    def _fetch(self) -> bool:
+        import requests
+
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        try:
+            res = requests.get(self.url, headers=headers, timeout=self.timeout)
+            if res.status_code == 304:
+                self.fetched_at = time.time()
+                self.save()
+                return True
+            if res.status_code != 200:
+                self.last_error = f"HTTP {res.status_code}"
+                return False
+            users = res.json().get("users", [])
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+
+        self.update_users(users)
+        self.etag = res.headers.get('ETag')
+        self.last_modified = res.headers.get('Last-Modified')
+        self.fetched_at = time.time()
+        self.last_error = None
+        self.save()
+        return True
+
+    def start_background_refresh(self) -> threading.Thread:
+        """
+        Refresh in a daemon thread; the cached hashes stay usable meanwhile.
+
+        Returns:
+            threading.Thread: The running refresh thread
+        """
+        if self._refresh_thread is None or not self._refresh_thread.is_alive():
+            self._refreshed.clear()
+            self._refresh_thread = threading.Thread(target=self.refresh,
+                                                    name="credential-refresh", daemon=True)
+            self._refresh_thread.start()
+        return self._refresh_thread
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the background refresh to finish.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, None waits indefinitely
+
+        Returns:
+            bool: True if a refresh attempt completed
+        """
+        return self._refreshed.wait(timeout)
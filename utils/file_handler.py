@@ -2,16 +2,41 @@
 Utilities for file operations.
 """
 
+import io
 import os
+import csv
+import json
 import datetime
 
-def save_signals_to_file(signals, market_name):
+# Machine-readable output formats supported by write_signals
+SIGNAL_FORMATS = ("jsonl", "csv", "text")
+
+# Formats accepted by export_signals/iter_signals, keyed by file extension
+EXPORT_FORMATS = {".jsonl": "jsonl", ".csv": "csv", ".npz": "npz"}
+
+# Columns of the binary format that are stored dictionary-encoded
+COLUMNAR_STRING_FIELDS = (
+    "market", "timeframe", "accuracy", "signal_type",
+    "news_filter_result", "volatility_filter_result"
+)
+COLUMNAR_VERSION = 1
+
+# Column order for CSV output
+CSV_FIELDS = [
+    "market", "timeframe", "accuracy", "signal_type", "signal_time",
+    "confidence", "strength", "position_size_multiplier",
+    "news_filter_result", "volatility_filter_result"
+]
+
+def save_signals_to_file(signals, market_name, fmt="text"):
     """
-    Save a list of signals to a text file.
+    Save a list of signals to a file.
     
     Args:
         signals (list): List of Signal objects to save
         market_name (str): Name of the market for filename
+        fmt (str): 'text' for the readable summary, or 'jsonl', 'csv' or 'npz'
+            for a lossless export
         
     Returns:
         str: The filename where signals were saved
@@ -21,6 +46,11 @@ def save_signals_to_file(signals, market_name):
     
     # Generate filename with timestamp
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    if fmt != "text":
+        filename = f"signals/{market_name}_{timestamp}.{fmt}"
+        export_signals(signals, filename, fmt)
+        return filename
+    
     filename = f"signals/{market_name}_{timestamp}.txt"
     
     # Write signals to file
@@ -42,11 +72,15 @@ def read_signals_from_file(filename):
         filename (str): Path to the signals file
         
     Returns:
-        list: List of signal strings read from the file
+        list: Signal objects for .jsonl/.csv/.npz exports, otherwise the
+            signal strings read from a text file
     """
     if not os.path.exists(filename):
         return []
     
+    if os.path.splitext(filename)[1] in EXPORT_FORMATS:
+        return list(iter_signals(filename))
+    
     signals = []
     with open(filename, "r") as f:
         for line in f:
@@ -54,4 +88,204 @@ def read_signals_from_file(filename):
             if line and not line.startswith("-") and ":" in line:
                 signals.append(line)
     
-    return signals
\ No newline at end of file
+    return signals
+
+def _json_default(value):
+    """Convert NumPy scalars and datetimes that json cannot encode natively."""
+    if hasattr(value, "item"):
+        return value.item()
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+def write_signals(signals, stream, fmt="jsonl"):
+    """
+    Write signals to an open text stream in a machine-readable format.
+    
+    Args:
+        signals (list): List of Signal objects to write
+        stream: Writable text stream (file or sys.stdout)
+        fmt (str): Output format ('jsonl', 'csv' or 'text')
+        
+    Returns:
+        int: Number of signals written
+    """
+    if fmt not in SIGNAL_FORMATS:
+        raise ValueError(f"Unsupported signal format: {fmt}")
+    
+    if fmt == "text":
+        stream.write("".join(f"{signal}\n" for signal in signals))
+        return len(signals)
+    
+    records = [signal.to_dict() for signal in signals]
+    
+    if fmt == "jsonl":
+        stream.write("".join(json.dumps(record, default=_json_default) + "\n" for record in records))
+    else:
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for record in records:
+            record["news_filter_result"] = json.dumps(record["news_filter_result"], default=_json_default)
+            record["volatility_filter_result"] = json.dumps(record["volatility_filter_result"], default=_json_default)
+            writer.writerow(record)
+    
+    return len(records)
+
+def _export_format(path, fmt):
+    """Resolve an explicit format or infer it from the file extension."""
+    fmt = fmt or EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in EXPORT_FORMATS.values():
+        raise ValueError(f"Unsupported export format for {path}: {fmt}")
+    return fmt
+
+def _encode_column(values):
+    """Dictionary-encode a string column into (codes, distinct values)."""
+    import numpy as np
+    
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values),
+                        dtype=np.int32, count=len(values))
+    return codes, np.array(list(index), dtype=str)
+
+def write_columnar(signals, stream):
+    """
+    Write signals in the compact binary columnar format (.npz).
+    
+    Repeated strings (markets, labels, filter results) are stored once per
+    distinct value; times are int64 microseconds, numbers float64.
+    
+    Args:
+        signals (list): List of Signal objects to write
+        stream: Writable binary stream or path
+        
+    Returns:
+        int: Number of signals written
+    """
+    import numpy as np
+    from models.signal import SignalBatch
+    
+    records = SignalBatch.from_signals(signals).records
+    columns = {"version": np.array(COLUMNAR_VERSION)}
+    
+    offsets = []
+    for signal in signals:
+        offset = signal.signal_time.utcoffset()
+        offsets.append(-1 if offset is None else int(offset.total_seconds()))
+    columns["signal_time_us"] = records["timestamp"]
+    # -1 marks a naive time; otherwise seconds east of UTC
+    columns["utc_offset_s"] = np.array(offsets, dtype=np.int32)
+    columns["confidence"] = records["confidence"]
+    columns["position_size_multiplier"] = records["multiplier"]
+    
+    for field in COLUMNAR_STRING_FIELDS:
+        values = [getattr(signal, field) for signal in signals]
+        if field.endswith("_filter_result"):
+            values = [json.dumps(v, default=_json_default, sort_keys=True) for v in values]
+        columns[f"{field}_codes"], columns[f"{field}_values"] = _encode_column(values)
+    
+    np.savez_compressed(stream, **columns)
+    return len(signals)
+
+def iter_columnar(stream):
+    """
+    Stream Signal objects back from a binary columnar export.
+    
+    Args:
+        stream: Readable binary stream or path
+        
+    Yields:
+        Signal: One restored signal per row
+    """
+    import numpy as np
+    from models.signal import Signal
+    
+    with np.load(stream, allow_pickle=False) as data:
+        if int(data["version"]) != COLUMNAR_VERSION:
+            raise ValueError(f"Unsupported columnar version: {int(data['version'])}")
+        
+        strings = {}
+        for field in COLUMNAR_STRING_FIELDS:
+            values = data[f"{field}_values"].tolist()
+            if field.endswith("_filter_result"):
+                values = [json.loads(v) for v in values]
+            strings[field] = (data[f"{field}_codes"], values)
+        times = data["signal_time_us"].tolist()
+        offsets = data["utc_offset_s"].tolist()
+        confidences = data["confidence"].tolist()
+        multipliers = data["position_size_multiplier"].tolist()
+    
+    epoch = datetime.datetime(1970, 1, 1)
+    for i, micros in enumerate(times):
+        signal_time = epoch + datetime.timedelta(microseconds=micros)
+        if offsets[i] != -1:
+            signal_time = signal_time.replace(
+                tzinfo=datetime.timezone(datetime.timedelta(seconds=offsets[i])))
+        
+        record = {field: values[codes[i]] for field, (codes, values) in strings.items()}
+        record.update(signal_time=signal_time, confidence=confidences[i],
+                      position_size_multiplier=multipliers[i])
+        yield Signal.from_dict(record)
+
+def export_signals(signals, path, fmt=None):
+    """
+    Export signals losslessly with a single write.
+    
+    The whole batch is serialised in memory first, so thousands of signals
+    cost one file write instead of one per signal.
+    
+    Args:
+        signals (list): List of Signal objects to export
+        path (str): Destination file (parent directories are created)
+        fmt (str, optional): 'jsonl', 'csv' or 'npz'; inferred from the extension if omitted
+        
+    Returns:
+        int: Number of signals written
+    """
+    fmt = _export_format(path, fmt)
+    
+    if fmt == "npz":
+        buffer = io.BytesIO()
+        count = write_columnar(signals, buffer)
+        payload, mode = buffer.getvalue(), "wb"
+    else:
+        buffer = io.StringIO()
+        count = write_signals(signals, buffer, fmt)
+        payload, mode = buffer.getvalue(), "w"
+    
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, mode, **({} if mode == "wb" else {"newline": ""})) as f:
+        f.write(payload)
+    
+    return count
+
+def iter_signals(path, fmt=None):
+    """
+    Stream Signal objects from a .jsonl, .csv or .npz export.
+    
+    Args:
+        path (str): Exported file
+        fmt (str, optional): Format override; inferred from the extension if omitted
+        
+    Yields:
+        Signal: Restored signals in file order
+    """
+    from models.signal import Signal
+    
+    fmt = _export_format(path, fmt)
+    
+    if fmt == "npz":
+        yield from iter_columnar(path)
+        return
+    
+    with open(path, "r", newline="") as f:
+        if fmt == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield Signal.from_dict(json.loads(line))
+        else:
+            for row in csv.DictReader(f):
+                row["news_filter_result"] = json.loads(row["news_filter_result"] or "{}")
+                row["volatility_filter_result"] = json.loads(row["volatility_filter_result"] or "{}")
+                yield Signal.from_dict(row)
@@ -0,0 +1,221 @@
+"""
+Leveled logging with a background writer thread and repeat suppression.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+LOGGER_NAME = "afa"
+
+# Console level for each UI mode
+MODE_LEVELS = {
+    'verbose': logging.DEBUG,
+    'interactive': logging.INFO,
+    'quiet': logging.WARNING,
+}
+
+_handler = None
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger under the application's logger hierarchy.
+
+    Args:
+        name (str): Component name, usually __name__
+
+    Returns:
+        logging.Logger: Logger named 'afa.<name>'
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+class RepeatFilter(logging.Filter):
+    """
+    Drops a message already logged within the last ``interval`` seconds.
+
+    When the message next gets through, it says how many copies were dropped,
+    so a loop that logs the same line per call costs one line per interval.
+    """
+
+    def __init__(self, interval: float = 10.0, max_keys: int = 2048):
+        """
+        Initialize repeat filter.
+
+        Args:
+            interval (float): Seconds during which identical messages are dropped
+            max_keys (int): Distinct messages remembered before old ones are pruned
+        """
+        super().__init__()
+        self.interval = interval
+        self.max_keys = max_keys
+        self._seen: Dict[Tuple[str, int, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        key = (record.name, record.levelno, message)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is not None and now - entry[0] < self.interval:
+                entry[1] += 1
+                return False
+
+            repeated = int(entry[1]) if entry is not None else 0
+            self._seen[key] = [now, 0]
+            if len(self._seen) > self.max_keys:
+                cutoff = now - self.interval
+                self._seen = {k: v for k, v in self._seen.items() if v[0] >= cutoff}
+
+        if repeated:
+            record.msg, record.args = f"{message} (repeated {repeated}x)", None
+        return True
+
+class ConsoleHandler(logging.StreamHandler):
+    """Writes to a fixed stream, or to whatever sys.stdout is when a record is written."""
+
+    def __init__(self, stream=None):
+        """
+        Initialize console handler.
+
+        Args:
+            stream: Output stream; None follows sys.stdout (status line, dashboard)
+        """
+        super().__init__(stream or sys.stdout)
+        self._fixed_stream = stream
+
+    def emit(self, record: logging.LogRecord):
+        self.stream = self._fixed_stream or sys.stdout
+        super().emit(record)
+
+class AsyncHandler(logging.Handler):
+    """
+    Queues records and writes them from a background thread.
+
+    The calling thread only formats the message and enqueues it, so slow
+    terminals and log files never stall the signal pipeline. Records that
+    arrive while the queue is full are counted in ``dropped`` instead of
+    blocking.
+    """
+
+    def __init__(self, handlers: List[logging.Handler], maxsize: int = 10000):
+        """
+        Initialize async handler.
+
+        Args:
+            handlers (List[logging.Handler]): Handlers the writer thread delivers to
+            maxsize (int): Maximum queued records
+        """
+        super().__init__()
+        self.handlers = handlers
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name="afa-log", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            # Resolve arguments now; they may change before the writer runs
+            record.msg, record.args = record.getMessage(), None
+            if record.exc_info:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+                record.exc_info = None
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+        except Exception:
+            self.handleError(record)
+
+    def _run(self):
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until every queued record has been written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Write the remaining records, stop the thread and close the handlers."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(5)
+        for handler in self.handlers:
+            handler.close()
+        super().close()
+
+def setup_logging(mode: str = 'interactive', stream=None, log_file: Optional[str] = None,
+                  repeat_interval: float = 10.0) -> AsyncHandler:
+    """
+    Configure application logging; calling it again replaces the setup.
+
+    Args:
+        mode (str): 'interactive' (INFO), 'quiet' (warnings and errors) or 'verbose' (DEBUG)
+        stream: Console stream, the current sys.stdout when None
+        log_file (Optional[str]): Also write every DEBUG+ record to this file
+        repeat_interval (float): Seconds during which identical messages are dropped
+
+    Returns:
+        AsyncHandler: The installed handler
+    """
+    global _handler
+
+    if mode not in MODE_LEVELS:
+        raise ValueError(f"Invalid log mode: {mode}")
+
+    logger = logging.getLogger(LOGGER_NAME)
+    if _handler is not None:
+        logger.removeHandler(_handler)
+        _handler.close()
+    else:
+        atexit.register(shutdown_logging)
+
+    console = ConsoleHandler(stream)
+    console.setLevel(MODE_LEVELS[mode])
+    console.setFormatter(logging.Formatter("%(message)s"))
+    handlers: List[logging.Handler] = [console]
+
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s"))
+        handlers.append(file_handler)
+
+    _handler = AsyncHandler(handlers)
+    _handler.addFilter(RepeatFilter(repeat_interval))
+
+    # Records below every handler's level are discarded before they are built
+    logger.setLevel(min(handler.level for handler in handlers))
+    logger.addHandler(_handler)
+    logger.propagate = False
+    return _handler
+
+def flush_logs():
+    """Wait until queued log records have been written."""
+    if _handler is not None:
+        _handler.flush()
+
+def shutdown_logging():
+    """Write any queued records and stop the writer thread."""
+    global _handler
+    if _handler is not None:
+        logging.getLogger(LOGGER_NAME).removeHandler(_handler)
+        _handler.close()
+        _handler = None
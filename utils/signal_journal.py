@@ -0,0 +1,372 @@
+"""
+Append-only signal journal with a market/hour index for range queries.
+"""
+
+import bisect
+import datetime
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Iterator, Tuple
+
+from utils.file_handler import _json_default
+
+DEFAULT_JOURNAL_DIR = os.path.join("signals", "journal")
+SEGMENT_PREFIX = "segment-"
+COMPACT_MANIFEST = "compact.manifest"
+
+def _hour_bucket(signal_time: datetime.datetime) -> int:
+    """Index bucket of a signal time (hours since the epoch)."""
+    return int(signal_time.timestamp() // 3600)
+
+class SignalJournal:
+    """
+    Signals appended as JSON lines to numbered segment files.
+
+    Every segment has a sidecar ``.idx`` file with one ``hour market offset
+    length`` line per record. The index is held in memory as
+    market -> sorted hours -> record locations, so a query seeks straight to
+    the matching records instead of parsing whole files. Segments rotate at
+    ``max_segment_bytes``; compact() rewrites sealed segments sorted by market
+    and time and drops records past the retention window.
+    """
+
+    _instance = None
+
+    def __init__(self, directory: str = DEFAULT_JOURNAL_DIR,
+                 max_segment_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize signal journal.
+
+        Args:
+            directory (str): Directory holding segment and index files
+            max_segment_bytes (int): Size at which the active segment is sealed
+        """
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+
+        # market -> hour -> [(segment, offset, length), ...]
+        self._index: Dict[str, Dict[int, List[Tuple[int, int, int]]]] = {}
+        self._hours: Dict[str, List[int]] = {}
+        self._segments: List[int] = []
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @classmethod
+    def get_instance(cls) -> 'SignalJournal':
+        """
+        Get the shared signal journal.
+
+        Returns:
+            SignalJournal: Singleton instance
+        """
+        if cls._instance is None:
+            cls._instance = SignalJournal()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return sum(len(entries) for hours in self._index.values() for entries in hours.values())
+
+    def _segment_path(self, segment: int, suffix: str = ".jsonl") -> str:
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{segment:06d}{suffix}")
+
+    def _add_entry(self, market: str, hour: int, location: Tuple[int, int, int]):
+        hours = self._index.setdefault(market, {})
+        if hour not in hours:
+            hours[hour] = []
+            bisect.insort(self._hours.setdefault(market, []), hour)
+        hours[hour].append(location)
+
+    def _load(self):
+        """Load every segment index, rebuilding any that is missing or stale."""
+        self._recover_compaction()
+
+        for name in sorted(os.listdir(self.directory)):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(".jsonl"):
+                self._segments.append(int(name[len(SEGMENT_PREFIX):-len(".jsonl")]))
+
+        for segment in self._segments:
+            entries = self._read_index(segment)
+            if entries is None:
+                entries = self._rebuild_index(segment)
+            for hour, market, offset, length in entries:
+                self._add_entry(market, hour, (segment, offset, length))
+
+    def _write_durable(self, path: str, data: bytes):
+        """Write a file and flush it to disk before returning."""
+        with open(path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _finish_compaction(self, manifest: Dict[str, Any]):
+        """
+        Move a committed compaction into place; safe to repeat after a crash.
+
+        New segments replace their ``.compact`` files first, then the sealed
+        segments they were built from are removed and the active segment is
+        renumbered. The manifest is deleted last.
+        """
+        for new in manifest['new_segments']:
+            for suffix in (".jsonl", ".idx"):
+                staged = self._segment_path(new, suffix + ".compact")
+                if os.path.exists(staged):
+                    os.replace(staged, self._segment_path(new, suffix))
+
+        for old in manifest['sealed']:
+            for suffix in (".jsonl", ".idx"):
+                path = self._segment_path(old, suffix)
+                if os.path.exists(path):
+                    os.remove(path)
+
+        active, renumbered = manifest['active'], manifest['renumbered']
+        for suffix in (".jsonl", ".idx"):
+            source = self._segment_path(active, suffix)
+            if os.path.exists(source) and not os.path.exists(self._segment_path(renumbered, suffix)):
+                os.replace(source, self._segment_path(renumbered, suffix))
+
+        os.remove(os.path.join(self.directory, COMPACT_MANIFEST))
+
+    def _recover_compaction(self):
+        """Finish a compaction interrupted after its manifest was written, or discard it."""
+        manifest_path = os.path.join(self.directory, COMPACT_MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as f:
+                self._finish_compaction(json.load(f))
+
+        # Staged files without a manifest belong to a compaction that never committed
+        for name in os.listdir(self.directory):
+            if name == f"{COMPACT_MANIFEST}.tmp" or (name.startswith(SEGMENT_PREFIX) and name.endswith(".compact")):
+                os.remove(os.path.join(self.directory, name))
+
+    def _read_index(self, segment: int) -> Optional[List[Tuple[int, str, int, int]]]:
+        path = self._segment_path(segment, ".idx")
+        if not os.path.exists(path):
+            return None
+
+        entries = []
+        with open(path, "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 4:
+                    entries.append((int(parts[0]), parts[1], int(parts[2]), int(parts[3])))
+
+        # An index that does not reach the end of its segment missed a write
+        indexed_end = max((offset + length for _, _, offset, length in entries), default=0)
+        if indexed_end != os.path.getsize(self._segment_path(segment)):
+            return None
+        return entries
+
+    def _rebuild_index(self, segment: int) -> List[Tuple[int, str, int, int]]:
+        """Scan a segment and rewrite its index file."""
+        entries = []
+        offset = 0
+        with open(self._segment_path(segment), "rb") as f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    record = json.loads(line)
+                    signal_time = datetime.datetime.fromisoformat(record['signal_time'])
+                    entries.append((_hour_bucket(signal_time), record['market'], offset, len(line)))
+                offset += len(line)
+
+        with open(self._segment_path(segment, ".idx"), "w") as f:
+            f.write("".join(f"{h} {m} {o} {n}\n" for h, m, o, n in entries))
+        return entries
+
+    def _active_segment(self, incoming: int) -> int:
+        """Get the segment to append to, sealing the current one if it is full."""
+        if self._segments:
+            segment = self._segments[-1]
+            path = self._segment_path(segment)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            if size == 0 or size + incoming <= self.max_segment_bytes:
+                return segment
+        segment = (self._segments[-1] + 1) if self._segments else 1
+        self._segments.append(segment)
+        return segment
+
+    def append(self, signals: List) -> int:
+        """
+        Append signals to the journal with one write per batch.
+
+        Args:
+            signals (list): Signal objects to record
+
+        Returns:
+            int: Number of signals appended
+        """
+        if not signals:
+            return 0
+
+        lines = [(json.dumps(s.to_dict(), default=_json_default) + "\n").encode("utf-8")
+                 for s in signals]
+        payload = b"".join(lines)
+
+        with self._lock:
+            segment = self._active_segment(len(payload))
+            path = self._segment_path(segment)
+            with open(path, "ab") as f:
+                start = f.tell()
+                f.write(payload)
+
+            entries = []
+            offset = start
+            for signal, line in zip(signals, lines):
+                entries.append((_hour_bucket(signal.signal_time), signal.market, offset, len(line)))
+                offset += len(line)
+
+            with open(self._segment_path(segment, ".idx"), "a") as f:
+                f.write("".join(f"{h} {m} {o} {n}\n" for h, m, o, n in entries))
+            for hour, market, offset, length in entries:
+                self._add_entry(market, hour, (segment, offset, length))
+
+        return len(signals)
+
+    def markets(self) -> List[str]:
+        """Get every market present in the journal."""
+        return sorted(self._index)
+
+    def _locations(self, markets: List[str], start_hour: Optional[int],
+                   end_hour: Optional[int]) -> List[Tuple[int, int, int]]:
+        locations = []
+        with self._lock:
+            for market in markets:
+                hours = self._hours.get(market, [])
+                lo = 0 if start_hour is None else bisect.bisect_left(hours, start_hour)
+                hi = len(hours) if end_hour is None else bisect.bisect_right(hours, end_hour)
+                for hour in hours[lo:hi]:
+                    locations.extend(self._index[market][hour])
+        return sorted(locations)
+
+    def query(self, market: Optional[str] = None, start: Optional[datetime.datetime] = None,
+              end: Optional[datetime.datetime] = None) -> Iterator:
+        """
+        Stream signals for a market and time range.
+
+        Args:
+            market (Optional[str]): Market symbol, all markets if omitted
+            start (Optional[datetime]): Inclusive lower bound on signal time
+            end (Optional[datetime]): Exclusive upper bound on signal time
+
+        Yields:
+            Signal: Matching signals in segment order
+        """
+        from models.signal import Signal
+
+        markets = [market] if market else self.markets()
+        start_hour = None if start is None else _hour_bucket(start)
+        end_hour = None if end is None else _hour_bucket(end)
+
+        current_segment, handle = None, None
+        try:
+            for segment, offset, length in self._locations(markets, start_hour, end_hour):
+                if segment != current_segment:
+                    if handle:
+                        handle.close()
+                    handle = open(self._segment_path(segment), "rb")
+                    current_segment = segment
+                handle.seek(offset)
+                signal = Signal.from_dict(json.loads(handle.read(length)))
+
+                if start is not None and signal.signal_time < start:
+                    continue
+                if end is not None and signal.signal_time >= end:
+                    continue
+                yield signal
+        finally:
+            if handle:
+                handle.close()
+
+    @staticmethod
+    def _close_staged(out, out_idx):
+        """Flush a staged segment and its index to disk and close them."""
+        for handle in (out, out_idx):
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+
+    def compact(self, retain_days: Optional[int] = None) -> int:
+        """
+        Rewrite sealed segments sorted by market and time.
+
+        The active segment's records are left alone so appends can continue;
+        the rewritten segments get fresh numbers after it and the active
+        segment is then renumbered to stay last. Records older than
+        ``retain_days`` are dropped. The rewritten segments are staged as
+        ``.compact`` files and committed with a manifest, so a crash at any
+        point either leaves the old segments in place or is finished on the
+        next load.
+
+        Args:
+            retain_days (Optional[int]): Keep only this many days of signals
+
+        Returns:
+            int: Number of records dropped
+        """
+        with self._lock:
+            sealed = self._segments[:-1]
+            if not sealed:
+                return 0
+            active = self._segments[-1]
+
+            cutoff_hour = None
+            if retain_days is not None:
+                cutoff = datetime.datetime.now() - datetime.timedelta(days=retain_days)
+                cutoff_hour = _hour_bucket(cutoff)
+
+            sealed_set = set(sealed)
+            records = []
+            dropped = 0
+            for market, hours in self._index.items():
+                for hour, locations in hours.items():
+                    for location in locations:
+                        if location[0] not in sealed_set:
+                            continue
+                        if cutoff_hour is not None and hour < cutoff_hour:
+                            dropped += 1
+                            continue
+                        records.append((market, hour, location))
+            records.sort(key=lambda r: (r[0], r[1], r[2]))
+
+            # Re-sorting can spread records over more segments than were
+            # sealed, so never reuse numbers that may still be taken
+            first = active + 1
+            new_segments = []
+            out, out_idx, segment, size = None, None, None, 0
+            handles = {}
+            try:
+                for market, hour, (src, offset, length) in records:
+                    if out is None or size + length > self.max_segment_bytes:
+                        if out:
+                            self._close_staged(out, out_idx)
+                        segment = first + len(new_segments)
+                        new_segments.append(segment)
+                        out = open(self._segment_path(segment, ".jsonl.compact"), "wb")
+                        out_idx = open(self._segment_path(segment, ".idx.compact"), "w")
+                        size = 0
+                    if src not in handles:
+                        handles[src] = open(self._segment_path(src), "rb")
+                    handles[src].seek(offset)
+                    out.write(handles[src].read(length))
+                    out_idx.write(f"{hour} {market} {size} {length}\n")
+                    size += length
+            finally:
+                for handle in handles.values():
+                    handle.close()
+                if out:
+                    self._close_staged(out, out_idx)
+
+            # The manifest commits the compaction; the active segment is
+            # renumbered after the new ones so appends continue there
+            manifest = {'sealed': sealed, 'new_segments': new_segments, 'active': active,
+                        'renumbered': first + len(new_segments)}
+            manifest_path = os.path.join(self.directory, COMPACT_MANIFEST)
+            self._write_durable(f"{manifest_path}.tmp", json.dumps(manifest).encode("utf-8"))
+            os.replace(f"{manifest_path}.tmp", manifest_path)
+            self._finish_compaction(manifest)
+
+            self._index, self._hours, self._segments = {}, {}, []
+            self._load()
+            return dropped